@@ -12,6 +12,7 @@ import logging
 import logging.handlers
 import os
 import sys
+import time
 from typing import Any
 
 from buderus_wps import (
@@ -19,10 +20,28 @@ from buderus_wps import (
     EnergyBlockingControl,
     HeatPump,
     HeatPumpClient,
+    ReplayAdapter,
     USBtinAdapter,
 )
 
 
+def _replay_speed(text: str) -> float | None:
+    """argparse type for --replay-speed: a positive factor, or "max" (unthrottled)."""
+    if text.lower() == "max":
+        return None
+    try:
+        speed = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid speed {text!r}: expected a positive number or 'max'"
+        ) from None
+    if not speed > 0:
+        raise argparse.ArgumentTypeError(
+            f"invalid speed {text!r}: must be greater than 0 (or 'max')"
+        )
+    return speed
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="wps-cli", description="Buderus WPS CLI over USBtin"
@@ -56,6 +75,19 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--cache-path", default=None, help="Parameter cache file path (enables caching)"
     )
+    parser.add_argument(
+        "--replay",
+        default=None,
+        metavar="CAPTURE",
+        help="Play back a FHEM capture (.hex) instead of opening --port",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=_replay_speed,
+        default=1.0,
+        metavar="FACTOR",
+        help="Replay speed factor, 'max' = as fast as possible (default: 1)",
+    )
 
     sub = parser.add_subparsers(dest="command", required=True)
 
@@ -113,6 +145,11 @@ def build_parser() -> argparse.ArgumentParser:
     monitor_p.add_argument(
         "--temps-only", action="store_true", help="Only show temperature readings"
     )
+    monitor_p.add_argument(
+        "--stats",
+        action="store_true",
+        help="Show per-key rate and min/max/mean over the collection period",
+    )
 
     # energy command group
     energy_p = sub.add_parser("energy", help="Energy blocking control commands")
@@ -462,7 +499,9 @@ def cmd_dump(client: HeatPumpClient, args: argparse.Namespace) -> int:
     return 0 if not errors else 1
 
 
-def cmd_monitor(adapter: USBtinAdapter, args: argparse.Namespace) -> int:
+def cmd_monitor(
+    adapter: USBtinAdapter | ReplayAdapter, args: argparse.Namespace
+) -> int:
     """Monitor broadcast traffic and display sensor readings."""
     monitor = BroadcastMonitor(adapter)
     print(f"Monitoring CAN bus for {args.duration} seconds...", file=sys.stderr)
@@ -473,7 +512,25 @@ def cmd_monitor(adapter: USBtinAdapter, args: argparse.Namespace) -> int:
         def filter_func(r):
             return r.is_temperature
 
+    started = time.time()
     cache = monitor.collect(duration=args.duration, filter_func=filter_func)
+    show_stats = getattr(args, "stats", False)
+    elapsed = time.time() - started
+
+    def key_stats(reading) -> dict[str, Any] | None:
+        stats = monitor.history.window(
+            reading.base, reading.idx, elapsed, now=started + elapsed
+        )
+        if stats is None:
+            return None
+        scale = 10.0 if reading.is_temperature else 1.0
+        return {
+            "count": stats.count,
+            "per_minute": round(stats.rate * 60.0, 1),
+            "min": stats.min / scale,
+            "max": stats.max / scale,
+            "mean": round(stats.mean / scale, 2),
+        }
 
     if args.json:
         import json
@@ -481,19 +538,20 @@ def cmd_monitor(adapter: USBtinAdapter, args: argparse.Namespace) -> int:
         results = []
         for can_id, reading in sorted(cache.readings.items()):
             name = monitor.get_known_name(reading)
-            results.append(
-                {
-                    "can_id": f"0x{can_id:08X}",
-                    "base": f"0x{reading.base:04X}",
-                    "idx": reading.idx,
-                    "name": name,
-                    "dlc": reading.dlc,
-                    "raw_hex": reading.raw_data.hex(),
-                    "raw_value": reading.raw_value,
-                    "temperature": reading.temperature,
-                    "is_temperature": reading.is_temperature,
-                }
-            )
+            entry = {
+                "can_id": f"0x{can_id:08X}",
+                "base": f"0x{reading.base:04X}",
+                "idx": reading.idx,
+                "name": name,
+                "dlc": reading.dlc,
+                "raw_hex": reading.raw_data.hex(),
+                "raw_value": reading.raw_value,
+                "temperature": reading.temperature,
+                "is_temperature": reading.is_temperature,
+            }
+            if show_stats:
+                entry["stats"] = key_stats(reading)
+            results.append(entry)
         print(json.dumps({"count": len(results), "readings": results}))
     else:
         if not cache.readings:
@@ -517,6 +575,24 @@ def cmd_monitor(adapter: USBtinAdapter, args: argparse.Namespace) -> int:
                 f"0x{can_id:08X}  0x{reading.base:04X}   {reading.idx:<6} {name:<24} {reading.dlc:<5} 0x{raw_hex:<10} {value_str}"
             )
 
+        if show_stats:
+            print(f"\nPer-key statistics over {args.duration:g} seconds:\n")
+            print(
+                f"{'Base':<8} {'Idx':<6} {'Name':<24} {'Count':<7} {'Per min':<9} {'Min':<9} {'Max':<9} {'Mean':<9}"
+            )
+            print("-" * 90)
+            seen = set()
+            for _, reading in sorted(cache.readings.items()):
+                key = (reading.base, reading.idx)
+                stats = key_stats(reading)
+                if key in seen or stats is None:
+                    continue
+                seen.add(key)
+                name = monitor.get_known_name(reading) or "-"
+                print(
+                    f"0x{reading.base:04X}   {reading.idx:<6} {name:<24} {stats['count']:<7} {stats['per_minute']:<9} {stats['min']:<9g} {stats['max']:<9g} {stats['mean']:<9g}"
+                )
+
     return 0
 
 
@@ -626,12 +702,21 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     _configure_logging(args)
-    adapter = USBtinAdapter(
-        args.port,
-        baudrate=args.baud,
-        timeout=args.timeout,
-        read_only=args.read_only or args.dry_run,
-    )
+    adapter: USBtinAdapter | ReplayAdapter
+    if args.replay:
+        adapter = ReplayAdapter(
+            args.replay,
+            speed=args.replay_speed,
+            timeout=args.timeout,
+            read_only=args.read_only or args.dry_run,
+        )
+    else:
+        adapter = USBtinAdapter(
+            args.port,
+            baudrate=args.baud,
+            timeout=args.timeout,
+            read_only=args.read_only or args.dry_run,
+        )
 
     # Use HeatPump class with optional cache path
     from pathlib import Path
@@ -646,7 +731,7 @@ def main(argv: list[str] | None = None) -> int:
     try:
         adapter.connect()
     except Exception as e:
-        print(f"ERROR: failed to connect to {args.port}: {e}", file=sys.stderr)
+        print(f"ERROR: failed to connect to {adapter.port}: {e}", file=sys.stderr)
         return 1
     try:
         if args.command == "read":
@@ -29,20 +29,26 @@ __version__ = "0.1.0"
 __author__ = "Buderus WPS HA Project"
 __license__ = "MIT"
 
+from .async_client import AsyncHeatPumpClient
+from .async_transport import AsyncFrameSubscription, AsyncUSBtinTransport
 from .broadcast_monitor import (
     KNOWN_BROADCASTS,
     BroadcastCache,
     BroadcastMonitor,
     BroadcastReading,
+    BroadcastReadPolicy,
+    CollectionResult,
     decode_can_id,
     encode_can_id,
 )
+from .bus_arbiter import BusArbiter, BusPriority
 from .can_adapter import USBtinAdapter
 from .can_message import (
     CAN_PREFIX_COUNTER,
     CAN_PREFIX_DATA,
     CANMessage,
 )
+from .capabilities import CapabilityMap
 from .config import (
     CircuitConfig,
     DHWConfig,
@@ -54,6 +60,7 @@ from .config import (
     get_default_sensor_map,
     load_config,
 )
+from .demultiplexer import FrameDemultiplexer, FrameSubscription
 from .element_discovery import (
     ELEMENT_COUNT_REQUEST_ID,
     ELEMENT_COUNT_RESPONSE_ID,
@@ -62,6 +69,7 @@ from .element_discovery import (
     DiscoveredElement,
     ElementDiscovery,
     ElementListParser,
+    StreamingElementParser,
 )
 from .energy_blocking import (
     BlockingResult,
@@ -108,14 +116,20 @@ from .menu_api import (
     VacationPeriod,
 )
 from .menu_structure import MenuItem
+from .metrics import BusMetrics, LatencyHistogram
 from .parameter import HeatPump, Parameter
+from .poll_scheduler import PollItem, PollScheduler
 from .program_switching import (
     ParameterIO,
     ProgramState,
     ProgramSwitchConfig,
     ProgramSwitchingController,
 )
+from .read_spec import ReadEngine, ReadOutcome, ReadSpec
+from .replay_adapter import CaptureRecord, ReplayAdapter, load_fhem_capture
+from .response_cache import ResponseCache
 from .schedule_codec import ScheduleCodec, ScheduleSlot, WeeklySchedule
+from .timeseries import BroadcastHistory, TimeSeries, WindowStats
 from .value_encoder import ValueEncoder
 
 __all__ = [
@@ -137,11 +151,19 @@ __all__ = [
     "ValidationError",
     # CAN Message and Adapter
     "CANMessage",
+    "FrameDemultiplexer",
+    "FrameSubscription",
     "USBtinAdapter",
+    "ReplayAdapter",
+    "CaptureRecord",
+    "load_fhem_capture",
+    "AsyncFrameSubscription",
+    "AsyncUSBtinTransport",
     # CAN ID Constants (Hardware Verified 2025-12-05)
     # Heat Pump Interface
     "HeatPump",
     "HeatPumpClient",
+    "AsyncHeatPumpClient",
     "Parameter",
     "ParameterIO",
     "ProgramState",
@@ -149,6 +171,17 @@ __all__ = [
     "ProgramSwitchingController",
     # Utilities
     "ValueEncoder",
+    "BusMetrics",
+    "BusArbiter",
+    "BusPriority",
+    "LatencyHistogram",
+    "ResponseCache",
+    "PollItem",
+    "PollScheduler",
+    "ReadEngine",
+    "ReadOutcome",
+    "ReadSpec",
+    "CapabilityMap",
     # Menu API enums
     "AlarmCategory",
     "CircuitType",
@@ -176,6 +209,11 @@ __all__ = [
     "BroadcastCache",
     "BroadcastMonitor",
     "BroadcastReading",
+    "BroadcastReadPolicy",
+    "CollectionResult",
+    "BroadcastHistory",
+    "TimeSeries",
+    "WindowStats",
     "decode_can_id",
     "encode_can_id",
     "KNOWN_BROADCASTS",
@@ -198,6 +236,7 @@ __all__ = [
     "DiscoveredElement",
     "ElementDiscovery",
     "ElementListParser",
+    "StreamingElementParser",
     "ELEMENT_COUNT_REQUEST_ID",
     "ELEMENT_COUNT_RESPONSE_ID",
     "ELEMENT_DATA_REQUEST_ID",
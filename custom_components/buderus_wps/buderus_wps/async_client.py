@@ -0,0 +1,192 @@
+"""
+Asyncio Buderus WPS heat pump client.
+
+AsyncHeatPumpClient offers the HeatPumpClient read/write operations as
+coroutines on top of AsyncUSBtinTransport, so parameter reads and broadcast
+monitoring can share one event loop without executor threads. Parameter
+lookup and value encoding/decoding are shared with HeatPumpClient through
+ParameterCodec.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, Callable, Optional
+
+from .async_transport import AsyncUSBtinTransport
+from .broadcast_monitor import (
+    PARAMETER_RESPONSE_BASE,
+    BroadcastReading,
+    BroadcastReadPolicy,
+    parse_broadcast_frame,
+)
+from .can_message import CANMessage
+from .exceptions import TimeoutError
+from .heat_pump import (
+    CAN_REQUEST_BASE,
+    CAN_RESPONSE_BASE,
+    DEFAULT_READ_WINDOW,
+    ParameterCodec,
+)
+from .parameter import HeatPump
+from .response_cache import ResponseCache
+
+
+class AsyncHeatPumpClient(ParameterCodec):
+    """Coroutine-based parameter client for AsyncUSBtinTransport."""
+
+    def __init__(
+        self,
+        transport: AsyncUSBtinTransport,
+        registry: Optional[HeatPump] = None,
+        logger: Optional[logging.Logger] = None,
+        read_policy: Optional[BroadcastReadPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ) -> None:
+        super().__init__(registry, logger, read_policy, response_cache)
+        self._transport = transport
+
+    @property
+    def transport(self) -> AsyncUSBtinTransport:
+        return self._transport
+
+    async def read_value(
+        self, name_or_idx: Any, timeout: Optional[float] = None
+    ) -> bytes:
+        """Read the raw value of one parameter.
+
+        Raises:
+            KeyError: Unknown parameter
+            TimeoutError: No response within timeout
+        """
+        param = self.get(name_or_idx)
+        response = await self._transport.send_request(
+            self._rtr_request(param.idx),
+            CAN_RESPONSE_BASE | (param.idx << 14),
+            timeout=timeout,
+        )
+        return bytes(response.data)
+
+    async def read(
+        self, name_or_idx: Any, timeout: Optional[float] = None
+    ) -> dict[str, Any]:
+        """Read and decode parameter, returning metadata + raw/decoded values."""
+        param = self.get(name_or_idx)
+        local = self._local_raw(param)
+        if local is not None:
+            raw, source = local
+            return self._build_result(param, raw, source=source)
+        generation = self._generation(param)
+        raw = await self.read_value(param.idx, timeout=timeout)
+        self._remember(param, raw, generation)
+        return self._build_result(param, raw)
+
+    async def read_many(
+        self,
+        names_or_idxs: Iterable[Any],
+        deadline: Optional[float] = None,
+        timeout: Optional[float] = None,
+        window: int = DEFAULT_READ_WINDOW,
+    ) -> dict[Any, dict[str, Any]]:
+        """Read several parameters with up to ``window`` RTRs in flight.
+
+        Same arguments and result shape as HeatPumpClient.read_many().
+        """
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+
+        per_request = timeout if timeout is not None else self._transport.timeout
+        budget = deadline if deadline is not None else self._transport.timeout
+        end = time.monotonic() + budget
+
+        results, keys_by_idx, params = self._resolve_batch(names_or_idxs)
+        local_raw, sources = self._resolve_local(params)
+        generations = {idx: self._generation(param) for idx, param in params.items()}
+        raw_by_idx: dict[int, bytes] = dict(local_raw)
+        errors: dict[int, str] = {}
+        slots = asyncio.Semaphore(window)
+
+        async def read_one(idx: int) -> None:
+            async with slots:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    errors[idx] = "timeout"
+                    return
+                try:
+                    response = await self._transport.send_request(
+                        self._rtr_request(idx),
+                        CAN_RESPONSE_BASE | (idx << 14),
+                        timeout=min(per_request, remaining),
+                    )
+                except TimeoutError:
+                    errors[idx] = "timeout"
+                except Exception as e:
+                    errors[idx] = str(e)
+                else:
+                    raw_by_idx[idx] = bytes(response.data)
+
+        await asyncio.gather(*(read_one(idx) for idx in params if idx not in local_raw))
+
+        self._assemble_batch(
+            results, keys_by_idx, params, raw_by_idx, errors, sources, generations
+        )
+        return results
+
+    async def write(self, name_or_idx: Any, value: Any) -> None:
+        """Encode and transmit a new parameter value.
+
+        Raises:
+            KeyError: Unknown parameter
+            PermissionError: Parameter is read-only or transport is read-only
+            ValueError: Value outside the parameter's range
+        """
+        param = self.get(name_or_idx)
+        # FHEM: read=1 means "readable", not "read-only"
+        # A parameter is read-only if min >= max (no valid write range)
+        if param.min >= param.max:
+            raise PermissionError(
+                f"Parameter {param.text} is read-only (min={param.min} >= max={param.max})"
+            )
+        encoded = self._encode_value(param, value)
+        # PROTOCOL: Write uses same CAN ID as read request (CAN_REQUEST_BASE | idx << 14)
+        try:
+            self._transport.send_frame_nowait(
+                CANMessage(
+                    arbitration_id=CAN_REQUEST_BASE | (param.idx << 14),
+                    data=encoded,
+                    is_extended_id=True,
+                )
+            )
+        finally:
+            self._forget(param)
+
+    async def subscribe_broadcasts(
+        self,
+        filter_func: Optional[Callable[[BroadcastReading], bool]] = None,
+    ) -> AsyncIterator[BroadcastReading]:
+        """Yield broadcast readings as they arrive on the bus.
+
+        Args:
+            filter_func: Optional predicate; only matching readings are yielded
+
+        Yields:
+            BroadcastReading for every received broadcast data frame
+            (parameter responses and element-list frames are skipped)
+        """
+        subscription = self._transport.subscribe()
+        try:
+            async for frame in subscription:
+                if frame.is_remote_frame:
+                    continue
+                if frame.arbitration_id & 0x3FFF == PARAMETER_RESPONSE_BASE:
+                    continue
+                reading = parse_broadcast_frame(frame)
+                if reading is None:
+                    continue
+                if filter_func is None or filter_func(reading):
+                    yield reading
+        finally:
+            self._transport.unsubscribe(subscription)
@@ -0,0 +1,498 @@
+"""Asyncio USBtin transport using SLCAN protocol over serial port.
+
+AsyncUSBtinTransport is the event-loop counterpart of USBtinAdapter. Instead
+of polling the serial port from a thread it registers the port's file
+descriptor with the running loop (loop.add_reader), parses SLCAN lines as
+bytes arrive and routes each frame to:
+
+- Response waiters: asyncio futures keyed by arbitration ID, used by
+  send_request() for RTR parameter reads.
+- Subscriptions: asyncio queues receiving every matching frame, used for
+  broadcast monitoring.
+
+Non-frame lines (``\\r`` acknowledgements, version strings, ``\\a`` NAKs)
+complete the pending initialization command, if any.
+
+Protocol References:
+- SLCAN: Lawicel AB ASCII protocol
+- USBtin: fischl.de/usbtin hardware adapter
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any, Optional
+
+try:
+    import serial
+except ImportError as e:
+    raise ImportError(
+        "pyserial is required for USBtin adapter. " "Install with: pip install pyserial"
+    ) from e
+
+from .can_adapter import USBTIN_INIT_COMMANDS
+from .can_message import CANMessage
+from .demultiplexer import DEFAULT_SUBSCRIPTION_SIZE
+from .exceptions import (
+    DeviceCommunicationError,
+    DeviceDisconnectedError,
+    DeviceInitializationError,
+    DeviceNotFoundError,
+    DevicePermissionError,
+    TimeoutError,
+)
+
+# Maximum time to wait for the adapter to acknowledge an init command
+COMMAND_TIMEOUT = 2.0
+
+# SLCAN frame type prefixes (t/T data, r/R remote)
+_FRAME_PREFIXES = b"tTrR"
+
+
+class AsyncFrameSubscription:
+    """Asyncio queue of frames delivered to a single subscriber.
+
+    Supports ``async for frame in subscription``.
+
+    Attributes:
+        can_id: Arbitration ID filter, or None to receive every frame
+        dropped: Number of frames dropped because the queue was full
+    """
+
+    def __init__(
+        self, can_id: Optional[int] = None, maxsize: int = DEFAULT_SUBSCRIPTION_SIZE
+    ) -> None:
+        self.can_id = can_id
+        self.dropped = 0
+        self._queue: asyncio.Queue[CANMessage] = asyncio.Queue(maxsize=maxsize)
+
+    def matches(self, frame: CANMessage) -> bool:
+        """Check whether a frame passes this subscription's filter."""
+        return self.can_id is None or frame.arbitration_id == self.can_id
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[CANMessage]:
+        """Wait for the next frame.
+
+        Args:
+            timeout: Maximum time to wait (seconds), None to wait forever
+
+        Returns:
+            Next CANMessage, or None if the timeout expired
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def offer(self, frame: CANMessage) -> None:
+        """Queue a frame, counting it as dropped if the queue is full."""
+        try:
+            self._queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def __aiter__(self) -> AsyncFrameSubscription:
+        return self
+
+    async def __anext__(self) -> CANMessage:
+        return await self._queue.get()
+
+
+class AsyncUSBtinTransport:
+    """Asyncio USBtin CAN transport with SLCAN protocol support.
+
+    Must be connected and used from a single running event loop.
+
+    Attributes:
+        port: Serial port path (e.g., '/dev/ttyACM0')
+        baudrate: Serial communication speed (default: 115200)
+        timeout: Default request timeout in seconds (default: 5.0)
+    """
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 115200,
+        timeout: float = 5.0,
+        read_only: bool = False,
+        skip_init: bool = False,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """Initialize transport (does not open connection).
+
+        Args:
+            port: Serial port path
+            baudrate: Serial communication speed
+            timeout: Default request timeout in seconds
+            read_only: Reject all frame transmission when True
+            skip_init: Skip the SLCAN initialization sequence
+            logger: Optional logger instance
+        """
+        if not port:
+            raise ValueError("Port cannot be empty")
+        if timeout <= 0:
+            raise ValueError(f"Timeout must be positive, got {timeout}")
+
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.read_only = read_only
+        self.skip_init = skip_init
+        self.stabilization_delay = float(os.getenv("USBTIN_STABILIZATION_DELAY", "0.1"))
+        self._logger = logger or logging.getLogger(__name__)
+
+        self._serial: Optional[Any] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._buffer = bytearray()
+        self._waiters: dict[int, list[asyncio.Future[CANMessage]]] = {}
+        self._subscriptions: list[AsyncFrameSubscription] = []
+        self._command_future: Optional[asyncio.Future[bytes]] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Check if connection is currently open."""
+        return self._serial is not None and self._loop is not None
+
+    @property
+    def pending_waiters(self) -> int:
+        """Number of registered response waiters not yet resolved."""
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+    async def connect(self) -> AsyncUSBtinTransport:
+        """Open the serial port, start reading and initialize the adapter.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            DeviceNotFoundError: Serial port not found
+            DevicePermissionError: Permission denied
+            DeviceInitializationError: Device initialization failed
+            RuntimeError: Already connected
+        """
+        if self.is_open:
+            raise RuntimeError(
+                f"Already connected to {self.port}. "
+                "Call disconnect() first or use a new transport instance."
+            )
+
+        loop = asyncio.get_running_loop()
+        try:
+            self._logger.debug("Opening serial port %s @ %s", self.port, self.baudrate)
+            ser = await loop.run_in_executor(None, self._open_serial)
+        except FileNotFoundError as e:
+            raise DeviceNotFoundError(
+                f"Serial port {self.port} not found. "
+                "Check USB connection and port path.",
+                context={"port": self.port},
+            ) from e
+        except PermissionError as e:
+            raise DevicePermissionError(
+                f"Permission denied accessing {self.port}. "
+                "Add user to dialout group: sudo usermod -a -G dialout $USER",
+                context={"port": self.port},
+            ) from e
+        except serial.SerialException as e:
+            raise DeviceNotFoundError(
+                f"Failed to open serial port {self.port}: {e}",
+                context={"port": self.port, "error": str(e)},
+            ) from e
+
+        self._serial = ser
+        self._loop = loop
+        self._buffer.clear()
+        loop.add_reader(ser.fileno(), self._on_readable)
+
+        try:
+            if self.stabilization_delay > 0:
+                await asyncio.sleep(self.stabilization_delay)
+            if not self.skip_init:
+                await self._initialize()
+            return self
+        except Exception as e:
+            self._logger.exception("Error during connect/init for %s: %s", self.port, e)
+            await self.disconnect()
+            if isinstance(e, DeviceInitializationError):
+                raise
+            raise DeviceInitializationError(
+                f"Unexpected error during initialization: {e}",
+                context={"port": self.port, "error": str(e)},
+            ) from e
+
+    def _open_serial(self) -> Any:
+        # timeout=0: reads return whatever is buffered, the loop tells us when
+        return serial.Serial(
+            self.port, baudrate=self.baudrate, timeout=0, write_timeout=1.0
+        )
+
+    async def _initialize(self) -> None:
+        """Run the USBtin init sequence with the same NAK tolerance as USBtinAdapter."""
+        allow_nak_close = 2
+        allow_nak_version = 1
+        for cmd in USBTIN_INIT_COMMANDS:
+            response = await self._command(cmd, COMMAND_TIMEOUT)
+            if response != b"\a":
+                continue
+            if cmd == b"C\r" and allow_nak_close > 0:
+                allow_nak_close -= 1
+                continue
+            if cmd in (b"V\r", b"v\r") and allow_nak_version > 0:
+                allow_nak_version -= 1
+                continue
+            if cmd in (b"S4\r", b"O\r"):
+                # Bitrate already set / channel already open; proceed
+                continue
+            raise DeviceInitializationError(
+                f"Device returned error during initialization (command: {cmd.decode('utf-8', 'ignore').strip()})",
+                context={
+                    "port": self.port,
+                    "command": cmd.decode("utf-8", "ignore"),
+                    "response": "NAK",
+                },
+            )
+
+    async def _command(self, command: bytes, timeout: float) -> bytes:
+        """Send an SLCAN command and wait for its reply line.
+
+        Returns:
+            Reply bytes (e.g. b"\\r", b"V1010\\r" or b"\\a"), b"" on timeout
+        """
+        assert self._loop is not None
+        future: asyncio.Future[bytes] = self._loop.create_future()
+        self._command_future = future
+        try:
+            self._write(command)
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return b""
+        finally:
+            self._command_future = None
+
+    async def disconnect(self) -> None:
+        """Stop reading, fail pending waiters and close the serial port.
+
+        Never raises; safe to call multiple times.
+        """
+        if self._serial is None:
+            return
+
+        ser = self._serial
+        if self._loop is not None:
+            try:
+                self._loop.remove_reader(ser.fileno())
+            except Exception:
+                pass  # Ignore errors during shutdown
+        self._fail_all(
+            DeviceDisconnectedError(
+                "Adapter disconnected while waiting for response",
+                context={"port": self.port},
+            )
+        )
+        self._serial = None
+        self._loop = None
+
+        try:
+            ser.write(b"C\r")
+        except Exception:
+            pass  # Ignore errors during shutdown
+        try:
+            ser.close()
+        except Exception:
+            pass  # Ignore errors during cleanup
+
+    async def __aenter__(self) -> AsyncUSBtinTransport:
+        return await self.connect()
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.disconnect()
+
+    def expect(self, can_id: int) -> asyncio.Future[CANMessage]:
+        """Register a waiter for the next frame with the given arbitration ID.
+
+        Register before transmitting the request, then call cancel() once done.
+        """
+        if self._loop is None:
+            raise DeviceCommunicationError(
+                "Device not connected", context={"port": self.port}
+            )
+        future: asyncio.Future[CANMessage] = self._loop.create_future()
+        self._waiters.setdefault(can_id, []).append(future)
+        return future
+
+    def cancel(self, can_id: int, future: asyncio.Future[CANMessage]) -> None:
+        """Remove a waiter registered with expect() (no-op if already resolved)."""
+        waiters = self._waiters.get(can_id)
+        if waiters and future in waiters:
+            waiters.remove(future)
+            if not waiters:
+                del self._waiters[can_id]
+        future.cancel()
+
+    def subscribe(
+        self, can_id: Optional[int] = None, maxsize: int = DEFAULT_SUBSCRIPTION_SIZE
+    ) -> AsyncFrameSubscription:
+        """Create a subscription receiving every matching frame.
+
+        Args:
+            can_id: Only deliver frames with this arbitration ID (None = all)
+            maxsize: Queue bound; excess frames are counted in ``dropped``
+
+        Returns:
+            The new AsyncFrameSubscription (release with unsubscribe())
+        """
+        subscription = AsyncFrameSubscription(can_id, maxsize)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: AsyncFrameSubscription) -> None:
+        """Stop delivering frames to a subscription."""
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def send_frame_nowait(self, message: CANMessage) -> None:
+        """Transmit a CAN frame without waiting for any response.
+
+        Raises:
+            DeviceCommunicationError: Device not connected
+            PermissionError: Transport is in read-only mode
+        """
+        if not self.is_open:
+            raise DeviceCommunicationError(
+                "Device not connected", context={"port": self.port}
+            )
+        if self.read_only:
+            raise PermissionError(
+                "Adapter is in read-only mode; sending frames is disabled."
+            )
+        self._logger.debug(
+            "TX: id=0x%X dlc=%s rtr=%s",
+            message.arbitration_id,
+            message.dlc,
+            message.is_remote_frame,
+        )
+        self._write(message.to_usbtin_format().encode("ascii"))
+
+    async def send_request(
+        self,
+        message: CANMessage,
+        response_id: int,
+        timeout: Optional[float] = None,
+    ) -> CANMessage:
+        """Transmit a request and wait for the frame with ``response_id``.
+
+        Unrelated traffic is delivered to subscribers and never consumed.
+
+        Args:
+            message: Request frame (typically an RTR)
+            response_id: Arbitration ID of the expected response
+            timeout: Maximum time to wait (default: transport timeout)
+
+        Returns:
+            The response CANMessage
+
+        Raises:
+            TimeoutError: No matching response within timeout
+            DeviceDisconnectedError: Transport closed while waiting
+        """
+        effective_timeout = timeout if timeout is not None else self.timeout
+        future = self.expect(response_id)
+        try:
+            self.send_frame_nowait(message)
+            return await asyncio.wait_for(asyncio.shield(future), effective_timeout)
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(
+                f"No response 0x{response_id:X} within timeout",
+                context={
+                    "port": self.port,
+                    "response_id": response_id,
+                    "timeout": effective_timeout,
+                },
+            ) from e
+        finally:
+            self.cancel(response_id, future)
+
+    def _write(self, data: bytes) -> None:
+        if self._serial is None:
+            raise DeviceDisconnectedError(
+                "Cannot write: serial port not open", context={"port": self.port}
+            )
+        try:
+            self._serial.write(data)
+        except (serial.SerialException, OSError) as e:
+            raise DeviceDisconnectedError(
+                f"Serial write error: {e}",
+                context={"port": self.port, "error": str(e)},
+            ) from e
+
+    def _on_readable(self) -> None:
+        """Loop reader callback: drain the port and route complete lines."""
+        ser = self._serial
+        if ser is None:
+            return
+        try:
+            chunk = ser.read(ser.in_waiting or 1)
+        except (serial.SerialException, OSError) as e:
+            self._logger.error("Serial read error on %s: %s", self.port, e)
+            if self._loop is not None:
+                self._loop.remove_reader(ser.fileno())
+            self._fail_all(
+                DeviceDisconnectedError(
+                    f"Serial read error: {e}",
+                    context={"port": self.port, "error": str(e)},
+                )
+            )
+            return
+        if chunk:
+            self._buffer += chunk
+            self._process_buffer()
+
+    def _process_buffer(self) -> None:
+        buffer = self._buffer
+        while True:
+            # A line ends at \r, or at \a (NAK, sent without \r)
+            cr = buffer.find(b"\r")
+            bell = buffer.find(b"\a")
+            if cr < 0 and bell < 0:
+                return
+            end = bell if cr < 0 or 0 <= bell < cr else cr
+            line = bytes(buffer[:end]).strip(b"\n ")
+            terminator = buffer[end]
+            del buffer[: end + 1]
+
+            if terminator == 0x07:
+                self._complete_command(b"\a")
+            elif line and line[0] in _FRAME_PREFIXES:
+                self._dispatch_line(line)
+            else:
+                self._complete_command(line + b"\r")
+
+    def _complete_command(self, response: bytes) -> None:
+        future = self._command_future
+        if future is not None and not future.done():
+            future.set_result(response)
+
+    def _dispatch_line(self, line: bytes) -> None:
+        try:
+            frame = CANMessage.from_usbtin_format(line.decode("ascii"))
+        except Exception as e:
+            self._logger.debug("Dropping unparseable frame %r: %s", line, e)
+            return
+
+        for subscription in self._subscriptions:
+            if subscription.matches(frame):
+                subscription.offer(frame)
+        for future in self._waiters.pop(frame.arbitration_id, ()):
+            if not future.done():
+                future.set_result(frame)
+
+    def _fail_all(self, error: BaseException) -> None:
+        waiters = self._waiters
+        self._waiters = {}
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+        if self._command_future is not None and not self._command_future.done():
+            self._command_future.set_exception(error)
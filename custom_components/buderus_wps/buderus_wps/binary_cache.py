@@ -0,0 +1,238 @@
+"""Compact binary cache file for parameter and element definitions.
+
+File layout (integers big-endian):
+
+- header: magic b"BWPC", format version, record count, sizes of the
+  string table, metadata and blob sections, SHA-256 of everything after
+  the header
+- records: one fixed-width record per parameter (idx, extid, min, max,
+  read flag, offset/length of name and format in the string table)
+- string table: names and formats (ASCII), each stored once
+- metadata: small JSON object (timestamps, device info, byte counts)
+- blob: opaque bytes (the element cache keeps the raw element list)
+
+read_cache() maps the file and validates sizes and checksum in one pass
+before decoding; write_cache() writes a temporary file and renames it over
+the cache, so readers never see a partially written file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"BWPC"
+FORMAT_VERSION = 1
+
+# magic, version, record count, strings size, metadata size, blob size, sha256
+_HEADER = struct.Struct(">4sHIIII32s")
+# idx, extid, min, max, read, name offset, name length, format offset,
+# format length
+_RECORD = struct.Struct(">H7siiBIBIB")
+
+HEADER_SIZE = _HEADER.size
+RECORD_SIZE = _RECORD.size
+
+
+class CacheFormatError(ValueError):
+    """File is not a valid binary cache (wrong magic, version, size or checksum)."""
+
+
+@dataclass
+class CacheContents:
+    """Decoded contents of a cache file.
+
+    Attributes:
+        records: Parameter dicts (idx, extid, min, max, read, text and,
+            if stored, format)
+        meta: Metadata saved with the records
+        blob: Opaque bytes saved with the records
+        checksum: "sha256:<hex>" of the file body
+    """
+
+    records: list[dict[str, Any]]
+    meta: dict[str, Any] = field(default_factory=dict)
+    blob: bytes = b""
+    checksum: str = ""
+
+
+def is_binary_cache(path: str | Path) -> bool:
+    """Whether ``path`` starts with the binary cache magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def encode_cache(
+    records: Iterable[dict[str, Any]],
+    meta: dict[str, Any] | None = None,
+    blob: bytes = b"",
+) -> bytes:
+    """Serialize records, metadata and blob to the binary cache format.
+
+    Raises:
+        CacheFormatError: If a record cannot be represented (extid not 7
+            bytes of hex, name or format not ASCII or longer than 255)
+    """
+    strings = bytearray()
+    offsets: dict[str, int] = {}
+
+    def intern(text: str) -> tuple[int, int]:
+        offset = offsets.get(text)
+        if offset is None:
+            offset = offsets[text] = len(strings)
+            strings.extend(text.encode("ascii"))
+        return offset, len(text)
+
+    body = bytearray()
+    count = 0
+    try:
+        for record in records:
+            extid = bytes.fromhex(record["extid"])
+            if len(extid) != 7:
+                raise ValueError(f"extid {record['extid']!r} is not 7 bytes")
+            text_offset, text_len = intern(record["text"])
+            format_offset, format_len = intern(record.get("format") or "")
+            body += _RECORD.pack(
+                record["idx"],
+                extid,
+                record["min"],
+                record["max"],
+                record.get("read", 0),
+                text_offset,
+                text_len,
+                format_offset,
+                format_len,
+            )
+            count += 1
+    except (KeyError, TypeError, ValueError, struct.error) as e:
+        raise CacheFormatError(f"Cannot encode record {count}: {e}") from e
+
+    meta_bytes = json.dumps(meta or {}, separators=(",", ":")).encode("utf-8")
+    body += strings
+    body += meta_bytes
+    body += blob
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        count,
+        len(strings),
+        len(meta_bytes),
+        len(blob),
+        hashlib.sha256(body).digest(),
+    )
+    return header + bytes(body)
+
+
+def decode_cache(data: bytes | memoryview | mmap.mmap) -> CacheContents:
+    """Validate and decode a binary cache.
+
+    Raises:
+        CacheFormatError: If magic, version, size or checksum do not match
+    """
+    if len(data) < HEADER_SIZE:
+        raise CacheFormatError("File shorter than cache header")
+    magic, version, count, strings_size, meta_size, blob_size, digest = (
+        _HEADER.unpack_from(data, 0)
+    )
+    if magic != MAGIC:
+        raise CacheFormatError("Not a binary cache file")
+    if version != FORMAT_VERSION:
+        raise CacheFormatError(f"Unsupported cache version {version}")
+    records_end = HEADER_SIZE + count * RECORD_SIZE
+    strings_end = records_end + strings_size
+    meta_end = strings_end + meta_size
+    if meta_end + blob_size != len(data):
+        raise CacheFormatError(
+            f"Cache size {len(data)} does not match header "
+            f"({meta_end + blob_size} bytes)"
+        )
+    with memoryview(data) as view:
+        if hashlib.sha256(view[HEADER_SIZE:]).digest() != digest:
+            raise CacheFormatError("Cache checksum mismatch")
+        strings = bytes(view[records_end:strings_end]).decode("ascii")
+        try:
+            meta = json.loads(bytes(view[strings_end:meta_end]))
+        except ValueError as e:
+            raise CacheFormatError(f"Invalid cache metadata: {e}") from e
+        blob = bytes(view[meta_end:])
+        records = []
+        for (
+            idx,
+            extid,
+            min_value,
+            max_value,
+            read,
+            text_offset,
+            text_len,
+            format_offset,
+            format_len,
+        ) in _RECORD.iter_unpack(view[HEADER_SIZE:records_end]):
+            record: dict[str, Any] = {
+                "idx": idx,
+                "extid": extid.hex().upper(),
+                "min": min_value,
+                "max": max_value,
+                "read": read,
+                "text": strings[text_offset : text_offset + text_len],
+            }
+            if format_len:
+                record["format"] = strings[format_offset : format_offset + format_len]
+            records.append(record)
+    return CacheContents(records, meta, blob, f"sha256:{digest.hex()}")
+
+
+def read_cache(path: str | Path) -> CacheContents:
+    """Map and decode the cache file at ``path``.
+
+    Raises:
+        OSError: If the file cannot be read
+        CacheFormatError: If the file is not a valid cache
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < HEADER_SIZE:
+            raise CacheFormatError("File shorter than cache header")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode_cache(mapped)
+
+
+def write_cache(
+    path: str | Path,
+    records: Iterable[dict[str, Any]],
+    meta: dict[str, Any] | None = None,
+    blob: bytes = b"",
+) -> int:
+    """Atomically replace ``path`` with a cache of ``records``.
+
+    Returns:
+        Size of the written file in bytes
+
+    Raises:
+        OSError: If the file cannot be written
+        CacheFormatError: If a record cannot be encoded
+    """
+    data = encode_cache(records, meta, blob)
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return len(data)
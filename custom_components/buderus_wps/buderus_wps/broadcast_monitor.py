@@ -8,19 +8,35 @@ different base addresses:
 - Base 0x0270: Status data
 
 This module provides passive monitoring to capture these broadcast values
-without relying on RTR request/response patterns.
+without relying on RTR request/response patterns, either for a fixed period
+(collect), until a set of keys has been seen (collect_until) or
+continuously in the background (start/stop) on top of the adapter's
+shared reader thread.
 """
 
 from __future__ import annotations
 
 import logging
 import struct
+import threading
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Callable, Optional
 
 from .can_adapter import USBtinAdapter
 from .can_message import CANMessage
+from .demultiplexer import FrameSubscription
+from .timeseries import BroadcastHistory
+
+# Low 14 bits shared by parameter RTR responses and element-list frames
+PARAMETER_RESPONSE_BASE = 0x3FE0
+
+# Weight of the newest interval in the learned broadcast period (EWMA)
+PERIOD_SMOOTHING = 0.25
+
+# Default freshness bound for broadcast-first parameter reads (seconds)
+DEFAULT_READ_MAX_AGE = 60.0
 
 
 @dataclass
@@ -58,13 +74,35 @@ class BroadcastReading:
 
 @dataclass
 class BroadcastCache:
-    """Cache of recent broadcast readings."""
+    """Cache of recent broadcast readings.
+
+    Readings are keyed by CAN ID. Secondary indexes map (base, idx) and idx
+    to the CAN ID most recently stored for that key, so lookups stay
+    constant-time however many IDs the bus carries and always return the
+    newest reading when several CAN IDs share a key. Modify the cache
+    through update()/clear() so the indexes stay in sync.
+    """
 
     readings: dict[int, BroadcastReading] = field(default_factory=dict)
+    _by_key: dict[tuple[int, int], int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_idx: dict[int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for reading in sorted(self.readings.values(), key=lambda r: r.timestamp):
+            self._index(reading)
+
+    def _index(self, reading: BroadcastReading) -> None:
+        self._by_key[(reading.base, reading.idx)] = reading.can_id
+        self._by_idx[reading.idx] = reading.can_id
 
     def update(self, reading: BroadcastReading) -> None:
         """Update cache with new reading."""
         self.readings[reading.can_id] = reading
+        self._index(reading)
 
     def get(self, can_id: int) -> Optional[BroadcastReading]:
         """Get cached reading by CAN ID."""
@@ -73,13 +111,11 @@ class BroadcastCache:
     def get_by_idx_and_base(self, idx: int, base: int) -> Optional[BroadcastReading]:
         """Get cached reading by idx and base.
 
-        Searches all readings for one matching the given idx and base,
-        since the high bits of the CAN ID can vary.
+        The high bits of the CAN ID can vary, so several IDs may share an
+        (idx, base); the most recently stored one is returned.
         """
-        for reading in self.readings.values():
-            if reading.idx == idx and reading.base == base:
-                return reading
-        return None
+        can_id = self._by_key.get((base, idx))
+        return None if can_id is None else self.readings.get(can_id)
 
     def get_by_idx(self, idx: int) -> Optional[BroadcastReading]:
         """Get cached reading by idx only (searches all bases).
@@ -87,10 +123,69 @@ class BroadcastCache:
         Useful for parameters that may broadcast on varying bases,
         like COMPRESSOR_REAL_FREQUENCY (idx=278).
         """
-        for reading in self.readings.values():
-            if reading.idx == idx:
-                return reading
-        return None
+        can_id = self._by_idx.get(idx)
+        return None if can_id is None else self.readings.get(can_id)
+
+    def get_many(
+        self,
+        keys: Iterable[tuple[int, int]],
+        max_age: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> dict[tuple[int, int], Optional[BroadcastReading]]:
+        """Look up several readings by (base, idx).
+
+        Args:
+            keys: (base, idx) pairs, e.g. a sensor map or KNOWN_BROADCASTS
+            max_age: If given, readings older than this (seconds) count as missing
+            now: Reference time for max_age (default: time.time())
+
+        Returns:
+            Dict mapping every requested key to its reading or None
+        """
+        oldest = None
+        if max_age is not None:
+            oldest = (now if now is not None else time.time()) - max_age
+        result: dict[tuple[int, int], Optional[BroadcastReading]] = {}
+        for base, idx in keys:
+            reading = self.get_by_idx_and_base(idx, base)
+            if (
+                reading is not None
+                and oldest is not None
+                and reading.timestamp < oldest
+            ):
+                reading = None
+            result[(base, idx)] = reading
+        return result
+
+    def get_fresh(
+        self, idx: int, base: int, max_age: float, now: Optional[float] = None
+    ) -> Optional[BroadcastReading]:
+        """Get reading by idx and base if it is at most ``max_age`` seconds old.
+
+        Args:
+            idx: Parameter index
+            base: Base address
+            max_age: Maximum reading age in seconds
+            now: Reference time (default: time.time())
+
+        Returns:
+            Reading, or None if missing or stale
+        """
+        reading = self.get_by_idx_and_base(idx, base)
+        if reading is None:
+            return None
+        if (now if now is not None else time.time()) - reading.timestamp > max_age:
+            return None
+        return reading
+
+    def snapshot(self) -> BroadcastCache:
+        """Return a point-in-time copy safe to iterate while updates continue."""
+        copy = BroadcastCache()
+        # Indexes first: every CAN ID they name is then in the readings copy
+        copy._by_key = dict(self._by_key)
+        copy._by_idx = dict(self._by_idx)
+        copy.readings = dict(self.readings)
+        return copy
 
     def get_temperatures(self, circuit: Optional[int] = None) -> list[BroadcastReading]:
         """Get all temperature readings, optionally filtered by circuit."""
@@ -102,6 +197,40 @@ class BroadcastCache:
     def clear(self) -> None:
         """Clear the cache."""
         self.readings.clear()
+        self._by_key.clear()
+        self._by_idx.clear()
+
+
+@dataclass
+class CollectionResult:
+    """Outcome of BroadcastMonitor.collect_until().
+
+    Attributes:
+        readings: Reading found for each required (base, idx) key
+        missed: Required keys without a reading when the deadline passed
+        unreachable: Required keys whose learned broadcast period is longer
+            than the deadline, so waiting for them usually times out
+        elapsed: Seconds spent waiting
+    """
+
+    readings: dict[tuple[int, int], BroadcastReading]
+    missed: list[tuple[int, int]]
+    unreachable: list[tuple[int, int]]
+    elapsed: float
+
+    @property
+    def complete(self) -> bool:
+        """True if every required key was found."""
+        return not self.missed
+
+
+@dataclass
+class _KeyWaiter:
+    """Required keys still pending for one collect_until() call."""
+
+    pending: set[tuple[int, int]]
+    readings: dict[tuple[int, int], BroadcastReading]
+    done: threading.Event = field(default_factory=threading.Event)
 
 
 # Known broadcast ID mappings based on observed traffic
@@ -216,6 +345,61 @@ def get_broadcast_for_param(param_name: str) -> Optional[tuple]:
     return PARAM_TO_BROADCAST.get(param_name.upper())
 
 
+@dataclass
+class BroadcastReadPolicy:
+    """Answer parameter reads from broadcast traffic when fresh enough.
+
+    Used by the parameter clients: a read of a parameter listed in
+    ``mapping`` is served from ``cache`` (typically the live cache of a
+    running BroadcastMonitor) if the reading is at most the parameter's
+    max age old; otherwise the client falls back to an RTR.
+
+    Attributes:
+        cache: Broadcast cache to read from
+        default_max_age: Freshness bound in seconds for parameters without
+            an entry in ``max_age``
+        max_age: Per-parameter freshness bounds in seconds (upper-case names)
+        mapping: Parameter name to (base, idx); base None searches the
+            circuit bases 0x0060-0x0063
+    """
+
+    cache: BroadcastCache
+    default_max_age: float = DEFAULT_READ_MAX_AGE
+    max_age: dict[str, float] = field(default_factory=dict)
+    mapping: dict[str, tuple[Optional[int], int]] = field(
+        default_factory=lambda: dict(PARAM_TO_BROADCAST)
+    )
+
+    def lookup(
+        self, param_name: str, param_format: str, now: Optional[float] = None
+    ) -> Optional[BroadcastReading]:
+        """Return a fresh broadcast reading for a parameter, if any.
+
+        Args:
+            param_name: Parameter name
+            param_format: Parameter format; temperature parameters only
+                accept readings that decode as a plausible temperature
+            now: Reference time (default: time.time())
+
+        Returns:
+            Reading to decode as the parameter value, or None to use RTR
+        """
+        name = param_name.upper()
+        key = self.mapping.get(name)
+        if key is None:
+            return None
+        bound = self.max_age.get(name, self.default_max_age)
+        base, idx = key
+        for candidate in CIRCUIT_BASES if base is None else (base,):
+            reading = self.cache.get_fresh(idx, candidate, bound, now=now)
+            if reading is None:
+                continue
+            if is_temperature_param(param_format) and not reading.is_temperature:
+                continue
+            return reading
+        return None
+
+
 def is_temperature_param(param_format: str) -> bool:
     """
     Check if a parameter format indicates a temperature value.
@@ -250,6 +434,40 @@ def encode_can_id(direction: int, idx: int, base: int) -> int:
     return (direction << 26) | (idx << 14) | base
 
 
+def parse_broadcast_frame(frame: CANMessage) -> Optional[BroadcastReading]:
+    """Decode a received CAN frame into a BroadcastReading.
+
+    Args:
+        frame: Received data frame
+
+    Returns:
+        BroadcastReading, or None for frames without payload
+    """
+    if frame.dlc < 1:
+        return None
+
+    direction, idx, base = decode_can_id(frame.arbitration_id)
+
+    # Parse raw value (big-endian, signed for 2-byte temperature values)
+    if frame.dlc >= 2:
+        # Use signed 16-bit for temperature values (supports negative temps)
+        raw_value = struct.unpack(">h", bytes(frame.data[:2]))[0]
+    elif frame.dlc == 1:
+        raw_value = frame.data[0]
+    else:
+        raw_value = 0
+
+    return BroadcastReading(
+        can_id=frame.arbitration_id,
+        base=base,
+        idx=idx,
+        dlc=frame.dlc,
+        raw_data=bytes(frame.data),
+        raw_value=raw_value,
+        timestamp=time.time(),
+    )
+
+
 class BroadcastMonitor:
     """
     Monitor CAN bus for broadcast messages.
@@ -263,23 +481,166 @@ class BroadcastMonitor:
         # Get temperature readings
         for reading in cache.get_temperatures():
             print(f"{reading.can_id:08X}: {reading.temperature}°C")
+
+        # Or stop as soon as the needed keys were seen
+        result = monitor.collect_until([(0x0060, 12), (0x0270, 5)], deadline=5.0)
+
+        # Or keep the cache updated in the background (requires the
+        # adapter's background reader) and read it at any time
+        adapter.start_reader()
+        monitor.start()
+        reading = monitor.cache.get_fresh(idx=12, base=0x0060, max_age=60.0)
+        monitor.stop()
     """
 
     def __init__(
         self,
         adapter: USBtinAdapter,
         logger: Optional[logging.Logger] = None,
+        history: Optional[BroadcastHistory] = None,
     ) -> None:
+        """Initialize the monitor.
+
+        Args:
+            adapter: Connected adapter
+            logger: Optional logger
+            history: Sample history to record into (default: a new
+                BroadcastHistory tracking every key)
+        """
         self._adapter = adapter
         self._logger = logger or logging.getLogger(__name__)
         self._cache = BroadcastCache()
+        self._history = history if history is not None else BroadcastHistory()
         self._callbacks: list[Callable[[BroadcastReading], None]] = []
+        self._subscription: Optional[FrameSubscription] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._waiters: list[_KeyWaiter] = []
+        self._waiter_lock = threading.Lock()
+        # Broadcast period learning per (base, idx): the CAN ID first seen
+        # for the key, its last timestamp and the smoothed interval
+        self._period_ids: dict[tuple[int, int], int] = {}
+        self._last_seen: dict[tuple[int, int], float] = {}
+        self._periods: dict[tuple[int, int], float] = {}
+        self._warned_unreachable: set[tuple[int, int]] = set()
 
     @property
     def cache(self) -> BroadcastCache:
         """Access the reading cache."""
         return self._cache
 
+    @property
+    def history(self) -> BroadcastHistory:
+        """Recent samples per (base, idx), kept across collect() calls."""
+        return self._history
+
+    @property
+    def running(self) -> bool:
+        """True while continuous background monitoring is active."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start continuous background monitoring.
+
+        Subscribes to every frame seen by the adapter's background reader,
+        so monitoring shares the port with RTR traffic and no broadcast is
+        missed between readers. The cache keeps the latest timestamped
+        reading per CAN ID and is never cleared; use get_fresh() or the
+        reading timestamps for staleness checks. Parameter responses and
+        element-list frames (base 0x3FE0) are not cached.
+
+        Calling this while already running is a no-op.
+
+        Raises:
+            RuntimeError: Adapter not connected or background reader not running
+        """
+        if self.running:
+            return
+        if not self._adapter.is_open:
+            raise RuntimeError("Adapter not connected")
+        if not self._adapter.reader_running:
+            raise RuntimeError(
+                "Continuous monitoring requires the adapter's background reader"
+            )
+
+        self._stop.clear()
+        self._subscription = self._adapter.demultiplexer.subscribe()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._subscription,),
+            name="broadcast-monitor",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop continuous monitoring (idempotent). The cache is kept."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+        if self._subscription is not None:
+            self._adapter.demultiplexer.unsubscribe(self._subscription)
+            self._subscription = None
+        self._thread = None
+
+    def _run(self, subscription: FrameSubscription) -> None:
+        """Feed subscribed frames into the cache until stopped."""
+        while not self._stop.is_set():
+            frame = subscription.get(timeout=0.2)
+            if frame is None or frame.is_remote_frame:
+                continue
+            if frame.arbitration_id & 0x3FFF == PARAMETER_RESPONSE_BASE:
+                continue
+            reading = self._process_frame(frame)
+            if reading:
+                self._store(reading)
+
+    def _store(self, reading: BroadcastReading) -> None:
+        """Update cache and history, learn the period and notify waiters/callbacks."""
+        self._cache.update(reading)
+        key = (reading.base, reading.idx)
+        # Copies of a key under other CAN IDs would skew period and history
+        if self._period_ids.setdefault(key, reading.can_id) == reading.can_id:
+            self._learn_period(key, reading.timestamp)
+            self._history.record(key, reading.timestamp, reading.raw_value)
+        if self._waiters:
+            with self._waiter_lock:
+                for waiter in self._waiters:
+                    if key in waiter.pending:
+                        waiter.pending.discard(key)
+                        waiter.readings[key] = reading
+                        if not waiter.pending:
+                            waiter.done.set()
+        for callback in self._callbacks:
+            try:
+                callback(reading)
+            except Exception as e:
+                self._logger.warning("Callback error: %s", e)
+
+    def _learn_period(self, key: tuple[int, int], timestamp: float) -> None:
+        """Fold the interval since the key's previous reading into its period."""
+        last = self._last_seen.get(key)
+        self._last_seen[key] = timestamp
+        if last is None or timestamp <= last:
+            return
+        interval = timestamp - last
+        period = self._periods.get(key)
+        if period is None:
+            self._periods[key] = interval
+        else:
+            self._periods[key] = period + PERIOD_SMOOTHING * (interval - period)
+
+    def broadcast_period(self, base: int, idx: int) -> Optional[float]:
+        """Learned interval between broadcasts of (base, idx) in seconds.
+
+        Returns:
+            Smoothed period, or None until the key was seen twice
+        """
+        return self._periods.get((base, idx))
+
     def add_callback(self, callback: Callable[[BroadcastReading], None]) -> None:
         """Add callback to be called for each new reading."""
         self._callbacks.append(callback)
@@ -290,31 +651,7 @@ class BroadcastMonitor:
 
     def _process_frame(self, frame: CANMessage) -> Optional[BroadcastReading]:
         """Process a CAN frame into a BroadcastReading."""
-        if frame.dlc < 1:
-            return None
-
-        direction, idx, base = decode_can_id(frame.arbitration_id)
-
-        # Parse raw value (big-endian, signed for 2-byte temperature values)
-        if frame.dlc >= 2:
-            # Use signed 16-bit for temperature values (supports negative temps)
-            raw_value = struct.unpack(">h", bytes(frame.data[:2]))[0]
-        elif frame.dlc == 1:
-            raw_value = frame.data[0]
-        else:
-            raw_value = 0
-
-        reading = BroadcastReading(
-            can_id=frame.arbitration_id,
-            base=base,
-            idx=idx,
-            dlc=frame.dlc,
-            raw_data=bytes(frame.data),
-            raw_value=raw_value,
-            timestamp=time.time(),
-        )
-
-        return reading
+        return parse_broadcast_frame(frame)
 
     def collect(
         self,
@@ -329,13 +666,26 @@ class BroadcastMonitor:
             filter_func: Optional filter to select which readings to keep
 
         Returns:
-            BroadcastCache with collected readings
+            BroadcastCache with collected readings. While continuous
+            monitoring runs, this is a separate cache holding the readings
+            that arrived during the period; the live cache is not cleared.
         """
         if not self._adapter.is_open:
             raise RuntimeError("Adapter not connected")
 
-        self._cache.clear()
         start = time.time()
+        if self.running:
+            self._stop.wait(duration)
+            return BroadcastCache(
+                readings={
+                    can_id: reading
+                    for can_id, reading in self._cache.snapshot().readings.items()
+                    if reading.timestamp >= start
+                    and (filter_func is None or filter_func(reading))
+                }
+            )
+
+        self._cache.clear()
 
         while time.time() - start < duration:
             try:
@@ -344,17 +694,100 @@ class BroadcastMonitor:
                     reading = self._process_frame(frame)
                     if reading:
                         if filter_func is None or filter_func(reading):
-                            self._cache.update(reading)
-                            for callback in self._callbacks:
-                                try:
-                                    callback(reading)
-                                except Exception as e:
-                                    self._logger.warning("Callback error: %s", e)
+                            self._store(reading)
             except Exception as e:
                 self._logger.debug("Read error: %s", e)
 
         return self._cache
 
+    def collect_until(
+        self,
+        required_keys: Iterable[tuple[int, int]],
+        deadline: float = 5.0,
+        max_age: Optional[float] = None,
+    ) -> CollectionResult:
+        """Collect broadcasts until every required key has a reading.
+
+        Unlike collect(), this returns as soon as all keys are present
+        instead of always waiting the full duration. Works both with
+        continuous monitoring running (waits on the live cache) and
+        without it (reads frames from the adapter until done).
+
+        Args:
+            required_keys: (base, idx) pairs, e.g. get_default_sensor_map()
+            deadline: Maximum time to wait (seconds)
+            max_age: If given, cached readings at most this old (seconds)
+                count immediately; otherwise only readings arriving during
+                the call count
+
+        Returns:
+            CollectionResult with the readings found and the keys missed
+        """
+        if not self._adapter.is_open:
+            raise RuntimeError("Adapter not connected")
+
+        keys = list(dict.fromkeys(required_keys))
+        start = time.time()
+        unreachable = []
+        for key in keys:
+            period = self._periods.get(key)
+            if period is not None and period > deadline:
+                unreachable.append(key)
+                if key not in self._warned_unreachable:
+                    self._warned_unreachable.add(key)
+                    self._logger.warning(
+                        "Broadcast base=0x%04X idx=%d repeats every %.1fs, "
+                        "longer than the %.1fs deadline",
+                        key[0],
+                        key[1],
+                        period,
+                        deadline,
+                    )
+
+        waiter = _KeyWaiter(pending=set(keys), readings={})
+        with self._waiter_lock:
+            if max_age is not None:
+                cached = self._cache.get_many(keys, max_age=max_age, now=start)
+                for key, reading in cached.items():
+                    if reading is not None:
+                        waiter.pending.discard(key)
+                        waiter.readings[key] = reading
+            if waiter.pending:
+                self._waiters.append(waiter)
+            else:
+                waiter.done.set()
+
+        try:
+            if self.running:
+                waiter.done.wait(deadline)
+            else:
+                end = start + deadline
+                while not waiter.done.is_set():
+                    remaining = end - time.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        frame = self._adapter._read_frame(timeout=min(0.1, remaining))
+                        if frame:
+                            reading = self._process_frame(frame)
+                            if reading:
+                                self._store(reading)
+                    except Exception as e:
+                        self._logger.debug("Read error: %s", e)
+        finally:
+            with self._waiter_lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                missed = [key for key in keys if key in waiter.pending]
+                readings = dict(waiter.readings)
+
+        return CollectionResult(
+            readings=readings,
+            missed=missed,
+            unreachable=unreachable,
+            elapsed=time.time() - start,
+        )
+
     def collect_temperatures(self, duration: float = 5.0) -> list[BroadcastReading]:
         """
         Collect temperature readings for specified duration.
@@ -0,0 +1,160 @@
+"""Priority arbitration of CAN bus transactions.
+
+Several threads share one adapter: scheduled polls, user-triggered writes
+and reads, and long discovery scans. Holding one lock for a whole poll cycle
+makes a button press wait for the entire cycle. BusArbiter instead grants
+the bus per transaction (one RTR exchange, one write, or one pipelined
+window of a read_many() batch) to the waiting thread with the most urgent
+BusPriority; waiters of equal priority are served in arrival order. A write
+therefore waits for at most the transaction in progress.
+
+Threads declare the class of their work with using(); HeatPumpClient calls
+claim() around every transaction. Work that declares nothing counts as an
+interactive read.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Optional
+
+from .exceptions import TimeoutError
+
+
+class BusPriority(IntEnum):
+    """Priority classes, most urgent first."""
+
+    INTERACTIVE_WRITE = 0
+    INTERACTIVE_READ = 1
+    POLL = 2
+    DISCOVERY = 3
+
+
+class BusArbiter:
+    """Grants exclusive bus access per transaction by priority class.
+
+    Re-entrant per thread: a transaction that calls another client method
+    (e.g. a retrying read) keeps the bus instead of queueing behind itself.
+    """
+
+    def __init__(self, default: BusPriority = BusPriority.INTERACTIVE_READ) -> None:
+        """Initialize the arbiter.
+
+        Args:
+            default: Class of work on threads that did not call using()
+        """
+        self.default = default
+        self._cond = threading.Condition()
+        self._waiters: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._owner: Optional[int] = None
+        self._depth = 0
+        self._local = threading.local()
+        self._grants = dict.fromkeys(BusPriority, 0)
+        self._wait_total = dict.fromkeys(BusPriority, 0.0)
+        self._wait_max = dict.fromkeys(BusPriority, 0.0)
+
+    @property
+    def priority(self) -> BusPriority:
+        """Class of work declared by the calling thread."""
+        return getattr(self._local, "priority", self.default)
+
+    @contextmanager
+    def using(self, priority: BusPriority) -> Iterator[None]:
+        """Declare the class of the calling thread's bus work within the block."""
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            if previous is None:
+                del self._local.priority
+            else:
+                self._local.priority = previous
+
+    def acquire(
+        self, priority: Optional[BusPriority] = None, timeout: Optional[float] = None
+    ) -> None:
+        """Wait for the bus.
+
+        Args:
+            priority: Class of the transaction (default: the thread's class)
+            timeout: Longest wait in seconds (default: wait forever)
+
+        Raises:
+            TimeoutError: If the bus was not granted within ``timeout``
+        """
+        me = threading.get_ident()
+        cls = self.priority if priority is None else priority
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return
+            ticket = (int(cls), next(self._seq))
+            heapq.heappush(self._waiters, ticket)
+            start = time.monotonic()
+            granted = self._cond.wait_for(
+                lambda: self._owner is None and self._waiters[0] == ticket,
+                timeout=timeout,
+            )
+            if not granted:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise TimeoutError(
+                    f"Bus not granted within {timeout}s",
+                    context={"priority": cls.name},
+                )
+            heapq.heappop(self._waiters)
+            self._owner = me
+            self._depth = 1
+            waited = time.monotonic() - start
+            self._grants[cls] += 1
+            self._wait_total[cls] += waited
+            self._wait_max[cls] = max(self._wait_max[cls], waited)
+
+    def release(self) -> None:
+        """Release the bus (after acquire())."""
+        with self._cond:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("release() by a thread that does not own the bus")
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def claim(
+        self, priority: Optional[BusPriority] = None, timeout: Optional[float] = None
+    ) -> Iterator[None]:
+        """Hold the bus for one transaction."""
+        self.acquire(priority, timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> dict[str, Any]:
+        """Grants and queue wait per class (JSON-serializable)."""
+        with self._cond:
+            return {
+                "waiting": len(self._waiters),
+                "classes": {
+                    cls.name.lower(): {
+                        "grants": self._grants[cls],
+                        "wait_avg_ms": (
+                            round(self._wait_total[cls] / self._grants[cls] * 1000, 1)
+                            if self._grants[cls]
+                            else None
+                        ),
+                        "wait_max_ms": round(self._wait_max[cls] * 1000, 1),
+                    }
+                    for cls in BusPriority
+                },
+            }
@@ -3,19 +3,14 @@
 This module provides persistent caching of discovered parameters to avoid
 the slow (~30 second) discovery protocol on every connection.
 
-Cache structure (JSON):
-{
-    "version": "1.0.0",
-    "created": "2025-12-18T10:30:00Z",
-    "device_id": "BUDERUS_WPS_SN12345",
-    "firmware": "v1.23",
-    "checksum": "sha256:abc123...",
-    "element_count": 1789,
-    "parameters": [...]
-}
+Parameters are stored in the binary cache format of binary_cache:
+fixed-width records plus a string table, with the creation time, device
+id and firmware in the metadata section and a SHA-256 checksum in the
+header. The file is validated and decoded in one pass, and an unchanged
+file is not read again.
 
 Example:
-    >>> cache = ParameterCache(Path("~/.cache/buderus/params.json"))
+    >>> cache = ParameterCache(Path("~/.cache/buderus/params.bin"))
     >>> if cache.is_valid():
     ...     params = cache.load()
     ... else:
@@ -23,33 +18,39 @@ Example:
     ...     cache.save(params)
 """
 
-import hashlib
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from .binary_cache import (
+    FORMAT_VERSION,
+    CacheContents,
+    CacheFormatError,
+    read_cache,
+    write_cache,
+)
+
 
 class ParameterCache:
     """Manages persistent cache of discovered parameters.
 
-    The cache stores parameter definitions in JSON format with checksum
-    validation to detect corruption. This enables fast reconnection by
-    avoiding the slow discovery protocol.
+    The cache stores parameter definitions in the binary cache format with
+    checksum validation to detect corruption. This enables fast
+    reconnection by avoiding the slow discovery protocol.
 
     Attributes:
         CACHE_VERSION: Current cache format version
         cache_path: Path to cache file
 
     Example:
-        >>> cache = ParameterCache(Path("/tmp/params.json"))
+        >>> cache = ParameterCache(Path("/tmp/params.bin"))
         >>> cache.save([{"idx": 0, "text": "PARAM_0", ...}])
         >>> print(cache.is_valid())
         True
         >>> params = cache.load()
     """
 
-    CACHE_VERSION = "1.0.0"
+    CACHE_VERSION = FORMAT_VERSION
 
     def __init__(self, cache_path: Path):
         """Initialize cache with file path.
@@ -58,48 +59,24 @@ class ParameterCache:
             cache_path: Path to cache file (will be created on save)
         """
         self.cache_path = cache_path
+        # Contents of the last read and the file identity (inode, mtime,
+        # size) they were read at; saves replace the file, changing the inode
+        self._contents: Optional[CacheContents] = None
+        self._stamp: Optional[tuple[int, int, int]] = None
 
     def is_valid(self) -> bool:
         """Check if cache exists and is valid.
 
         Validates:
         - File exists
-        - Valid JSON structure
-        - Version matches current version
-        - Checksum validates parameters
+        - Magic and version match the current format
+        - Sizes match the header
+        - Checksum validates the file body
 
         Returns:
             True if cache is valid and can be loaded
         """
-        if not self.cache_path.exists():
-            return False
-
-        try:
-            with open(self.cache_path) as f:
-                data = json.load(f)
-
-            # Check required fields
-            if not isinstance(data, dict):
-                return False
-
-            if data.get("version") != self.CACHE_VERSION:
-                return False
-
-            if "parameters" not in data:
-                return False
-
-            if "checksum" not in data:
-                return False
-
-            # Validate checksum
-            expected_checksum = self._compute_checksum(data["parameters"])
-            if data["checksum"] != expected_checksum:
-                return False
-
-            return True
-
-        except (json.JSONDecodeError, OSError, KeyError):
-            return False
+        return self._read() is not None
 
     def load(self) -> Optional[list[dict]]:
         """Load parameters from cache.
@@ -107,16 +84,13 @@ class ParameterCache:
         Returns:
             List of parameter dicts if cache is valid, None otherwise
         """
-        if not self.is_valid():
-            return None
+        contents = self._read()
+        return contents.records if contents is not None else None
 
-        try:
-            with open(self.cache_path) as f:
-                data = json.load(f)
-            result: Optional[list[dict[Any, Any]]] = data.get("parameters")
-            return result
-        except (json.JSONDecodeError, OSError):
-            return None
+    def metadata(self) -> Optional[dict[str, Any]]:
+        """Metadata of a valid cache (created, device_id, firmware), else None."""
+        contents = self._read()
+        return contents.meta if contents is not None else None
 
     def save(
         self,
@@ -126,8 +100,8 @@ class ParameterCache:
     ) -> bool:
         """Save parameters to cache.
 
-        Creates or overwrites cache file with parameter data. Includes
-        checksum for integrity validation on load.
+        Creates or atomically replaces the cache file with parameter data.
+        Includes a checksum for integrity validation on load.
 
         Args:
             parameters: List of parameter dicts
@@ -137,65 +111,50 @@ class ParameterCache:
         Returns:
             True if save successful, False on error
         """
+        meta: dict[str, Any] = {
+            "created": datetime.now(timezone.utc).isoformat(),
+        }
+        if device_id is not None:
+            meta["device_id"] = device_id
+        if firmware is not None:
+            meta["firmware"] = firmware
+
         try:
             # Ensure parent directory exists
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Build cache data
-            data = {
-                "version": self.CACHE_VERSION,
-                "created": datetime.utcnow().isoformat(),
-                "element_count": len(parameters),
-                "checksum": self._compute_checksum(parameters),
-                "parameters": parameters,
-            }
-
-            if device_id is not None:
-                data["device_id"] = device_id
-
-            if firmware is not None:
-                data["firmware"] = firmware
-
-            # Write to file
-            with open(self.cache_path, "w") as f:
-                json.dump(data, f, indent=2)
-
-            return True
-
-        except OSError:
+            write_cache(self.cache_path, parameters, meta)
+        except (OSError, CacheFormatError):
             return False
+        self._contents = None
+        self._stamp = None
+        return True
 
     def invalidate(self) -> None:
         """Remove cache file.
 
         Call this when cache should be regenerated (e.g., firmware change).
         """
+        self._contents = None
+        self._stamp = None
         try:
             if self.cache_path.exists():
                 self.cache_path.unlink()
         except OSError:
             pass  # Ignore errors during invalidation
 
-    @staticmethod
-    def _compute_checksum(parameters: list[dict]) -> str:
-        """Compute SHA256 checksum of parameters.
-
-        Creates a deterministic hash of the parameter data for
-        integrity validation.
-
-        Args:
-            parameters: List of parameter dicts
-
-        Returns:
-            Checksum string in format "sha256:hexdigest"
-        """
-        # Sort parameters by idx for deterministic ordering
-        sorted_params = sorted(parameters, key=lambda p: p.get("idx", 0))
-
-        # Create deterministic JSON representation
-        json_str = json.dumps(sorted_params, sort_keys=True, separators=(",", ":"))
-
-        # Compute SHA256
-        digest = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
-
-        return f"sha256:{digest}"
+    def _read(self) -> Optional[CacheContents]:
+        """Contents of the cache file, re-read only if the file changed."""
+        try:
+            stat = self.cache_path.stat()
+        except OSError:
+            self._contents = None
+            self._stamp = None
+            return None
+        stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if stamp != self._stamp:
+            try:
+                self._contents = read_cache(self.cache_path)
+            except (OSError, CacheFormatError):
+                self._contents = None
+            self._stamp = stamp
+        return self._contents
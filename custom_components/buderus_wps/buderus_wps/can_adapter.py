@@ -11,9 +11,11 @@ Protocol References:
 import atexit
 import logging
 import os
+import select
 import threading
 import time
-from typing import Literal, Optional
+from concurrent import futures
+from typing import Callable, Literal, Optional
 from unittest.mock import Mock
 
 try:
@@ -24,6 +26,7 @@ except ImportError:
     )
 
 from .can_message import CANMessage
+from .demultiplexer import FrameDemultiplexer
 from .exceptions import (
     DeviceCommunicationError,
     DeviceDisconnectedError,
@@ -32,6 +35,32 @@ from .exceptions import (
     DevicePermissionError,
     TimeoutError,
 )
+from .metrics import BusMetrics
+from .slcan_framer import SlcanFramer
+
+# PROTOCOL: USBtin SLCAN initialization sequence
+USBTIN_INIT_COMMANDS = [
+    b"C\r",  # Close channel (1st)
+    b"C\r",  # Close channel (2nd, safety)
+    b"V\r",  # Hardware version (1st)
+    b"V\r",  # Hardware version (2nd)
+    b"v\r",  # Firmware version
+    b"S4\r",  # Set bitrate to 125 kbps (Buderus standard)
+    b"O\r",  # Open channel
+]
+
+# Serial read timeout used by the background reader thread. The driver wakes
+# the reader as soon as a byte arrives; this only bounds shutdown latency.
+READER_READ_TIMEOUT = 0.1
+
+# Idle gap that ends a receive_stream() once data has started arriving
+STREAM_IDLE_TIMEOUT = 0.2
+
+# Sleep between reads when the port offers no pollable file descriptor
+# (read_mode="poll", mocked serials, non-POSIX platforms)
+POLL_INTERVAL = 0.01
+
+ReadMode = Literal["select", "poll"]
 
 
 class USBtinAdapter:
@@ -54,6 +83,8 @@ class USBtinAdapter:
         read_only: bool = False,
         logger: Optional[logging.Logger] = None,
         skip_init: bool = False,
+        read_mode: ReadMode = "select",
+        metrics: Optional[BusMetrics] = None,
     ) -> None:
         """Initialize USBtin adapter (does not open connection).
 
@@ -63,6 +94,10 @@ class USBtinAdapter:
             timeout: Operation timeout in seconds (0.1-60.0, default: 5.0)
             read_only: If True, disable transmit operations (receive-only/monitor mode)
             logger: Optional logger for debug output (defaults to module logger)
+            skip_init: Skip the SLCAN initialization sequence
+            read_mode: "select" waits on the serial fd until data arrives;
+                "poll" sleeps between reads (fallback when no fd is available)
+            metrics: Shared BusMetrics instance (default: a new one)
 
         Raises:
             ValueError: Invalid port, baudrate, or timeout parameters
@@ -83,6 +118,9 @@ class USBtinAdapter:
         if timeout > 60.0:
             raise ValueError(f"Timeout must not exceed 60 seconds, got {timeout}")
 
+        if read_mode not in ("select", "poll"):
+            raise ValueError(f"read_mode must be 'select' or 'poll', got {read_mode!r}")
+
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
@@ -90,6 +128,8 @@ class USBtinAdapter:
             raise ValueError("read_only must be a boolean")
         self.read_only = read_only
         self.skip_init = skip_init
+        self.read_mode = read_mode
+        self.metrics = metrics if metrics is not None else BusMetrics()
         self._logger = logger or logging.getLogger(__name__)
         # Allow stabilization delay override for test/hardware tuning
         stabilization_env = os.getenv("USBTIN_STABILIZATION_DELAY")
@@ -105,8 +145,18 @@ class USBtinAdapter:
 
         # Internal state
         self._serial: Optional[serial.Serial] = None
+        self._read_fd: Optional[int] = None
         self._in_operation = False
         self._op_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        # Background reader state (see start_reader)
+        self._demux = FrameDemultiplexer()
+        self._reader_thread: Optional[threading.Thread] = None
+        self._reader_stop = threading.Event()
+
+        # Receive buffer for the polling read paths (reset on flush)
+        self._rx_framer = SlcanFramer(fallback=self._parse_fallback)
 
         # Register cleanup handler
         atexit.register(self._atexit_cleanup)
@@ -125,6 +175,16 @@ class USBtinAdapter:
         """Human-friendly connection status string."""
         return "connected" if self.is_open else "closed"
 
+    @property
+    def reader_running(self) -> bool:
+        """True while the background reader thread owns the serial port."""
+        return self._reader_thread is not None and self._reader_thread.is_alive()
+
+    @property
+    def demultiplexer(self) -> FrameDemultiplexer:
+        """Frame router fed by the background reader thread."""
+        return self._demux
+
     def connect(self) -> "USBtinAdapter":
         """Open serial connection and initialize USBtin adapter.
 
@@ -189,6 +249,8 @@ class USBtinAdapter:
                 context={"port": self.port, "error": str(e)},
             )
 
+        self._read_fd = self._resolve_read_fd()
+
         try:
             # Wait for device stabilization
             if self.stabilization_delay > 0:
@@ -196,15 +258,7 @@ class USBtinAdapter:
 
             # Initialization sequence (can be skipped when skip_init=True)
             if not self.skip_init:
-                init_commands = [
-                    b"C\r",  # Close channel (1st)
-                    b"C\r",  # Close channel (2nd, safety)
-                    b"V\r",  # Hardware version (1st)
-                    b"V\r",  # Hardware version (2nd)
-                    b"v\r",  # Firmware version
-                    b"S4\r",  # Set bitrate to 125 kbps (Buderus standard)
-                    b"O\r",  # Open channel
-                ]
+                init_commands = USBTIN_INIT_COMMANDS
                 allow_nak_close = 2  # tolerate NAK on both close attempts if channel already closed/in use
                 allow_nak_version = 1  # tolerate one NAK on version query
                 for cmd in init_commands:
@@ -263,6 +317,14 @@ class USBtinAdapter:
         if not self.is_open:
             return
 
+        self.stop_reader()
+        self._demux.fail_all(
+            DeviceDisconnectedError(
+                "Adapter disconnected while waiting for response",
+                context={"port": self.port},
+            )
+        )
+
         try:
             # Send close command to adapter
             if self._serial and self._serial.is_open:
@@ -281,6 +343,7 @@ class USBtinAdapter:
 
         finally:
             self._serial = None
+            self._read_fd = None
             self._in_operation = False
             self._logger.debug("Disconnected serial port %s", self.port)
 
@@ -328,6 +391,81 @@ class USBtinAdapter:
         except Exception:
             pass  # Ignore all errors during exit
 
+    def start_reader(self) -> None:
+        """Start the background reader thread.
+
+        Once started, a single daemon thread continuously drains the serial
+        port, parses SLCAN frames and hands them to the FrameDemultiplexer.
+        All receive paths (_read_frame, receive_frame, receive_stream,
+        send_request) are served from the demultiplexer instead of polling
+        the port, so concurrent callers no longer fail with "Operation
+        already in progress" and no traffic is discarded by flushing.
+
+        Calling this while the reader is already running is a no-op.
+
+        Raises:
+            DeviceCommunicationError: Device not connected
+        """
+        if not self.is_open or not self._serial:
+            raise DeviceCommunicationError(
+                "Device not connected", context={"port": self.port}
+            )
+        if self.reader_running:
+            return
+
+        self._reader_stop.clear()
+        self._serial.timeout = READER_READ_TIMEOUT
+        self._reader_thread = threading.Thread(
+            target=self._reader_loop,
+            name=f"usbtin-reader-{self.port}",
+            daemon=True,
+        )
+        self._reader_thread.start()
+        self._logger.debug("Started background reader for %s", self.port)
+
+    def stop_reader(self, timeout: float = 1.0) -> None:
+        """Stop the background reader thread (idempotent).
+
+        Args:
+            timeout: Maximum time to wait for the thread to exit (seconds)
+        """
+        thread = self._reader_thread
+        if thread is None:
+            return
+        self._reader_stop.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+        self._reader_thread = None
+        self._logger.debug("Stopped background reader for %s", self.port)
+
+    def _reader_loop(self) -> None:
+        """Drain the serial port and dispatch frames until stopped."""
+        serial_port = self._serial
+        framer = SlcanFramer(fallback=self._parse_fallback)
+        try:
+            while not self._reader_stop.is_set() and serial_port is not None:
+                # Blocks in the driver until a byte arrives (or the read
+                # timeout expires), then picks up everything else queued.
+                chunk = serial_port.read(serial_port.in_waiting or 1)
+                if not chunk:
+                    continue
+                framer.feed(chunk)
+                # Transmit acks (z/Z) and other non-frame replies are skipped
+                frames = framer.drain()
+                self.metrics.record_rx(len(frames), len(chunk))
+                for msg in frames:
+                    self._demux.dispatch(msg)
+        except (serial.SerialException, OSError) as e:
+            if self._reader_stop.is_set():
+                return
+            self._logger.error("Background reader for %s failed: %s", self.port, e)
+            self._demux.fail_all(
+                DeviceDisconnectedError(
+                    f"Serial read error: {e}",
+                    context={"port": self.port, "error": str(e)},
+                )
+            )
+
     def _write_command(self, command: bytes) -> None:
         """Write command to serial port.
 
@@ -344,7 +482,9 @@ class USBtinAdapter:
 
         try:
             self._logger.debug("TX raw: %s", command)
-            self._serial.write(command)
+            with self._write_lock:
+                self._serial.write(command)
+            self.metrics.record_tx(len(command), frame=command[:1] in b"tTrR")
         except serial.SerialTimeoutException:
             raise DeviceDisconnectedError(
                 "Write timeout - device may be disconnected",
@@ -383,23 +523,22 @@ class USBtinAdapter:
                 "Cannot read: serial port not open", context={"port": self.port}
             )
 
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         response = b""
 
         try:
-            while time.time() - start_time < timeout:
-                # Always read at least one byte to allow mocked serials with
-                # in_waiting=0 to return their configured response.
-                to_read = self._serial.in_waiting or 1
-                chunk = self._serial.read(to_read)
+            while time.monotonic() < deadline:
+                chunk = self._read_available(deadline)
                 if chunk:
+                    self.metrics.record_rx(0, len(chunk))
                     response += chunk
 
                     # Check for terminator
                     if b"\r" in response or b"\a" in response:
                         break
 
-                time.sleep(0.01)  # 10ms poll interval
+                if self._read_fd is None:
+                    time.sleep(POLL_INTERVAL)
 
             if response:
                 self._logger.debug("RX raw: %s", response)
@@ -410,6 +549,48 @@ class USBtinAdapter:
                 f"Serial read error: {e}", context={"port": self.port, "error": str(e)}
             )
 
+    def _resolve_read_fd(self) -> Optional[int]:
+        """Return the serial fd to wait on in select mode, or None to poll."""
+        if self.read_mode != "select" or os.name != "posix":
+            return None
+        try:
+            fd = self._serial.fileno()  # type: ignore[union-attr]
+        except (AttributeError, OSError, ValueError):
+            return None
+        # Mocked serials return Mock objects here; only real fds qualify
+        return fd if isinstance(fd, int) and fd >= 0 else None
+
+    def _wait_readable(self, fd: int, deadline: float) -> bool:
+        """Block until ``fd`` is readable or the monotonic deadline passes.
+
+        Returns:
+            True if data is available to read
+        """
+        if self._serial.in_waiting:  # type: ignore[union-attr]
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        readable, _, _ = select.select([fd], [], [], remaining)
+        return bool(readable)
+
+    def _read_available(self, deadline: float) -> bytes:
+        """Read whatever the port has buffered, waiting until ``deadline``.
+
+        In select mode this wakes as soon as the driver has data and returns
+        b"" once the deadline passes. Without a pollable fd it performs a
+        single read of at least one byte (subject to the serial timeout) and
+        the caller sleeps POLL_INTERVAL between attempts.
+        """
+        serial_port = self._serial
+        assert serial_port is not None
+        fd = self._read_fd
+        if fd is not None and not self._wait_readable(fd, deadline):
+            return b""
+        # Always read at least one byte to allow mocked serials with
+        # in_waiting=0 to return their configured response.
+        return bytes(serial_port.read(serial_port.in_waiting or 1))
+
     def _read_frame(self, timeout: float = 5.0) -> Optional[CANMessage]:
         """Read a single CAN frame from the serial port with timeout (T041).
 
@@ -430,58 +611,38 @@ class USBtinAdapter:
                 "Device not connected", context={"port": self.port}
             )
 
-        start_time = time.time()
-        buffer = b""
+        if self.reader_running:
+            # The reader thread owns the port; take the next unclaimed frame
+            return self._demux.next_unclaimed(timeout)
+
+        deadline = time.monotonic() + timeout
+        framer = self._rx_framer
 
         try:
-            while time.time() - start_time < timeout:
-                to_read = self._serial.in_waiting or 1
+            # Frames left over from an earlier multi-frame read come first
+            msg = framer.next_frame()
+            if msg is not None:
+                self.metrics.record_rx(1, 0)
+                return msg
+
+            while time.monotonic() < deadline:
                 try:
-                    chunk = self._serial.read(to_read)
+                    chunk = self._read_available(deadline)
                 except StopIteration:
                     chunk = b""
                 if chunk:
-                    buffer += chunk
-
-                    # Check for complete frame (terminated by \r)
-                    if b"\r" in buffer:
-                        # Extract frame up to terminator
-                        frame_bytes, remaining = buffer.split(b"\r", 1)
-                        buffer = remaining  # Keep remaining data for next read
-
-                        # Parse and return frame
-                        frame_str = frame_bytes.decode("ascii", errors="ignore").strip()
-                        self._logger.debug("RX frame: %r", frame_str)
-                        if frame_str:
-                            try:
-                                msg = CANMessage.from_usbtin_format(frame_str)
-                                self._logger.debug(
-                                    "Parsed CAN: id=0x%X dlc=%d data=%s",
-                                    msg.arbitration_id,
-                                    msg.dlc,
-                                    msg.data.hex() if msg.data else "",
-                                )
-                                return msg
-                            except Exception as e:
-                                self._logger.debug(
-                                    "Parse failed: %s, trying lenient", e
-                                )
-                                lenient_msg = self._lenient_parse_frame(frame_str)
-                                if lenient_msg:
-                                    self._logger.debug(
-                                        "Lenient parsed: id=0x%X dlc=%d data=%s",
-                                        lenient_msg.arbitration_id,
-                                        lenient_msg.dlc,
-                                        (
-                                            lenient_msg.data.hex()
-                                            if lenient_msg.data
-                                            else ""
-                                        ),
-                                    )
-                                    return lenient_msg
-
-                # Poll every 10ms for real-time CAN
-                time.sleep(0.01)
+                    self.metrics.record_rx(0, len(chunk))
+                    framer.feed(chunk)
+                    msg = framer.next_frame()
+                    if msg is not None:
+                        self.metrics.record_rx(1, 0)
+                        self._logger.debug(
+                            "RX frame: id=0x%X dlc=%d", msg.arbitration_id, msg.dlc
+                        )
+                        return msg
+
+                if self._read_fd is None:
+                    time.sleep(POLL_INTERVAL)
 
             # Timeout - no complete frame received
             return None
@@ -493,12 +654,42 @@ class USBtinAdapter:
         except Exception as e:
             raise DeviceCommunicationError(
                 f"Frame parsing error: {e}",
-                context={
-                    "port": self.port,
-                    "buffer": buffer.decode("ascii", errors="ignore"),
-                },
+                context={"port": self.port, "buffered": len(framer)},
             )
 
+    def _parse_frame_str(self, frame_str: str) -> Optional[CANMessage]:
+        """Parse an SLCAN frame string, falling back to lenient parsing.
+
+        Returns:
+            CANMessage, or None if the line is not a parseable frame
+        """
+        try:
+            msg = CANMessage.from_usbtin_format(frame_str)
+            self._logger.debug(
+                "Parsed CAN: id=0x%X dlc=%d data=%s",
+                msg.arbitration_id,
+                msg.dlc,
+                msg.data.hex() if msg.data else "",
+            )
+            return msg
+        except Exception as e:
+            self._logger.debug("Parse failed: %s, trying lenient", e)
+            self.metrics.incr("lenient_parses")
+            lenient_msg = self._lenient_parse_frame(frame_str)
+            if lenient_msg:
+                self._logger.debug(
+                    "Lenient parsed: id=0x%X dlc=%d data=%s",
+                    lenient_msg.arbitration_id,
+                    lenient_msg.dlc,
+                    lenient_msg.data.hex() if lenient_msg.data else "",
+                )
+            return lenient_msg
+
+    def _parse_fallback(self, line: bytes) -> Optional[CANMessage]:
+        """SlcanFramer fallback for lines the strict byte parser rejected."""
+        self.metrics.incr("lenient_parses")
+        return self._lenient_parse_frame(line.decode("ascii", errors="ignore"))
+
     def _lenient_parse_frame(self, frame_str: str) -> Optional[CANMessage]:
         """Attempt a lenient parse for malformed SLCAN frames."""
         try:
@@ -554,6 +745,24 @@ class USBtinAdapter:
                 "Adapter is in read-only mode; sending frames is disabled."
             )
 
+        if self.reader_running:
+            effective_timeout = timeout if timeout is not None else self.timeout
+            self.flush_input_buffer()
+            self._write_command(message.to_usbtin_format().encode("ascii"))
+            response = self._read_frame(timeout=effective_timeout)
+            if response is None:
+                self.metrics.incr("timeouts")
+                raise TimeoutError(
+                    "No response received within timeout",
+                    context={
+                        "port": self.port,
+                        "timeout": effective_timeout,
+                        "request_id": f"0x{message.arbitration_id:X}",
+                        "extended": message.is_extended_id,
+                    },
+                )
+            return response
+
         # Guard against concurrent operations
         if not self._op_lock.acquire(blocking=False):
             raise RuntimeError("Operation already in progress")
@@ -578,6 +787,7 @@ class USBtinAdapter:
             response = self._read_frame(timeout=effective_timeout)
 
             if response is None:
+                self.metrics.incr("timeouts")
                 raise TimeoutError(
                     "No response received within timeout",
                     context={
@@ -626,6 +836,84 @@ class USBtinAdapter:
         )
         self._write_command(slcan_frame.encode("ascii"))
 
+    def send_request(
+        self,
+        message: CANMessage,
+        response_id: int,
+        timeout: Optional[float] = None,
+    ) -> CANMessage:
+        """Send a request and wait for the response with a specific CAN ID.
+
+        With the background reader running, a waiter for ``response_id`` is
+        registered before transmitting, so the round trip is bounded by wire
+        latency and unrelated traffic is left for other consumers. Without
+        the reader, frames are polled until the matching ID arrives.
+
+        Args:
+            message: CANMessage to send (typically an RTR)
+            response_id: Arbitration ID of the expected response
+            timeout: Maximum time to wait for the response (seconds)
+
+        Returns:
+            Response CANMessage with arbitration_id == response_id
+
+        Raises:
+            DeviceCommunicationError: Device not connected
+            PermissionError: Adapter is in read-only mode
+            TimeoutError: No matching response within timeout
+        """
+        if not self.is_open or not self._serial:
+            raise DeviceCommunicationError(
+                "Device not connected", context={"port": self.port}
+            )
+        if self.read_only:
+            raise PermissionError(
+                "Adapter is in read-only mode; sending frames is disabled."
+            )
+
+        effective_timeout = timeout if timeout is not None else self.timeout
+        timeout_context = {
+            "port": self.port,
+            "timeout": effective_timeout,
+            "request_id": f"0x{message.arbitration_id:X}",
+            "response_id": f"0x{response_id:X}",
+        }
+
+        if self.reader_running:
+            future = self._demux.expect(response_id)
+            try:
+                self._write_command(message.to_usbtin_format().encode("ascii"))
+                return future.result(timeout=effective_timeout)
+            except futures.TimeoutError as e:
+                self.metrics.incr("timeouts")
+                raise TimeoutError(
+                    "No response received within timeout", context=timeout_context
+                ) from e
+            finally:
+                self._demux.cancel(response_id, future)
+
+        # Polling fallback: same exclusive-port rules as send_frame
+        if not self._op_lock.acquire(blocking=False):
+            raise RuntimeError("Operation already in progress")
+
+        try:
+            self.flush_input_buffer()
+            self._write_command(message.to_usbtin_format().encode("ascii"))
+            deadline = time.monotonic() + effective_timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.metrics.incr("timeouts")
+                    raise TimeoutError(
+                        "No response received within timeout", context=timeout_context
+                    )
+                frame = self._read_frame(timeout=remaining)
+                if frame is not None and frame.arbitration_id == response_id:
+                    return frame
+        finally:
+            if self._op_lock.locked():
+                self._op_lock.release()
+
     def receive_frame(self, timeout: Optional[float] = None) -> CANMessage:
         """Receive CAN frame passively (T043).
 
@@ -647,6 +935,17 @@ class USBtinAdapter:
                 "Device not connected", context={"port": self.port}
             )
 
+        if self.reader_running:
+            effective_timeout = timeout if timeout is not None else self.timeout
+            frame = self._read_frame(timeout=effective_timeout)
+            if frame is None:
+                self.metrics.incr("timeouts")
+                raise TimeoutError(
+                    "No frame received within timeout",
+                    context={"port": self.port, "timeout": effective_timeout},
+                )
+            return frame
+
         # Guard against concurrent operations
         if not self._op_lock.acquire(blocking=False):
             raise RuntimeError("Operation already in progress")
@@ -657,6 +956,7 @@ class USBtinAdapter:
             frame = self._read_frame(timeout=effective_timeout)
 
             if frame is None:
+                self.metrics.incr("timeouts")
                 raise TimeoutError(
                     "No frame received within timeout",
                     context={"port": self.port, "timeout": effective_timeout},
@@ -673,6 +973,7 @@ class USBtinAdapter:
         expected_bytes: int,
         timeout: float = 10.0,
         frame_filter: Optional[int] = None,
+        on_data: Optional[Callable[[bytes], None]] = None,
     ) -> bytes:
         """Receive multiple frames as a continuous byte stream.
 
@@ -683,6 +984,8 @@ class USBtinAdapter:
             expected_bytes: Approximate number of bytes expected
             timeout: Maximum time to wait for all data
             frame_filter: Optional CAN ID to filter (only frames matching this ID)
+            on_data: Optional callback receiving payload bytes as they arrive,
+                so the caller can process the stream before it completes
 
         Returns:
             Accumulated data bytes from all received frames
@@ -696,14 +999,20 @@ class USBtinAdapter:
                 "Device not connected", context={"port": self.port}
             )
 
+        if self.reader_running:
+            return self._receive_stream_from_reader(
+                expected_bytes, timeout, frame_filter, on_data
+            )
+
         # Guard against concurrent operations
         if not self._op_lock.acquire(blocking=False):
             raise RuntimeError("Operation already in progress")
 
         try:
             data = bytearray()
-            raw_buffer = bytearray()
+            framer = SlcanFramer()
             start_time = time.time()
+            deadline = time.monotonic() + timeout
             idle_count = 0
             max_idle = (
                 200  # Allow 200 idle cycles (200ms) for slower devices/bus congestion
@@ -714,14 +1023,32 @@ class USBtinAdapter:
                 if elapsed > timeout:
                     break
 
+                if self._read_fd is not None:
+                    # Sleep in select() until bytes arrive; a quiet period of
+                    # STREAM_IDLE_TIMEOUT after data has arrived ends the stream
+                    idle_end = min(deadline, time.monotonic() + STREAM_IDLE_TIMEOUT)
+                    chunk = self._read_available(idle_end)
+                    if not chunk:
+                        if data:
+                            break  # Stream went idle after data arrived
+                        continue
+                    framer.feed(chunk)
+                    received = len(data)
+                    self.metrics.record_rx(
+                        framer.drain_payloads(data, frame_filter), len(chunk)
+                    )
+                    if on_data is not None and len(data) > received:
+                        on_data(bytes(data[received:]))
+                    continue
+
                 # Read all available data from serial (fast bulk read)
                 available = self._serial.in_waiting
                 if available > 0:
                     chunk = self._serial.read(available)
                     if chunk:
-                        raw_buffer.extend(chunk)
+                        self.metrics.record_rx(0, len(chunk))
+                        framer.feed(chunk)
                         idle_count = 0
-                        time.time()
                 else:
                     # Very brief pause - 1ms for tight polling
                     time.sleep(0.001)
@@ -734,33 +1061,12 @@ class USBtinAdapter:
                         idle_count = 0  # Reset and keep trying
                     continue
 
-                # Parse complete frames from buffer (do this even without new data)
-                while b"\r" in raw_buffer:
-                    frame_end = raw_buffer.index(b"\r")
-                    frame_bytes = bytes(raw_buffer[:frame_end])
-                    raw_buffer = raw_buffer[frame_end + 1 :]
-
-                    if not frame_bytes:
-                        continue
-
-                    try:
-                        frame_str = frame_bytes.decode("ascii", errors="ignore").strip()
-                        if not frame_str:
-                            continue
-
-                        msg = CANMessage.from_usbtin_format(frame_str)
-
-                        # Apply filter if specified
-                        if frame_filter is not None:
-                            if msg.arbitration_id != frame_filter:
-                                continue
-
-                        # Accumulate data
-                        if msg.data:
-                            data.extend(msg.data)
-                    except Exception:
-                        # Skip malformed frames
-                        continue
+                # Decode payloads of all complete frames in place; malformed
+                # frames are skipped
+                received = len(data)
+                self.metrics.record_rx(framer.drain_payloads(data, frame_filter), 0)
+                if on_data is not None and len(data) > received:
+                    on_data(bytes(data[received:]))
 
             # Log what we got
             self._logger.debug(
@@ -770,6 +1076,7 @@ class USBtinAdapter:
             )
 
             if len(data) == 0:
+                self.metrics.incr("timeouts")
                 raise TimeoutError(
                     "No stream data received within timeout",
                     context={
@@ -785,12 +1092,67 @@ class USBtinAdapter:
             if self._op_lock.locked():
                 self._op_lock.release()
 
+    def _receive_stream_from_reader(
+        self,
+        expected_bytes: int,
+        timeout: float,
+        frame_filter: Optional[int],
+        on_data: Optional[Callable[[bytes], None]] = None,
+    ) -> bytes:
+        """receive_stream() implementation backed by the background reader."""
+        # Frames that arrived between the request and this call are still in
+        # the unclaimed backlog; move them into the subscription first.
+        subscription = self._demux.subscribe(frame_filter, include_backlog=True)
+        try:
+            data = bytearray()
+            start_time = time.monotonic()
+            deadline = start_time + timeout
+            while len(data) < expected_bytes:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                wait = min(remaining, STREAM_IDLE_TIMEOUT) if data else remaining
+                msg = subscription.get(timeout=wait)
+                if msg is None:
+                    if data:
+                        break  # Stream went idle after data arrived
+                    continue
+                if msg.data:
+                    data.extend(msg.data)
+                    if on_data is not None:
+                        on_data(bytes(msg.data))
+        finally:
+            self._demux.unsubscribe(subscription)
+
+        self._logger.debug(
+            "Stream complete: %d bytes in %.2fs",
+            len(data),
+            time.monotonic() - start_time,
+        )
+
+        if len(data) == 0:
+            self.metrics.incr("timeouts")
+            raise TimeoutError(
+                "No stream data received within timeout",
+                context={
+                    "port": self.port,
+                    "timeout": timeout,
+                    "filter": f"0x{frame_filter:08X}" if frame_filter else None,
+                },
+            )
+
+        return bytes(data)
+
     def flush_input_buffer(self) -> None:
         """Flush serial input buffer to clear old data (T044).
 
         Discards any pending data in the serial input buffer. Useful before
         sending a new request to ensure old responses don't interfere.
 
+        With the background reader running, only the unclaimed backlog is
+        discarded; the port itself is left alone so frames already addressed
+        to registered waiters and subscriptions are not lost.
+
         Raises:
             DeviceCommunicationError: Device not connected
         """
@@ -799,10 +1161,23 @@ class USBtinAdapter:
                 "Device not connected", context={"port": self.port}
             )
 
+        if self.reader_running:
+            self.metrics.incr("flush_discarded_frames", self._demux.clear_unclaimed())
+            return
+
+        discarded = len(self._rx_framer)
+        self._rx_framer.reset()
+
         try:
+            pending = self._serial.in_waiting
+            if isinstance(pending, int):  # Mocked serials return Mock objects
+                discarded += pending
             self._serial.reset_input_buffer()
         except serial.SerialException as e:
             raise DeviceCommunicationError(
                 f"Failed to flush buffer: {e}",
                 context={"port": self.port, "error": str(e)},
             )
+
+        if discarded:
+            self.metrics.incr("flush_discarded_bytes", discarded)
@@ -0,0 +1,230 @@
+"""Persisted map of parameters the installed heat pump cannot answer.
+
+Smaller models lack some sensors (e.g. GT10/GT11 brine temperatures) and
+answer their RTRs with a short response or not at all; disconnected sensors
+answer with the DEAD marker. Reading them every poll cycle only produces
+the same error and, for missing parameters, costs a full timeout.
+
+CapabilityMap counts consistent failures per parameter. After ``threshold``
+identical results in a row a parameter is marked:
+
+- "absent": no response (timeout) or unknown to the registry
+- "dead": responds with the DEAD marker (decoded None)
+- "invalid_dlc": response shorter than the value needs
+
+Marked parameters are read only once per ``probe_interval`` until a read
+succeeds, which clears the mark. Marks are saved to a JSON file so a
+restart does not re-learn them. Other errors (parse errors, bus errors)
+neither count nor clear a streak.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+ABSENT = "absent"
+DEAD = "dead"
+INVALID_DLC = "invalid_dlc"
+
+# Read errors that count towards a mark, and the mark they lead to
+ERROR_STATUS = {
+    "timeout": ABSENT,
+    "unknown_parameter": ABSENT,
+    "no_value": DEAD,
+    "invalid_dlc": INVALID_DLC,
+}
+
+# Consistent failures before a parameter is marked
+DEFAULT_THRESHOLD = 3
+
+# Seconds between probes of a marked parameter
+DEFAULT_PROBE_INTERVAL = 3600.0
+
+
+@dataclass
+class CapabilityEntry:
+    """Failure streak of one parameter.
+
+    Attributes:
+        status: Mark the streak leads to ("absent", "dead", "invalid_dlc")
+        count: Consecutive failures with this status
+        marked: Whether the parameter is skipped between probes
+        since: Wall-clock time of the first failure of the streak
+        last_probe: Wall-clock time of the latest failed read
+    """
+
+    status: str
+    count: int
+    marked: bool
+    since: float
+    last_probe: float
+
+
+def _key(name: Any) -> str:
+    return name.upper() if isinstance(name, str) else str(name)
+
+
+class CapabilityMap:
+    """Per-installation record of unavailable parameters.
+
+    Thread-safe; the file is only written when a mark is set or cleared.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: Optional[str | Path] = None,
+        threshold: int = DEFAULT_THRESHOLD,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty map.
+
+        Args:
+            path: JSON file for load()/save() (None: not persisted)
+            threshold: Consistent failures before a parameter is marked
+            probe_interval: Seconds between reads of a marked parameter
+            clock: Wall-clock time source (injectable for tests)
+        """
+        if threshold < 1:
+            raise ValueError(f"threshold must be at least 1, got {threshold}")
+        self.path = Path(path) if path is not None else None
+        self.threshold = threshold
+        self.probe_interval = probe_interval
+        self._clock = clock
+        self._entries: dict[str, CapabilityEntry] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def status(self, name: Any) -> Optional[str]:
+        """Mark of a parameter, or None if it is read normally."""
+        entry = self._entries.get(_key(name))
+        return entry.status if entry is not None and entry.marked else None
+
+    def should_read(self, name: Any) -> bool:
+        """Whether a parameter is due for a read (unmarked or due for a probe)."""
+        entry = self._entries.get(_key(name))
+        if entry is None or not entry.marked:
+            return True
+        return self._clock() - entry.last_probe >= self.probe_interval
+
+    def record(self, name: Any, error: Optional[str]) -> None:
+        """Record the result of a read (error None on success)."""
+        key = _key(name)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if error is None:
+                if entry is not None:
+                    del self._entries[key]
+                    if entry.marked:
+                        _LOGGER.info("%s answers again, polling resumed", key)
+                        self._dirty = True
+                return
+            status = ERROR_STATUS.get(error)
+            if status is None:
+                return
+            if entry is None or entry.status != status:
+                if entry is not None and entry.marked:
+                    self._dirty = True
+                entry = CapabilityEntry(status, 0, False, now, now)
+                self._entries[key] = entry
+            entry.count += 1
+            entry.last_probe = now
+            if not entry.marked and entry.count >= self.threshold:
+                entry.marked = True
+                self._dirty = True
+                _LOGGER.info(
+                    "%s marked %s after %d reads, probing every %.0fs",
+                    key,
+                    status,
+                    entry.count,
+                    self.probe_interval,
+                )
+
+    def unavailable(self) -> dict[str, str]:
+        """Marked parameters and their status."""
+        with self._lock:
+            return {
+                key: entry.status
+                for key, entry in self._entries.items()
+                if entry.marked
+            }
+
+    def snapshot(self) -> dict[str, Any]:
+        """All streaks and marks (JSON-serializable, for diagnostics)."""
+        with self._lock:
+            return {
+                "threshold": self.threshold,
+                "probe_interval_s": self.probe_interval,
+                "parameters": {
+                    key: asdict(entry) for key, entry in sorted(self._entries.items())
+                },
+            }
+
+    def load(self) -> bool:
+        """Load marks from ``path``; a missing or unreadable file loads nothing.
+
+        Returns:
+            True if marks were loaded
+        """
+        if self.path is None:
+            return False
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") != self.VERSION:
+                return False
+            entries = {
+                key: CapabilityEntry(**value)
+                for key, value in data.get("parameters", {}).items()
+            }
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            _LOGGER.warning("Ignoring capability map %s: %s", self.path, e)
+            return False
+        with self._lock:
+            self._entries = entries
+            self._dirty = False
+        return True
+
+    def save(self, force: bool = False) -> bool:
+        """Write the map to ``path`` if a mark changed since the last save.
+
+        The file is replaced atomically, so a crash never leaves it truncated.
+
+        Returns:
+            True if the file was written
+        """
+        if self.path is None or not (self._dirty or force):
+            return False
+        with self._lock:
+            data = {
+                "version": self.VERSION,
+                "parameters": {
+                    key: asdict(entry) for key, entry in self._entries.items()
+                },
+            }
+            self._dirty = False
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            _LOGGER.warning("Failed to save capability map %s: %s", self.path, e)
+            self._dirty = True
+            return False
+        return True
@@ -0,0 +1,225 @@
+"""Per-CAN-ID frame demultiplexer for the USBtin background reader.
+
+When USBtinAdapter runs its background reader thread, every received frame
+is handed to a FrameDemultiplexer which routes it to:
+
+- Response waiters: futures registered for one arbitration ID (for example
+  0x0C003FE0 | idx << 14 for an RTR parameter read). A frame that resolves
+  a waiter is claimed and does not enter the unclaimed backlog.
+- Subscriptions: queues receiving a copy of every frame, optionally filtered
+  by arbitration ID. Used for broadcast monitoring and element-list streams.
+- The unclaimed backlog: a bounded deque of frames no waiter claimed. It
+  backs the "next frame on the bus" semantics of receive_frame().
+
+Nothing is discarded by flushing the serial port, so a response that arrives
+before its caller gets around to waiting for it is still delivered.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Optional
+
+from .can_message import CANMessage
+
+# Maximum number of unclaimed frames retained for receive_frame() callers
+DEFAULT_BACKLOG_SIZE = 1024
+
+# Per-subscription queue bound (element list chunks are ~512 frames)
+DEFAULT_SUBSCRIPTION_SIZE = 4096
+
+
+class FrameSubscription:
+    """Queue of frames delivered to a single subscriber.
+
+    Attributes:
+        can_id: Arbitration ID filter, or None to receive every frame
+        dropped: Number of frames dropped because the queue was full
+    """
+
+    def __init__(
+        self, can_id: Optional[int] = None, maxsize: int = DEFAULT_SUBSCRIPTION_SIZE
+    ) -> None:
+        self.can_id = can_id
+        self.dropped = 0
+        self._queue: queue.Queue[CANMessage] = queue.Queue(maxsize=maxsize)
+
+    def matches(self, frame: CANMessage) -> bool:
+        """Check whether a frame passes this subscription's filter."""
+        return self.can_id is None or frame.arbitration_id == self.can_id
+
+    def get(self, timeout: Optional[float] = None) -> Optional[CANMessage]:
+        """Wait for the next frame.
+
+        Args:
+            timeout: Maximum time to wait (seconds), None to wait forever
+
+        Returns:
+            Next CANMessage, or None if the timeout expired
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def get_nowait(self) -> Optional[CANMessage]:
+        """Return the next queued frame without blocking, or None."""
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return None
+
+    def offer(self, frame: CANMessage) -> None:
+        """Queue a frame, counting it as dropped if the queue is full."""
+        try:
+            self._queue.put_nowait(frame)
+        except queue.Full:
+            self.dropped += 1
+
+
+class FrameDemultiplexer:
+    """Route received CAN frames to waiters, subscribers and the backlog.
+
+    All methods are thread-safe. dispatch() is called from the reader thread;
+    everything else is called from client threads.
+    """
+
+    def __init__(self, backlog_size: int = DEFAULT_BACKLOG_SIZE) -> None:
+        self._lock = threading.Lock()
+        self._frame_available = threading.Condition(self._lock)
+        self._waiters: dict[int, list[Future[CANMessage]]] = {}
+        self._subscriptions: list[FrameSubscription] = []
+        self._unclaimed: deque[CANMessage] = deque(maxlen=backlog_size)
+
+    @property
+    def pending_waiters(self) -> int:
+        """Number of registered response waiters not yet resolved."""
+        with self._lock:
+            return sum(len(futures) for futures in self._waiters.values())
+
+    @property
+    def backlog_size(self) -> int:
+        """Number of frames currently held in the unclaimed backlog."""
+        with self._lock:
+            return len(self._unclaimed)
+
+    def expect(self, can_id: int) -> Future[CANMessage]:
+        """Register a waiter for the next frame with the given arbitration ID.
+
+        Register before transmitting the request so the response cannot be
+        missed, then call cancel() once done (resolved or not).
+
+        Args:
+            can_id: Arbitration ID of the expected response
+
+        Returns:
+            Future resolved with the matching CANMessage
+        """
+        future: Future[CANMessage] = Future()
+        with self._lock:
+            self._waiters.setdefault(can_id, []).append(future)
+        return future
+
+    def cancel(self, can_id: int, future: Future[CANMessage]) -> None:
+        """Remove a waiter registered with expect() (no-op if already resolved)."""
+        with self._lock:
+            futures = self._waiters.get(can_id)
+            if futures and future in futures:
+                futures.remove(future)
+                if not futures:
+                    del self._waiters[can_id]
+        future.cancel()
+
+    def subscribe(
+        self,
+        can_id: Optional[int] = None,
+        maxsize: int = DEFAULT_SUBSCRIPTION_SIZE,
+        include_backlog: bool = False,
+    ) -> FrameSubscription:
+        """Create a subscription receiving copies of matching frames.
+
+        Args:
+            can_id: Only deliver frames with this arbitration ID (None = all)
+            maxsize: Queue bound; excess frames are counted in ``dropped``
+            include_backlog: Atomically move matching frames out of the
+                unclaimed backlog into the new subscription
+
+        Returns:
+            The new FrameSubscription (release with unsubscribe())
+        """
+        subscription = FrameSubscription(can_id, maxsize)
+        with self._lock:
+            if include_backlog:
+                kept: deque[CANMessage] = deque(maxlen=self._unclaimed.maxlen)
+                for frame in self._unclaimed:
+                    if subscription.matches(frame):
+                        subscription.offer(frame)
+                    else:
+                        kept.append(frame)
+                self._unclaimed = kept
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: FrameSubscription) -> None:
+        """Stop delivering frames to a subscription."""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def dispatch(self, frame: CANMessage) -> bool:
+        """Route a received frame.
+
+        Args:
+            frame: Frame parsed by the reader thread
+
+        Returns:
+            True if the frame resolved at least one response waiter
+        """
+        with self._lock:
+            futures = self._waiters.pop(frame.arbitration_id, None)
+            for subscription in self._subscriptions:
+                if subscription.matches(frame):
+                    subscription.offer(frame)
+            if not futures:
+                self._unclaimed.append(frame)
+                self._frame_available.notify()
+
+        claimed = False
+        for future in futures or ():
+            if future.set_running_or_notify_cancel():
+                future.set_result(frame)
+                claimed = True
+        return claimed
+
+    def next_unclaimed(self, timeout: float) -> Optional[CANMessage]:
+        """Pop the oldest unclaimed frame, waiting up to ``timeout`` seconds."""
+        with self._frame_available:
+            if not self._unclaimed:
+                self._frame_available.wait_for(lambda: bool(self._unclaimed), timeout)
+            if self._unclaimed:
+                return self._unclaimed.popleft()
+            return None
+
+    def clear_unclaimed(self) -> int:
+        """Discard the unclaimed backlog.
+
+        Returns:
+            Number of frames discarded
+        """
+        with self._lock:
+            count = len(self._unclaimed)
+            self._unclaimed.clear()
+            return count
+
+    def fail_all(self, error: BaseException) -> None:
+        """Fail every pending waiter, e.g. when the reader thread dies."""
+        with self._lock:
+            waiters = self._waiters
+            self._waiters = {}
+        for futures in waiters.values():
+            for future in futures:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(error)
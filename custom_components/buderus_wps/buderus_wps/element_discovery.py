@@ -17,6 +17,16 @@ Element data format per entry (18 bytes header + variable name):
 - Bytes 13-16: min (int32, big-endian, signed)
 - Byte 17: name_length
 - Bytes 18+: name (ASCII string, name_length-1 bytes)
+
+Downloading the full list takes about 30 s, so the received chunks are
+kept with the elements in the (checksummed, binary_cache format) cache
+file: a failed download resumes at the last good offset (also across
+restarts, via a ".partial" file next to the cache), and an expired cache
+is revalidated by comparing the reported byte count and the first chunk
+before anything is downloaded again.
+
+Elements are parsed while the frames of a chunk are still arriving, so
+callers can use them before the download completes.
 """
 
 import json
@@ -25,7 +35,9 @@ import os
 import struct
 import time
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .binary_cache import is_binary_cache, read_cache, write_cache
 
 if TYPE_CHECKING:
     from .can_adapter import USBtinAdapter
@@ -41,6 +53,16 @@ ELEMENT_BUFFER_READ_ID = 0x01FDBFE0  # R01FDBFE00 (RTR)
 
 # PROTOCOL: Element header size (before variable-length name)
 ELEMENT_HEADER_SIZE = 18
+_HEADER = struct.Struct(">H7siiB")
+
+# Largest idx an element can have (12 bits of the CAN ID)
+MAX_ELEMENT_IDX = 0x0FFF
+
+# Most bytes skipped while searching for the next header after corruption
+RESYNC_WINDOW = 4096
+
+# Version of the element cache metadata (1 and 2 were JSON files)
+ELEMENT_CACHE_VERSION = 3
 
 
 @dataclass
@@ -121,100 +143,180 @@ class ElementListParser:
         Returns:
             List of parsed DiscoveredElement instances
         """
-        elements: list[DiscoveredElement] = []
-        offset = 0
-
-        while offset + ELEMENT_HEADER_SIZE <= len(data):
-            try:
-                element, bytes_consumed = self._parse_single_element(data, offset)
-                if element is not None:
-                    elements.append(element)
-                offset += bytes_consumed
-            except Exception as e:
-                logger.warning(f"Failed to parse element at offset {offset}: {e}")
-                # Try to skip to next element by scanning for valid idx
-                offset += 1
-
+        stream = StreamingElementParser()
+        elements = stream.feed(data)
+        stream.close()
         return elements
 
-    def _parse_single_element(
-        self, data: bytes, offset: int
-    ) -> tuple[Optional[DiscoveredElement], int]:
-        """Parse a single element from data at given offset.
 
-        Args:
-            data: The full data buffer
-            offset: Starting offset for this element
+class StreamingElementParser:
+    """Incremental parser for the element list byte stream.
 
-        Returns:
-            Tuple of (element or None if invalid, bytes consumed)
-        """
-        # Check minimum header size
-        if offset + ELEMENT_HEADER_SIZE > len(data):
-            return None, len(data) - offset
+    feed() accepts the stream split at arbitrary points (CAN frames,
+    chunks) and returns the elements completed by each piece, so elements
+    are available while the download is still running.
 
-        # PROTOCOL: Parse 18-byte header
-        # Bytes 0-1: idx (uint16 big-endian)
-        idx = struct.unpack(">H", data[offset : offset + 2])[0]
+    An entry with a zero name length, a non-ASCII name or no null
+    terminator after the name is treated as corruption (e.g. a lost CAN
+    frame). Instead of retrying every byte
+    offset, the parser scans for the next plausible header: idx within
+    range, a printable name and its null terminator. The scan gives up
+    after ``resync_window`` bytes; the rest of the stream is then dropped.
+    """
 
-        # Bytes 2-8: extid (7 bytes as hex string)
-        extid_bytes = data[offset + 2 : offset + 9]
-        extid = extid_bytes.hex().upper()
+    def __init__(self, resync_window: int = RESYNC_WINDOW) -> None:
+        """Initialize the parser.
 
-        # Bytes 9-12: max (int32 big-endian signed)
-        max_value = struct.unpack(">i", data[offset + 9 : offset + 13])[0]
+        Args:
+            resync_window: Most bytes skipped while searching for the next
+                header after corruption
+        """
+        self.resync_window = resync_window
+        self.elements_parsed = 0
+        self.bytes_skipped = 0
+        self.resyncs = 0
+        self.desynced = False
+        self._buf = bytearray()
+        self._offset = 0  # Stream offset of _buf[0]
+        self._resyncing = False
+        self._scanned = 0  # Bytes skipped by the current resync
 
-        # Bytes 13-16: min (int32 big-endian signed)
-        min_value = struct.unpack(">i", data[offset + 13 : offset + 17])[0]
+    @property
+    def offset(self) -> int:
+        """Stream offset of the first byte not yet parsed."""
+        return self._offset
 
-        # Byte 17: name_length (includes original null terminator)
-        name_length = data[offset + 17]
+    def feed(self, data: bytes) -> list[DiscoveredElement]:
+        """Consume the next bytes of the stream.
 
-        if name_length == 0:
-            logger.warning(f"Element at offset {offset} has zero name length, skipping")
-            return None, ELEMENT_HEADER_SIZE
+        Args:
+            data: Bytes following those of the previous call
 
-        # Actual name length is name_length - 1 (excluding null terminator)
-        actual_name_len = name_length - 1
+        Returns:
+            Elements completed by these bytes, in stream order
+        """
+        if self.desynced:
+            self.bytes_skipped += len(data)
+            return []
+        self._buf += data
+        elements: list[DiscoveredElement] = []
+        with memoryview(self._buf) as view:
+            pos = self._parse(view, elements)
+        if self.desynced:
+            pos = len(self._buf)
+        del self._buf[:pos]
+        self._offset += pos
+        self.elements_parsed += len(elements)
+        return elements
 
-        # Check if we have enough data for the name + null terminator
-        if offset + ELEMENT_HEADER_SIZE + name_length > len(data):
+    def close(self) -> None:
+        """End the stream; a truncated last entry is dropped."""
+        if self._buf:
             logger.warning(
-                f"Element at offset {offset} has name_length={name_length} but "
-                f"only {len(data) - offset - ELEMENT_HEADER_SIZE} bytes remain"
+                "Element list ends with %d unparsed bytes at offset %d",
+                len(self._buf),
+                self._offset,
             )
-            return None, len(data) - offset
-
-        # Parse name
-        name_bytes = data[
-            offset
-            + ELEMENT_HEADER_SIZE : offset
-            + ELEMENT_HEADER_SIZE
-            + actual_name_len
-        ]
-        try:
-            text = name_bytes.decode("ascii")
-        except UnicodeDecodeError:
-            # Try with replacement characters for non-ASCII
-            text = name_bytes.decode("ascii", errors="replace")
-            if text != name_bytes.decode("ascii", errors="ignore"):
+            self.bytes_skipped += len(self._buf)
+            self._offset += len(self._buf)
+            self._buf.clear()
+
+    def _parse(self, view: memoryview, elements: list[DiscoveredElement]) -> int:
+        """Parse complete entries from ``view``; returns bytes consumed."""
+        pos = 0
+        end = len(view)
+        while end - pos >= ELEMENT_HEADER_SIZE:
+            if self._resyncing:
+                pos = self._resync(view, pos)
+                if self._resyncing:
+                    return pos
+            idx, extid, max_value, min_value, name_length = _HEADER.unpack_from(
+                view, pos
+            )
+            if name_length == 0:
+                self._start_resync(pos, "zero name length")
+                pos += 1
+                continue
+            total = ELEMENT_HEADER_SIZE + name_length
+            if end - pos < total:
+                break  # Name still arriving
+            name = bytes(view[pos + ELEMENT_HEADER_SIZE : pos + total - 1])
+            if view[pos + total - 1] != 0 or not name.isascii():
+                self._start_resync(pos, "malformed name")
+                pos += 1
+                continue
+            elements.append(
+                DiscoveredElement(
+                    idx=idx,
+                    extid=extid.hex().upper(),
+                    text=name.decode("ascii"),
+                    min_value=min_value,
+                    max_value=max_value,
+                )
+            )
+            pos += total
+        return pos
+
+    def _start_resync(self, pos: int, reason: str) -> None:
+        logger.warning(
+            "Corrupt element at offset %d (%s), resynchronizing",
+            self._offset + pos,
+            reason,
+        )
+        self.resyncs += 1
+        self._resyncing = True
+        self._scanned = 1
+        self.bytes_skipped += 1
+
+    def _resync(self, view: memoryview, pos: int) -> int:
+        """Skip to the next plausible header; returns the new position.
+
+        Leaves ``_resyncing`` set if more data is needed to decide.
+        """
+        end = len(view)
+        while end - pos >= ELEMENT_HEADER_SIZE:
+            if self._scanned >= self.resync_window:
                 logger.warning(
-                    f"Element at offset {offset} has non-ASCII name, skipping"
+                    "No element header within %d bytes after offset %d, "
+                    "dropping the rest of the element list",
+                    self.resync_window,
+                    self._offset + pos - self._scanned,
+                )
+                self.desynced = True
+                self.bytes_skipped += end - pos
+                return end
+            plausible = _plausible_header(view, pos)
+            if plausible is None:
+                return pos  # Candidate's name still arriving
+            if plausible:
+                logger.info(
+                    "Resynchronized at offset %d after %d bytes",
+                    self._offset + pos,
+                    self._scanned,
                 )
-                return None, ELEMENT_HEADER_SIZE + actual_name_len
+                self._resyncing = False
+                return pos
+            pos += 1
+            self._scanned += 1
+            self.bytes_skipped += 1
+        return pos
 
-        # Total bytes consumed (includes null terminator)
-        total_bytes = ELEMENT_HEADER_SIZE + name_length
 
-        element = DiscoveredElement(
-            idx=idx,
-            extid=extid,
-            text=text,
-            min_value=min_value,
-            max_value=max_value,
-        )
+def _plausible_header(view: memoryview, pos: int) -> Optional[bool]:
+    """Whether a complete, well-formed entry starts at ``pos``.
 
-        return element, total_bytes
+    Returns None if the entry extends past the data received so far.
+    """
+    idx, _, _, _, name_length = _HEADER.unpack_from(view, pos)
+    if idx > MAX_ELEMENT_IDX or name_length < 2:
+        return False
+    total = ELEMENT_HEADER_SIZE + name_length
+    if len(view) - pos < total:
+        return None
+    if view[pos + total - 1] != 0:
+        return False
+    name = bytes(view[pos + ELEMENT_HEADER_SIZE : pos + total - 1])
+    return name.isascii() and name.decode("ascii").isprintable()
 
 
 class ElementDiscovery:
@@ -259,6 +361,10 @@ class ElementDiscovery:
         self._last_received_bytes: int = (
             0  # Tracks received byte count from last discovery
         )
+        # Element data received so far, in chunk order, for a list of
+        # _chunks_reported bytes; discover() resumes after the last chunk
+        self._chunks: list[bytes] = []
+        self._chunks_reported: int = -1
 
     def request_element_count(self, timeout: float = 5.0, max_retries: int = 3) -> int:
         """Request the total element data length.
@@ -355,6 +461,7 @@ class ElementDiscovery:
         offset: int,
         size: int = CHUNK_SIZE,
         timeout: float = 5.0,
+        on_data: Optional[Callable[[bytes], None]] = None,
     ) -> bytes:
         """Request a chunk of element data.
 
@@ -366,6 +473,8 @@ class ElementDiscovery:
             offset: Byte offset to start reading from
             size: Number of bytes to request (default: 4096)
             timeout: Maximum time to wait for complete response
+            on_data: Optional callback receiving the chunk's bytes as the
+                frames arrive
 
         Returns:
             Raw element data bytes
@@ -413,6 +522,7 @@ class ElementDiscovery:
                 expected_bytes=size,
                 timeout=timeout,
                 frame_filter=ELEMENT_DATA_RESPONSE_ID,
+                on_data=on_data,
             )
             self._logger.debug("Received %d bytes in chunk", len(data))
             return data
@@ -430,19 +540,23 @@ class ElementDiscovery:
         self,
         timeout: float = 30.0,
         min_completion_ratio: float = 0.95,
+        on_elements: Optional[Callable[[list[DiscoveredElement]], None]] = None,
     ) -> list[DiscoveredElement]:
         """Discover all available parameters from the heat pump.
 
         This is the main entry point for parameter discovery. It:
         1. Requests the element data length
-        2. Reads element data in chunks
-        3. Parses all element definitions
-        4. Validates completeness against reported byte count
+        2. Reads element data in chunks, parsing frames as they arrive
+        3. Validates completeness against reported byte count
 
         Args:
             timeout: Maximum time for complete discovery
             min_completion_ratio: Minimum ratio of actual/reported bytes required
                 (default 0.95 = 95%). Set to 0.0 to disable validation.
+            on_elements: Optional callback receiving the elements of each
+                chunk as soon as the chunk is received, before the download
+                completes. The elements of resumed chunks are delivered
+                again, as one list, on every attempt.
 
         Returns:
             List of all discovered elements
@@ -458,6 +572,12 @@ class ElementDiscovery:
         # Step 1: Get element data length in bytes
         reported_bytes = self.request_element_count(timeout=5.0)
         self._last_reported_bytes = reported_bytes  # Store for cache metadata
+        received = sum(len(chunk) for chunk in self._chunks)
+        if reported_bytes != self._chunks_reported or received >= reported_bytes:
+            # Chunks of another element list cannot be resumed, and a
+            # complete download is not repeated from memory
+            self._chunks = []
+            self._chunks_reported = reported_bytes
 
         if reported_bytes == 0:
             self._logger.warning("Heat pump reported 0 bytes of element data")
@@ -469,9 +589,29 @@ class ElementDiscovery:
             "Discovering element list (%d bytes reported)", estimated_size
         )
 
-        # Step 2: Read data in chunks
-        all_data = bytearray()
-        offset = 0
+        # Step 2: Read data in chunks, resuming after chunks already received,
+        # and parse the stream while it arrives
+        parser = StreamingElementParser()
+        elements: list[DiscoveredElement] = []
+        delivered = 0
+
+        def consume(data: bytes) -> None:
+            elements.extend(parser.feed(data))
+
+        def deliver() -> None:
+            nonlocal delivered
+            if on_elements is not None and len(elements) > delivered:
+                on_elements(elements[delivered:])
+            delivered = len(elements)
+
+        for held in self._chunks:
+            consume(held)
+        deliver()
+        offset = sum(len(held) for held in self._chunks)
+        if offset:
+            self._logger.info(
+                "Resuming element discovery at offset %d/%d", offset, reported_bytes
+            )
         chunks_read = 0
         max_chunks = (estimated_size // self.CHUNK_SIZE) + 5  # Extra margin
 
@@ -479,19 +619,32 @@ class ElementDiscovery:
             elapsed = time.time() - start_time
             remaining = timeout - elapsed
             if remaining <= 0:
-                self._logger.warning("Discovery timeout after %d bytes", len(all_data))
+                self._logger.warning("Discovery timeout after %d bytes", offset)
                 break
 
+            streamed = 0
+
+            def on_data(data: bytes) -> None:
+                nonlocal streamed
+                streamed += len(data)
+                consume(data)
+
             try:
                 chunk_size = min(self.CHUNK_SIZE, reported_bytes - offset)
                 chunk = self.request_data_chunk(
                     offset=offset,
                     size=chunk_size,
                     timeout=min(remaining, 5.0),
+                    on_data=on_data,
                 )
-                all_data.extend(chunk)
+                # Adapters that do not stream deliver the chunk only here
+                if len(chunk) > streamed:
+                    consume(chunk[streamed:])
+                deliver()
                 offset += len(chunk)
                 chunks_read += 1
+                if chunk:
+                    self._chunks.append(bytes(chunk))
 
                 # If we got less than requested, we're done
                 if len(chunk) < chunk_size:
@@ -505,16 +658,20 @@ class ElementDiscovery:
                 self._logger.debug("No more data at offset %d", offset)
                 break
 
-        self._logger.info(
-            "Received %d bytes total in %d chunks", len(all_data), chunks_read
-        )
-        self._last_received_bytes = len(all_data)
-
-        # Step 3: Parse elements
-        elements = self._parser.parse_data_chunk(bytes(all_data))
+        # Elements streamed before a chunk failed
+        deliver()
+        self._logger.info("Received %d bytes total in %d chunks", offset, chunks_read)
+        self._last_received_bytes = offset
+        parser.close()
+        if parser.bytes_skipped:
+            self._logger.warning(
+                "Skipped %d corrupt bytes of element data (%d resyncs)",
+                parser.bytes_skipped,
+                parser.resyncs,
+            )
 
-        # Step 4: Validate completeness against reported bytes
-        actual_bytes = len(all_data)
+        # Step 3: Validate completeness against reported bytes
+        actual_bytes = offset
         completion_ratio = actual_bytes / reported_bytes if reported_bytes > 0 else 1.0
 
         if actual_bytes > reported_bytes:
@@ -553,6 +710,68 @@ class ElementDiscovery:
 
         return elements
 
+    def _cache_meta(self) -> dict[str, Any]:
+        """Metadata recording the held chunks, for cache and partial files."""
+        return {
+            "version": ELEMENT_CACHE_VERSION,
+            "timestamp": _utc_now_iso(),
+            "timestamp_unix": time.time(),
+            "reported_bytes": self._chunks_reported,
+            "chunk_size": self.CHUNK_SIZE,
+            "chunk_sizes": [len(chunk) for chunk in self._chunks],
+        }
+
+    def _revalidate(self, reported_bytes: int, chunks: list[bytes]) -> bool:
+        """Check whether the device still has the element list of ``chunks``.
+
+        Costs one count request and, if the byte count is unchanged, one
+        chunk. Either way the fetched data seeds the next discover(): all
+        of ``chunks`` when they are still valid, else the fresh first chunk.
+
+        Args:
+            reported_bytes: Byte count reported when ``chunks`` were read
+            chunks: Element data chunks from offset 0 (at least one)
+
+        Returns:
+            True if byte count and first chunk are unchanged
+        """
+        current = self.request_element_count(timeout=5.0)
+        self._chunks = []
+        self._chunks_reported = current
+        if current != reported_bytes:
+            self._logger.info(
+                "Element list changed: %d bytes reported, %d cached",
+                current,
+                reported_bytes,
+            )
+            return False
+
+        first = self.request_data_chunk(offset=0, size=len(chunks[0]), timeout=5.0)
+        if first != chunks[0]:
+            self._logger.info("Element list changed: first chunk differs")
+            if len(first) == len(chunks[0]):
+                self._chunks = [first]
+            return False
+        self._chunks = [first, *chunks[1:]]
+        return True
+
+    def _resume_partial(self, partial_path: str, max_age: Optional[float]) -> None:
+        """Seed discover() with chunks saved by an earlier failed discovery."""
+        try:
+            partial = read_cache(partial_path)
+            age = time.time() - partial.meta.get("timestamp_unix", 0)
+            if max_age is not None and age > max_age:
+                return
+            chunks = _split_chunks(partial.meta, partial.blob)
+            if chunks and self._revalidate(partial.meta["reported_bytes"], chunks):
+                self._logger.info(
+                    "Resuming discovery from %d saved chunks", len(chunks)
+                )
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self._logger.warning("Ignoring saved discovery progress: %s", e)
+
     def discover_with_cache(
         self,
         cache_path: str,
@@ -561,6 +780,8 @@ class ElementDiscovery:
         timeout: float = 30.0,
         max_retries: int = 3,
         min_completion_ratio: float = 0.95,
+        on_elements: Optional[Callable[[list[DiscoveredElement]], None]] = None,
+        legacy_path: Optional[str] = None,
     ) -> list[DiscoveredElement]:
         """Discover elements with caching and fail-fast behavior.
 
@@ -569,19 +790,30 @@ class ElementDiscovery:
 
         Behavior:
         - If valid cache exists and refresh=False: Load from cache
+        - If the cache is older than max_cache_age: Revalidate it (element
+          count plus first chunk) and keep it if the list is unchanged
+        - Discovery resumes after chunks received by failed attempts, also
+          those saved by an earlier run in ``<cache_path>.partial``
         - If discovery succeeds: Save to cache and return
         - If discovery fails AND valid cache exists: Fall back to cache
         - If discovery fails AND no cache (fresh install): Raise DiscoveryRequiredError
 
         Args:
-            cache_path: Path to cache file (JSON format)
+            cache_path: Path to cache file (binary cache format; JSON
+                caches of earlier versions are still read)
             refresh: If True, always perform fresh discovery
-            max_cache_age: Maximum cache age in seconds. If cache is older, refresh.
-                          None means no age limit (default).
+            max_cache_age: Maximum cache age in seconds. An older cache is
+                          revalidated against the device and re-downloaded
+                          only if the element list changed. None means no
+                          age limit (default).
             timeout: Maximum time for discovery per attempt
             max_retries: Number of retry attempts on incomplete discovery (default: 3)
             min_completion_ratio: Minimum ratio of actual/reported bytes required
                 (default 0.95 = 95%). Set to 0.0 to disable validation.
+            on_elements: Passed to discover() for elements parsed during a
+                download; not called for elements loaded from the cache
+            legacy_path: JSON cache of an earlier version, read while
+                ``cache_path`` does not exist and removed once it is written
 
         Returns:
             List of discovered elements
@@ -594,14 +826,27 @@ class ElementDiscovery:
         # Track if we have a valid cache to fall back to
         cached_elements: Optional[list[DiscoveredElement]] = None
         cache_existed = False
+        partial_path = f"{cache_path}.partial"
+        if refresh:
+            self._chunks = []
+            self._chunks_reported = -1
+
+        source_path = cache_path
+        if (
+            legacy_path is not None
+            and not os.path.exists(cache_path)
+            and os.path.exists(legacy_path)
+        ):
+            source_path = legacy_path
 
         # Try loading from cache
-        if os.path.exists(cache_path):
+        if os.path.exists(source_path):
             try:
-                with open(cache_path) as f:
-                    cache_data = json.load(f)
+                cache_data, cached_records, cached_blob = _read_element_cache(
+                    source_path
+                )
 
-                # Log cache metadata if available (version 2)
+                # Log cache metadata if available (version 2 and later)
                 version = cache_data.get("version", 1)
                 complete = cache_data.get("complete", True)
                 reported = cache_data.get(
@@ -619,7 +864,7 @@ class ElementDiscovery:
                             min_value=e["min_value"],
                             max_value=e["max_value"],
                         )
-                        for e in cache_data.get("elements", [])
+                        for e in cached_records
                     ]
                     cache_existed = True
                     self._logger.debug(
@@ -665,6 +910,29 @@ class ElementDiscovery:
                     )
                     needs_refresh = True
 
+                # An expired cache with chunk checksums is kept if the device
+                # still reports the same list: one count and one chunk
+                # instead of the full download
+                cached_chunks = (
+                    _split_chunks(cache_data, cached_blob)
+                    if complete and needs_refresh and not refresh
+                    else []
+                )
+                if cached_chunks and cached_elements:
+                    try:
+                        if self._revalidate(reported, cached_chunks):
+                            cache_data.update(self._cache_meta())
+                            _write_element_cache(
+                                cache_path, cached_elements, cache_data, self._chunks
+                            )
+                            self._logger.info(
+                                "Element list unchanged, revalidated cache: %s",
+                                cache_path,
+                            )
+                            needs_refresh = False
+                    except Exception as e:
+                        self._logger.warning("Cache revalidation failed: %s", e)
+
                 # Return cached elements if no refresh needed
                 if not needs_refresh and cached_elements:
                     self._logger.info(
@@ -677,10 +945,14 @@ class ElementDiscovery:
                     )
                     return cached_elements
 
-            except (json.JSONDecodeError, KeyError, OSError) as e:
+            except (ValueError, KeyError, TypeError, OSError) as e:
                 self._logger.warning("Failed to load cache: %s", e)
 
-        # Perform discovery with retry on incomplete results
+        if not refresh and not self._chunks:
+            self._resume_partial(partial_path, max_cache_age)
+
+        # Perform discovery with retry on incomplete results; each attempt
+        # resumes after the chunks received by the previous ones
         elements: list[DiscoveredElement] = []
         last_error: Optional[Exception] = None
         discovery_succeeded = False
@@ -691,6 +963,7 @@ class ElementDiscovery:
                 elements = self.discover(
                     timeout=timeout,
                     min_completion_ratio=min_completion_ratio,
+                    on_elements=on_elements,
                 )
                 discovery_succeeded = True
                 break  # Success - exit retry loop
@@ -721,6 +994,15 @@ class ElementDiscovery:
 
         # Handle discovery failure
         if not discovery_succeeded:
+            if self._chunks:
+                # Keep the progress for the next run without touching the
+                # last complete cache
+                try:
+                    _write_element_cache(
+                        partial_path, [], self._cache_meta(), self._chunks
+                    )
+                except OSError as e:
+                    self._logger.warning("Failed to save discovery progress: %s", e)
             if cache_existed and cached_elements:
                 # Cache-only fallback: use last successful discovery
                 self._logger.warning(
@@ -744,8 +1026,6 @@ class ElementDiscovery:
 
         # Save successful discovery to cache
         try:
-            from datetime import datetime, timezone
-
             reported_bytes = self._last_reported_bytes
             actual_bytes = self._last_received_bytes
             actual_count = len(elements)
@@ -755,28 +1035,25 @@ class ElementDiscovery:
                 else True
             )
 
-            cache_data = {
-                "version": 2,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "timestamp_unix": time.time(),
-                "reported_count": reported_bytes,  # Backward compatibility (bytes)
-                "actual_count": actual_count,
-                "reported_bytes": reported_bytes,
-                "actual_bytes": actual_bytes,
-                "complete": is_complete,
-                "elements": [
-                    {
-                        "idx": e.idx,
-                        "extid": e.extid,
-                        "text": e.text,
-                        "min_value": e.min_value,
-                        "max_value": e.max_value,
-                    }
-                    for e in elements
-                ],
-            }
-            with open(cache_path, "w") as f:
-                json.dump(cache_data, f, indent=2)
+            cache_data = self._cache_meta()
+            cache_data.update(
+                {
+                    "reported_count": reported_bytes,  # Backward compatibility
+                    "actual_count": actual_count,
+                    "reported_bytes": reported_bytes,
+                    "actual_bytes": actual_bytes,
+                    "complete": is_complete,
+                }
+            )
+            _write_element_cache(
+                cache_path,
+                elements,
+                cache_data,
+                self._chunks if is_complete else [],
+            )
+            for stale in (partial_path, legacy_path):
+                if stale and stale != cache_path and os.path.exists(stale):
+                    os.remove(stale)
             self._logger.info(
                 "Saved %d elements (%d/%d bytes) to cache: %s (complete=%s)",
                 actual_count,
@@ -789,3 +1066,98 @@ class ElementDiscovery:
             self._logger.warning("Failed to save cache: %s", e)
 
         return elements
+
+
+def _read_element_cache(path: str) -> tuple[dict[str, Any], list[dict], bytes]:
+    """Metadata, element dicts and chunk data of an element cache file.
+
+    Reads the binary format and the JSON format of earlier versions (whose
+    chunks are not used).
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is neither a valid binary nor JSON cache
+    """
+    if is_binary_cache(path):
+        contents = read_cache(path)
+        records = [
+            {
+                "idx": r["idx"],
+                "extid": r["extid"],
+                "text": r["text"],
+                "min_value": r["min"],
+                "max_value": r["max"],
+            }
+            for r in contents.records
+        ]
+        return contents.meta, records, contents.blob
+    with open(path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("Element cache is not a JSON object")
+    data.pop("chunks", None)
+    return data, data.pop("elements", []), b""
+
+
+def _write_element_cache(
+    path: str,
+    elements: list[DiscoveredElement],
+    meta: dict[str, Any],
+    chunks: list[bytes],
+) -> None:
+    """Atomically write an element cache with the raw ``chunks``."""
+    meta = {**meta, "chunk_sizes": [len(chunk) for chunk in chunks]}
+    write_cache(
+        path,
+        [
+            {
+                "idx": e.idx,
+                "extid": e.extid,
+                "text": e.text,
+                "min": e.min_value,
+                "max": e.max_value,
+            }
+            for e in elements
+        ],
+        meta,
+        b"".join(chunks),
+    )
+
+
+def _split_chunks(meta: dict[str, Any], blob: bytes) -> list[bytes]:
+    """Chunks of a cache blob as recorded in its metadata (none if inconsistent)."""
+    sizes = meta.get("chunk_sizes") or []
+    if sum(sizes) != len(blob):
+        return []
+    chunks = []
+    offset = 0
+    for size in sizes:
+        chunks.append(blob[offset : offset + size])
+        offset += size
+    return chunks
+
+
+def load_element_cache(path: str) -> list[DiscoveredElement]:
+    """Elements of the cache file written by discover_with_cache().
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a valid element cache
+    """
+    _, records, _ = _read_element_cache(path)
+    return [
+        DiscoveredElement(
+            idx=e["idx"],
+            extid=e["extid"],
+            text=e["text"],
+            min_value=e["min_value"],
+            max_value=e["max_value"],
+        )
+        for e in records
+    ]
+
+
+def _utc_now_iso() -> str:
+    from datetime import datetime, timezone
+
+    return datetime.now(timezone.utc).isoformat()
@@ -12,13 +12,21 @@ from __future__ import annotations
 
 import logging
 import struct
+import threading
 import time
+from collections.abc import Iterable
+from concurrent import futures
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any, Optional
 
+from .broadcast_monitor import BroadcastReadPolicy
+from .bus_arbiter import BusArbiter
 from .can_adapter import USBtinAdapter
 from .can_message import CANMessage
 from .exceptions import DeviceCommunicationError, TimeoutError
+from .metrics import BusMetrics
 from .parameter import HeatPump, Parameter
+from .response_cache import ResponseCache
 from .value_encoder import ValueEncoder
 
 # PROTOCOL: CAN message ID base values for parameter access
@@ -27,26 +35,403 @@ from .value_encoder import ValueEncoder
 CAN_REQUEST_BASE = 0x04003FE0  # RTR request for parameter read
 CAN_RESPONSE_BASE = 0x0C003FE0  # Response to parameter read
 
+# Number of RTRs kept in flight by read_many()
+DEFAULT_READ_WINDOW = 8
 
-class HeatPumpClient:
-    """High-level client using USBtinAdapter to fetch metadata and read/write values."""
+# Values of the 'source' key in read results
+SOURCE_RTR = "rtr"
+SOURCE_BROADCAST = "broadcast"
+SOURCE_CACHE = "cache"
+
+
+class ParameterCodec:
+    """Parameter lookup plus value encoding/decoding shared by the clients.
+
+    Holds no transport; HeatPumpClient (blocking) and AsyncHeatPumpClient
+    (asyncio) add the bus operations on top of it.
+
+    Decoded reads are answered locally when possible: with a
+    ``read_policy``, parameters that are also broadcast come from a fresh
+    broadcast reading, and with a ``response_cache``, slow-changing settings
+    come from an earlier response until their TTL expires. Read results carry
+    a 'source' key ("broadcast", "cache" or "rtr").
+    """
 
     def __init__(
         self,
-        adapter: USBtinAdapter,
         registry: Optional[HeatPump] = None,
         logger: Optional[logging.Logger] = None,
+        read_policy: Optional[BroadcastReadPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
-        if adapter is None:
-            raise ValueError("adapter is required")
-        self._adapter = adapter
         self._registry = registry or HeatPump()
         self._logger = logger or logging.getLogger(__name__)
+        self.read_policy = read_policy
+        self.response_cache = response_cache
 
     @property
     def registry(self) -> HeatPump:
         return self._registry
 
+    def get(self, name_or_idx: Any) -> Parameter:
+        param = self._lookup(name_or_idx)
+        if not param:
+            raise KeyError(f"Unknown parameter: {name_or_idx}")
+        return param
+
+    def _lookup(self, name_or_idx: Any) -> Optional[Parameter]:
+        """Look up parameter by name or index using the registry.
+
+        Supports both HeatPump (get_parameter) and ParameterRegistry (get_by_name/get_by_index).
+        """
+        # Try HeatPump interface first
+        # Use unified lookup method
+        return self._registry.get_parameter(name_or_idx)
+
+    def _resolve_batch(
+        self, names_or_idxs: Iterable[Any]
+    ) -> tuple[dict[Any, dict[str, Any]], dict[int, list[Any]], dict[int, Parameter]]:
+        """Resolve a read_many() request list, deduplicating by idx.
+
+        Returns:
+            (results pre-filled with unknown-parameter errors,
+             requested keys per idx, parameter per idx)
+        """
+        results: dict[Any, dict[str, Any]] = {}
+        keys_by_idx: dict[int, list[Any]] = {}
+        params: dict[int, Parameter] = {}
+        for key in names_or_idxs:
+            param = self._lookup(key)
+            if param is None:
+                results[key] = {
+                    "name": str(key),
+                    "raw": b"",
+                    "decoded": None,
+                    "error": "unknown_parameter",
+                }
+                continue
+            keys_by_idx.setdefault(param.idx, []).append(key)
+            params[param.idx] = param
+        return results, keys_by_idx, params
+
+    def _local_raw(self, param: Parameter) -> Optional[tuple[bytes, str]]:
+        """Raw value and source for ``param`` without a bus round trip, if any."""
+        if self.read_policy is not None:
+            reading = self.read_policy.lookup(param.text, param.format)
+            if reading is not None:
+                return reading.raw_data, SOURCE_BROADCAST
+        if self.response_cache is not None:
+            raw = self.response_cache.get(param)
+            if raw is not None:
+                return raw, SOURCE_CACHE
+        return None
+
+    def _resolve_local(
+        self, params: dict[int, Parameter]
+    ) -> tuple[dict[int, bytes], dict[int, str]]:
+        """Raw values and sources of the batch parameters answered locally."""
+        raw_by_idx: dict[int, bytes] = {}
+        sources: dict[int, str] = {}
+        if self.read_policy is None and self.response_cache is None:
+            return raw_by_idx, sources
+        for idx, param in params.items():
+            local = self._local_raw(param)
+            if local is not None:
+                raw_by_idx[idx], sources[idx] = local
+        return raw_by_idx, sources
+
+    def _generation(self, param: Parameter) -> int:
+        """Response cache generation of ``param``, taken before sending its RTR."""
+        if self.response_cache is None:
+            return 0
+        return self.response_cache.generation(param)
+
+    def _remember(self, param: Parameter, raw: bytes, generation: int) -> None:
+        """Store an RTR response unless ``param`` was written since ``generation``."""
+        if self.response_cache is not None:
+            self.response_cache.put(param, raw, generation=generation)
+
+    def _forget(self, param: Parameter) -> None:
+        """Invalidate the cached response of a written parameter."""
+        if self.response_cache is not None:
+            self.response_cache.invalidate(param)
+
+    def _assemble_batch(
+        self,
+        results: dict[Any, dict[str, Any]],
+        keys_by_idx: dict[int, list[Any]],
+        params: dict[int, Parameter],
+        raw_by_idx: dict[int, bytes],
+        errors: dict[int, str],
+        sources: dict[int, str],
+        generations: dict[int, int],
+    ) -> None:
+        """Fill read_many() results from raw values and per-idx errors.
+
+        ``sources`` names the source of locally answered idxs; all other raw
+        values are RTR responses and are stored in the response cache unless
+        the parameter was written after its ``generations`` entry was taken.
+        """
+        for idx, param in params.items():
+            if idx in raw_by_idx:
+                source = sources.get(idx, SOURCE_RTR)
+                if source == SOURCE_RTR:
+                    self._remember(param, raw_by_idx[idx], generations[idx])
+                result = self._build_result(param, raw_by_idx[idx], source=source)
+            else:
+                result = self._build_error(param, errors.get(idx, "timeout"))
+            for key in keys_by_idx[idx]:
+                results[key] = result
+
+        failed = sum(1 for idx in params if idx not in raw_by_idx)
+        if failed:
+            self._logger.debug(
+                "read_many: %d/%d parameters failed", failed, len(params)
+            )
+
+    @staticmethod
+    def _rtr_request(idx: int) -> CANMessage:
+        """Build the RTR frame requesting parameter ``idx``."""
+        return CANMessage(
+            arbitration_id=CAN_REQUEST_BASE | (idx << 14),
+            data=b"",
+            is_extended_id=True,
+            is_remote_frame=True,
+        )
+
+    def _build_result(
+        self, param: Parameter, raw: bytes, source: str = SOURCE_RTR
+    ) -> dict[str, Any]:
+        """Build the read_parameter() result dict for a raw value."""
+        return {
+            "name": param.text,
+            "idx": param.idx,
+            "extid": param.extid,
+            "format": param.format,
+            "min": param.min,
+            "max": param.max,
+            "read": param.read,
+            "raw": raw,
+            "decoded": self._decode_value(param, raw),
+            "source": source,
+        }
+
+    @staticmethod
+    def _build_error(param: Parameter, error: str) -> dict[str, Any]:
+        """Build a failed-read result dict."""
+        return {
+            "name": param.text,
+            "idx": param.idx,
+            "format": param.format,
+            "raw": b"",
+            "decoded": None,
+            "error": error,
+        }
+
+    def _encode_value(self, param: Parameter, value: Any) -> bytes:
+        """Encode human-readable value to raw bytes for CAN transmission.
+
+        # PROTOCOL: Matches FHEM behavior from fhem/26_KM273v018.pm:2728-2729
+        # User passes human-readable values (e.g., 53.0°C), we convert to raw.
+
+        Args:
+            param: Parameter definition with format, min, max
+            value: Human-readable value from user
+
+        Returns:
+            Bytes for CAN transmission (typically 2 bytes)
+
+        Raises:
+            ValueError: If value is out of range for the parameter
+        """
+        fmt = param.format
+        from .formats import get_format_factor
+
+        # For formats with factors, validate human-readable value against scaled min/max
+        factor = get_format_factor(fmt)
+        if factor != 1:
+            # Convert min/max from raw to human-readable for validation
+            min_human = param.min * factor
+            max_human = param.max * factor
+            try:
+                float_value = float(value)
+                if float_value < min_human or float_value > max_human:
+                    raise ValueError(
+                        f"Value {value} out of range for {param.text} "
+                        f"[{min_human}, {max_human}]"
+                    )
+            except (TypeError, ValueError) as e:
+                if "out of range" in str(e):
+                    raise
+                # Non-numeric values handled by encoder (e.g., select options)
+        else:
+            # For int format, validate raw value directly
+            try:
+                int_value = int(value)
+                if int_value < param.min or int_value > param.max:
+                    raise ValueError(
+                        f"Value {value} out of range for {param.text} "
+                        f"[{param.min}, {param.max}]"
+                    )
+            except (TypeError, ValueError) as e:
+                if "out of range" in str(e):
+                    raise
+                # Non-numeric values (select options, time strings) handled by encoder
+
+        # Use FHEM-compatible encoding for known formats
+        # This converts human-readable values to raw bytes
+        return ValueEncoder.encode_by_format(
+            value=value,
+            format_type=fmt,
+            size_bytes=2,  # FHEM always uses 2 bytes for writes
+            min_val=param.min,
+        )
+
+    def _encode_int_like(
+        self, param: Parameter, value: Any, dlc_hint: int = 0
+    ) -> bytes:
+        try:
+            ivalue = int(value)
+        except Exception as e:
+            raise ValueError(f"Invalid value for {param.text}: {value}") from e
+        if ivalue < param.min or ivalue > param.max:
+            raise ValueError(
+                f"Value {ivalue} out of range for {param.text} [{param.min}, {param.max}]"
+            )
+        signed = param.min < 0
+
+        # Use dlc_hint if provided (from actual device response)
+        if dlc_hint > 0:
+            size = dlc_hint
+        else:
+            # PROTOCOL: FHEM always uses 2 bytes for writes (see line 2746)
+            # Always use at least 2 bytes for compatibility with heat pump
+            size = 2
+            if signed:
+                if ivalue < -32768 or ivalue > 32767:
+                    size = 4
+            else:
+                if ivalue > 0xFFFF:
+                    size = 4
+        return ivalue.to_bytes(size, "big", signed=signed)
+
+    def _decode_value(self, param: Parameter, raw: bytes) -> Any:
+        """Decode raw bytes from CAN to human-readable value.
+
+        # PROTOCOL: Matches FHEM behavior from fhem/26_KM273v018.pm:2714-2740
+        # Returns human-readable values (e.g., 53.0°C from raw 530).
+
+        Args:
+            param: Parameter definition with format, min, max
+            raw: Raw bytes from CAN response
+
+        Returns:
+            Decoded human-readable value (float, int, str, or None for DEAD)
+        """
+        try:
+            result = ValueEncoder.decode_by_format(
+                data=raw,
+                format_type=param.format,
+                min_val=param.min,
+            )
+            # None indicates DEAD sensor - return as-is for caller to handle
+            return result
+        except (ValueError, struct.error) as e:
+            self._logger.warning(
+                "Failed to decode %s (format=%s, raw=%s): %s",
+                param.text,
+                param.format,
+                raw.hex(),
+                e,
+            )
+            return raw.hex()  # Return hex string as fallback
+
+
+class HeatPumpClient(ParameterCodec):
+    """High-level client using USBtinAdapter to fetch metadata and read/write values.
+
+    RTR round-trip latencies and unexpected response IDs are recorded in
+    ``metrics``, which is the adapter's BusMetrics unless one is passed in.
+    With an ``arbiter``, every bus transaction (RTR exchange, write, or
+    window of a read_many() batch) first claims the bus from it.
+
+    Concurrent reads of the same parameter are coalesced: a read_value() or
+    read_many() that finds an RTR for the idx already in flight waits for
+    that response instead of sending another (counted as
+    ``coalesced_reads``). A write ends coalescing onto reads sent before it.
+    """
+
+    def __init__(
+        self,
+        adapter: USBtinAdapter,
+        registry: Optional[HeatPump] = None,
+        logger: Optional[logging.Logger] = None,
+        metrics: Optional[BusMetrics] = None,
+        read_policy: Optional[BroadcastReadPolicy] = None,
+        response_cache: Optional[ResponseCache] = None,
+        arbiter: Optional[BusArbiter] = None,
+    ) -> None:
+        if adapter is None:
+            raise ValueError("adapter is required")
+        super().__init__(registry, logger, read_policy, response_cache)
+        self._adapter = adapter
+        self.arbiter = arbiter
+        if metrics is None:
+            adapter_metrics = getattr(adapter, "metrics", None)
+            metrics = (
+                adapter_metrics
+                if isinstance(adapter_metrics, BusMetrics)
+                else BusMetrics()
+            )
+        self.metrics = metrics
+        # idx -> Future of the raw response of the RTR in flight
+        self._inflight: dict[int, futures.Future[bytes]] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _bus(self) -> AbstractContextManager[Any]:
+        """Claim the bus for one transaction (no-op without an arbiter)."""
+        return self.arbiter.claim() if self.arbiter is not None else nullcontext()
+
+    def _join_read(self, idx: int) -> tuple[futures.Future[bytes], bool]:
+        """Future of the read of ``idx`` in flight, and whether the caller sends it."""
+        with self._inflight_lock:
+            future = self._inflight.get(idx)
+            if future is not None:
+                self.metrics.incr("coalesced_reads")
+                return future, False
+            future = futures.Future()
+            self._inflight[idx] = future
+            return future, True
+
+    def _finish_read(
+        self,
+        idx: int,
+        future: futures.Future[bytes],
+        raw: Optional[bytes] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Hand the outcome of a sent read to every reader that joined it."""
+        with self._inflight_lock:
+            if self._inflight.get(idx) is future:
+                del self._inflight[idx]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(raw if raw is not None else b"")
+
+    @staticmethod
+    def _await_read(
+        future: futures.Future[bytes], param: Parameter, timeout: float
+    ) -> bytes:
+        """Raw response of a joined read."""
+        try:
+            return future.result(timeout=max(timeout, 0))
+        except futures.TimeoutError:
+            raise TimeoutError(
+                f"No response for {param.text} within {timeout}s",
+                context={"param": param.text, "coalesced": True},
+            ) from None
+
     def fetch_live_registry(self, timeout: float = 5.0) -> HeatPump:
         """
         Best-effort live fetch of parameter list using KM273_ReadElementList flow.
@@ -90,16 +475,23 @@ class HeatPumpClient:
         # this code path is never reached
         return self._registry
 
-    def get(self, name_or_idx: Any) -> Parameter:
-        param = self._lookup(name_or_idx)
-        if not param:
-            raise KeyError(f"Unknown parameter: {name_or_idx}")
-        return param
-
     def read_value(self, name_or_idx: Any, timeout: Optional[float] = None) -> bytes:
         param = self.get(name_or_idx)
         adapter_timeout = getattr(self._adapter, "timeout", 2.0)
         effective_timeout = timeout if timeout is not None else adapter_timeout
+        future, send = self._join_read(param.idx)
+        if not send:
+            return self._await_read(future, param, effective_timeout)
+        try:
+            raw = self._exchange(param, effective_timeout)
+        except BaseException as e:
+            self._finish_read(param.idx, future, error=e)
+            raise
+        self._finish_read(param.idx, future, raw)
+        return raw
+
+    def _exchange(self, param: Parameter, effective_timeout: float) -> bytes:
+        """Send one RTR for ``param`` and wait for its response."""
         request_id = CAN_REQUEST_BASE | (param.idx << 14)
         response_id = CAN_RESPONSE_BASE | (param.idx << 14)
         request = CANMessage(
@@ -108,48 +500,63 @@ class HeatPumpClient:
             is_extended_id=True,
             is_remote_frame=True,
         )
-        self._adapter.flush_input_buffer()
-        start = time.time()
-        frame = self._adapter.send_frame(request, timeout=effective_timeout)
-        if frame.arbitration_id == response_id:
-            return frame.data
-
-        # If the first frame is unrelated traffic, keep listening until timeout for the expected id.
-        # If the first frame is unrelated traffic, keep listening until timeout for the expected id.
-        while True:
-            elapsed = time.time() - start
-            if elapsed >= effective_timeout:
-                break
-
-            remaining = effective_timeout - elapsed
-            # Ensure we give at least a reasonable minimum time for the read to complete
-            # but don't exceed the total deadline too much.
-            # 0.01 is too small for serial latency. Use at least 0.1s or remaining.
-            # But the adapter.receive_frame uses polling, so 0.01 is actually fine...
-            # WAIT. The error says "No frame received within timeout ... timeout=0.01".
-            # This means receive_frame(timeout=0.01) failed.
-            # This happens if we are very close to the deadline.
-            # Let's ensure we don't call receive_frame with < 0.1 unless we really have to.
-
-            call_timeout = max(remaining, 0.1)
-            next_frame = self._adapter.receive_frame(timeout=call_timeout)
-            if next_frame is None:
-                # If we timed out on the receive call, we check total time
-                if time.time() - start >= effective_timeout:
+        with self._bus():
+            if self._adapter.reader_running:
+                # Background reader demultiplexes by CAN ID: wait for our response only
+                sent = time.monotonic()
+                response = self._adapter.send_request(
+                    request, response_id, timeout=effective_timeout
+                )
+                self.metrics.record_latency(param.text, time.monotonic() - sent)
+                return bytes(response.data)
+
+            self._adapter.flush_input_buffer()
+            start = time.time()
+            sent = time.monotonic()
+            frame = self._adapter.send_frame(request, timeout=effective_timeout)
+            if frame.arbitration_id == response_id:
+                self.metrics.record_latency(param.text, time.monotonic() - sent)
+                return frame.data
+            self.metrics.incr("unexpected_responses")
+
+            # If the first frame is unrelated traffic, keep listening until timeout for the expected id.
+            # If the first frame is unrelated traffic, keep listening until timeout for the expected id.
+            while True:
+                elapsed = time.time() - start
+                if elapsed >= effective_timeout:
                     break
-                continue
-
-            if next_frame.arbitration_id == response_id:
-                return next_frame.data
 
-        raise DeviceCommunicationError(
-            f"Unexpected response id 0x{frame.arbitration_id:X} (expected 0x{response_id:X})",
-            context={
-                "expected": response_id,
-                "got": frame.arbitration_id,
-                "param": param.text,
-            },
-        )
+                remaining = effective_timeout - elapsed
+                # Ensure we give at least a reasonable minimum time for the read to complete
+                # but don't exceed the total deadline too much.
+                # 0.01 is too small for serial latency. Use at least 0.1s or remaining.
+                # But the adapter.receive_frame uses polling, so 0.01 is actually fine...
+                # WAIT. The error says "No frame received within timeout ... timeout=0.01".
+                # This means receive_frame(timeout=0.01) failed.
+                # This happens if we are very close to the deadline.
+                # Let's ensure we don't call receive_frame with < 0.1 unless we really have to.
+
+                call_timeout = max(remaining, 0.1)
+                next_frame = self._adapter.receive_frame(timeout=call_timeout)
+                if next_frame is None:
+                    # If we timed out on the receive call, we check total time
+                    if time.time() - start >= effective_timeout:
+                        break
+                    continue
+
+                if next_frame.arbitration_id == response_id:
+                    self.metrics.record_latency(param.text, time.monotonic() - sent)
+                    return next_frame.data
+                self.metrics.incr("unexpected_responses")
+
+            raise DeviceCommunicationError(
+                f"Unexpected response id 0x{frame.arbitration_id:X} (expected 0x{response_id:X})",
+                context={
+                    "expected": response_id,
+                    "got": frame.arbitration_id,
+                    "param": param.text,
+                },
+            )
 
     def read_value_with_retry(
         self,
@@ -297,169 +704,291 @@ class HeatPumpClient:
         }
 
     def read_parameter(
-        self, name_or_idx: Any, timeout: Optional[float] = None
+        self, name_or_idx: Any, timeout: Optional[float] = None, local: bool = True
     ) -> dict[str, Any]:
-        """Read and decode parameter, returning metadata + raw/decoded values."""
-        param = self.get(name_or_idx)
-        raw = self.read_value(param.text, timeout=timeout)
-        decoded = self._decode_value(param, raw)
-        return {
-            "name": param.text,
-            "idx": param.idx,
-            "extid": param.extid,
-            "format": param.format,
-            "min": param.min,
-            "max": param.max,
-            "read": param.read,
-            "raw": raw,
-            "decoded": decoded,
-        }
-
-    def write_value(
-        self, name_or_idx: Any, value: Any, timeout: Optional[float] = None
-    ) -> None:
-        param = self.get(name_or_idx)
-        # FHEM: read=1 means "readable", not "read-only"
-        # A parameter is read-only if min >= max (no valid write range)
-        if param.min >= param.max:
-            raise PermissionError(
-                f"Parameter {param.text} is read-only (min={param.min} >= max={param.max})"
-            )
-        encoded = self._encode_value(param, value)
-        # PROTOCOL: Write uses same CAN ID as read request (CAN_REQUEST_BASE | idx << 14)
-        # See FHEM 26_KM273v018.pm line 2229, 2678, 2746
-        request_id = CAN_REQUEST_BASE | (param.idx << 14)
-        msg = CANMessage(arbitration_id=request_id, data=encoded, is_extended_id=True)
-        self._adapter.flush_input_buffer()
-        adapter_timeout = getattr(self._adapter, "timeout", 2.0)
-        self._adapter.send_frame(
-            msg, timeout=timeout if timeout is not None else adapter_timeout
-        )
+        """Read and decode parameter, returning metadata + raw/decoded values.
 
-    # Internal helpers
-    def _lookup(self, name_or_idx: Any) -> Optional[Parameter]:
-        """Look up parameter by name or index using the registry.
-
-        Supports both HeatPump (get_parameter) and ParameterRegistry (get_by_name/get_by_index).
+        Served from a fresh broadcast (``read_policy``) or a cached response
+        (``response_cache``) when possible, else by RTR; the result's
+        'source' key tells which. With ``local=False`` the value is always
+        read by RTR (and the response cache refreshed).
         """
-        # Try HeatPump interface first
-        # Use unified lookup method
-        return self._registry.get_parameter(name_or_idx)
+        param = self.get(name_or_idx)
+        if local:
+            cached = self._local_raw(param)
+            if cached is not None:
+                raw, source = cached
+                return self._build_result(param, raw, source=source)
+        generation = self._generation(param)
+        raw = self.read_value(param.text, timeout=timeout)
+        self._remember(param, raw, generation)
+        return self._build_result(param, raw)
 
-    def _encode_value(self, param: Parameter, value: Any) -> bytes:
-        """Encode human-readable value to raw bytes for CAN transmission.
+    def read_many(
+        self,
+        names_or_idxs: Iterable[Any],
+        deadline: Optional[float] = None,
+        timeout: Optional[float] = None,
+        window: int = DEFAULT_READ_WINDOW,
+    ) -> dict[Any, dict[str, Any]]:
+        """Read several parameters with pipelined RTR requests.
 
-        # PROTOCOL: Matches FHEM behavior from fhem/26_KM273v018.pm:2728-2729
-        # User passes human-readable values (e.g., 53.0°C), we convert to raw.
+        Up to ``window`` RTRs (0x04003FE0 | idx << 14) are kept in flight and
+        responses are matched by their 0x0C003FE0 | idx << 14 IDs as they
+        arrive, so a batch costs roughly one bus round trip per window
+        instead of one full request/response cycle per parameter.
 
         Args:
-            param: Parameter definition with format, min, max
-            value: Human-readable value from user
+            names_or_idxs: Parameter names and/or indices to read
+            deadline: Total time budget for the batch in seconds
+                (default: adapter timeout)
+            timeout: Per-request timeout in seconds (default: adapter timeout)
+            window: Maximum number of outstanding requests
 
         Returns:
-            Bytes for CAN transmission (typically 2 bytes)
-
-        Raises:
-            ValueError: If value is out of range for the parameter
+            Dict keyed by each requested name/idx. Successful entries have the
+            same shape as read_parameter(); failed entries carry an 'error'
+            key ("unknown_parameter", "timeout" or the error message) with
+            decoded=None. Reads that succeeded are returned even if others
+            failed. Parameters answered from broadcasts or the response
+            cache send no RTR.
         """
-        fmt = param.format
-        from .formats import get_format_factor
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
 
-        # For formats with factors, validate human-readable value against scaled min/max
-        factor = get_format_factor(fmt)
-        if factor != 1:
-            # Convert min/max from raw to human-readable for validation
-            min_human = param.min * factor
-            max_human = param.max * factor
+        adapter_timeout = getattr(self._adapter, "timeout", 2.0)
+        per_request = timeout if timeout is not None else adapter_timeout
+        budget = deadline if deadline is not None else adapter_timeout
+        end = time.monotonic() + budget
+
+        results, keys_by_idx, params = self._resolve_batch(names_or_idxs)
+        local_raw, sources = self._resolve_local(params)
+        # Taken before any RTR goes out; a write in between voids the response
+        generations = {idx: self._generation(param) for idx, param in params.items()}
+        pending: dict[int, Parameter] = {}
+        joined: dict[int, futures.Future[bytes]] = {}
+        sent: dict[int, futures.Future[bytes]] = {}
+        for idx, param in params.items():
+            if idx in local_raw:
+                continue
+            future, send = self._join_read(idx)
+            if send:
+                pending[idx] = param
+                sent[idx] = future
+            else:
+                joined[idx] = future
+
+        raw_by_idx: dict[int, bytes] = {}
+        errors: dict[int, str] = {}
+        try:
+            self._pipeline(pending, per_request, end, window, raw_by_idx, errors)
+        finally:
+            for idx, future in sent.items():
+                if idx in raw_by_idx:
+                    self._finish_read(idx, future, raw_by_idx[idx])
+                    continue
+                error = errors.get(idx, "timeout")
+                self._finish_read(
+                    idx,
+                    future,
+                    error=(
+                        TimeoutError(f"No response for {params[idx].text}")
+                        if error == "timeout"
+                        else DeviceCommunicationError(error)
+                    ),
+                )
+        for idx, future in joined.items():
             try:
-                float_value = float(value)
-                if float_value < min_human or float_value > max_human:
-                    raise ValueError(
-                        f"Value {value} out of range for {param.text} "
-                        f"[{min_human}, {max_human}]"
-                    )
-            except (TypeError, ValueError) as e:
-                if "out of range" in str(e):
-                    raise
-                # Non-numeric values handled by encoder (e.g., select options)
+                raw_by_idx[idx] = self._await_read(
+                    future, params[idx], end - time.monotonic()
+                )
+            except TimeoutError:
+                errors[idx] = "timeout"
+            except Exception as e:
+                errors[idx] = str(e)
+        raw_by_idx.update(local_raw)
+
+        self._assemble_batch(
+            results, keys_by_idx, params, raw_by_idx, errors, sources, generations
+        )
+        return results
+
+    def _pipeline(
+        self,
+        pending: dict[int, Parameter],
+        per_request: float,
+        end: float,
+        window: int,
+        raw_by_idx: dict[int, bytes],
+        errors: dict[int, str],
+    ) -> None:
+        """Pipelined RTR reads of ``pending`` into ``raw_by_idx``/``errors``."""
+        if self._adapter.reader_running:
+            pipeline = self._pipeline_with_reader
         else:
-            # For int format, validate raw value directly
-            try:
-                int_value = int(value)
-                if int_value < param.min or int_value > param.max:
-                    raise ValueError(
-                        f"Value {value} out of range for {param.text} "
-                        f"[{param.min}, {param.max}]"
-                    )
-            except (TypeError, ValueError) as e:
-                if "out of range" in str(e):
-                    raise
-                # Non-numeric values (select options, time strings) handled by encoder
+            pipeline = self._pipeline_polling
+        if self.arbiter is None:
+            chunk_raw, chunk_errors = pipeline(pending, per_request, end, window)
+            raw_by_idx.update(chunk_raw)
+            errors.update(chunk_errors)
+            return
+        # One window per bus claim, so more urgent work can go between
+        idxs = list(pending)
+        for i in range(0, len(idxs), window):
+            chunk = {idx: pending[idx] for idx in idxs[i : i + window]}
+            if time.monotonic() >= end:
+                errors.update(dict.fromkeys(chunk, "timeout"))
+                continue
+            with self._bus():
+                chunk_raw, chunk_errors = pipeline(chunk, per_request, end, window)
+            raw_by_idx.update(chunk_raw)
+            errors.update(chunk_errors)
 
-        # Use FHEM-compatible encoding for known formats
-        # This converts human-readable values to raw bytes
-        return ValueEncoder.encode_by_format(
-            value=value,
-            format_type=fmt,
-            size_bytes=2,  # FHEM always uses 2 bytes for writes
-            min_val=param.min,
-        )
+    def _pipeline_with_reader(
+        self,
+        params: dict[int, Parameter],
+        per_request: float,
+        end: float,
+        window: int,
+    ) -> tuple[dict[int, bytes], dict[int, str]]:
+        """Pipelined RTR reads using the adapter's background-reader waiters."""
+        demux = self._adapter.demultiplexer
+        pending = list(reversed(list(params)))
+        in_flight: dict[Any, tuple[int, float, float]] = {}
+        raw_by_idx: dict[int, bytes] = {}
+        errors: dict[int, str] = {}
 
-    def _encode_int_like(
-        self, param: Parameter, value: Any, dlc_hint: int = 0
-    ) -> bytes:
         try:
-            ivalue = int(value)
-        except Exception as e:
-            raise ValueError(f"Invalid value for {param.text}: {value}") from e
-        if ivalue < param.min or ivalue > param.max:
-            raise ValueError(
-                f"Value {ivalue} out of range for {param.text} [{param.min}, {param.max}]"
-            )
-        signed = param.min < 0
-
-        # Use dlc_hint if provided (from actual device response)
-        if dlc_hint > 0:
-            size = dlc_hint
-        else:
-            # PROTOCOL: FHEM always uses 2 bytes for writes (see line 2746)
-            # Always use at least 2 bytes for compatibility with heat pump
-            size = 2
-            if signed:
-                if ivalue < -32768 or ivalue > 32767:
-                    size = 4
-            else:
-                if ivalue > 0xFFFF:
-                    size = 4
-        return ivalue.to_bytes(size, "big", signed=signed)
+            while pending or in_flight:
+                now = time.monotonic()
+                while pending and len(in_flight) < window and now < end:
+                    idx = pending.pop()
+                    future = demux.expect(CAN_RESPONSE_BASE | (idx << 14))
+                    try:
+                        self._adapter.send_frame_nowait(self._rtr_request(idx))
+                    except Exception as e:
+                        demux.cancel(CAN_RESPONSE_BASE | (idx << 14), future)
+                        errors[idx] = str(e)
+                        continue
+                    in_flight[future] = (idx, min(now + per_request, end), now)
+
+                if not in_flight:
+                    break
 
-    def _decode_value(self, param: Parameter, raw: bytes) -> Any:
-        """Decode raw bytes from CAN to human-readable value.
+                next_expiry = min(expiry for _, expiry, _ in in_flight.values())
+                done, _ = futures.wait(
+                    list(in_flight),
+                    timeout=max(next_expiry - time.monotonic(), 0),
+                    return_when=futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    idx, _, sent = in_flight.pop(future)
+                    try:
+                        raw_by_idx[idx] = bytes(future.result().data)
+                    except Exception as e:
+                        errors[idx] = str(e)
+                    else:
+                        self.metrics.record_latency(
+                            params[idx].text, time.monotonic() - sent
+                        )
+
+                now = time.monotonic()
+                for future, (idx, expiry, _) in list(in_flight.items()):
+                    if expiry <= now:
+                        del in_flight[future]
+                        demux.cancel(CAN_RESPONSE_BASE | (idx << 14), future)
+                        errors[idx] = "timeout"
+                        self.metrics.incr("timeouts")
+        finally:
+            for future, (idx, _, _) in in_flight.items():
+                demux.cancel(CAN_RESPONSE_BASE | (idx << 14), future)
+
+        return raw_by_idx, errors
+
+    def _pipeline_polling(
+        self,
+        params: dict[int, Parameter],
+        per_request: float,
+        end: float,
+        window: int,
+    ) -> tuple[dict[int, bytes], dict[int, str]]:
+        """Pipelined RTR reads by polling receive_frame() for responses."""
+        pending = list(reversed(list(params)))
+        # response_id -> (idx, expiry, sent)
+        in_flight: dict[int, tuple[int, float, float]] = {}
+        raw_by_idx: dict[int, bytes] = {}
+        errors: dict[int, str] = {}
+
+        if pending:
+            self._adapter.flush_input_buffer()
+
+        while pending or in_flight:
+            now = time.monotonic()
+            while pending and len(in_flight) < window and now < end:
+                idx = pending.pop()
+                try:
+                    self._adapter.send_frame_nowait(self._rtr_request(idx))
+                except Exception as e:
+                    errors[idx] = str(e)
+                    continue
+                in_flight[CAN_RESPONSE_BASE | (idx << 14)] = (
+                    idx,
+                    min(now + per_request, end),
+                    now,
+                )
 
-        # PROTOCOL: Matches FHEM behavior from fhem/26_KM273v018.pm:2714-2740
-        # Returns human-readable values (e.g., 53.0°C from raw 530).
+            if not in_flight:
+                break
 
-        Args:
-            param: Parameter definition with format, min, max
-            raw: Raw bytes from CAN response
+            next_expiry = min(expiry for _, expiry, _ in in_flight.values())
+            wait = next_expiry - time.monotonic()
+            frame = None
+            if wait > 0:
+                try:
+                    frame = self._adapter.receive_frame(timeout=wait)
+                except TimeoutError:
+                    frame = None
+            if frame is not None and frame.arbitration_id in in_flight:
+                idx, _, sent = in_flight.pop(frame.arbitration_id)
+                raw_by_idx[idx] = bytes(frame.data)
+                self.metrics.record_latency(params[idx].text, time.monotonic() - sent)
+            elif frame is not None:
+                self.metrics.incr("unexpected_responses")
+
+            now = time.monotonic()
+            for response_id, (idx, expiry, _) in list(in_flight.items()):
+                if expiry <= now:
+                    del in_flight[response_id]
+                    errors[idx] = "timeout"
+                    self.metrics.incr("timeouts")
+
+        return raw_by_idx, errors
 
-        Returns:
-            Decoded human-readable value (float, int, str, or None for DEAD)
-        """
-        try:
-            result = ValueEncoder.decode_by_format(
-                data=raw,
-                format_type=param.format,
-                min_val=param.min,
-            )
-            # None indicates DEAD sensor - return as-is for caller to handle
-            return result
-        except (ValueError, struct.error) as e:
-            self._logger.warning(
-                "Failed to decode %s (format=%s, raw=%s): %s",
-                param.text,
-                param.format,
-                raw.hex(),
-                e,
+    def write_value(
+        self, name_or_idx: Any, value: Any, timeout: Optional[float] = None
+    ) -> None:
+        param = self.get(name_or_idx)
+        # FHEM: read=1 means "readable", not "read-only"
+        # A parameter is read-only if min >= max (no valid write range)
+        if param.min >= param.max:
+            raise PermissionError(
+                f"Parameter {param.text} is read-only (min={param.min} >= max={param.max})"
             )
-            return raw.hex()  # Return hex string as fallback
+        encoded = self._encode_value(param, value)
+        # PROTOCOL: Write uses same CAN ID as read request (CAN_REQUEST_BASE | idx << 14)
+        # See FHEM 26_KM273v018.pm line 2229, 2678, 2746
+        request_id = CAN_REQUEST_BASE | (param.idx << 14)
+        msg = CANMessage(arbitration_id=request_id, data=encoded, is_extended_id=True)
+        adapter_timeout = getattr(self._adapter, "timeout", 2.0)
+        # Reads sent before this write must not answer reads issued after it
+        with self._inflight_lock:
+            self._inflight.pop(param.idx, None)
+        try:
+            with self._bus():
+                self._adapter.flush_input_buffer()
+                self._adapter.send_frame(
+                    msg, timeout=timeout if timeout is not None else adapter_timeout
+                )
+        finally:
+            # Even a failed send may have reached the heat pump
+            self._forget(param)
@@ -168,8 +168,9 @@ class StatusView:
     def _read_temp(self, param_name: str) -> Optional[float]:
         """Read a temperature parameter, returning None if not available.
 
-        Note: RTR-based reads often fail due to CAN bus traffic. Consider
-        using BroadcastMonitor for reliable temperature readings.
+        Note: RTR-based reads often fail due to CAN bus traffic. Give the
+        client a BroadcastReadPolicy to serve broadcast temperatures
+        (GT2/GT8/GT9, RC10 room temps) from a running BroadcastMonitor.
         """
         try:
             result = self._client.read_parameter(param_name)
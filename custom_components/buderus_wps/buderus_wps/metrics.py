@@ -0,0 +1,217 @@
+"""Frame-level counters and latency histograms for the CAN stack.
+
+BusMetrics is shared by USBtinAdapter (frames/bytes on the wire, timeouts,
+lenient-parse fallbacks, flush-discarded data) and HeatPumpClient (RTR
+round-trip latency per parameter, unexpected response IDs, reads that
+joined one already in flight). Recording is
+designed to stay on in the hot path:
+
+- Counters are plain integers in a dict; an increment is a single dict
+  update with no lock. Concurrent increments from the reader thread and a
+  caller can in rare cases lose one count, which is acceptable for
+  diagnostics.
+- Latency histograms use fixed log-spaced buckets (0.5 ms to ~60 s, 25%
+  wide), so recording is a bisect plus an integer increment and memory per
+  parameter is constant. Percentiles are read from bucket upper bounds.
+
+snapshot() builds a plain dict (JSON-serializable) with totals, per-second
+rates over the recent snapshot window and p50/p95/p99 latencies.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+# Counter names maintained by the adapter and client
+COUNTERS = (
+    "rx_frames",
+    "rx_bytes",
+    "tx_frames",
+    "tx_bytes",
+    "timeouts",
+    "unexpected_responses",
+    "lenient_parses",
+    "flush_discarded_bytes",
+    "flush_discarded_frames",
+    "coalesced_reads",
+)
+
+# Counters reported as per-second rates in snapshots
+RATE_COUNTERS = ("rx_frames", "rx_bytes", "tx_frames", "tx_bytes")
+
+# Log-spaced latency bucket upper bounds in seconds: 0.5 ms * 1.25^n up to ~60 s
+LATENCY_BUCKETS: tuple[float, ...] = tuple(0.0005 * 1.25**n for n in range(53))
+
+# Rates are averaged over snapshots taken within this many seconds
+RATE_WINDOW = 60.0
+
+# Minimum spacing of rate samples kept for the window (seconds)
+RATE_SAMPLE_INTERVAL = 1.0
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram.
+
+    Attributes:
+        count: Number of recorded samples
+        total: Sum of recorded samples (seconds)
+        max: Largest recorded sample (seconds)
+    """
+
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self) -> None:
+        # One extra bucket collects samples beyond the last bound
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one sample."""
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Return the bucket upper bound containing the q-th percentile.
+
+        Args:
+            q: Percentile in 0-100
+
+        Returns:
+            Latency in seconds (capped at the observed maximum), or None
+            if nothing was recorded
+        """
+        if self.count == 0:
+            return None
+        rank = max(1, int(self.count * q / 100.0 + 0.999999))
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank:
+                if i < len(LATENCY_BUCKETS):
+                    return min(LATENCY_BUCKETS[i], self.max)
+                return self.max
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        """Summary in milliseconds."""
+
+        def ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000.0, 2)
+
+        return {
+            "count": self.count,
+            "mean_ms": ms(self.total / self.count) if self.count else None,
+            "p50_ms": ms(self.percentile(50)),
+            "p95_ms": ms(self.percentile(95)),
+            "p99_ms": ms(self.percentile(99)),
+            "max_ms": ms(self.max) if self.count else None,
+        }
+
+
+class BusMetrics:
+    """Counters and RTR latency histograms for one CAN connection."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize metrics.
+
+        Args:
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._clock = clock
+        self.counters: dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.rtr_latency = LatencyHistogram()
+        self._latency: dict[str, LatencyHistogram] = {}
+        self._started = clock()
+        self._samples: deque[tuple[float, tuple[int, ...]]] = deque(
+            [(self._started, (0,) * len(RATE_COUNTERS))]
+        )
+
+    def incr(self, name: str, n: int = 1) -> None:
+        """Increment a counter."""
+        self.counters[name] += n
+
+    def record_rx(self, frames: int, nbytes: int) -> None:
+        """Record received serial data and the frames parsed from it."""
+        counters = self.counters
+        counters["rx_frames"] += frames
+        counters["rx_bytes"] += nbytes
+
+    def record_tx(self, nbytes: int, frame: bool = True) -> None:
+        """Record a write to the adapter (frames and SLCAN commands)."""
+        counters = self.counters
+        if frame:
+            counters["tx_frames"] += 1
+        counters["tx_bytes"] += nbytes
+
+    def record_latency(self, parameter: str, seconds: float) -> None:
+        """Record an RTR round trip for a parameter."""
+        self.rtr_latency.record(seconds)
+        histogram = self._latency.get(parameter)
+        if histogram is None:
+            histogram = self._latency.setdefault(parameter, LatencyHistogram())
+        histogram.record(seconds)
+
+    def latency(self, parameter: str) -> Optional[LatencyHistogram]:
+        """Return the latency histogram of a parameter, if any reads were timed."""
+        return self._latency.get(parameter)
+
+    def reset(self) -> None:
+        """Zero all counters and histograms."""
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.rtr_latency = LatencyHistogram()
+        self._latency = {}
+        self._started = self._clock()
+        self._samples = deque([(self._started, (0,) * len(RATE_COUNTERS))])
+
+    def snapshot(self, per_parameter: bool = True) -> dict[str, Any]:
+        """Build a JSON-serializable view of the current metrics.
+
+        Rates are averaged since the oldest snapshot taken within the last
+        RATE_WINDOW seconds (or since creation/reset).
+
+        Args:
+            per_parameter: Include per-parameter latency summaries
+
+        Returns:
+            Dict with 'uptime_s', 'counters', 'rates', 'rtr_latency' and
+            optionally 'parameters'
+        """
+        now = self._clock()
+        counters = dict(self.counters)
+        current = tuple(counters[name] for name in RATE_COUNTERS)
+
+        samples = self._samples
+        while len(samples) > 1 and now - samples[1][0] >= RATE_WINDOW:
+            samples.popleft()
+        oldest_time, oldest = samples[0]
+        if now - samples[-1][0] >= RATE_SAMPLE_INTERVAL:
+            samples.append((now, current))
+
+        elapsed = now - oldest_time
+        rates = {
+            f"{name}_per_s": (
+                round((value - base) / elapsed, 2) if elapsed > 0 else 0.0
+            )
+            for name, value, base in zip(RATE_COUNTERS, current, oldest)
+        }
+
+        result: dict[str, Any] = {
+            "uptime_s": round(now - self._started, 1),
+            "counters": counters,
+            "rates": rates,
+            "rtr_latency": self.rtr_latency.snapshot(),
+        }
+        if per_parameter:
+            result["parameters"] = {
+                name: histogram.snapshot()
+                for name, histogram in sorted(self._latency.items())
+            }
+        return result
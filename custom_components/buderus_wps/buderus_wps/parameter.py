@@ -11,7 +11,7 @@ The HeatPump class provides a container for all parameters with efficient lookup
 index number or parameter name. It supports loading parameters from multiple sources:
 - Cache: Previously discovered parameters saved to disk
 - Discovery: Live discovery from device via CAN bus
-- Fallback: Static data from parameter_data.py
+- Fallback: Static data from parameter_data.py, built per parameter on first lookup
 
 Classes:
     Parameter: Immutable dataclass representing a single heat pump parameter
@@ -26,11 +26,18 @@ Example:
 """
 
 import logging
+import threading
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from .parameter_table import ParameterTable
 
 logger = logging.getLogger(__name__)
 
+_View = TypeVar("_View")
+
 
 @dataclass(frozen=True)
 class Parameter:
@@ -161,9 +168,18 @@ class HeatPump:
     Loads parameters from cache, discovery, or static fallback data.
     Provides lookup by name (case-insensitive) or index number.
 
+    Sorted and filtered views (parameters, list_writable_parameters, ...) are
+    immutable tuples computed once per registry version; loading parameters
+    or a discovery that changes them starts a new version.
+
+    Lookups are thread-safe: resolving fallback rows, building views and
+    applying discoveries hold a lock, and a row is added to the lookups
+    before its name or index counts as resolved.
+
     Attributes:
         data_source: Source of parameter data ("fallback", "cache", or "discovery")
         using_fallback: True if using static fallback data
+        version: Incremented whenever the parameter set changes
 
     Example:
         >>> hp = HeatPump()
@@ -182,13 +198,24 @@ class HeatPump:
 
         Args:
             adapter: Optional CAN adapter for discovery (not used in simplified mode)
-            cache_path: Optional path to cached parameter JSON file.
+            cache_path: Optional path to parameter cache file.
                        If provided and exists, loads from cache.
             force_discovery: If True, skip cache and try discovery (requires adapter)
         """
         self._params_by_name: dict[str, Parameter] = {}
         self._params_by_idx: dict[int, Parameter] = {}
+        # Static fallback table; its rows are added to the dicts above the
+        # first time their name or idx is looked up (a resolved key is
+        # never read from the table again)
+        self._fallback: Optional[ParameterTable] = None
+        self._resolved_names: set[str] = set()
+        self._resolved_idx: set[int] = set()
         self._discovered_names: set = set()  # Names with discovered/cached idx
+        # Views of the current version, by name (see _view)
+        self._version = 0
+        self._views: dict[str, Any] = {}
+        # Reentrant: resolving an idx resolves its name, views resolve all
+        self._lock = threading.RLock()
         self._data_source = "fallback"
         self._using_fallback = True
         self._adapter = adapter
@@ -229,7 +256,7 @@ class HeatPump:
         # Load static fallback data
         self._load_fallback()
         logger.warning(
-            "Using fallback parameter data (%d parameters)", len(self._params_by_idx)
+            "Using fallback parameter data (%d parameters)", self.parameter_count()
         )
 
     def _run_discovery(self) -> None:
@@ -280,18 +307,105 @@ class HeatPump:
             logger.warning("Failed to save cache: %s", e)
 
     def _load_fallback(self) -> None:
-        """Load parameters from static fallback data."""
+        """Load parameters from static fallback data.
+
+        Parameters are built lazily: a discovery cache usually replaces most
+        of them, so only the ones that are looked up are materialised.
+        """
         from .parameter_data import PARAMETER_DATA
 
-        self._load_parameters(PARAMETER_DATA)
+        self._load_parameters([])
+        self._fallback = PARAMETER_DATA
+        names = PARAMETER_DATA.names
+        for shadowed, row in PARAMETER_DATA.duplicates():
+            logger.warning(
+                "Duplicate idx=%d: %s overwrites %s (only one accessible by index)",
+                PARAMETER_DATA[row]["idx"],
+                names[row],
+                names[shadowed],
+            )
         self._data_source = "fallback"
         self._using_fallback = True
-        logger.debug("Loaded %d parameters from fallback", len(self._params_by_idx))
+        logger.debug("Loaded %d parameters from fallback", self.parameter_count())
 
-    def _load_parameters(self, data: list[dict[str, Any]]) -> None:
+    def _resolve_name(self, name: str) -> None:
+        """Add the fallback parameter called ``name`` (upper-case) on first use."""
+        if self._fallback is None or name in self._resolved_names:
+            return
+        with self._lock:
+            fallback = self._fallback
+            if fallback is None or name in self._resolved_names:
+                return
+            row = fallback.find_name(name)
+            if row is not None:
+                item = fallback[row]
+                param = self._params_by_name[name] = Parameter(
+                    idx=item["idx"],
+                    extid=item["extid"],
+                    min=item["min"],
+                    max=item["max"],
+                    format=item["format"],
+                    read=item["read"],
+                    text=item["text"],
+                )
+                # Duplicate indices resolve to the last row, as in _load_parameters
+                if (
+                    param.idx not in self._resolved_idx
+                    and fallback.find_idx(param.idx) == row
+                ):
+                    self._params_by_idx[param.idx] = param
+                    self._resolved_idx.add(param.idx)
+            self._resolved_names.add(name)
+
+    def _resolve_idx(self, idx: int) -> None:
+        """Add the fallback parameter with index ``idx`` on first use."""
+        if self._fallback is None or idx in self._resolved_idx:
+            return
+        with self._lock:
+            fallback = self._fallback
+            if fallback is None or idx in self._resolved_idx:
+                return
+            row = fallback.find_idx(idx)
+            if row is not None:
+                self._resolve_name(fallback.names[row].upper())
+            self._resolved_idx.add(idx)
+
+    def _resolve_all(self) -> None:
+        """Materialise all remaining fallback parameters."""
+        with self._lock:
+            fallback = self._fallback
+            if fallback is None:
+                return
+            for item in fallback:
+                self._resolve_idx(item["idx"])
+            for name in fallback.names:
+                self._resolve_name(name.upper())
+            self._fallback = None
+
+    def _changed(self) -> None:
+        """Start a new version: drop the cached views."""
+        self._version += 1
+        self._views.clear()
+
+    def _view(self, key: str, build: Callable[[], _View]) -> _View:
+        """View ``key`` of the current version, built on first use."""
+        try:
+            return self._views[key]  # type: ignore[no-any-return]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._views:
+                self._views[key] = build()
+            return self._views[key]  # type: ignore[no-any-return]
+
+    def _load_parameters(self, data: Iterable[dict[str, Any]]) -> None:
         """Load parameters from list of dicts."""
+        self._changed()
         self._params_by_name.clear()
         self._params_by_idx.clear()
+        self._fallback = None
+        self._resolved_names.clear()
+        self._resolved_idx.clear()
 
         for item in data:
             try:
@@ -330,7 +444,10 @@ class HeatPump:
 
     def parameter_count(self) -> int:
         """Return total number of loaded parameters."""
-        return len(self._params_by_idx)
+        count = len(self._params_by_idx)
+        if self._fallback is not None:
+            count += len(self._fallback.indices() - self._resolved_idx)
+        return count
 
     def get_parameter_by_name(self, name: str) -> Parameter:
         """Look up parameter by name (case-insensitive).
@@ -344,7 +461,9 @@ class HeatPump:
         Raises:
             KeyError: If parameter not found
         """
-        param = self._params_by_name.get(name.upper())
+        key = name.upper()
+        self._resolve_name(key)
+        param = self._params_by_name.get(key)
         if param is None:
             raise KeyError(f"Unknown parameter: {name}")
         return param
@@ -361,6 +480,7 @@ class HeatPump:
         Raises:
             KeyError: If parameter not found
         """
+        self._resolve_idx(idx)
         param = self._params_by_idx.get(idx)
         if param is None:
             raise KeyError(f"Unknown parameter index: {idx}")
@@ -376,31 +496,57 @@ class HeatPump:
             Parameter object or None if not found
         """
         if isinstance(name_or_idx, str):
-            return self._params_by_name.get(name_or_idx.upper())
+            key = name_or_idx.upper()
+            self._resolve_name(key)
+            return self._params_by_name.get(key)
         if isinstance(name_or_idx, int):
+            self._resolve_idx(name_or_idx)
             return self._params_by_idx.get(name_or_idx)
         return None
 
     @property
-    def parameters(self) -> list[Parameter]:
-        """Return list of all parameters sorted by index (for CLI compatibility)."""
-        return sorted(self._params_by_idx.values(), key=lambda p: p.idx)
+    def version(self) -> int:
+        """Version of the parameter set (incremented on every change)."""
+        return self._version
+
+    @property
+    def parameters(self) -> tuple[Parameter, ...]:
+        """Return all parameters sorted by index (for CLI compatibility)."""
+        return self._view("sorted", self._sorted_parameters)
 
-    def all_parameters(self) -> list[Parameter]:
-        """Return list of all parameters sorted by index."""
+    def _sorted_parameters(self) -> tuple[Parameter, ...]:
+        self._resolve_all()
+        return tuple(sorted(self._params_by_idx.values(), key=lambda p: p.idx))
+
+    def all_parameters(self) -> tuple[Parameter, ...]:
+        """Return all parameters sorted by index."""
         return self.parameters
 
-    def list_all_parameters(self) -> list[Parameter]:
-        """Return list of all parameters sorted by index (alias for all_parameters)."""
+    def list_all_parameters(self) -> tuple[Parameter, ...]:
+        """Return all parameters sorted by index (alias for all_parameters)."""
         return self.all_parameters()
 
-    def list_writable_parameters(self) -> list[Parameter]:
-        """Return list of writable parameters (read=0) sorted by index."""
-        return [p for p in self.all_parameters() if p.read == 0]
+    def list_writable_parameters(self) -> tuple[Parameter, ...]:
+        """Return writable parameters (read=0) sorted by index."""
+        return self._view(
+            "writable", lambda: tuple(p for p in self.parameters if p.read == 0)
+        )
+
+    def list_readonly_parameters(self) -> tuple[Parameter, ...]:
+        """Return read-only parameters (read=1) sorted by index."""
+        return self._view(
+            "readonly", lambda: tuple(p for p in self.parameters if p.read == 1)
+        )
+
+    def list_parameters_by_format(self, format: str) -> tuple[Parameter, ...]:
+        """Return parameters with the given format (e.g. "tem") sorted by index."""
+        return self._view("by_format", self._group_by_format).get(format, ())
 
-    def list_readonly_parameters(self) -> list[Parameter]:
-        """Return list of read-only parameters (read=1) sorted by index."""
-        return [p for p in self.all_parameters() if p.read == 1]
+    def _group_by_format(self) -> dict[str, tuple[Parameter, ...]]:
+        groups: dict[str, list[Parameter]] = {}
+        for param in self.parameters:
+            groups.setdefault(param.format, []).append(param)
+        return {fmt: tuple(params) for fmt, params in groups.items()}
 
     def has_parameter_name(self, name: str) -> bool:
         """Check if parameter exists by name (case-insensitive).
@@ -411,7 +557,9 @@ class HeatPump:
         Returns:
             True if parameter exists, False otherwise
         """
-        return name.upper() in self._params_by_name
+        key = name.upper()
+        self._resolve_name(key)
+        return key in self._params_by_name
 
     def has_parameter_index(self, idx: int) -> bool:
         """Check if parameter exists by index.
@@ -422,6 +570,7 @@ class HeatPump:
         Returns:
             True if parameter exists, False otherwise
         """
+        self._resolve_idx(idx)
         return idx in self._params_by_idx
 
     def is_discovered(self, name: str) -> bool:
@@ -470,93 +619,119 @@ class HeatPump:
         Returns:
             Number of parameters updated
         """
-        updated = 0
-        for elem in discovered_elements:
-            name = elem.text.upper()
-            if name in self._params_by_name:
-                old_param = self._params_by_name[name]
+        return self.apply_discovery(discovered_elements)
 
-                # Check if ANY field needs updating (idx, extid, min, or max)
-                idx_changed = old_param.idx != elem.idx
-                extid_changed = old_param.extid != elem.extid
-                min_changed = old_param.min != elem.min_value
-                max_changed = old_param.max != elem.max_value
-                needs_update = (
-                    idx_changed or extid_changed or min_changed or max_changed
-                )
+    def apply_discovery(self, discovered_elements: Iterable[Any]) -> int:
+        """Apply a batch of discovered elements in one pass.
 
-                if needs_update:
-                    # Create new parameter with all values from discovery
-                    # (but keep format/read from static defaults)
-                    new_param = Parameter(
-                        idx=elem.idx,
-                        extid=elem.extid,
-                        min=elem.min_value,
-                        max=elem.max_value,
-                        format=old_param.format,  # Keep format from static defaults
-                        read=old_param.read,  # Keep read flag from static defaults
-                        text=old_param.text,
-                    )
+        Changed and new parameters are collected first; the name and index
+        lookups are then updated together under the registry lock and the
+        cached views invalidated once, so applying a complete element list
+        costs a single walk. A parameter that moves only releases its old
+        index if it still owns it.
 
-                    # Update lookups
-                    if idx_changed:
-                        # Remove old idx mapping if idx changed
-                        del self._params_by_idx[old_param.idx]
-                        logger.info(
-                            "Updated %s: idx %d -> %d (CAN ID 0x%08X -> 0x%08X)",
-                            old_param.text,
-                            old_param.idx,
-                            elem.idx,
-                            0x04003FE0 | (old_param.idx << 14),
-                            0x04003FE0 | (elem.idx << 14),
-                        )
-                    else:
-                        # Log metadata changes when idx is same
-                        changes = []
-                        if extid_changed:
-                            changes.append(f"extid {old_param.extid} -> {elem.extid}")
-                        if min_changed:
-                            changes.append(f"min {old_param.min} -> {elem.min_value}")
-                        if max_changed:
-                            changes.append(f"max {old_param.max} -> {elem.max_value}")
-                        logger.debug(
-                            "Updated %s metadata: %s",
-                            old_param.text,
-                            ", ".join(changes),
-                        )
+        Args:
+            discovered_elements: DiscoveredElements (idx, extid, text,
+                min_value, max_value)
 
-                    self._params_by_name[name] = new_param
-                    self._params_by_idx[elem.idx] = new_param
-                    updated += 1
-            else:
-                # New parameter not in static defaults - add it
+        Returns:
+            Number of existing parameters whose idx, extid, min or max changed
+        """
+        with self._lock:
+            count = 0
+            updated = 0
+            changes: dict[str, tuple[Optional[Parameter], Parameter]] = {}
+            for elem in discovered_elements:
+                count += 1
+                name = elem.text.upper()
+                self._discovered_names.add(name)
+                self._resolve_name(name)
+                old_param = self._params_by_name.get(name)
+                if old_param is None:
+                    # New parameter not in static defaults - add it
+                    changes[name] = (
+                        None,
+                        Parameter(
+                            idx=elem.idx,
+                            extid=elem.extid,
+                            min=elem.min_value,
+                            max=elem.max_value,
+                            format="int",  # Default format for unknown parameters
+                            read=0,  # Assume writable
+                            text=elem.text,
+                        ),
+                    )
+                    logger.debug(
+                        "Added discovered parameter: %s (idx=%d)", elem.text, elem.idx
+                    )
+                    continue
+
+                # Check if ANY field needs updating (idx, extid, min, or max)
+                if (
+                    old_param.idx == elem.idx
+                    and old_param.extid == elem.extid
+                    and old_param.min == elem.min_value
+                    and old_param.max == elem.max_value
+                ):
+                    continue
+
+                # New parameter with all values from discovery (but keep
+                # format/read from static defaults)
                 new_param = Parameter(
                     idx=elem.idx,
                     extid=elem.extid,
                     min=elem.min_value,
                     max=elem.max_value,
-                    format="int",  # Default format for unknown parameters
-                    read=0,  # Assume writable
-                    text=elem.text,
-                )
-                self._params_by_name[name] = new_param
-                self._params_by_idx[elem.idx] = new_param
-                logger.debug(
-                    "Added discovered parameter: %s (idx=%d)", elem.text, elem.idx
+                    format=old_param.format,
+                    read=old_param.read,
+                    text=old_param.text,
                 )
+                changes[name] = (old_param, new_param)
+                updated += 1
+                if old_param.idx != elem.idx:
+                    logger.info(
+                        "Updated %s: idx %d -> %d (CAN ID 0x%08X -> 0x%08X)",
+                        old_param.text,
+                        old_param.idx,
+                        elem.idx,
+                        0x04003FE0 | (old_param.idx << 14),
+                        0x04003FE0 | (elem.idx << 14),
+                    )
+                else:
+                    # Log metadata changes when idx is same
+                    details = []
+                    if old_param.extid != elem.extid:
+                        details.append(f"extid {old_param.extid} -> {elem.extid}")
+                    if old_param.min != elem.min_value:
+                        details.append(f"min {old_param.min} -> {elem.min_value}")
+                    if old_param.max != elem.max_value:
+                        details.append(f"max {old_param.max} -> {elem.max_value}")
+                    logger.debug(
+                        "Updated %s metadata: %s", old_param.text, ", ".join(details)
+                    )
 
-        # Mark ALL discovered elements as having reliable idx values
-        for elem in discovered_elements:
-            self._discovered_names.add(elem.text.upper())
+            if changes:
+                # Release moved indices first, so a parameter moving into an
+                # index another one just left keeps it
+                for old_param, new_param in changes.values():
+                    if old_param is not None and old_param.idx != new_param.idx:
+                        self._resolve_idx(old_param.idx)
+                        if self._params_by_idx.get(old_param.idx) is old_param:
+                            del self._params_by_idx[old_param.idx]
+                for name, (_, new_param) in changes.items():
+                    self._resolve_idx(new_param.idx)
+                    self._params_by_name[name] = new_param
+                    self._params_by_idx[new_param.idx] = new_param
+                self._changed()
 
         if updated > 0:
             self._data_source = "discovery"
             self._using_fallback = False
             logger.info("Updated %d parameter indices from discovery", updated)
 
-        logger.info(
+        logger.debug(
             "Element discovery: %d elements, %d indices updated, %d parameters now discovered",
-            len(discovered_elements),
+            count,
             updated,
             len(self._discovered_names),
         )
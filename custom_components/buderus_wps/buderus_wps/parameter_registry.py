@@ -2,8 +2,8 @@
 Parameter registry backed by static defaults with optional device overrides.
 
 Defaults are generated from fhem/26_KM273v018.pm via tools/generate_parameter_defaults.py
-and stored in buderus_wps/parameter_defaults.py. When a live heat pump provides
-an updated element list, the registry can be rebuilt with those entries.
+into the packed table exposed by buderus_wps/parameter_defaults.py. When a live heat
+pump provides an updated element list, the registry can be rebuilt with those entries.
 """
 
 from __future__ import annotations
@@ -0,0 +1,213 @@
+"""Packed static parameter table with lazy row materialisation.
+
+The static parameter definitions (from fhem/26_KM273v018.pm) are generated
+by tools/generate_parameter_defaults.py into parameter_table_data as packed
+columns: little-endian arrays for idx/min/max, byte columns for the read
+flag, format code and extid, and a table of names. ParameterTable is a
+read-only sequence over these columns. A row's dict is built the first
+time it is accessed, and the name and idx indexes are built on first lookup.
+
+parameter_defaults.PARAMETER_DEFAULTS and parameter_data.PARAMETER_DATA
+are both views over the same columns; PARAMETER_DATA applies the curated
+corrections in DATA_OVERRIDES.
+
+Example:
+    >>> from buderus_wps.parameter_defaults import PARAMETER_DEFAULTS
+    >>> PARAMETER_DEFAULTS.get_by_name("access_level")["max"]
+    5
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from types import ModuleType
+from typing import Any, Optional, overload
+
+# Packed columns and the array typecode they are stored with
+ARRAY_COLUMNS = {"IDX": "H", "MIN": "i", "MAX": "i"}
+EXTID_SIZE = 7
+
+
+def _unpack_array(typecode: str, data: bytes) -> array:
+    values = array(typecode, data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def pack_array(typecode: str, values: Sequence[int]) -> bytes:
+    """Little-endian bytes of ``values`` as stored in parameter_table_data."""
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+class ParameterTable(Sequence[dict[str, Any]]):
+    """Read-only sequence of parameter dicts backed by packed columns.
+
+    Rows are dicts with the keys idx, extid, max, min, format, read and text,
+    in the order of the FHEM table. Each dict is built on first access and
+    reused afterwards, so callers see the same object for the same row.
+    Lookups by name are case-insensitive; lookups by idx return the last row
+    with that idx (the table has a few duplicate indices).
+
+    Args:
+        source: Generated module (or mapping) with COUNT, FORMATS, IDX, MIN,
+            MAX, READ, FORMAT, EXTID and NAMES
+        overrides: Field values replacing the generated ones, by name
+    """
+
+    def __init__(
+        self,
+        source: ModuleType | Mapping[str, Any],
+        overrides: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    ) -> None:
+        columns = vars(source) if isinstance(source, ModuleType) else source
+        self._count: int = columns["COUNT"]
+        self._formats: tuple[str, ...] = tuple(columns["FORMATS"])
+        self._idx = _unpack_array(ARRAY_COLUMNS["IDX"], columns["IDX"])
+        self._min = _unpack_array(ARRAY_COLUMNS["MIN"], columns["MIN"])
+        self._max = _unpack_array(ARRAY_COLUMNS["MAX"], columns["MAX"])
+        self._read: bytes | bytearray = columns["READ"]
+        self._format: bytes | bytearray = columns["FORMAT"]
+        self._extid: bytes | bytearray = columns["EXTID"]
+        self._names_source: str = columns["NAMES"]
+        self._names: Optional[tuple[str, ...]] = None
+        self._by_name: Optional[dict[str, int]] = None
+        self._by_idx: Optional[dict[int, int]] = None
+        self._rows: list[Optional[dict[str, Any]]] = [None] * self._count
+        sizes = {
+            len(self._idx),
+            len(self._min),
+            len(self._max),
+            len(self._read),
+            len(self._format),
+            len(self._extid) // EXTID_SIZE,
+        }
+        if sizes != {self._count}:
+            raise ValueError(f"Parameter table columns do not match COUNT {sizes}")
+        if overrides:
+            self._apply_overrides(overrides)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("parameter table index out of range")
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for i in range(self._count):
+            yield self.row(i)
+
+    def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
+        if not isinstance(other, (list, tuple, ParameterTable)):
+            return NotImplemented
+        return len(other) == self._count and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"<ParameterTable {self._count} parameters>"
+
+    def row(self, i: int) -> dict[str, Any]:
+        """Dict of row ``i`` (built on first access)."""
+        entry = self._rows[i]
+        if entry is None:
+            start = i * EXTID_SIZE
+            entry = self._rows[i] = {
+                "idx": self._idx[i],
+                "extid": self._extid[start : start + EXTID_SIZE].hex().upper(),
+                "max": self._max[i],
+                "min": self._min[i],
+                "format": self._formats[self._format[i]],
+                "read": self._read[i],
+                "text": self.names[i],
+            }
+        return entry
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Parameter names in row order."""
+        if self._names is None:
+            self._names = tuple(sys.intern(name) for name in self._names_source.split())
+        return self._names
+
+    def find_name(self, name: str) -> Optional[int]:
+        """Row of the parameter called ``name`` (case-insensitive), or None."""
+        if self._by_name is None:
+            self._by_name = {text.upper(): i for i, text in enumerate(self.names)}
+        return self._by_name.get(name.upper())
+
+    def find_idx(self, idx: int) -> Optional[int]:
+        """Last row with index ``idx``, or None."""
+        return self._idx_index().get(idx)
+
+    def get_by_name(self, name: str) -> Optional[dict[str, Any]]:
+        """Parameter dict by name (case-insensitive), or None."""
+        row = self.find_name(name)
+        return self.row(row) if row is not None else None
+
+    def get_by_idx(self, idx: int) -> Optional[dict[str, Any]]:
+        """Parameter dict of the last row with index ``idx``, or None."""
+        row = self.find_idx(idx)
+        return self.row(row) if row is not None else None
+
+    def indices(self) -> set[int]:
+        """Distinct parameter indices."""
+        return set(self._idx_index())
+
+    def duplicates(self) -> list[tuple[int, int]]:
+        """(shadowed row, row returned by find_idx) pairs for duplicate indices."""
+        by_idx = self._idx_index()
+        return [(i, by_idx[idx]) for i, idx in enumerate(self._idx) if by_idx[idx] != i]
+
+    def _idx_index(self) -> dict[int, int]:
+        if self._by_idx is None:
+            self._by_idx = {idx: i for i, idx in enumerate(self._idx)}
+        return self._by_idx
+
+    def _apply_overrides(self, overrides: Mapping[str, Mapping[str, Any]]) -> None:
+        """Patch copies of the columns with per-name field overrides."""
+        self._idx = array(self._idx.typecode, self._idx)
+        self._min = array(self._min.typecode, self._min)
+        self._max = array(self._max.typecode, self._max)
+        self._read = bytearray(self._read)
+        self._format = bytearray(self._format)
+        self._extid = bytearray(self._extid)
+        for name, fields in overrides.items():
+            i = self.find_name(name)
+            if i is None:
+                raise ValueError(f"Override for unknown parameter {name!r}")
+            for key, value in fields.items():
+                if key == "idx":
+                    self._idx[i] = value
+                elif key == "min":
+                    self._min[i] = value
+                elif key == "max":
+                    self._max[i] = value
+                elif key == "read":
+                    self._read[i] = value
+                elif key == "format":
+                    self._format[i] = self._formats.index(value)
+                elif key == "extid":
+                    start = i * EXTID_SIZE
+                    self._extid[start : start + EXTID_SIZE] = bytes.fromhex(value)
+                else:
+                    raise ValueError(f"Cannot override {key!r} of {name!r}")
@@ -0,0 +1,2911 @@
+# Auto-generated by tools/generate_parameter_defaults.py
+# Do not edit manually. Source: fhem/26_KM273v018.pm
+#
+# Packed columns of the static parameter table, decoded by
+# parameter_table.ParameterTable: IDX (uint16), MIN and MAX (int32) are
+# little-endian arrays; READ, FORMAT (index into FORMATS) and EXTID
+# (7 bytes per row) are byte columns; NAMES has one name per line.
+
+from __future__ import annotations
+
+COUNT = 1788
+
+FORMATS = (
+    "dp1",
+    "dp2",
+    "hm1",
+    "hm2",
+    "int",
+    "pw2",
+    "pw3",
+    "rp1",
+    "rp2",
+    "sw1",
+    "sw2",
+    "t15",
+    "tem",
+)
+
+IDX = bytes.fromhex(
+    "00000100020003000400050006000700080009000a000b000c000e000f001000"
+    "110012001300150016001700180019001b001d001f0020002200240026002800"
+    "2a002c002e0030003100330035003700380039003a003b003c003d003f004100"
+    "43004400450046004700480049004a004b004c004d004e004f00500051005200"
+    "53005400550056005700580059005a005b005c005d005f006100630064006500"
+    "660068006a006c006e0070007100730074007500760078007a007c007e008000"
+    "8200840085008600870088008a008c008e009000920094009600970098009900"
+    "9b009c009d009e009f00a000a100a300a400a600a800a900aa00ab00ac00ad00"
+    "ae00b000b200b400b600b700b900bb00bc00bd00be00bf00c100c300c400c600"
+    "c700c800c900ca00cb00cc00cd00ce00d000d200d300d400d500d600d700d800"
+    "d900da00db00dc00de00e000e100e200e300e400e600e800ea00ec00ee00ef00"
+    "f000f100f200f300f400f500f600f700f800f900fb00fd00ff00010102010301"
+    "0401050106010701080109010a010b010c010d010e010f011001110112011301"
+    "1401150116011701180119011a011b011c011d011e011f012001210122012301"
+    "240126012701280129012a012b012c012d012e01300132013301340135013601"
+    "3701380139013a013b013c013d013e013f014001410142014301440145014701"
+    "49014b014d014f01510153015501570159015a015b015c015d015e015f016001"
+    "61016201630165016701680169016a016b016c016d016e016f01700171017201"
+    "730174017501770179017a017b017c017d017f01820183018501860188018901"
+    "8a018b018c018d018e018f01900191019201930195019601970198019a019b01"
+    "9c019d019e019f01a101a301a501a701a901ab01ad01af01b101b301b501b701"
+    "b901bb01bd01bf01c101c301c501c701c901cb01cc01ce01d001d201d401d601"
+    "d801da01dc01de01e001e201e401e601e901ea01eb01ec01ed01ee01ef01f001"
+    "f101f301f501f601f701f801f901fb01fc01fd01fe01ff010002010202020302"
+    "05020602070209020a020b020c020d020f021002110213021402160218021902"
+    "1a021b021c021e022002210222022302240225022602270229022b022d022f02"
+    "310233023402350236023702380239023a023b023c023d023e023f0240024102"
+    "420243024402450246024702480249024a024b024c024d024e024f0250025102"
+    "53025402550256025702580259025a025b025c025e0260026202630264026502"
+    "670269026b026d026e02700271027302740275027602770279027a027b027d02"
+    "7e02800281028302840286028702880289028b028c028e028f02900292029302"
+    "94029602970298029a029c029e029f02a002a202a402a502a602a702a802a902"
+    "ab02ac02ae02af02b102b302b402b602b702b902bb02bc02bd02be02c002c202"
+    "c302c402c502c702c802c902ca02cc02cd02ce02d002d102d202d402d502d602"
+    "d702d902da02db02dd02df02e002e102e202e402e502e602e702e802e902eb02"
+    "ec02ed02ee02ef02f102f202f302f502f602f702f902fb02fd02ff0201030303"
+    "0503070309030b030c030d030e031003120313031503170319031b031d031f03"
+    "2003210322032403260328032a032c032e032f03310333033503370339033b03"
+    "3d033f03410343034503470349034b034d034f03510353035503570359035b03"
+    "5d035f03600361036203630364036603670369036b036c036d036e0371037203"
+    "7303740375037603770378037a037c037d037f03810382038303840385038603"
+    "8703880389038a038b038c038d038e038f039003910392039303940395039703"
+    "980399039a039b039c039d039f03a003a103a203a303a403a503a603a703a803"
+    "a903aa03ab03ac03ad03ae03af03b003b103b303b403b603b703b903bb03bc03"
+    "bd03be03bf03c003c103c303c403c503c603c703c803c903ca03cb03cd03cf03"
+    "d003d203d403d503d703d903da03db03dc03dd03de03e003e203e303e403e503"
+    "e603e803ea03ec03ee03f003f203f403f603f803fa03fc03fe03000402040404"
+    "060408040a040c040e04100412041404160418041a041c041e04200422042404"
+    "260428042a042c042e04300432043404360438043a043c043e04400442044404"
+    "460448044a044c044d044e044f04500452045404560458045a045b045c045d04"
+    "5e045f046004610462046304640465046604680469046a046c046e0470047104"
+    "720473047404750476047704780479047a047b047c047d047e047f0480048104"
+    "820483048404860488048a048c048d048f049104930495049604970498049904"
+    "9a049b049c049d049e049f04a004a104a204a304a504a704a904ab04ad04af04"
+    "b104b304b404b604b704b904ba04bc04bd04bf04c004c104c304c504c604c704"
+    "c904cb04cc04cd04cf04d004d104d304d504d604d704d804d904da04db04dc04"
+    "dd04de04e004e204e404e604e704e804ea04ec04ee04f004f104f204f404f504"
+    "f704f804f904fa04fb04fc04fd04fe04ff040005010502050305040505050605"
+    "0705080509050a050b050c050d050e050f051005110512051305140515051605"
+    "1705180519051a051b051c051e051f05200521052505270529052b052c052d05"
+    "2e052f0530053105320533053405350536053705380539053a053b053c053d05"
+    "3e0540054105420543054405450546054705480549054a054b054c054d054e05"
+    "4f05500551055205530554055505570559055b055d055f056105630565056705"
+    "69056b056d056f05710573057405760578057a057c057e057f05800581058205"
+    "8305840585058605870589058a058b058c058d058e058f059005910592059305"
+    "9405950596059705980599059a059b059c059e059f05a005a105a205a305a405"
+    "a505a605a705a805a905aa05ab05ac05ae05b005b205b405b605b805ba05bc05"
+    "be05c005c205c305c405c505c605c705c805c905ca05cb05cd05ce05d005d205"
+    "d405d605d805da05dc05de05e005e205e305e405e505e705e805e905ea05eb05"
+    "ed05ee05f005f105f305f505f705f905fb05fc05fd05ff050106020604060606"
+    "070609060b060d060f06110613061506170619061b061d061f06210623062506"
+    "270629062b062d062f063006310633063406350636063706380639063b063c06"
+    "3d063e063f06410643064506470649064b064d064f0651065306550657065906"
+    "5b065d065f066006620664066606680669066a066c066d066e06700672067306"
+    "7506770679067b067d067f06810683068506870689068b068d068f0691069306"
+    "9406960698069a069c069d069e069f06a006a106a206a306a506a706a906ab06"
+    "ad06ae06b006b206b406b606b806ba06bc06be06c006c206c406c606c806ca06"
+    "cb06cc06cd06cf06d006d106d206d306d406d506d606d706d806d906da06db06"
+    "dc06dd06de06df06e006e106e306e506e706e906eb06ed06ef06f106f306f506"
+    "f706f906fb06fd06ff06010703070507070709070b070c070e07100712071407"
+    "160718071a071c071e07200722072407260728072a072c072e07300732073407"
+    "360738073a073c073e07400742074407460748074a074c074e07500752075407"
+    "560758075a075c075e07600762076407660768076a076c076e07700772077407"
+    "760778077a077c077e07800782078407860788078a078c078e07900792079307"
+    "9407950796079707980799079a079b079c079d079e079f07a007a107a207a407"
+    "a607a807a907ab07ad07ae07af07b007b107b307b507b607b707b807b907ba07"
+    "bb07bc07bd07be07bf07c007c107c307c507c707c907cb07cc07cd07cf07d007"
+    "d207d407d507d607d707d907db07dc07dd07de07e007e107e207e307e407e507"
+    "e607e707e807e907ea07eb07ec07ed07ee07ef07f007f107f207f307f407f507"
+    "f607f707f807f907fa07fb07fc07fd07fe07ff07000801080208030804080508"
+    "06080708080809080a080b080c080d080e080f08100812081408160818081a08"
+    "1b081c081d081e0820082208240825082608270828082a082c082e0830083208"
+    "3408360838083a083c083e084008420844084608470848084a084c084e085008"
+    "520854085508570859085b085d085f0860086108630865086608670868086908"
+    "6a086b086c086d086e086f087008710872087308740875087608770878087908"
+    "7a087b087c087d087e087f088008810882088308840885088608870888088908"
+    "8a088b088c088e088f0891089208930894089608970898089a089c089d089f08"
+    "a008a108a208a308a408a608a708a908aa08ac08ad08af08b008b208b308b508"
+    "b608b708b808b908ba08bb08bc08bd08be08bf08c108c208c308c408c508c608"
+    "c708c808c908cd08d108d508d908dd08e108e508e908ea08ee08f208f608fa08"
+    "fe08020906090a090b090f091009140918091c091d091e09220926092a092e09"
+    "320936093709380939093a093e09420946094a094e09520956095a095e095f09"
+    "630967096b096f097309770978097c0980098109850989098d098e0992099609"
+    "9709980999099d099e099f09a109a209a309a409a509a609a709a809a909ab09"
+    "ac09ad09ae09af09b009b109b209b309b409b609b709b809b909ba09bb09bc09"
+    "bd09be09bf09c009c109c209c309c409c509c609c709c809c909ca09cb09cc09"
+    "cd09ce09cf09d009d109d209d309d409d509d609d709d809d909da09db09dc09"
+    "dd09de09df09e009e109e209e309e409e509e609e709e809e909ea09eb09ec09"
+    "ed09ee09ef09f009f109f209f309f409f509f609f709f809f909fa09fb09fc09"
+    "fd09fe09ff09000a010a020a030a040a050a060a070a080a090a0a0a0b0a0c0a"
+    "0d0a0e0a0f0a100a110a120a130a140a150a160a170a180a190a1a0a1b0a1c0a"
+    "1d0a1e0a1f0a200a210a220a230a240a250a260a270a280a"
+)
+
+MIN = bytes.fromhex(
+    "0000000000000000010000000000000000000000000000000000000000000000"
+    "000000000000000000000000e2ffffff01000000e6ffffff0000000000000000"
+    "00000000000000000000000000000000000000000a000000f6ffffff00000000"
+    "0000000000000000010000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000a000000010000000100000002000000"
+    "0000000000000000000000000000000000000000000000000000000001000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000032000000000000000000000001000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000001000000000000000000000001000000"
+    "3c00000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000100000003000000"
+    "0300000000000000000000000000000000000000000000000100000000000000"
+    "0000000000000000000000000300000003000000000000000000000000000000"
+    "0000000000000000010000000000000000000000000000000000000000000000"
+    "0300000000000000320000000000000000000000010000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000090010000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000001800000018000000"
+    "1400000000000000000000000000000007000000070000000700000007000000"
+    "00000000000000003c0000003c00000000000000140000000200000000000000"
+    "0000000000000000000000000100000001000000000000000000000000000000"
+    "0000000000000000000000000500000000000000000000000000000000000000"
+    "0000000000000000000000000000000001000000010000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000a0000000a0000000000000000000000"
+    "000000000000000000000000000000000100000001000000d8ffffffd8ffffff"
+    "0000000000000000000000000000000000000000000000000100000001000000"
+    "0000000000000000010000000100000001000000010000000000000000000000"
+    "0100000001000000000000000000000000000000000000000000000000000000"
+    "0000000000000000900100009cffffff00000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000001000000"
+    "0500000000000000000000000100000005000000000000000000000000000000"
+    "000000000000000000000000c8000000c8000000c8000000c8000000c8000000"
+    "c8000000c8000000c800000000000000000000000000000000000000c8000000"
+    "c80000000000000000000000d2000000d2000000d2000000d2000000c8000000"
+    "c800000005000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "c8000000c8000000140000000000000000000000000000000000000000000000"
+    "0000000000000000ceffffff0000000000000000ceffffff0000000000000000"
+    "ceffffff00000000000000000000000000000000ceffffff0000000000000000"
+    "ceffffff00000000000000000000000000000000000000000000000000000000"
+    "00000000000000002c0100000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000ecffffffd8ffffff0000000000000000"
+    "0000000000000000000000000000000032000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000100000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000320000000100000014000000000000000000000014000000"
+    "460000000000000001000000ceffffff9cffffff000000000000000001000000"
+    "0100000001000000ceffffff0a000000010000000a0000009cffffff00000000"
+    "00000000ceffffff9cffffff0000000000000000ceffffff010000000a000000"
+    "9cffffff0000000000000000ceffffff0000000000000000ceffffff00000000"
+    "00000000ceffffff00000000000000000000000000000000ceffffff00000000"
+    "000000000000000000000000ceffffff00000000000000000000000000000000"
+    "ceffffff00000000000000000000000000000000ceffffff0000000000000000"
+    "0000000000000000ceffffff0000000000000000000000000000000032000000"
+    "ceffffff000000000000000032000000ceffffff0000000000000000ceffffff"
+    "0000000000000000ceffffff0000000000000000ceffffff0000000000000000"
+    "00000000ceffffff0000000000000000f40100000a000000ceffffff00000000"
+    "00000000010000000100000001000000000000002d000000f40100000a000000"
+    "01000000ceffffff0000000000000000ceffffff0000000000000000ceffffff"
+    "0000000000000000000000000000000064000000640000001400000014000000"
+    "14000000140000000000000000000000050000000a0000000000000000000000"
+    "000000000a0000000a0000006400000064000000640000006400000001000000"
+    "01000000090000009cffffff9cffffffa2feffff000000000000000000000000"
+    "f6ffffff9cffffff9cffffff9cffffff9cffffff9cffffff9cffffff9cffffff"
+    "9cffffff9cffffff9cffffff9cffffff9cffffff9cffffff9cffffff9cffffff"
+    "9cffffff9cffffff9cffffff9cffffff9cffffff9cffffff9cffffff9cffffff"
+    "9cffffff00000000000000000000000000000000000000000000000000000000"
+    "3200000001000000000000000000000001000000000000000000000005000000"
+    "0500000000000000010000000100000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000001000000010000000100000001000000000000000000000001000000"
+    "0100000001000000010000000000000000000000000000000000000000000000"
+    "0000000000000000000000000100000001000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0100000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000001000000010000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000001000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000a00000000000000000000000000000000000000"
+    "0000000000000000000000000000000001000000000000000a00000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000010000000000000032000000"
+    "0000000000000000010000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000a0000000a0000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000100000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000064000000000000000000000000000000f6ffffff05000000ceffffff"
+    "0000000000000000000000006400000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000014000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000ceffffffceffffffceffffff000000000000000000000000"
+    "000000000000000005000000e600000000000000000000000000000000000000"
+    "0500000000000000000000000000000000000000000000000100000001000000"
+    "0200000002000000020000000200000000000000000000000000000032000000"
+    "0000000000000000010000000000000000000000280000000f00000000000000"
+    "0000000000000000000000000000000000000000010000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000001400000000000000"
+    "0000000000000000140000000000000000000000000000001400000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000006400000064000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000640000006400000000000000000000000000000000000000"
+    "0000000064000000640000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000100000001000000"
+    "000000000000000000000000fa0000000000000000000000000000000a000000"
+    "0a0000000000000001000000ceffffff000000000000000000000000ceffffff"
+    "000000000000000000000000ceffffff00000000000000000000000000000000"
+    "0000000000000000000000004600000023000000000000002800000028000000"
+    "000000005a000000000000000000000000000000640000000a00000000000000"
+    "1400000001000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000000000000a000000000000000000000000000000"
+    "000000000a0000000a000000000000000000000000000000f401000000000000"
+    "00000000000000000000000000000000000000000a0000000000000000000000"
+    "e001000001000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000"
+)
+
+MAX = bytes.fromhex(
+    "0000000005000000f00000000000000000000000000000000000000000000000"
+    "00000000000000000000000028000000b4000000140000000200000002000000"
+    "020000000200000000000000f000000000000001640000000a00000087000000"
+    "870000008700000004000000e8030000e8030000e8030000e8030000e8030000"
+    "e8030000e8030000e803000000000001580200003c0000003c00000064000000"
+    "000000010000000100000001000000010000000100000000000000003c000000"
+    "6400000064000000640000006400000000000000000000010000000100000001"
+    "0000000100000001000000010000000100000001000000015a0000005a000000"
+    "0000000000000000000000006400000064000000640000006400000064000000"
+    "0000000000000000640000000000000000000000000000013c00000000000000"
+    "640000007017000064000000640000002c01000000000000b004000002000000"
+    "1e0000001e000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000006400000064000000"
+    "6400000000000000000000000000000000000001000000050000000187000000"
+    "00000001000000010000000a000000003c00000078000000000000003c000000"
+    "b004000064000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000001000000005802000000000000"
+    "00000000000000000000000100000000000000000a000000100e00000f000000"
+    "0f00000000000000000000000000000000000000000000006400000000000000"
+    "0000000000000000640000000f0000000f000000000000000000000000000000"
+    "0000000000000000640000000000000000000000000000006400000000000000"
+    "14000000640000007017000064000000640000002c0100006400000064000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000e6000000000000000000000100000001000000010000000100000000"
+    "0000000100000001000000010000000100000000000000005a00000078000000"
+    "5600000000000001000000003c0000000d0000000d0000000d0000000d000000"
+    "0000000000000000aa000000aa00000000000000500000000a00000000000000"
+    "5802000000000000000000000200000002000000000000010000000003000000"
+    "1e00000000000000000000001400000007000000000000000000000000000000"
+    "0000000000000000000000000000000014000000140000000000000000000000"
+    "7800000078000000000000000000000000000000000000008403000084030000"
+    "840300008403000000000000000000002c0100002c0100005802000058020000"
+    "0000000000000000000000000000000008000000080000000000000000000000"
+    "0f0000000f000000900100009001000000000001000000013000000030000000"
+    "3c0000003c000000140000001400000014000000140000002300000023000000"
+    "1400000014000000580200005802000000000000000000000000000000000001"
+    "0000000000000000bc0200006400000018000000000000000000000000000000"
+    "000000000000000000000000000000000000000000000000000000000a000000"
+    "6400000000000000000000000a00000064000000000000000000000100000001"
+    "0000000100000001000000013002000030020000160300001603000030020000"
+    "3002000030020000300200000000000000000000000000000000000080020000"
+    "8002000000000000000000008002000080020000800200008002000020030000"
+    "200300003c000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0200000000000000000000000000000500000000020000000000000100000001"
+    "1603000016030000640000006400000000000000000000000000000000000007"
+    "0000000000000000320000000000000100000001320000000000000000000000"
+    "3200000000000000000000000000000100000001320000000000000000000000"
+    "3200000000000000000000000000000100000000000000000100000000000000"
+    "0000000000000000840300000000000000000000000000010000000100000001"
+    "0000000178000000580200000000000000000000000000000000000000000000"
+    "000000000000000000000000460000000a000000000000000000000000000000"
+    "0000000000000001000000000000000196000000000000000000000000000001"
+    "0000000100000001000000010000000000000001000000010000000100000001"
+    "0000000000000001000000010000000100000001000000000700000000000000"
+    "0000000000000000170000000000000100000001000000000000000000000000"
+    "0000000064000000701700002c01000050000000000000003c0000002c010000"
+    "f4010000000000007800000032000000c800000000000000000000003c000000"
+    "3c0000001e000000320000002c0100000400000064000000c800000000000000"
+    "0000000032000000c80000000000000000000000320000000400000064000000"
+    "c800000000000000000000003200000000000000000000003200000000000000"
+    "0000000032000000000000000000000000000000e00100003200000000000000"
+    "0000000000000000000000003200000000000001000000000000000000000000"
+    "32000000000000000000000100000000e0010000320000000000000000000000"
+    "00000000e0010000320000000000000100000000000000000000000096000000"
+    "3200000000000000000000009600000032000000000000000000000032000000"
+    "0000000000000000320000000000000000000000320000000000000100000000"
+    "0000000032000000000000000000000020030000640000003200000000000000"
+    "000000003c0000003c0000001e000000000000005f0000002003000064000000"
+    "6400000032000000000000000000000032000000000000000000000032000000"
+    "000000000000000000000000000000002c0100002c0100002c0100002c010000"
+    "2c0100002c0100000000000064000000140000003c000000e8030000e8030000"
+    "000000003804000038040000e8030000e8030000200300002003000014000000"
+    "140000000c00000064000000640000009cffffff000000000000000000000000"
+    "0f00000064000000640000006400000064000000640000006400000064000000"
+    "6400000064000000640000006400000064000000640000006400000064000000"
+    "6400000064000000640000006400000064000000640000006400000064000000"
+    "6400000000000000000000010000000100000001000000018a02000078000000"
+    "70170000c800000000000000000000000f000000580200000000000023000000"
+    "1100000002000000300000003000000000000000000000000000000000000000"
+    "0000000000000000000000090000000900000001000000010000000100000001"
+    "000000001f0000001f0000000c0000000c00000063000000630000001f000000"
+    "1f0000000c0000000c0000006300000063000000fa000000fa00000005000000"
+    "050000003c0000003c0000000500000005000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000100000000"
+    "0000000100000000000000010000000000000001000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000064000000640000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000100000001"
+    "0000000064000000000000000000000000000000000000000000000000000000"
+    "0000000064000000640000000000000000000000000000000000000000000000"
+    "1e00000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000030000000300000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000010000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "000000000000000000000000b0040000b004000005000000050000003c000000"
+    "3c00000005000000050000000000000100000000000000000000000000000000"
+    "000000006400000000000000f00000000000000000000000000000003c000000"
+    "3c00000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000006400000003000000030000000300000003000000"
+    "0300000003000000030000000200000064000000000000005802000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000000000003c0000006400000070170000"
+    "64000000640000002c0100000000000000000000000000000000000000000000"
+    "000000000000000000000000000000007017000064000000000000000000000a"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000001000000006400000064000000640000006400000064000000"
+    "6400000064000000640000006400000064000000000000013000000064000000"
+    "6400000064000000640000006400000064000000640000006400000064000000"
+    "640000005e0100000000000001000000000000000a0000006400000032000000"
+    "0100000023000000020000005e01000001000000000000000000000000000000"
+    "0000000000000000000000000000000064000000640000006400000064000000"
+    "0000000100000001000000000000000000000001000000000000000000000000"
+    "0000000000000000000000010000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000100000001000000010000000100000001"
+    "0000000000000000000000000000000000000000000000000000000100000000"
+    "0000000000000000000000000000000000000001000000000000000000000000"
+    "00000000000000000000000000000000e8030000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000100000001"
+    "0000000100000001000000010000000100000001000000010000000163000000"
+    "00000000000000013200000032000000320000000a0000000000000000000000"
+    "0000000032000000580200009001000000000000000000000000000000000000"
+    "2c01000000000000000000010000000100000001000000011400000014000000"
+    "3200000032000000320000003200000000000001000000016400000070170000"
+    "64000000640000002c010000000000000000000090010000f000000000000000"
+    "0000000000000001000000013c000000e8030000701700000000000000000000"
+    "0000000000000000000000016000000060000000600000006000000060000000"
+    "6000000060000000600000000000000114000000000000025a00000000000001"
+    "14000000000000025a0000000000000800000008230000006300000000000001"
+    "0000000800000001000000010000000100000001000000000000000100000001"
+    "0000000100000001000000006400000000000000000000000000000000000000"
+    "0000000100000001000000010000000100000000000000000000000000000001"
+    "06000000060000005e0100005e0100005e0100005e0100005e01000000000000"
+    "0000000000000000000000005e0100005e010000000000006400000064000000"
+    "0000000100000001000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000003000000030000000000000000000000000000000000000000000000"
+    "00000000000000015e0100005e01000000000000000000000000000000000000"
+    "060000002c0100002c0100000600000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000001000000000000000000000000140000000500000005000000"
+    "0000000002000000000000015802000000000000000000000000000064000000"
+    "6400000000000000f00000003200000000000000000000000000000032000000"
+    "0000000000000000000000003200000000000000000000000000000000000001"
+    "000000000000000100000000c8000000c8000000000000006400000064000000"
+    "00000000620200000000000000000000000000008c0000005000000000000000"
+    "5a0000000a000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000010000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000010000000000000000"
+    "0000000000000001000000000000000000000000000000000000000000000000"
+    "0000000000000001000000010000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000100000000"
+    "0000000000000000000000000000000000000000000000010000000000000000"
+    "0000000000000000000000000000000000000001000000000000000000000001"
+    "00000001000000010000000000000000b4000000000000000000000000000001"
+    "00000000c8000000c80000000000000000000000000000008a02000030000000"
+    "0800000000000000000000000000000017000000320000000000000000000000"
+    "bc02000004000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000"
+)
+
+READ = bytes.fromhex(
+    "0000000000000000000000000000000000000000010000000000010000000000"
+    "0000000000000000000000000001010000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000001000000000000000000000000000000000000000000000000000000"
+    "0000000000000001000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000101000000000000000000"
+    "0001000000000000000000000001000000000000000000000000000000000000"
+    "0000000000000100000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000001010000000000000000000000000000000000000000"
+    "0000000100010001010101010001000100010001010101010000010101010101"
+    "0101010101010101010101000001000001000000000001000000000000000001"
+    "0000010000000001000001000000000000000101010000000000000100000000"
+    "0000000101010000010000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000001000100010100"
+    "0100000000000001010001000000000001000001010000000100000000000001"
+    "0000000000000001000000000001000000000000000001000000000001000000"
+    "0100000100000000000000000001010000000001000000000001000000000000"
+    "0000000000000000000001000100010000000000000001000000000000000000"
+    "0000000000000000000000000000000000000000000000000000010100000100"
+    "0001000000000000000000000001000101010001000100010001000100000001"
+    "0100000000000000010000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000001000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000001000000000000000000000000000101010101000100010100"
+    "0000000000000000000000010000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000010000000000"
+    "0000000000000000000000000100000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000001000000000000000000000000"
+    "0200020000000000000000000000000000000000000200020202020202000000"
+    "0000000002000200000000000000000000000000000000000200000002020202"
+    "0202020202020202020202020200000000000000000000000000000000000000"
+    "0101010100000000000000000000000000010000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000050500000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000100000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000101010101010101"
+    "0101010000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000001000000000000010101010101"
+    "0101010101010101000100000000000000000100000001000100000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000010000000100010000000100"
+    "0000000000000000000000000000000000000100010000000000000100010000"
+    "0000000000000101000000010101000101000000000000000000000000000000"
+    "0000000000000000000000000000000000010000000001000000000101010101"
+    "0101000001000100010000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "00000000000000000000000000000000000000000000000000000000"
+)
+
+FORMAT = bytes.fromhex(
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "040404040c0c0404040404040404040404040404040404040404040404040404"
+    "040404040404040404040c0c0404040404040404040404040404040404040404"
+    "0404040c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c040a0a0a0a0a0a"
+    "0a0a0a0a0a0a0a0a01040404040004040c0c040404040c0404040c04040c040c"
+    "04040c04040c040c0c040c040404040404040c0c040404040404040c04040404"
+    "0404040c0c0c04040c0404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040c0c04040c0c040c04040c0c0c040c0c04"
+    "0c0c0c040c0c040c0c040c0c040c0c040c0c040c0c040c040c04040c0404040c"
+    "0c040404040404040c040c04040c040c0c040c040c040c0c040c0c040c0c0404"
+    "0c0c040c0c040c040c040404040c0c04040c040c0c040c0c040c040404040404"
+    "0404040404040404040c0c0c0c0c0c0404040c0c0c0c0c0c040c0c0c0c0c0c0c"
+    "0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c0c04040404040c040404040404040404"
+    "0401040404040404040404040404040404040404040404040404040404040404"
+    "040404040404040404040404040404040404040404040404040404040c040404"
+    "040404040c04040404040404040c0c040c0c040c040404040404040404040404"
+    "0404040c0c04040c0c04040c0c0c040c040c0c0c0c0c0c0c0c0c0c040c040c04"
+    "040c0c04040c0c04040c040c040c0c04040c0c04040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040c0c040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0c040c0404040404040404040404040404040404040404040404040404040404"
+    "040404040c040c0404040404040404040404040404040404080404040c040709"
+    "0909090909090909090909090904040404040404040404040404040404040404"
+    "0404040c04040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "040404040404040404040404040c040c04040404040404040404040b0b0b0b0b"
+    "0b0b0b0404040404040404040404040404040404040404040404040404040404"
+    "040404040404040404040c0c0c0c04040404040c040404040404090909090909"
+    "0909090909090909090808090909090909040c0c0c0c0c04070c0c0704040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "04040404040404040404040c04040c04040404040c0404040c040c0404040c04"
+    "0404040404040404040404040404040404040202020203030404040404040404"
+    "0404040404040606060404050505050404040404040202020203030404040404"
+    "0404040404040404040606060404040404040404040404040404040404040c04"
+    "04040404040404040c0404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "0404040404040404040404040404040404040404040404040404040404040404"
+    "04040404040404040404040404040404040404040404040404040404"
+)
+
+EXTID = bytes.fromhex(
+    "814a53c66a080261e1e1fc660023a1137cb3eb0b26007b1307040471004e2529"
+    "50048100392219c6048200a7468c6504830071c5013102ef004d59464306bc00"
+    "259eef360272006d634f6402e8e555e4e11002e9e23123fc9f02eae5b8b81b2e"
+    "02ebe1c80adf0d069ee151038eb706a1e12604be2106a2e1b8602b8206bd4a9e"
+    "dfa5490cbae1a12688970225c02d7ce3a909e9edd21cf87202eee5311e7ec202"
+    "edeae9c03814036eeab88c0518036bea0f167017036f217e78269802262ab28e"
+    "7f2704242a2b872e9d04252a5c801e0b04262ac2e48ba804272a7e1a6660069d"
+    "2ae71337da069f2a9014074c06c12a0e7092ef06a0c0ab5157e30366e21d07ae"
+    "5b0758e20696ec690364e2e5f030a80363e90dd98ae8036500cc181667030ac0"
+    "11831ba40304c0888a4a1e048cc0206b01390b4ec0b96250830b4d0e0794ab25"
+    "026f0e2d19b8a50270e2b490501d0367e95d82721503b1e9870c05f30912e950"
+    "9210640911e91294402003b001e185d8d10c92807fa9f59b0c8380e6a0a4210c"
+    "8c804e41ef060c8480d748bebc0c8500d8b508cb0c938011c1e2650c878088c8"
+    "b3df0c8a802029f8f80c8880b920a9420c89a9b293795f0cdaa92b9a28e50cd2"
+    "89837b63c20cd0891a7232780cd1093afab92e0cd301bd93f23e0c7ea1e12d84"
+    "300c7aa17824d58a0c7da1d0c59ead0c7ba149cccf170c7c002e38e20103b800"
+    "b73aa32a03b70202bf02ba03680ee200ff460acf0ec7626e190ad0006c61de39"
+    "0475e1e1264564035d0092c1864a035feadbf44d0603daeaa54531bb0371e69c"
+    "edcfad0568e6a0e0f0f40569eac12e997b037000ae75211705aee28c6bdacd05"
+    "67e1cbbd4f6e0690e10c545f0b05b0e12f4a191405afc2823936fb02f7c2ef64"
+    "20a502f3c29a3d7a2b02f8c249f1540402f9c239b7e77102f6c2db6c9b0902f4"
+    "c2e4ef079702f5000e7d2bd1027500977f6afa02740062413f45027600c45c8b"
+    "2900ef0ab062530c036c0a9f59caf403620ac60ad71c03690a9b74327b03610a"
+    "38b75244035e0a361a0a65036a0a77ffc89205e1e03ea16ad70781c0292d044b"
+    "063d0055f40c3f0271ea4e687acb036dc09241bb5c02ecc04081661b00f1c046"
+    "7902b40360000445723003b3e11214dda003b6e156b1386603c10aea24380d05"
+    "58e1f95e6c7603b5e27c7972aa03b422c710e3e906c48178b456b506be003f80"
+    "61cd02ae00f0ccc5a904280087cbf53f04290019af609c042a814669b75c063c"
+    "127c8850de02af12c0fdc709042b12b7faf79f042c12299e623c042d00210fed"
+    "0f002412bccd3b430025eaa75d6f5600bc0079baa67b00bb01c8cb95950d6d45"
+    "2053aeab082cc0f9d977ae0027c2c2cd4f410028c2d6b5878c0029e10306b522"
+    "0026e2fe5d4e50002aa1d20884c30b9fa12a7c97d20ba1816686e05c0bb38192"
+    "9827b90bc8002a5577090bd081e75046470bb481dfd38a800bc9a1d15b54a10b"
+    "a30e78469ddb0bc20eef76ab9e0bc00177ef6f200bbca1238e3ecc0caea1ae69"
+    "a1180bb8a1c0fa4ab00bb981c5d066f50bbe81210c0a7a0bca008903f1a00bd1"
+    "8191b57f7a0bbf81ccfbb3f30bcba1c0263ed80bba0e6b6ea4a80bc30ebcecf0"
+    "1a0bc101ee0d09210bbda15890bc2f0cb000ba9d50780ac8a11e2049670c98ea"
+    "70f2d7870baaea0e43ab3a0ba8eeaeafb7fb0bacae92a288a20baeea6a2803fa"
+    "0ba6a96f5a7beb0bb2a9c3d9935e0bb0008a02c3120b8f0060841e700b90014c"
+    "6edfe60b7201f7194e700d5701f31c60b8046b0018d2d12d00b30065d3a29b04"
+    "84000e6864fd0476005fe0363d0a2a162f92312f0a7a16f7ef15210a7b166545"
+    "60aa0a7c16ad77529a0a7dc1980c123400b0c1a4012d6d00b1c1c61b2e0400ae"
+    "c1fa16115d00af01a00cfa28025200f55c2f800303c092971e2f0309c00b9e4f"
+    "95048bc0a37f04b20b4bc03a7655080b4c00dc949b720b29c0210333ec0b75c0"
+    "b80a62560b76c010eb29710b77c089e278cb0b7800ba167a090b8e01e2a43ea5"
+    "0251e18aba5e9100b4e1ba260302017ae1caf526e700b500205ac16100b6014a"
+    "f08a5700ace16a8a67f000adc1bcc2391e0a63c13f6909f10a64c1ef785a580b"
+    "15c1565c20c20b148178f2d1c80a788146dac5120a79e95c34d4210a75e9b90c"
+    "5dfe0a7600f334c27f00b7e10a600fe900b9e1a47b5b1c00b80069e037750692"
+    "e2e5f581e5034601cfde450b00b201516fa1ee0664e1c7dc4a5d0857e12d314e"
+    "af0858c06ba159820867c183aea732025be1ad68c52c0672e168431b5e00ba82"
+    "6c36377c0b7f82de2c76bc0b0ae5778117e50240214d9712d5035b0132ad5d97"
+    "002b016d8a0dd9002c01d5c3a951002d01767669d7002e013875e083002f01b2"
+    "cad41c0030011e5fcb280031e1478ee36601ebe1be893a89067b00594afa3802"
+    "d100fedafc570671e1db78084f01f6e1cd17026406860028ac53cd02d200381b"
+    "8305067800e31cf38f0a8400a95a4b5a0a83e2e90063a40a86e285cadf680a7f"
+    "e2364cf4d30a85e2534223110a800ea7dc843602540ed7e473740687ee68a7b8"
+    "090255eea055eab4067ce2ff8eab6d01e5e2257a92e0068800a5bb73c4027e00"
+    "d2b795930670016189fb34027f012568bb0e0680e11d66580701fce19edc5083"
+    "0682e50e01998a01ffe5fc9257c40683e17b401dde01fee1c890fdec0681ee72"
+    "eb12cc01f0ee20db99050685203642ecd7027d20d3e8c92d0689a14a30d6610c"
+    "77a1a77b65d30c78e1f3a5e00e01f1e18aa43eb70684e151aa9f3d01ede1be75"
+    "9525067ee1fe03d2f702cfe1870d3865067fe53a13971a027ce56a6bc4cb068a"
+    "e12b1071c201e9e16ae3dd92067de2e83a284101f5e268fa3c60068b01b2f381"
+    "0902d001ff50b8e8068c0062329be402b4c0016372be05c1020e51a0000ca702"
+    "554611150ca8ee5991a93a02b8ee38a21e6702b9a109d86c650ca68e27406fc5"
+    "0ca4c1ee64b5700106c1d2698a290107c50188e15e0104c53d85de070105c165"
+    "168e69010ac1591bb130010bc5d1d8285f0108c5edd51706010940a21cb6040b"
+    "17e10bd3703c0b1be96a54e9fd0b1a56f99731110b214011889bc70b18e150c4"
+    "c1290b1ce9a34be1420b1956a3f60e710b2200d3e359cf030bc084b462440305"
+    "c01dbd33fe0b56c0b55c78d9048dc02c5529630b55eeb4a6964d02b6eee896b1"
+    "7b06540efa512a7a00fd0eba46a01f066cee70936aa500ffeeca3ab29d0658ee"
+    "681e964800feee95e1998606590e9e09bb7b0cd80e245556d40cd90e5a602ab8"
+    "01000e438ab5e2066eeea69db26402b7ee90d3d87a06550e7941adfc01010ea4"
+    "430a41066dee5de6fa5d0103eee6506719065aee456b06b00102eeb98b4c0206"
+    "5beeb8cf723c0a60ee79d5d3c40a5fe1a0277040010dc2a3f5f02802c3c2cea8"
+    "e67602bfc2bbf1bcf802c4c2683d92d702c5c2187b21a202c2c2faa05dda02c0"
+    "c2c523c14402c1c2e4558af802cac289089ca602c6c2fc51c62802ccc22f9de8"
+    "0702cbc25fdb5b7202c9c2bd00270a02c7c28283bb9402c8e1cab0771c095200"
+    "83f0fffb00fc006e6756ef0663c0f8fde3ec010c00df862f0b02b5e10b0efc9f"
+    "0780c060df8d6c0656c0ee6cb90d0657066bdde50f0cec06e3d563010cede11f"
+    "b861c80032213284225b0bd5801bc8cb5e0184017422ca5500380e114d85f103"
+    "ddc00e5d8d3a04398123c57a88003980c27db0080a106d853e880d0882c0daac"
+    "0de9075380d820198007efed87f7528d04b000560e1a0804b10e2dd1622104b2"
+    "ed3a3d3e4304b800d8811deb04b90eab45108f04bac0302ad08b07d480c95d73"
+    "f907f0edd46d090907d5002190c8f807d60ec6e6d92207d7ed69a765c707d800"
+    "af1fcf1b07d90e4072ab8c07da84245ee1cb0a5c8216949c7f0c498253ccd604"
+    "0c44a1495778540caa81a2a7f6370cb580d5d68b790cb600a5f331c0004aeea5"
+    "93ea5f004b0e3f05d925004c00950e4361027340425efe1f0a4a40db57afa50a"
+    "4b4073b6e4820b5040eabfb5380b4fe10dd5da4f02d9e1d2f3149a02d80e3557"
+    "d0c70c6f8e30cdbee80c708ed3939ece0c9a8ea3f96a410c998ef8becd0d0c6d"
+    "8e4d6d81680c6c00301e92e30c7180ed3d05f40c6ea195d2e6790c95e5d1cec0"
+    "e902d4e5cb75c22002da013e83f56902d601cdc5ea1a069300fca08d740c97c0"
+    "648ea3b3064e002854632603a7c0694d6ace064fe1cb5e3e8f02d701ac34897f"
+    "02d50188eef06d067ac05d9cc10c0302c0c49590b60b45c06c74db910b46c0f5"
+    "7d8a2b048800271682d90308c0058268240489c09c8b399e048ac0346a72b90b"
+    "47c0ad6323030b4800a999853a0487c084a70d030b02c01dae5cb90b03c0b54f"
+    "179e0b49c02c4646240b4a00653385a40b04c146ff6ac202aa02ac9077580b80"
+    "006c26255200bf016a215a3200bee1d13cd71600c080959153780b988084ec39"
+    "010b9a00464ac29a0d59004aec4fce0d5801aa9db4190d5b013eb14a220d5aea"
+    "d40ab6d00913eaaabbca6d0914eaced062ad0915e1acf52887004f005bb7b5b3"
+    "004de17ca36100004eee2a751b620050eedec69baf00510ee4fe05ae0056e2c0"
+    "9d3f760057edd48abc8a0412ee3be8c514084700f444e62604130ea262ccde04"
+    "14e15551778d046ce1beda2a7806c6e5dff9c1dc06c5ed5e390c4f005bee5634"
+    "821c022be1b939c0dd016ee93fec9550016deeb663a78100ec00772b8639005c"
+    "0e2139c16f005ded6d7167620415ee62215a590848001b868d1804160e6ec8cc"
+    "400417ed83afd5ca005ee1b8074529016fe9cc3f6d47016cee395ff34f00ed00"
+    "bb8186a7005f0eea6512ca0060ed7c0c0d1b041800f0b1361b04190ee047cba3"
+    "041aed3e65b904028b00350e8144028c0e6cf16064024bed3621878500582016"
+    "92ad5100590ef807e249005a0e222cd0390cbeaa88fb658f0cbfed8bebeb4b00"
+    "6100981daab200620e7e9390e700630e288433280d1380b4702c470064ed567d"
+    "32ce0065c016d09d1d006600af4d85d702390054b7aa2c00670eb5cf43420068"
+    "6d4be87068049e0eab0effdf049dc01592b05f07520e67ffa7580d12aa6bb86d"
+    "6d0d116d05059b31049f0e6bb7954904a081b96e5c0000690e02beac720cc2aa"
+    "f58863d70cc1edf698ed13006ac0fe65575e006b0092d8a3ab006c0e6396a05f"
+    "006d0ec9aa394c0d1be1378e0b14085ded04f4bee4041c0017008409041b0ec9"
+    "1eeeaf041de1365e2d32022ded4b5281dd006e001c57a448006f0ee502d2f100"
+    "70edbd0f650c0c7400f8c2ef370c750e05b4ee310c76ed96c458580c6800d0fd"
+    "a4d60c670e2e5e01540c66ed2df92a8a04a7c49092ad3504af00172230fc04aa"
+    "0e7ffd571904a5ed9033464404a80099ad371f04a90ef96925b704a6eeaea4f3"
+    "b7085bedb712c9f1085cede987a691041e0009c9b4ba041f0edc94fc9d0420e1"
+    "97b1fd5406c7e1eb94f64500f9e5cbe851d000f8005fa258650185edd8570f80"
+    "0186ee35c0250500eeed41a459c705b5e143f89a3a084fedb1b48d6d00710009"
+    "ddb67a00720edf08b3810073ed507c7d79042100e60bdf8404220e103efc0304"
+    "23ed6c2254e8007400c577b6e400750e1454602400760a71acc137026b0ac849"
+    "215a05f1ee882e18670249ee8dfdeffc05f2ea9e9bf7d90247eac70e859605f3"
+    "eaa296c8800248ea1a1172bb05f40e4a9862f40287e990138ec60227e14dc699"
+    "890281e12901840601f92afefeb21203e12a0f3ea5a403e000ece8b73c0b5f6e"
+    "7f1b6889034bee47ec0ac300d46eb4805109034ceebd660673026d6eb58ccbbd"
+    "034dee6a8db432026ce1ebe5792000d2e1e29d0e3f00d3219d8a4a0703cfee4a"
+    "cba689063e6e596997c7064deea73672d1069a4e40e8c327034ece0141796500"
+    "d10ea674b3ca00cbe5f9fa82e300d56e696808400359ee5843861c00df6ea5c2"
+    "08de0358eefe348da800e06e2b4d0f3d0357eecfdc973500e16ecbfa50d1035a"
+    "eead6a653f00d66e457557320356ee9c827fa200d76e89df57ac0355ee3af574"
+    "1600d86e831a5eb50354eeff524a9800d96e4fb05e2b0353ee5925412c00da6e"
+    "c13f59c80352ee68cd5bb100db6e0d9559560351eeceba500500dc6ed4b54bfa"
+    "0350ee38f220ec00dd6e181f4b64034fee9e852b5800de00431bef9c030cc0e4"
+    "aef76c0b52c07da7a6d6048ec0d546edf10306c04c4fbc4b0b51eef07561ac07"
+    "e4e1d769501c00ccea55c0014400cdea31aba98400ce00cae035fa00c8000ccd"
+    "051004bce12d76fbc90331e23409a4fd00c9002280f33400f4e1e3b281d900f7"
+    "e1c800448b00f5e1882248c90440e1ff34393100f6e17ee5bf2402f10e7900a3"
+    "1300ca0e7b5ed0cd00cf0e4caa026d063101fbbdf9be026e0e901c5f1a00d00e"
+    "ffd42446063240d1b9506d05dfc034bea42b05dec053404cd405c5c06aa2528f"
+    "02634080aa43f00861c00ed82215028e2093d1ec64024ae1c4e03db0075e61a8"
+    "a44edb0266e1af02c5f30265619ab55ef6075fe1bba333230264616081d15907"
+    "60e167beed1502676177f4697c0761e1faa1fcd5026861def91ee30762e11dbc"
+    "3a9402696128ecb7350763e9b0a0966d0b13e693e59c200b11e176b325dc0ad8"
+    "e1d2a42a030ae8e1e69db72f0adce1f334fa3b0ae9e1c80d3b990adae1a5a512"
+    "9e0aea02d4592aaf0d3c00f65c47df024e005a35f95b03f700f09c9dd3024c00"
+    "f4f8900e02f000d9a53a1003aa0040ac6baa03ab0037ab5b3c03ac001b7a8e81"
+    "03b2007df794df03ad00e4fec56503ae0093f9f5f303af00a5daf23603ba0019"
+    "2e4cbb03b90076aef2d4007a013a27fda9009a0108e4b1c203f1008bc64cb300"
+    "9300c00179fb00940ad66d197b009501cb63a5c500960251f45ba50097013905"
+    "fa1100980e7173a5e40099020706ceb7009b0199f3a0a7009c0018fbfe2e030f"
+    "0081f2af9403100057227f59009d006e3208cb024f0092f8ea6103f20e63fc6c"
+    "33090e006de32336007f80888802e30b6100f4ea728c02a680cf2878330b6200"
+    "5c0b39ab0b5c80116a64e20b6300c50268110b5b8056ca1e320b640eac0fc4db"
+    "08330e2a9bb6750825009c840c64099b0ee899934a04b30e6e0de1e404bb00db"
+    "2476b4099c0e03ae284907cc0e853a5ae707cd008007f2b7007e004c1a29ac03"
+    "f3003b1d193a03f400a5798c9903f5007bb4ceb60a0e0a50f7942f04860a5153"
+    "3d230b70e11e2e44e30661e1b0cf396c06620025ff8e2a024d00d146451403f6"
+    "02b14826a2008002ccb255c3008e024ffbefa004050e9310c7c2008f0e48e173"
+    "2b040602bbb565550090024e39859704070e584c146700910e844b73b5040802"
+    "22bc34ef028a024c7f3bce04090eded866c9025a0e0ac47456040a0e6c0a67f0"
+    "0081022841771800820eea9e155e0083025f46478e00840e21c2c6fb00850290"
+    "d9f8cf04990e57d5674005020ecedc36fa05030eb9db066c05040e27bf93cf05"
+    "050e50b8a35905060ec9b1f2e305070ebeb6c27505080e20816508049b021493"
+    "f635049a0ee0380f9e049c02b625e2bb00860ef79b25e60087022f2cb3010088"
+    "02ff5efebf040b0e710f574800890e798272b1040c02582b83970c6902fe9c94"
+    "880c720eba5384ed0c6a0eb528722f0c7302c8949e06008a026a77de1c04ab0e"
+    "cdd451b404ad02f37e8fa604ac0e4b40231a04ae02f5c0d3b5040d0e4b053638"
+    "008b0e6c086083040e02bf93ae90008c02f402b982040f0e8059e59d008d0ea0"
+    "a2601d0410001a6bb1b7025000a3cfa3ea041100cc502efa00920086a8ca4c03"
+    "f8023bc26e370d39028e20d54d0d3a02f927e5db0d3b0260ede3e00c9d026780"
+    "27f90c9e00dfc719df08650031c978f3086600d140d41e0cd7001f7c0f440d38"
+    "00a83cebfe009e0009ca5d1b03f900a04716a3009f00c5d3f8d803fa00394e47"
+    "1900a000c795468103fb004ee167f30c4500584d02290c4c024c365e680c1600"
+    "3e61ee070c4a00c6f0cd7b0c4b027941ccb0007b02e0489d0a007c02974fad9c"
+    "007d006e175e7705be005880ff31095600e44c966c05ad217a829f8f05ac00cc"
+    "eb2a1205ab002e34962805aa00fd57cf6c05b700bbfdbaa602fd0078c9526005"
+    "b100c5033eae07ce004617b8d502a7217efb651d02ff21769985d40bbb007f9a"
+    "841000a100143a281603fc01b251658303000068e1905300a200d5b4f7d603fd"
+    "6169f65b800244018a73e43501680289452993016b02b1838e70016a0664dd57"
+    "7800a302eae3d63905b301bb7f1b9900a402ee3778d900a5021d45302105b20e"
+    "5f7d58e802420ea370f2e605700063479e31065f00a8bc3f9f00a600d3cf5412"
+    "00a700a0df341503fe01c34aae520916000ec773520d0b814d48ddb806c00126"
+    "7beb2a02ac01ec9ed3470448019b99e3d104490105fd7672044b0172fa46e404"
+    "4a01ebf3175e044c019cf427c8044d1212c74ed502ad12d9064dee044212ae01"
+    "7d780443123065e8db0444124762d84d044512de6b89f7044612a96cb9610447"
+    "128c4247a708e4016d07017505d8122b16c99d05d901f905031502e41214c98a"
+    "4702e5010ca1c11d0ac912c3ab84680aca012320049808031274c8946a080401"
+    "80bbbabc02e601d7e9397907cf12c8d95c1b02e7127fc61c7807d0013094a8a5"
+    "03ff01bf5051060403124d8856c2040012cfe90e61040401f020cb6d02ab0168"
+    "c8fc160b741299651bca042e0113477c900bd6019cdfa6ae0bd712feac864c0b"
+    "d812ec3ada540bd981ae30d1f906bf81812e7c260639a19e82e3a00cc801df7d"
+    "ae6102a801f9a50990040101783dd8e70bcc012d1a45140bcd01002542290d02"
+    "0168b9bd960d031283cbac440d0412ff58e4ed0d05120a248a970bce1287407e"
+    "230bcf01720e94c40acc01ecd935fd0aeb12eb3de1fa0acd128d7332000aec12"
+    "5882c4e602a912200008a5040200b0cf9e6d0b8c012516229700aa1282bf1aff"
+    "00ab11602326bb0c65120fa10e7b0c6b01797ed2370d1e014cf768560d1f013b"
+    "f058c00d2001a594cd630d2101d293fdf50d22014b9aac4f0d23013c9d9cd90d"
+    "2401f7d26d5f0d2501ba0da9480d2601cd0a99de0d2701536e0c7d0d28012469"
+    "3ceb0d2901bd606d510d2a01ca675dc70d2b01b1d7f6620d2c01b738ed3f0d2d"
+    "01c03fdda90d2e015e5b480a0d2f01295c789c0d3001b05529260d3101c75219"
+    "b00d32019fe4cb990d48015e6a14590d4901762abe240d47816a19f20a0d5101"
+    "6f2c72870d3d017ee473540d3e0109e343c20d3f01f65069b80d4301ac5f09f8"
+    "0d4401db58396e0d4501e8a217230d4001895718e00d4101fe5028760d4201c2"
+    "9c0e9e0b6d01442c9ea50d36014b5ee4440d37025bddf7d30b6e0134dbc34b0d"
+    "330130484ec10d3401fc5cdc190d358312e8edf9017182466a831a017fe2a569"
+    "b174085ee2ebd0344400bde1385ece850ad2e18e05b9030ae5e132acfba80ad6"
+    "e1f89c2d3d0ae6e12165367b0ad4e1b75c16250ae74067368d550077006e7a13"
+    "4405970031d6749c097a0099c0da3f097d005fafd3b803df004f6def9c03de61"
+    "0b8c00cc097e0076ed86f7007961e1be4ff50078817c7b65dc063a013968ebbc"
+    "0d0c01780dcc6b0d0d61c1c41c8903d262c20ab7b303d600a6f57cb0050a003f"
+    "fc2d0a050b0048fb1d9c050c00d69f883f050d00a198b8a9050e003891e91305"
+    "0f004f96d985051000da4773d705090043129bf80998008aacedf6099969cb20"
+    "868303d86102b0eeb70277619bb9bf0d07ba61ecbe8f9b07b86172da1a3807b9"
+    "6105dd2aae07bb619cd47b1407bc61ebd34b8207bd61c314b02e07c06905d4fb"
+    "4e03d140f2a2575003d46247d78dcf03d50e4783bf2605270ede8aee9c05280e"
+    "a98dde0a05290e37e94ba9052a0e40ee7b3f052b0ed9e72a85052c0eaee01a13"
+    "052d0e8dacf5c205200e14a5a47805210e63a294ee05220efdc6014d05230e8a"
+    "c131db05240e13c8606105250e64cf50f7052661a09f089403d36a5544f20c03"
+    "726a2bf58eb103d9623ddc078a05636201d138d305646a4f9e267103db0089ce"
+    "456b04e60010c714d104e70067c0244704e800f9a4b1e404e9008ea3817204ea"
+    "0017aad0c804eb0060ade05e0832009363b8a804d2009755fde304ec62e77af6"
+    "7003d06940edbd6f03d701b8440d7d03e240db0290dd03dc0061d87a3804ed00"
+    "f8d12b8204ee008fd61b1404ef0011b28eb704f00066b5be2104f100ffbcef9b"
+    "04f20088bbdf0d04f340ca94436204d4000f5947f204f4009650164804f500e1"
+    "5726de04f6007f33b37d04f700083483eb04f800913dd25104f900e63ae2c704"
+    "fa4070f9a4fa04d302c050b2090a35007cd550870a3301689569980d63218161"
+    "509f096521186801250966216f6f31b3096721f10ba410096821860c94860969"
+    "211f05c53c096a216802f5aa096b2153ed79cd08802138510f0b088121f1ef79"
+    "050908007650b81b07fa61711891ff076b0ef5c134d5095d0e6cc8656f095e0e"
+    "1bcf55f9095f0e85abc05a09600ef2acf0cc09610e6ba5a17609620e1ca291e0"
+    "09630e67c1b8e308360e022c5b7e087d0ecb922d7009076e5e88ac2d0772009d"
+    "f805be085261fbae166e09bb00552ef6290a5665db20760f080569dbc26b4607"
+    "6c6d60af3bb207696186fe4ced09ba65d1f5a6c8076d611bb16db208f56e2d12"
+    "b8c8076e61511ea1e709bc025903e14f0d5d02c00ab0f50d4602b70d80630d5e"
+    "02296915c00d5f025e6e25560d6002c76774ec0d6102b060447a0d620e7d647f"
+    "32087f0e32bdbe78087e0efb03c87609066dfd36a8b60768407fd9e02508fa40"
+    "c6817a80076ac2a0367b6d09ed00aa92e118076640680276a408fd00cc30d120"
+    "086200e2faa7bb0b8d0eafa14c17090b0177c0211d0c600e4f6abddc0c5fc0b7"
+    "86fd240c61069dcd5c2e0c468689cd82bb0c5986f8bc4dfa0c56869af0d7a60c"
+    "4f82c990bd440c1d80e8533d5b0c3780c27420b00c3d86a11c4ed20c4e86c5c2"
+    "a2160c0681bf243e930c3586b5b459e50bfe86a060b9e90bf981244d29e40c58"
+    "862f7ed68c0c2c86c58027cc0bf386191719180c0286b2bed34e0c2086650d0d"
+    "650c2986120a3df30c2a868b036c490c2b862bb782f40c21865cb0b2620c2286"
+    "c2d427c10c2386b5d317570c24862cda46ed0c25865bdd767b0c2686cb626bea"
+    "0c2786bc655b7c0c28864805dca40c4786474bc5ce0c15867c4ad5d90c4886e8"
+    "85be8c0c178678dc41ba0c1880f0dbea330c36808577af980c08862cf8f3400c"
+    "0a018a2231010c3a815b6a58e30c3981078b72350c1f81a13108f70c3f814689"
+    "bdc30c3c81537e36250c3b8659a00d9d0c5080a999a8c60c51803090f97c0c52"
+    "80aef46cdf0c53800030fe3f0c0782a847dc840c1c06d3e57e9a0c5486f4c266"
+    "f40bfc86d0169ed50c558653f6e68d0bfd8218113cb40bf486b74895190c4d82"
+    "bfb011f10bff866a025fe00bf68613d517d20c2f86d072f0bc0c308628b63ce3"
+    "0c34865cc0c9210c3386ed0c7b6a0c2e86286882970c328643f9dee30c318062"
+    "0d2e210c0d862ebcc1f90c14828e5e20310c198259b592700c1a825a0105990c"
+    "1b8117e506360c2d814a526f5b0bf58635ffd7b20c03858e6674d50c38854edf"
+    "1e430c3e86d947da820c0b86c7dacce10c0e814713bea40bda82c52e3f910be2"
+    "826a1151ac0bea82a87329cf0bdd82bafdf97a0beb82dd2a73410be382944381"
+    "0c0bec820ee65d6e0be4825a8967620bed827ea0ee1b0be1825aa978a10bee82"
+    "9c7b92630bdf82e4fc54930bef82a3f80efd0be082f28713eb0bf0864e663ea2"
+    "0bf186145f89880c1300b485612a0c9c0694427bed0bfa06a32dad1c0bf206a7"
+    "558a6d0c57068c603c020bdb00930b5d460c1200d1e8971a0bf880c95ff0260c"
+    "09014e8c7da50c0c00baea25fc0c1100c09e410c0c4100ed44b0e30c4002abf1"
+    "a7610c00028447afd90c01067bf2077e0bfb06dfbd330e0c05064914ce5a0c0f"
+    "00f7957aef0bf706d2ea70fd0c1e069e4cb8c50c100e497b32eb0c620662de4e"
+    "250c04062a58e9ac0d5602e74cbabe0be7028a11ace00bdc02ff48f66e0be802"
+    "2c84d8410be9025cc26b340be602be19174c0bde02819a8bd20be5063752f518"
+    "0c4306ad02c5130c420031a15458085300f81f2256091e00ccbc308707670a5f"
+    "4b4447083440c4a80d1e09e840ce6501e30a3240b74c1b5108fb406c8f3a5905"
+    "78409af7088b0a3100f33e82c3091f014bd1f74d0a1a004328fedd0a1901cede"
+    "82b50a2600296dde8f0a27010c752b060a3600553bca330a34014a8cae040d0e"
+    "011d09d77d0a590028ccede80a5a015bdd52580d080095f7b1470d0900300fab"
+    "940b960a7a3c917204d80ae335c0c804d90a9432f05e04da0a0a5665fd04db0a"
+    "7d51556b04dc0ae45804d104dd0a935f344708306ade74765504d60afdab16f5"
+    "04de0a341560fb09090ae10f410d04df0a780610b704e00a0f01202104e10a91"
+    "65b58204e20ae662851404e30a7f6bd4ae04e40a086ce43808310a373ab0ca04"
+    "d50a0863ff8104e50ac1dd898f090a026bea4069087000171a69a808710e587b"
+    "bbf905120ec172ea4305130eb675dad505140e28114f7605150e5f167fe00516"
+    "0ec61f2e5a05170eb1181ecc05180e05aa65e905110e8feb0f7f090f0e465579"
+    "7109108222c8523a0a220eeac3175104fb0ec3e07a4a0d140e73ca46eb04fc0e"
+    "7e2a16840d150e04cd767d04fd0ea3bccf010d160e9aa9e3de04fe0edecfc959"
+    "0d170eedaed34804ff0e035910dc0d180e74a782f205000ebe937c120d190e03"
+    "a0b26405010e6305a5970d1a0e5ffe749104d70e850da73908350e4cb3d13709"
+    "0c0e345582290d660ead5cd3930d670eda5be3050d680e443f76a60d690e3338"
+    "46300d6a0eaa31178a0d6b0edd36271c0d6c0ef282a04a0d640e3b3cd6440d65"
+    "82f9b521cb0a230e5b7d808605190ec274d13c051a0eb573e1aa051b0e2b1774"
+    "09051c0e5c10449f051d0ec5191525051e0eb21e25b3051f0efdde46c00d6e0e"
+    "64d7177a0d740e13d027ec0d730e8db4b24f0d720efab382d90d710e63bad363"
+    "0d700e14bde3f50d6f0ed154a6430d770e8b8a97610d750e4234e16f0d760ed3"
+    "4a9c7f08550e1af4ea71090d021dd1d0b408f70284d8810e08f802f3dfb19809"
+    "89026dbb243b08f9021abc14ad098a0283b54517098b02f4b27581098c02100f"
+    "eae508540217273d8c08f602de994b820905406ae0502c08bd40f3e9019608be"
+    "4084ee310008bf401a8aa4a308c0406d8d943508c140f484c58f08c2408383f5"
+    "1908c340133ce88808c40059f750990920616a0c202c08cfc091347af3003a00"
+    "bb8f91db00c1ed6ce96123003ced6eafdf7a003ded6f6db54d003ee92776e286"
+    "00430a9f3bfeb9003f0a9d7d40e000400a9cbf2ad70041e1d4b3f692003be23e"
+    "5bfe060044e2943a16910042002d1e85d1004500733f9a0e004600ea36cbb400"
+    "47009d31fb220048e25ca4c19f004912c6a967e500c2c0cbccd18a0957c08495"
+    "5bab0958c0dc2828e804bec08c59297f0a02e18194411004c1e1ff34e027068d"
+    "ed3ddcc31204bfedceb4dce1068eed01d1fc4b04c0ed13ab2bcc068f00510392"
+    "c90a0380d0adb7850b9cea30756ef404c3ea4ec4124904c4e61800d661054de6"
+    "240de938054eea2aafba8904c50040b192e504c2008925b7940679ee4914843a"
+    "04bde161a234af0a240e178b819a0d1c063848ea380d1dc07a64c1ec0827c0e3"
+    "6d90560826e114ed4791054fea2acc5e79075de210798ba3054c019a57f78d08"
+    "9a0144b7ab4c01ca011a75548400c302ae6d0de200c4c0a53f3f7d02fee193b8"
+    "40cb0774e17dba37bd0775e1e426923b0776e1e45851bc0777e17f83de540778"
+    "e125d68e7c0779e10b1b37db077ae10ced9bff077bc05af5405a09a2e1612c0c"
+    "7e066ac0b3960c7e0669e12f0fce1f066bc0f55c0d9009a3e148e4b88c07d2c0"
+    "9a5eb88c07d1e106c77aed07d3c0ad220e5c0341c034c0685d02fae1c0d22ebb"
+    "02fce195c275e60565c0c820affd0981c0f54eb79d02fbc04997e841030dc0d0"
+    "9eb9fb0490c0787ff2dc0b58c0e176a3660b570088c4b29b0301c06fe120a603"
+    "edc0f6e8711c0491c05e093a3b0b59c0c7006b810b5a00e7008ff203ece10f14"
+    "fde50052c1aa37c2ae0053c14f5b85930054c1810d090c005500bc04cc910170"
+    "401844310700e240e7a15e1f0b0f407eceab5b00e340accac30100e40005de7d"
+    "17035c00c8427631016900c5942e8000e7c0f28707f00243e1e543d41f00eb61"
+    "07058a0b03cdee3fbc687f0580eea6b539c50581ee0e5472e20b54ee975d2358"
+    "0b536e3fcbfd6c03ce003f4c6430030700a645358a058200d142051c0b5d004f"
+    "2690bf0b5eee68497b9c07826e0332af1807830e70af9db500e9e935c24aa700"
+    "ea699921dc4403cc406435d2b50cefc04d975754077cc2f7e587150294c29ab8"
+    "914b028fc2efe1cbc50296c23c2de5ea0298c24c6b569f0293c2aeb02ae70290"
+    "c29133b6790291c2b045fdc50295c2dd18eb9b0299c2a841b1150297c27b8d9f"
+    "3a029cc20bcb2c4f029bc2e9105037029ac2d693cca9029242363db8840611e1"
+    "049063ea046461961a9f6c07c5429997ef4c0614428549a866061242991e96f8"
+    "061342079c05da06174226a891d7061542adf5683b061680863e34500cc4ee64"
+    "46cfdb00e86ecb439de5046e0ed933e01901880eb8115d5c04700ef53b345101"
+    "890087ba736d026ae14afe95e8029dee8de6431b046a6eb57c47e9046f619f87"
+    "9263061801032aad1f00e501d110d005044e01a617e093044f01387375300450"
+    "014f7445a6045101d67d141c045201a17a248a04530131c5391b045481d5ba54"
+    "cd063b014c1eddda056f01de529bb00cdc01373538c20cde01403208540ce001"
+    "de569df70ce201a951ad610ce4013058fcdb0ce601475fcc4d0ce901d7e0d1dc"
+    "0ceb019ce0ce7a0cdd011d21e0cf0cdf016a26d0590ce101f44245fa0ce30183"
+    "45756c0ce5011a4c24d60ce7016d4b14400ce801fdf409d10cea00556417180c"
+    "6301d97b1c4d0d0a01d3619df80c6401e825273200e601fc570bdb0455018b50"
+    "3b4d0456011534aeee04570162339e78045801fb3acfc20459018c3dff54045a"
+    "011c82e2c5045bc06ba62798053802fc92b4a40665c13d579dfb0668c2103987"
+    "6a053fe1a4d2ce57053ee1872a8838053ce11dc6a468053b029800bdf00666e1"
+    "7317c0720a89c036c36c230764ee85aec727053d020761939a06490cf05d8a3c"
+    "05370e7542150e0536e980506de3053ae90951db6e053900970d250700a9e1f3"
+    "115a2800a8ed0eeada7f0ab90eac7e06af0ab2009f37e8480ab30e4abfeb090a"
+    "b4ede2d144e00ab50e4d10c2020ab600dd12ef350ab70e07774a020ab8ede1d7"
+    "7f9f0aae0e54bc4d190aaf005958e1cf0ab00e9ce608140ab1c048543205094c"
+    "c029e15d980afe00f055a4120a8e006be7e0830a95e977d8e0f20a8fe9dba757"
+    "a70a900057afd8d50a97e9aea686120a98e9739b6b4e0a99c014177c850a91ea"
+    "a1ea86e90a96c01d7e5fc10a9a00c060cddb0af000992f192f0aefe1f032413d"
+    "0a92e11652eedc0a930016392ec60b07e1fd2c317a0a94e12cb8bde70a9b8391"
+    "88b45602a58394c01e2b06948350dfebb5029e831a473336069983e6d0e31f01"
+    "80836333f7f401818377ded05706a583c7046c7d06a6409aff32be05bb831852"
+    "f1e30257830bc47813069783e3910c27025683675e1f3b069583cc5c4d1106a7"
+    "83ef99d08506a883fab432f803118363bd63420312406512bbc205bc83ab5b0d"
+    "a5030e405591efaf07c98302ae12ac003483ce297d7e0033832a25edf306a940"
+    "4b19ae7205b980f63e80420b2a935b8c70a60a6a935f68951c0a6b93bf5b6360"
+    "0a6993e11998f80a6f8347eabd6a02a083dd88e9e7029f4090d0258705ba40ac"
+    "af056b022481dcc8d51e017881bf7e48580179838b1c7e4002a283f3e99ac606"
+    "9c8351da460402a1834ffe729f069b83380c545e018383cc6c55f901828379ac"
+    "dc8506aa838310f1cc06ae8319d8db3c06af40fdd6b6530214834debb04a0259"
+    "8375da5b0c0698838cac0dd502588336d3c3af0696836303ef1c06ab8362efc3"
+    "5306ac407be57799021883c820adec05bf835129fc5605c04091dc9a5905bd83"
+    "183ad8ba003683cf2cd0cf003583deebcc6806ad402c302a9f00378320d4d386"
+    "02a483917b1ecb02a340c811b206021d404f8b25f00223c0d802dc890660033d"
+    "c6687e0a67016a5399a300f0e182ee781f00f20a68b7289b00f381798b64b602"
+    "7b4021fe28ef07590150fbfc2b075ae959ee228700fae92746da7b00fb009043"
+    "2fbd0187004e977f0b067701a9d5a48a0253ee1597e1ad010ee1263dca71010f"
+    "e17b4289e402cdc9939e5ab602bd00bbd71e5202be80c54b781c0ca2e11c8666"
+    "0302bbe922e7ac5902bc004bd827ad02ba813a7faa280ca1eebbe3635f033ae1"
+    "37c21e8d034303a8d5bc550000030c2923470000037043a335000003df2e585d"
+    "0000039f4458e9000003d904a13a000003f977d30a0000030646eb5600000357"
+    "1b7c34000003d5e7d79600000343c2f841000003b6d656e600000387e23c2300"
+    "0003a36256d3000003cb658f620000035b7ec57a000003ae886072000003e496"
+    "d6400000036b1ade3b000003d5c876fb000003693e03ee0000038a0048b20000"
+    "03af041414000003df507427000003dbdce0bd0000039e84da8500000334a501"
+    "23000003eb7658b8000003b02c57b200000397d1baa50000039655d95c000003"
+    "5d2cec990000039bb8f62b0000039683331c0000033677609b0000036b2a061a"
+    "000003649b4c1b0000036271a05e000003be2d7be400000349e8229500000337"
+    "e6727c000003afa2968b00000395a0a18d0000038beed8dc000003a8432fe000"
+    "000335bcdbba00000306e9c769000003fb40f9e3000003bcf4652c000003c363"
+    "60e10000030315df2d00000334d523dc0000035f6232a0000003baffc53e0000"
+    "0326475c6e0000030dc217150000033e01149900000325eb8ee000000338e9da"
+    "6f00000390716e0c000003987556e000000330ede283000003ca2a2bbf000003"
+    "12f33ca100000365d5bf96000003d54804b7000003116fc318000003b6b0774b"
+    "0000033a5c6dee0000033f942d3b0000030d195291000003be9f792a000003bf"
+    "774e1e0000038d0b511c000003c32ccd20000003acef37b90000031040967b00"
+    "00038f585874000003fc507fbb0000039acee88800000373a6e56a000003e47e"
+    "e976000003327b7864000003cd930ca60000035396f6d1000003bea3936d0000"
+    "03e5b42278000003688e733200000374902f9f000003d7c6a936000003df94ac"
+    "2c0000039ca89db30000032f3cb070000003cb4c454d000003f2c17988000003"
+    "7afac7930000039c488e6b0000036b3d4c40000003c3827f2f00000330d70963"
+    "0000037a9ef9c900000340ee87130000032cd2dba80000036a78f290000003f5"
+    "e34a18000003f8766abc0000035375085c0000031077f855000003eb5a5d1800"
+    "0003d093bcc6000003c894a2500000036bc224f900000327de5ef7000003b11e"
+    "70550000"
+)
+
+NAMES = """\
+ACCESSORIES_CONNECTED_BITMASK
+ACCESS_LEVEL
+ACCESS_LEVEL_TIMEOUT_DELAY_TIME
+ADDITIONAL_ALARM
+ADDITIONAL_ALARM_2
+ADDITIONAL_ALARM_3
+ADDITIONAL_ALARM_4
+ADDITIONAL_ALLOW
+ADDITIONAL_ALLOW_XDHW
+ADDITIONAL_BLOCKED
+ADDITIONAL_BLOCK_HIGH_T2
+ADDITIONAL_BLOCK_HIGH_T2_TEMP
+ADDITIONAL_BLOCK_HIGH_T2_TIME
+ADDITIONAL_BLOCK_TIME_CONTROL_TEMPERATURE_LIMIT
+ADDITIONAL_CONNECTED_COMPRESSOR_1
+ADDITIONAL_CONNECTED_COMPRESSOR_2
+ADDITIONAL_CONNECTED_COMPRESSOR_3
+ADDITIONAL_CONNECTED_COMPRESSOR_4
+ADDITIONAL_CURRENT_EFFECT_LIMITATION
+ADDITIONAL_DELAY_TIME
+ADDITIONAL_DHW_ACKNOWLEDGED
+ADDITIONAL_DHW_HYSTERESIS
+ADDITIONAL_DHW_TEMP_CHANGE
+ADDITIONAL_EFFECT_LIMITATION_COMPRESSOR
+ADDITIONAL_EFFECT_LIMITATION_DHW
+ADDITIONAL_EFFECT_LIMITATION_NO_COMPRESSOR
+ADDITIONAL_ELECTRIC_COUNT
+ADDITIONAL_ELECTRIC_SIGNAL_1
+ADDITIONAL_ELECTRIC_SIGNAL_2
+ADDITIONAL_ELECTRIC_SIGNAL_3
+ADDITIONAL_ELECTRIC_SIGNAL_4
+ADDITIONAL_ELECTRIC_SIGNAL_OUT_1
+ADDITIONAL_ELECTRIC_SIGNAL_OUT_2
+ADDITIONAL_ELECTRIC_SIGNAL_OUT_3
+ADDITIONAL_ELECTRIC_SIGNAL_OUT_4
+ADDITIONAL_EL_NEUTRALZONE_LIMITATION
+ADDITIONAL_EL_NEUTRALZONE_LIMITATION_TIME
+ADDITIONAL_EL_NEUTRALZONE_RAMP_DOWN_TIME
+ADDITIONAL_EL_NEUTRALZONE_RAMP_UP_TIME
+ADDITIONAL_EL_NEUTRALZONE_SIZE
+ADDITIONAL_EXTERN_BLOCKED
+ADDITIONAL_EXTERN_BLOCK_BY_E21_EXT_1
+ADDITIONAL_EXTERN_BLOCK_BY_E21_EXT_2
+ADDITIONAL_EXTERN_BLOCK_BY_E22_EXT_1
+ADDITIONAL_EXTERN_BLOCK_BY_E22_EXT_2
+ADDITIONAL_GTf_AVERAGE
+ADDITIONAL_GTf_AVERAGE_OLD
+ADDITIONAL_LIMITATION_DEFROST_DELAY_TIME
+ADDITIONAL_LIMITATION_T1_MAX
+ADDITIONAL_LIMITATION_T1_START
+ADDITIONAL_LIMITATION_T8_MAX
+ADDITIONAL_LIMITATION_T8_START
+ADDITIONAL_LIMIT_100_EXTERN
+ADDITIONAL_LIMIT_100_EXTERN_BY_E21_EXT_1
+ADDITIONAL_LIMIT_100_EXTERN_BY_E21_EXT_2
+ADDITIONAL_LIMIT_100_EXTERN_BY_E22_EXT_1
+ADDITIONAL_LIMIT_100_EXTERN_BY_E22_EXT_2
+ADDITIONAL_LIMIT_50_EXTERN
+ADDITIONAL_LIMIT_50_EXTERN_BY_E21_EXT_1
+ADDITIONAL_LIMIT_50_EXTERN_BY_E21_EXT_2
+ADDITIONAL_LIMIT_50_EXTERN_BY_E22_EXT_1
+ADDITIONAL_LIMIT_50_EXTERN_BY_E22_EXT_2
+ADDITIONAL_LIMIT_KW_BY_E21_EXT_1
+ADDITIONAL_LIMIT_KW_BY_E21_EXT_2
+ADDITIONAL_LIMIT_KW_BY_E22_EXT_1
+ADDITIONAL_LIMIT_KW_BY_E22_EXT_2
+ADDITIONAL_LIMIT_KW_EXTERN
+ADDITIONAL_LIMIT_PERCENT_EXTERN
+ADDITIONAL_LIMIT_PERCENT_EXTERN_BY_E21_EXT_1
+ADDITIONAL_LIMIT_PERCENT_EXTERN_BY_E21_EXT_2
+ADDITIONAL_LIMIT_PERCENT_EXTERN_BY_E22_EXT_1
+ADDITIONAL_LIMIT_PERCENT_EXTERN_BY_E22_EXT_2
+ADDITIONAL_NEUTRALZONE_DECREASE
+ADDITIONAL_NEUTRALZONE_INCREASE
+ADDITIONAL_NEUTRALZONE_SIGNAL
+ADDITIONAL_ONE_STEP_START
+ADDITIONAL_ONE_STEP_STOP
+ADDITIONAL_ONLY
+ADDITIONAL_ONLY_RAMP_TIME
+ADDITIONAL_ONLY_SIGNAL_RAMP_UP
+ADDITIONAL_PID_D
+ADDITIONAL_PID_I
+ADDITIONAL_PID_MAX
+ADDITIONAL_PID_MIN
+ADDITIONAL_PID_P
+ADDITIONAL_POOL_ALLOW
+ADDITIONAL_POOL_DELAY_TIME
+ADDITIONAL_POOL_MODE
+ADDITIONAL_POOL_RAMP_DOWN_TIME
+ADDITIONAL_POOL_RAMP_UP_TIME
+ADDITIONAL_PROGRAM_1_FRI
+ADDITIONAL_PROGRAM_1_MON
+ADDITIONAL_PROGRAM_1_SAT
+ADDITIONAL_PROGRAM_1_SUN
+ADDITIONAL_PROGRAM_1_THU
+ADDITIONAL_PROGRAM_1_TUE
+ADDITIONAL_PROGRAM_1_WED
+ADDITIONAL_RAMP_DECREASE
+ADDITIONAL_RAMP_INCREASE
+ADDITIONAL_RAMP_INCREASE_DHW
+ADDITIONAL_REQUEST
+ADDITIONAL_SIGNAL
+ADDITIONAL_SIGNAL_FASTKONDENSERING
+ADDITIONAL_SIGNAL_LIMITATION
+ADDITIONAL_SIGNAL_NORMAL
+ADDITIONAL_SIGNAL_ONLY
+ADDITIONAL_SIGNAL_PID
+ADDITIONAL_SIGNAL_POOL
+ADDITIONAL_TIMEPROGRAM
+ADDITIONAL_TIMER_EVU_ECONOMY_MODE
+ADDITIONAL_TIME_CONTROL_BLOCK
+ADDITIONAL_TOTAL_EFFECT_PATRON
+ADDITIONAL_USER_BLOCKED
+ADDITIONAL_USER_ONLY
+ADDITIONAL_USE_NEUTRALZONE_REGULATOR
+ADDITIONAL_VALVE_ALLOW
+ADDITIONAL_VALVE_CLOSE_TIME
+ADDITIONAL_VALVE_DELAY_TIME
+ADDITIONAL_VALVE_MEASUREMENT
+ADDITIONAL_VALVE_OPEN_TIME
+ADDITIONAL_VALVE_RUNNING_TIME
+ADDITIONAL_VALVE_SIGNAL
+AHB0016_BOOT_COUNT
+AHB0016_CONNECTED
+AHB0016_CONNECTED_2
+AHB0016_CONNECTED_3
+AHB0016_CONNECTED_4
+AHB0016_CONNECTED_BITMASK
+AHB0016_VERSION
+AHB0016_VERSION_2
+AHB0016_VERSION_3
+AHB0016_VERSION_4
+AHB9012_CONNECTED
+AHB9012_VERSION
+ALARM_MODE_DELAY_TIME
+ALARM_MODE_REQUEST
+BACKWARDS_COMPABILITY_DUMMY
+BIVALENCE_POINT
+BUZZER_BLOCKED
+BUZZER_BLOCK_START_TIME
+BUZZER_BLOCK_STOP_TIME
+BUZZER_DELAY_TIME
+BUZZER_INTERVAL
+CIRCULATION_E21_G2_DELTA_DHW
+CIRCULATION_E21_G2_DELTA_HEATING
+CIRCULATION_E21_G2_DHW_MEAN_VALUE
+CIRCULATION_E21_G2_DHW_MEAN_VALUE_CASCADE
+CIRCULATION_E21_G2_GET_MEAN_VALUE
+CIRCULATION_E21_G2_HEATING_MEAN_VALUE
+CIRCULATION_E21_G2_HEATING_MEAN_VALUE_CASCADE
+CIRCULATION_E21_G2_IDLE_SPEED
+CIRCULATION_E21_G2_PID_CALCULATED_MEASUREMENT
+CIRCULATION_E21_G2_PID_SETPOINT
+CIRCULATION_E21_G2_SIGNAL
+CIRCULATION_E21_G2_USER_SET_PERCENT
+CIRCULATION_E22_G2_DELTA_DHW
+CIRCULATION_E22_G2_DELTA_HEATING
+CIRCULATION_E22_G2_DHW_MEAN_VALUE
+CIRCULATION_E22_G2_DHW_MEAN_VALUE_CASCADE
+CIRCULATION_E22_G2_GET_MEAN_VALUE
+CIRCULATION_E22_G2_HEATING_MEAN_VALUE
+CIRCULATION_E22_G2_HEATING_MEAN_VALUE_CASCADE
+CIRCULATION_E22_G2_IDLE_SPEED
+CIRCULATION_E22_G2_PID_CALCULATED_MEASUREMENT
+CIRCULATION_E22_G2_PID_SETPOINT
+CIRCULATION_E22_G2_SIGNAL
+CIRCULATION_E22_G2_USER_SET_PERCENT
+CIRCULATION_E74_G1_DIGITAL
+CIRCULATION_G2_DELTA_DHW_AT_LOW_T12
+CIRCULATION_G2_PID_D
+CIRCULATION_G2_PID_I
+CIRCULATION_G2_PID_MAX
+CIRCULATION_G2_PID_MIN
+CIRCULATION_G2_PID_P
+CIRCULATION_G2_VOLTAGE_AT_0
+CIRCULATION_G2_VOLTAGE_AT_100
+COMMUNICATION_BASECARD_E21_RESTART_DETECTED
+COMMUNICATION_BASECARD_E22_RESTART_DETECTED
+COMMUNICATION_FAILED_SENDINGS
+COMMUNICATION_SEND_SEC_ROOMSENSOR_STATUS
+COMPRESSORS_CONNECTED_COUNT
+COMPRESSOR_ALARM
+COMPRESSOR_ALARM_2
+COMPRESSOR_BLOCKED
+COMPRESSOR_BLOCKED_2
+COMPRESSOR_CALC_HOTGAS
+COMPRESSOR_CALC_HOTGAS_2
+COMPRESSOR_CALC_HOTGAS_FILTERED
+COMPRESSOR_CALC_HOTGAS_FILTERED_2
+COMPRESSOR_COP_FREQUENCY_MAX
+COMPRESSOR_COP_FREQUENCY_MIN
+COMPRESSOR_COP_T1_SETPOINT_MAX
+COMPRESSOR_COP_T1_SETPOINT_MIN
+COMPRESSOR_DHW_REQUEST
+COMPRESSOR_E21_EXTERN_BLOCKED
+COMPRESSOR_E21_EXTERN_BLOCK_BY_E21_EXT_1
+COMPRESSOR_E21_EXTERN_BLOCK_BY_E21_EXT_2
+COMPRESSOR_E21_EXTERN_BLOCK_BY_E22_EXT_1
+COMPRESSOR_E21_EXTERN_BLOCK_BY_E22_EXT_2
+COMPRESSOR_E22_EXTERN_BLOCKED
+COMPRESSOR_E22_EXTERN_BLOCK_BY_E21_EXT_1
+COMPRESSOR_E22_EXTERN_BLOCK_BY_E21_EXT_2
+COMPRESSOR_E22_EXTERN_BLOCK_BY_E22_EXT_1
+COMPRESSOR_E22_EXTERN_BLOCK_BY_E22_EXT_2
+COMPRESSOR_E22_RESTART_HANDLING_TRIGGED
+COMPRESSOR_HEATING_REQUEST
+COMPRESSOR_MAX_FREQUENCY
+COMPRESSOR_MAX_FREQUENCY_DEV
+COMPRESSOR_MIN_FREQUENCY
+COMPRESSOR_QUICKSTART
+COMPRESSOR_REAL_FREQUENCY
+COMPRESSOR_RESTART_TIME
+COMPRESSOR_SIZE
+COMPRESSOR_SIZE_2
+COMPRESSOR_SIZE_2_DISPLAY_VALUE
+COMPRESSOR_SIZE_DISPLAY_VALUE
+COMPRESSOR_SIZE_INDEX
+COMPRESSOR_SIZE_INDEX_2
+COMPRESSOR_SIZE_LW
+COMPRESSOR_SIZE_LW_2
+COMPRESSOR_START
+COMPRESSOR_STARTUP_FREQUENCY
+COMPRESSOR_STARTUP_TIME
+COMPRESSOR_START_2
+COMPRESSOR_START_DELAY_TIME
+COMPRESSOR_STATE
+COMPRESSOR_STATE_2
+COMPRESSOR_TYPE
+COMPRESSOR_TYPE_2
+COMPRESSOR_USE_START_DELAY_TIME
+CONFIGURATION
+CONFIGURATION_BUDERUS
+COOLING_FAN_STOP_DELAY_TIME
+COUNTRY
+CPU_BOOT_COUNTER
+CRANKCASE_HEATER_BLOCK_TEMP
+CURRENT_M_VALVE
+DATE_DAY
+DATE_DAY_OF_WEEK
+DATE_HOUR
+DATE_MIN
+DATE_MONTH
+DATE_SEC
+DATE_YEAR
+DEFROST_0_DELTA_TEMPERATURE
+DEFROST_0_DELTA_TEMPERATURE_2
+DEFROST_BATTERY
+DEFROST_BATTERY_2
+DEFROST_BLOCK_DELAY_TIME
+DEFROST_BLOCK_DELAY_TIME_2
+DEFROST_CYCLE
+DEFROST_CYCLE_2
+DEFROST_CYCLE_2_CLOSING_DOWN
+DEFROST_CYCLE_CLOSING_DOWN
+DEFROST_DELAY_4_WAY_VALVE_2_SWITCH
+DEFROST_DELAY_4_WAY_VALVE_SWITCH
+DEFROST_DELAY_COMPRESSOR_2_START
+DEFROST_DELAY_COMPRESSOR_START
+DEFROST_DELTA_T12_T11
+DEFROST_DELTA_T12_T11_2
+DEFROST_DELTA_TEMPERATURE
+DEFROST_DELTA_TEMPERATURE_2
+DEFROST_DELTA_TIME
+DEFROST_DELTA_TIME_2
+DEFROST_FAN
+DEFROST_FAN_2
+DEFROST_FAN_COUNTER
+DEFROST_FAN_COUNTER_2
+DEFROST_FAN_INTERVAL_COUNTER
+DEFROST_FAN_INTERVAL_COUNTER_2
+DEFROST_FAN_TEMPERATURE_LIMIT
+DEFROST_FAN_TEMPERATURE_LIMIT_2
+DEFROST_FAN_TIME
+DEFROST_FAN_TIME_2
+DEFROST_GT11_STOP
+DEFROST_GT11_STOP_2
+DEFROST_MANUAL_START
+DEFROST_MANUAL_START_2
+DEFROST_MAX_RUNNING_TIME_BETWEEN_DEFROSTS
+DEFROST_MAX_RUNNING_TIME_BETWEEN_DEFROSTS_2
+DEFROST_MAX_TIME
+DEFROST_MAX_TIME_2
+DEFROST_MINUS10_DELTA_TEMPERATURE
+DEFROST_MINUS10_DELTA_TEMPERATURE_2
+DEFROST_MINUS20_DELTA_TEMPERATURE
+DEFROST_MINUS20_DELTA_TEMPERATURE_2
+DEFROST_OUT_START_TEMPERATURE
+DEFROST_OUT_START_TEMPERATURE_2
+DEFROST_PLUS10_DELTA_TEMPERATURE
+DEFROST_PLUS10_DELTA_TEMPERATURE_2
+DEFROST_QUIT_DELAY_TIME
+DEFROST_QUIT_DELAY_TIME_2
+DEFROST_REQUEST
+DEFROST_REQUEST_2
+DHW_BLOCKED
+DHW_BLOCK_SWITCH_TO_HEATING
+DHW_CALCULATED_E21_T3_START_TEMP_SEC_PER_TENTH_ADJ
+DHW_CALCULATED_E22_T3_START_TEMP_SEC_PER_TENTH_ADJ
+DHW_CALCULATED_SETPOINT_TEMP
+DHW_CALCULATED_SETPOINT_TEMP_OFFSET
+DHW_CALCULATED_T3_DHW_LOADING_INTERVAL
+DHW_CALCULATED_T3_START_TEMP_MIN_VALUE
+DHW_COMPRESSOR_GT8DIFF_FREQUENCY_MAX
+DHW_COMPRESSOR_GT8DIFF_FREQUENCY_MIN
+DHW_COMPRESSOR_GT8DIFF_GT8_MAX
+DHW_COMPRESSOR_GT8DIFF_GT8_MIN
+DHW_COMPRESSOR_HEATING_FREQUENCY_MAX
+DHW_COMPRESSOR_HEATING_FREQUENCY_MIN
+DHW_COMPRESSOR_HEATING_GT2_MAX
+DHW_COMPRESSOR_HEATING_GT2_MIN
+DHW_E21_COMPRESSOR_TEMPORARY_STOP
+DHW_E21_COMPRESSOR_TEMPORARY_STOP_DELAY
+DHW_E21_COMPRESSOR_TEMPORARY_STOP_DIFF
+DHW_E21_COMPRESSOR_TEMPORARY_STOP_SAVED_GT3
+DHW_E22_COMPRESSOR_TEMPORARY_STOP
+DHW_E22_COMPRESSOR_TEMPORARY_STOP_DELAY
+DHW_E22_COMPRESSOR_TEMPORARY_STOP_DIFF
+DHW_E22_COMPRESSOR_TEMPORARY_STOP_SAVED_GT3
+DHW_EXTERN_BLOCKED
+DHW_EXTERN_BLOCK_BY_E21_EXT_1
+DHW_EXTERN_BLOCK_BY_E21_EXT_2
+DHW_EXTERN_BLOCK_BY_E22_EXT_1
+DHW_EXTERN_BLOCK_BY_E22_EXT_2
+DHW_GT3_START_MAX_TEMP
+DHW_GT3_START_MAX_TEMP_2
+DHW_GT3_START_TEMP
+DHW_GT3_START_TEMP_2
+DHW_GT3_START_TEMP_COMFORT
+DHW_GT3_START_TEMP_COMFORT_2
+DHW_GT3_START_TEMP_ECONOMY
+DHW_GT3_START_TEMP_ECONOMY_2
+DHW_GT3_STOP_MIN_TEMP
+DHW_GT3_STOP_MIN_TEMP_2
+DHW_GT3_STOP_TEMP
+DHW_GT3_STOP_TEMP_2
+DHW_GT8_STOP_MAX_TEMP
+DHW_GT8_STOP_MAX_TEMP_2
+DHW_GT8_STOP_TEMP
+DHW_GT8_STOP_TEMP_2
+DHW_GT8_STOP_TEMP_COMFORT
+DHW_GT8_STOP_TEMP_COMFORT_2
+DHW_GT8_STOP_TEMP_ECONOMY
+DHW_GT8_STOP_TEMP_ECONOMY_2
+DHW_GT9_STOP_TEMP
+DHW_GT9_STOP_TEMP_2
+DHW_MAX_TIME
+DHW_PROGRAM_1_5FRI
+DHW_PROGRAM_1_1MON
+DHW_PROGRAM_1_6SAT
+DHW_PROGRAM_1_7SUN
+DHW_PROGRAM_1_4THU
+DHW_PROGRAM_1_2TUE
+DHW_PROGRAM_1_3WED
+DHW_PROGRAM_2_5FRI
+DHW_PROGRAM_2_1MON
+DHW_PROGRAM_2_6SAT
+DHW_PROGRAM_2_7SUN
+DHW_PROGRAM_2_4THU
+DHW_PROGRAM_2_2TUE
+DHW_PROGRAM_2_3WED
+DHW_PROGRAM_MODE
+DHW_REQUEST
+DHW_REQUEST_2
+DHW_STATE_ECONOMY
+DHW_TIMECONTROLLED
+DHW_TIMEPROGRAM
+DHW_USER_ENABLED
+DHW_USER_ENABLED_2
+DHW_USER_SET_START_TEMP
+DHW_USER_SET_START_TEMP_2
+DISPLAY_BACKLIGHT_INTENSITY
+DISPLAY_CONTRAST
+DISPLAY_TESTED
+DRIFTTILLSTAND
+DRYOUT_SETPOINT_TEMP
+DST_ENABLED
+DST_OFFSET
+E31_T2_CONNECTED
+E31_T32_KORRIGERING_GLOBAL
+E71_T71_ACKNOWLEDGED
+E71_T71_CONNECTED
+E71_T71_KORRIGERING
+E71_T71_STATUS
+E71_T71_TEMP
+E71_T72_KORRIGERING
+E71_T72_STATUS
+E71_T72_TEMP
+E72_T71_ACKNOWLEDGED
+E72_T71_CONNECTED
+E72_T71_KORRIGERING
+E72_T71_STATUS
+E72_T71_TEMP
+E72_T72_KORRIGERING
+E72_T72_STATUS
+E72_T72_TEMP
+E81_T81_CONNECTED
+EEPROM_HEATING_SEASON_START_DELAY_TIME
+EEPROM_NEUTRALZON_M_VALVE_LIMIT_TIME
+ELECTRICAL_CONNECTION_400V
+ELECTRICAL_MODE
+ELECTRICAL_MODE_SELECTED
+ELSKAP_MAX
+ELSKAP_MAX_TEMP
+ELSKAP_TEMP
+EL_DHW_REQUEST
+ENABLE_HIGH_PROTECTION_HS_BY_E21_EXT_1
+ENABLE_HIGH_PROTECTION_HS_BY_E21_EXT_2
+ENABLE_HIGH_PROTECTION_HS_BY_E22_EXT_1
+ENABLE_HIGH_PROTECTION_HS_BY_E22_EXT_2
+ENVELOPE_BLOCK_ACKNOWLEDGE_TIME
+ENVELOPE_BLOCK_AFTER_DHW
+ENVELOPE_CURVE_MAX_TEMP
+ENVELOPE_CURVE_MAX_TEMP_AT_20
+ENVELOPE_CURVE_MAX_TEMP_AT_MINUS_10
+ENVELOPE_CURVE_MAX_TEMP_AT_MINUS_15
+ENVELOPE_CURVE_MAX_TEMP_AT_MINUS_20
+ENVELOPE_CURVE_MAX_TEMP_AT_MINUS_5
+ENVELOPE_CURVE_STOP
+ENVELOPE_CURVE_STOP_FUNCTION_ACTIVE
+ENVELOPE_MAX_OUTDOOR_TEMP
+ENVELOPE_MAX_TEMPERATURE
+ENVELOPE_MIN_OUTDOOR_TEMPERATURE
+ENVELOPE_STOP
+ENVELOPE_STOP_2
+ENVELOPE_STOP_HIGH_OUTDOOR_TEMP
+ENVELOPE_STOP_HOT_GAS_FUNCTION_ACTIVE
+ENVELOPE_STOP_OUTDOOR
+ENVELOPE_STOP_OUTDOOR_FUNCTION_ACTIVE
+ENVELOPE_STOP_TEMPERATURE
+ENVELOPE_STOP_VV
+ENVELOPE_STOP_VV_2
+EVU_1_ACTIVATED_BY_E21_EXT_1
+EVU_1_ACTIVATED_BY_E21_EXT_2
+EVU_1_ACTIVATED_BY_E22_EXT_1
+EVU_1_ACTIVATED_BY_E22_EXT_2
+EVU_1_ACTIVE
+EVU_2_ACTIVATED_BY_E21_EXT_1
+EVU_2_ACTIVATED_BY_E21_EXT_2
+EVU_2_ACTIVATED_BY_E22_EXT_1
+EVU_2_ACTIVATED_BY_E22_EXT_2
+EVU_2_ACTIVE
+EVU_3_ACTIVATED_BY_E21_EXT_1
+EVU_3_ACTIVATED_BY_E21_EXT_2
+EVU_3_ACTIVATED_BY_E22_EXT_1
+EVU_3_ACTIVATED_BY_E22_EXT_2
+EVU_3_ACTIVE
+EXERCISE_DAY
+EXERCISE_IOB6126_BITMASK
+EXERCISE_REQUEST
+EXERCISE_STATE
+EXERCISE_TIME
+EXTERN_HEAT_SOURCE_E71_EXT_INPUT_INV
+EXTERN_HEAT_SOURCE_E72_EXT_INPUT_INV
+FAKE_VARIABLE_BOOL_ONE
+FAKE_VARIABLE_BOOL_ZERO
+FAKE_VARIABLE_CHAR_ONE
+FAKE_VARIABLE_CHAR_ZERO
+FK_PID_D
+FK_PID_I
+FK_PID_P
+FREEZEGARD_COMPRESSOR_FREQUENCY
+FREEZEGUARD
+FREEZEGUARD_DELAY_TIME
+FREEZEGUARD_START_TEMPERATURE
+FREEZEGUARD_STOP_TEMPERATURE
+GRADMIN
+GRADMIN_MAX
+GT10_2_KORRIGERING
+GT10_2_LR_TEMP
+GT10_2_STATUS
+GT10_2_TEMP
+GT10_GT11_MAX_DELTA_DELAY_AFTER_SWITCH_TIME
+GT10_GT11_MAX_DELTA_DELAY_TIME
+GT10_GT11_MAX_DELTA_TEMP
+GT10_KORRIGERING
+GT10_LAG_KOND_TEMP
+GT10_LR_ANTAL_VARNINGAR
+GT10_LR_HYSTERES
+GT10_LR_TEMP
+GT10_STATUS
+GT10_TEMP
+GT11_2_KORRIGERING
+GT11_2_LF_TEMP
+GT11_2_STATUS
+GT11_2_TEMP
+GT11_KORRIGERING
+GT11_LF_ANTAL_VARNINGAR
+GT11_LF_HYSTERES
+GT11_LF_TEMP
+GT11_STATUS
+GT11_TEMP
+GT12_2_KORRIGERING
+GT12_2_STATUS
+GT12_2_TEMP
+GT12_KORRIGERING
+GT12_STATUS
+GT12_TEMP
+GT1_KORRIGERING
+GT1_STATUS
+GT1_TEMP
+GT2_ATTENUATED_TEMP
+GT2_ATTENUATION
+GT2_KORRIGERING
+GT2_STATUS
+GT2_TEMP
+GT2_TEMP_ROUND_OFFED
+GT3_ANSLUTEN
+GT3_KORRIGERING
+GT3_KVITTERAD
+GT3_KVITTERA_MANUELLT
+GT3_STATUS
+GT3_TEMP
+GT41_KORRIGERING_GLOBAL
+GT41_TEMP_GLOBAL
+GT45_ACKNOWLEDGED_GLOBAL
+GT45_ATTENUATED_TEMP_GLOBAL
+GT45_ATTENUATION_GLOBAL
+GT45_KORRIGERING_GLOBAL
+GT45_TEMP_GLOBAL
+GT5_ANSLUTEN
+GT5_ATTENUATED_TEMP
+GT5_ATTENUATION
+GT5_KORRIGERING
+GT5_KVITTERAD
+GT5_STATUS
+GT5_TEMP
+GT5_TEMP_ROUND_OFFED
+GT6_2_HG_TEMP
+GT6_2_KORRIGERING
+GT6_2_STATUS
+GT6_2_TEMP
+GT6_HG_TEMP
+GT6_KORRIGERING
+GT6_STATUS
+GT6_TEMP
+GT7_2_KORRIGERING
+GT7_2_STATUS
+GT7_2_TEMP
+GT7_KORRIGERING
+GT7_STATUS
+GT7_TEMP
+GT81_KORRIGERING
+GT81_KVITTERAD
+GT81_STATUS
+GT81_TEMP
+GT82_KORRIGERING
+GT82_STATUS
+GT82_TEMP
+GT8_2_HF_TEMP
+GT8_2_HIGH_GT9_RESTART_HYSTERESIS
+GT8_2_KORRIGERING
+GT8_2_STATUS
+GT8_2_TEMP
+GT8_GT9_MAX_DELTA_DELAY_AFTER_SWITCH_TIME
+GT8_GT9_MAX_DELTA_DELAY_TIME
+GT8_GT9_MAX_DELTA_TEMP
+GT8_HF_ELK
+GT8_HF_ELK_TEMP
+GT8_HF_TEMP
+GT8_HIGH_GT9_RESTART_HYSTERESIS
+GT8_HIGH_MAX_WARNING_COUNT
+GT8_KORRIGERING
+GT8_STATUS
+GT8_TEMP
+GT9_2_KORRIGERING
+GT9_2_STATUS
+GT9_2_TEMP
+GT9_KORRIGERING
+GT9_STATUS
+GT9_TEMP
+HEATING_1A_DIFF
+HEATING_1A_DIFF_2
+HEATING_1A_DIFF_CONST
+HEATING_1A_DIFF_CONST_2
+HEATING_1A_DIFF_MAX
+HEATING_1A_DIFF_MAX_2
+HEATING_1A_DIFF_MIN
+HEATING_1A_DIFF_MIN_2
+HEATING_ADDITIONAL_SETPOINT
+HEATING_ADDITIONAL_SETPOINT_OFFSET
+HEATING_CABLE_TEMP
+HEATING_CABLE_TIME
+HEATING_CIRCUIT_PID_ISPOINT_GLOBAL
+HEATING_CIRCUIT_PID_SETPOINT_GLOBAL
+HEATING_CURVE_CHECK_SETTING
+HEATING_CURVE_LEFT_Y_GLOBAL
+HEATING_CURVE_LEFT_Y_LOCAL
+HEATING_CURVE_MAX_GLOBAL
+HEATING_CURVE_MAX_LOCAL
+HEATING_CURVE_MIN_GLOBAL
+HEATING_CURVE_MIN_LOCAL
+HEATING_CURVE_MYCKET_PROCENT
+HEATING_CURVE_NORMAL_PROCENT
+HEATING_CURVE_NO_OF_POINTS
+HEATING_CURVE_PARALLEL_OFFSET
+HEATING_CURVE_PARALLEL_OFFSET_GLOBAL
+HEATING_CURVE_RIGHT_X_LOCAL
+HEATING_CURVE_RIGHT_Y_GLOBAL
+HEATING_CURVE_RIGHT_Y_LOCAL
+HEATING_CURVE_VALUE
+HEATING_CURVE_VH_LIMIT
+HEATING_CURVE_Y10_GLOBAL
+HEATING_CURVE_Y10_LOCAL
+HEATING_CURVE_Y11_GLOBAL
+HEATING_CURVE_Y11_LOCAL
+HEATING_CURVE_Y12_GLOBAL
+HEATING_CURVE_Y12_LOCAL
+HEATING_CURVE_Y1_GLOBAL
+HEATING_CURVE_Y1_LOCAL
+HEATING_CURVE_Y2_GLOBAL
+HEATING_CURVE_Y2_LOCAL
+HEATING_CURVE_Y3_GLOBAL
+HEATING_CURVE_Y3_LOCAL
+HEATING_CURVE_Y4_GLOBAL
+HEATING_CURVE_Y4_LOCAL
+HEATING_CURVE_Y5_GLOBAL
+HEATING_CURVE_Y5_LOCAL
+HEATING_CURVE_Y6_GLOBAL
+HEATING_CURVE_Y6_LOCAL
+HEATING_CURVE_Y7_GLOBAL
+HEATING_CURVE_Y7_LOCAL
+HEATING_CURVE_Y8_GLOBAL
+HEATING_CURVE_Y8_LOCAL
+HEATING_CURVE_Y9_GLOBAL
+HEATING_CURVE_Y9_LOCAL
+HEATING_EXTERN_BLOCKED
+HEATING_EXTERN_BLOCK_BY_E21_EXT_1
+HEATING_EXTERN_BLOCK_BY_E21_EXT_2
+HEATING_EXTERN_BLOCK_BY_E22_EXT_1
+HEATING_EXTERN_BLOCK_BY_E22_EXT_2
+HEATING_FIXED_TEMPERATURE
+HEATING_MAX_TIME
+HEATING_REGULATOR_I
+HEATING_REGULATOR_P
+HEATING_REQUEST
+HEATING_REQUEST_2
+HEATING_REQUEST_BLOCK_AFTER_START_TIME
+HEATING_REQUEST_BLOCK_TIME
+HEATING_SEASON_ACTIVE
+HEATING_SEASON_DELAYED_TEMP
+HEATING_SEASON_IMMEDIATE_TEMP
+HEATING_SEASON_MODE
+HEATING_SEASON_START_DELAY_TIME
+HEATING_SEASON_STOP_DELAY_TIME
+HEATING_SETPOINT
+HEATING_START
+HEATING_START_2
+HEATING_STATUS_BLOCK
+HEATING_STOP
+HEATING_STOP_2
+HEATING_SYSTEM_TYPE_GLOBAL
+HEATING_SYSTEM_TYPE_LOCAL
+HEATING_USE_EXTERNAL_SETPOINT
+HOLIDAY_ACTIVE
+HOLIDAY_ACTIVE_GLOBAL
+HOLIDAY_DHW
+HOLIDAY_REQUEST
+HOLIDAY_START_DAY
+HOLIDAY_START_DAY_GLOBAL
+HOLIDAY_START_MONTH
+HOLIDAY_START_MONTH_GLOBAL
+HOLIDAY_START_YEAR
+HOLIDAY_START_YEAR_GLOBAL
+HOLIDAY_STOP_DAY
+HOLIDAY_STOP_DAY_GLOBAL
+HOLIDAY_STOP_MONTH
+HOLIDAY_STOP_MONTH_GLOBAL
+HOLIDAY_STOP_YEAR
+HOLIDAY_STOP_YEAR_GLOBAL
+HOTGAS_HIGHEST_DIFF
+HOTGAS_LOWEST_DIFF
+HP_STOPS_UNTIL_ALARM
+HP_STOPS_UNTIL_ALARM_2
+HP_STOP_MAX_TIME
+HP_STOP_MAX_TIME_2
+HP_STOP_TIME_WINDOW
+HP_STOP_TIME_WINDOW_2
+HUMIDITY_BOARD_0_10V_GLOBAL
+HW_4_WAY_VALVE
+HW_4_WAY_VALVE_2
+HW_ADDITIONAL_ALARM
+HW_ADDITIONAL_DHW
+HW_ADDITIONAL_RELAY_1
+HW_ADDITIONAL_RELAY_2
+HW_ADDITIONAL_RELAY_3
+HW_ADDITIONAL_START
+HW_ADDITIONAL_TRIAC_1
+HW_ADDITIONAL_TRIAC_2
+HW_ADDITIONAL_TRIAC_3
+HW_ADDITIONAL_VALVE_CLOSE
+HW_ADDITIONAL_VALVE_OPEN
+HW_BUZZER
+HW_COMPRESSOR
+HW_COMPRESSOR_2
+HW_COMPRESSOR_CAN_COMMUNICATION
+HW_COMPRESSOR_COMMUNICATION_ERR
+HW_COMPRESSOR_CURRENT
+HW_COMPRESSOR_FREERUN
+HW_COMPRESSOR_NAK
+HW_COMPRESSOR_TARGET_FREQ
+HW_COMPRESSOR_TEMP
+HW_COMPRESSOR_VOLTAGE
+HW_COMPRESSOR_WORKING_FREQ
+HW_CONTACTOR_1
+HW_CONTACTOR_2
+HW_COOLING_FAN
+HW_CRANKCASE_HEATER
+HW_CRANKCASE_HEATER_2
+HW_E11_T11_TEMP
+HW_E21_EXT_1
+HW_E21_EXT_1_INV
+HW_E21_EXT_2
+HW_E21_EXT_2_INV
+HW_E22_EXT_1
+HW_E22_EXT_1_INV
+HW_E22_EXT_2
+HW_E22_EXT_2_INV
+HW_E31_T31_TEMP
+HW_E31_T32_TEMP
+HW_E71_EXT
+HW_E71_T71_TEMP
+HW_E71_T72_TEMP
+HW_E72_EXT
+HW_E72_T71_TEMP
+HW_E72_T72_TEMP
+HW_ELK
+HW_ELK_2
+HW_ELK_3
+HW_ELK_4
+HW_EL_VVB_ALARM
+HW_EXTERNAL_SETPOINT
+HW_EXTERNAL_SETPOINT_2
+HW_FAN_ANALOG
+HW_FAN_ANALOG_2
+HW_FAN_DIGITAL
+HW_FAN_DIGITAL_2
+HW_GT1
+HW_GT10
+HW_GT10_2
+HW_GT10_TEMP
+HW_GT10_TEMP_2
+HW_GT11
+HW_GT11_2
+HW_GT11_TEMP
+HW_GT11_TEMP_2
+HW_GT12
+HW_GT12_2
+HW_GT12_TEMP
+HW_GT12_TEMP_2
+HW_GT1_TEMP
+HW_GT2
+HW_GT2_TEMP
+HW_GT3
+HW_GT3_TEMP
+HW_GT41_GLOBAL
+HW_GT41_TEMP_1
+HW_GT41_TEMP_2
+HW_GT41_TEMP_3
+HW_GT41_TEMP_4
+HW_GT41_TEMP_5
+HW_GT41_TEMP_6
+HW_GT41_TEMP_7
+HW_GT41_TEMP_GLOBAL
+HW_GT45_GLOBAL
+HW_GT45_TEMP_GLOBAL
+HW_GT5
+HW_GT5_TEMP
+HW_GT6
+HW_GT6_2
+HW_GT6_TEMP
+HW_GT6_TEMP_2
+HW_GT7
+HW_GT7_2
+HW_GT7_TEMP
+HW_GT7_TEMP_2
+HW_GT8
+HW_GT81
+HW_GT81_TEMP
+HW_GT82
+HW_GT82_TEMP
+HW_GT8_2
+HW_GT8_TEMP
+HW_GT8_TEMP_2
+HW_GT9
+HW_GT9_2
+HW_GT9_TEMP
+HW_GT9_TEMP_2
+HW_HEATING_CABLE
+HW_HEATING_CABLE_2
+HW_HP
+HW_HP_2
+HW_HUMIDITY
+HW_HUMIDITY_2
+HW_HUMIDITY_3
+HW_IOB91119_AI_1
+HW_IOB91119_AI_5
+HW_IOB91119_DO10
+HW_IOB91119_DO12
+HW_IOB91119_DO8
+HW_IOB_B_DO5
+HW_LP
+HW_LP_2
+HW_MB1
+HW_MB1_2
+HW_MB2
+HW_MB2_2
+HW_MV_E12_EXT_1
+HW_MV_E12_PUMP_G1_DIGITAL
+HW_MV_E12_T1
+HW_MV_E12_VALVE_CLOSE
+HW_MV_E12_VALVE_OPEN
+HW_PGU_L1
+HW_PGU_L2
+HW_PGU_L3
+HW_PHASE_DETECTOR
+HW_PHASE_DETECTOR_2
+HW_POOL_EXT_1
+HW_POOL_VALVE
+HW_POOL_VALVE_CLOSE
+HW_POOL_VALVE_OPEN
+HW_PROTECTIVE_ANODE
+HW_PUMP_DHW_DIGITAL
+HW_PUMP_E71_G71_DIGITAL
+HW_PUMP_E72_G71_DIGITAL
+HW_PUMP_G1_DIGITAL
+HW_PUMP_G2_ANALOG
+HW_PUMP_G2_ANALOG_2
+HW_PUMP_G2_DIGITAL
+HW_PUMP_G2_DIGITAL_2
+HW_PUMP_G3_ANALOG
+HW_PUMP_G3_DIGITAL
+HW_PUMP_G3_DIGITAL_2
+HW_ROOM_BUZZER_INTERVALL
+HW_ROOM_BUZZER_MODE
+HW_ROOM_BUZZER_OFF_TIME
+HW_ROOM_BUZZER_ON_TIME
+HW_ROOM_GT5
+HW_ROOM_GT5_GLOBAL
+HW_ROOM_LED_MODE
+HW_ROOM_POT
+HW_ROOM_POT_GLOBAL
+HW_ROOM_TEMP
+HW_ROOM_TEMP_GLOBAL
+HW_SUMMARY_ALARM
+HW_SYSTEM_ON
+HW_VXV
+HW_VXV_2
+ICONS_IOB6126_EXTERN_BITMASK
+INIT_MV_STATUS_DONE
+IOB6126_BOOT_COUNT
+IOB6126_EXTERN_HEAT_CONNECTED
+IOB6126_EXTERN_HEAT_CONNECTED_2
+IOB6126_EXTERN_HEAT_CONNECTED_3
+IOB6126_EXTERN_HEAT_CONNECTED_4
+IOB6126_EXTERN_HEAT_CONNECTED_5
+IOB6126_EXTERN_HEAT_CONNECTED_6
+IOB6126_EXTERN_HEAT_CONNECTED_7
+IOB6126_EXTERN_HEAT_VERSION
+IOB6126_EXTERN_HEAT_VERSION_2
+IOB6126_EXTERN_HEAT_VERSION_3
+IOB6126_EXTERN_HEAT_VERSION_4
+IOB6126_EXTERN_HEAT_VERSION_5
+IOB6126_EXTERN_HEAT_VERSION_6
+IOB6126_EXTERN_HEAT_VERSION_7
+IOB6126_EXTERN_HEAT_VERSION_GLOBAL
+IOB6126_MAIN_COOLING_CONNECTED
+IOB6126_MAIN_COOLING_VERSION
+IOB6126_POOL_CONNECTED
+IOB6126_POOL_VERSION
+IOB6126_SOLAR_CONNECTED
+IOB6126_SOLAR_VERSION
+IOB6126_SUB_COOLING_CONNECTED
+IOB6126_SUB_COOLING_VERSION
+IOB6126_WOOD_HEATING_CONNECTED
+IOB6126_WOOD_HEATING_CONNECTED_2
+IOB6126_WOOD_HEATING_VERSION
+IOB6126_WOOD_HEATING_VERSION_2
+IOB91119_AW_COMP_CONNECTED
+IOB91119_AW_COMP_CONNECTED_2
+IOB91119_AW_COMP_VERSION
+IOB91119_AW_COMP_VERSION_2
+IOB91119_AW_HEAT_CONNECTED
+IOB91119_AW_HEAT_CONNECTED_2
+IOB91119_AW_HEAT_VERSION
+IOB91119_AW_LIGHT_HEAT_CONNECTED
+IOB91119_AW_LIGHT_HEAT_CONNECTED_2
+IOB91119_AW_LIGHT_HEAT_VERSION
+IOB91119_AW_LIGHT_HEAT_VERSION_2
+IOB91119_BOOT_COUNT
+IOB91119_CONNECTED_BITMASK
+IOB91119_DO8_G6_OR_SUMMARY_ALARM
+IOB91119_LW_CONNECTED
+IOB91119_LW_CONNECTED_2
+IOB91119_LW_DACH_LIGHT_CONNECTED
+IOB91119_LW_DACH_LIGHT_CONNECTED_2
+IOB91119_LW_DACH_LIGHT_HA_CONNECTED
+IOB91119_LW_DACH_LIGHT_HA_CONNECTED_2
+IOB91119_LW_DACH_LIGHT_HA_VERSION
+IOB91119_LW_DACH_LIGHT_HA_VERSION_2
+IOB91119_LW_DACH_LIGHT_VERSION
+IOB91119_LW_DACH_LIGHT_VERSION_2
+IOB91119_LW_LIGHT_CONNECTED
+IOB91119_LW_LIGHT_CONNECTED_2
+IOB91119_LW_LIGHT_VERSION
+IOB91119_LW_LIGHT_VERSION_2
+IOB91119_LW_VERSION
+IOB91119_LW_VERSION_2
+IOB91119_REBOOT
+IOBX10_CONNECTED
+IOBX10_VERSION
+IOB_B_AW_LIGHT_COMP_CONNECTED
+IOB_B_AW_LIGHT_COMP_VERSION
+IOB_B_EXTERN_HEAT_GENERATION
+IOB_B_EXTERN_HEAT_GENERATION_2
+IOB_B_EXTERN_HEAT_GENERATION_3
+IOB_B_EXTERN_HEAT_GENERATION_4
+IOB_B_EXTERN_HEAT_GENERATION_5
+IOB_B_EXTERN_HEAT_GENERATION_6
+IOB_B_EXTERN_HEAT_GENERATION_7
+IOB_B_EXTERN_HEAT_REVISION
+IOB_B_EXTERN_HEAT_REVISION_2
+IOB_B_EXTERN_HEAT_REVISION_3
+IOB_B_EXTERN_HEAT_REVISION_4
+IOB_B_EXTERN_HEAT_REVISION_5
+IOB_B_EXTERN_HEAT_REVISION_6
+IOB_B_EXTERN_HEAT_REVISION_7
+IOB_B_EXTERN_HEAT_VERSION
+IOB_B_EXTERN_HEAT_VERSION_2
+IOB_B_EXTERN_HEAT_VERSION_3
+IOB_B_EXTERN_HEAT_VERSION_4
+IOB_B_EXTERN_HEAT_VERSION_5
+IOB_B_EXTERN_HEAT_VERSION_6
+IOB_B_EXTERN_HEAT_VERSION_7
+IOB_B_HUMIDITY_2_CONNECTED
+IOB_B_HUMIDITY_3_CONNECTED
+IOB_B_HUMIDITY_CONNECTED
+IOB_B_HUMIDITY_CONNECTED_BITMASK
+IOB_B_HUMIDITY_GENERATION
+IOB_B_HUMIDITY_GENERATION_2
+IOB_B_HUMIDITY_GENERATION_3
+IOB_B_HUMIDITY_REVISION
+IOB_B_HUMIDITY_REVISION_2
+IOB_B_HUMIDITY_REVISION_3
+IOB_B_HUMIDITY_VERSION
+IOB_B_HUMIDITY_VERSION_2
+IOB_B_HUMIDITY_VERSION_3
+IOB_B_OIL_CONNECTED
+IOB_B_OIL_GENERATION
+IOB_B_OIL_REVISION
+IOB_B_OIL_VERSION
+IOB_B_POOL_GENERATION
+IOB_B_POOL_REVISION
+IOB_B_POOL_VERSION
+LANGUAGE
+LANGUAGE_ISO639_1
+LP_2_ALARM_DELAY
+LP_ALARM_DELAY
+LP_STOPS_UNTIL_ALARM
+LP_STOPS_UNTIL_ALARM_2
+LP_STOP_MAX_TIME
+LP_STOP_MAX_TIME_2
+LP_STOP_TIME_WINDOW
+LP_STOP_TIME_WINDOW_2
+MAN_OP
+MAN_OP_MIXING_VALVE_CLOSE_GLOBAL
+MAN_OP_MIXING_VALVE_D_VALVE_GLOBAL
+MAN_OP_MIXING_VALVE_G2_GLOBAL
+MAN_OP_MIXING_VALVE_G4_GLOBAL
+MAN_OP_MIXING_VALVE_OPEN_GLOBAL
+MAN_OP_MIXING_VALVE_SIGNAL_GLOBAL
+MAN_OP_TILLSKOTT
+MAN_OP_TIME
+MIXED_CIRCUITS_CONNECTED_BITMASK
+MIXED_CIRCUITS_SETPOINT_INIT_DONE_BITMASK
+MIXED_CIRCUITS_VALVEMODE_INIT_DONE_BITMASK
+MIXING_VALVE_CLOSE_TIME_GLOBAL
+MIXING_VALVE_DEFROST_DELAY_TIME_GLOBAL
+MIXING_VALVE_EXT_INPUT_1
+MIXING_VALVE_EXT_INPUT_2
+MIXING_VALVE_EXT_INPUT_3
+MIXING_VALVE_EXT_INPUT_4
+MIXING_VALVE_EXT_INPUT_5
+MIXING_VALVE_EXT_INPUT_6
+MIXING_VALVE_EXT_INPUT_7
+MIXING_VALVE_EXT_INPUT_GLOBAL
+MIXING_VALVE_EXT_INPUT_PRI_COOLING
+MIXING_VALVE_EXT_INPUT_SEC_COOLING
+MIXING_VALVE_MAX_LIMIT_HEATING_SYSTEM
+MIXING_VALVE_MODE_1
+MIXING_VALVE_MODE_2
+MIXING_VALVE_MODE_3
+MIXING_VALVE_MODE_4
+MIXING_VALVE_MODE_5
+MIXING_VALVE_MODE_6
+MIXING_VALVE_MODE_7
+MIXING_VALVE_MODE_GLOBAL
+MIXING_VALVE_NEUTRALZONE_GLOBAL
+MIXING_VALVE_NEUTRALZONE_LIMITATION_GLOBAL
+MIXING_VALVE_NEUTRALZONE_LIMITATION_TIME_GLOBAL
+MIXING_VALVE_NZ_CLOSE_1
+MIXING_VALVE_NZ_CLOSE_2
+MIXING_VALVE_NZ_CLOSE_3
+MIXING_VALVE_NZ_CLOSE_4
+MIXING_VALVE_NZ_CLOSE_5
+MIXING_VALVE_NZ_CLOSE_6
+MIXING_VALVE_NZ_CLOSE_7
+MIXING_VALVE_NZ_OPEN_1
+MIXING_VALVE_NZ_OPEN_2
+MIXING_VALVE_NZ_OPEN_3
+MIXING_VALVE_NZ_OPEN_4
+MIXING_VALVE_NZ_OPEN_5
+MIXING_VALVE_NZ_OPEN_6
+MIXING_VALVE_NZ_OPEN_7
+MIXING_VALVE_OPEN_TIME_GLOBAL
+MIXING_VALVE_PID_D
+MIXING_VALVE_PID_I
+MIXING_VALVE_PID_MAX
+MIXING_VALVE_PID_MIN
+MIXING_VALVE_PID_P
+MIXING_VALVE_PUMP_G41_1
+MIXING_VALVE_PUMP_G41_2
+MIXING_VALVE_PUMP_G41_3
+MIXING_VALVE_PUMP_G41_4
+MIXING_VALVE_PUMP_G41_5
+MIXING_VALVE_PUMP_G41_6
+MIXING_VALVE_PUMP_G41_7
+MIXING_VALVE_PUMP_G41_GLOBAL
+MIXING_VALVE_PUMP_G71
+MIXING_VALVE_RUNNING_TIME_GLOBAL
+MIXING_VALVE_START_LIMIT_HEATING_SYSTEM
+MIXING_VALVE_TIMECONTROLLED_GLOBAL
+MIXING_VALVE_USE_NEUTRALZONE_REGULATOR
+MIXING_VALVE_VALVECLOSE_1
+MIXING_VALVE_VALVECLOSE_2
+MIXING_VALVE_VALVECLOSE_3
+MIXING_VALVE_VALVECLOSE_4
+MIXING_VALVE_VALVECLOSE_5
+MIXING_VALVE_VALVECLOSE_6
+MIXING_VALVE_VALVECLOSE_7
+MIXING_VALVE_VALVECLOSE_GLOBAL
+MIXING_VALVE_VALVEOPEN_1
+MIXING_VALVE_VALVEOPEN_2
+MIXING_VALVE_VALVEOPEN_3
+MIXING_VALVE_VALVEOPEN_4
+MIXING_VALVE_VALVEOPEN_5
+MIXING_VALVE_VALVEOPEN_6
+MIXING_VALVE_VALVEOPEN_7
+MIXING_VALVE_VALVEOPEN_GLOBAL
+MV_CONDENSATIONGUARD_ACTIVE_BITMASK
+MV_CONDENSATIONGUARD_ACTIVE_GLOBAL
+MV_CONDENSATIONGUARD_ALERT_ACTIVE_BITMASK
+MV_COOLING_10V_RELATIVE_HUMIDITY_1
+MV_COOLING_10V_RELATIVE_HUMIDITY_2
+MV_COOLING_10V_RELATIVE_HUMIDITY_3
+MV_COOLING_10V_RELATIVE_HUMIDITY_4
+MV_COOLING_10V_RELATIVE_HUMIDITY_5
+MV_COOLING_10V_RELATIVE_HUMIDITY_6
+MV_COOLING_10V_RELATIVE_HUMIDITY_7
+MV_COOLING_10V_RELATIVE_HUMIDITY_GLOBAL
+MV_COOLING_10V_RELATIVE_HUMIDITY_PRI_COOLING
+MV_COOLING_10V_RELATIVE_HUMIDITY_SEC_COOLING
+MV_COOLING_ACTIVE
+MV_COOLING_DELAY_HEATING_GLOBAL
+MV_COOLING_DEWPOINT_SENSOR_1
+MV_COOLING_DEWPOINT_SENSOR_2
+MV_COOLING_DEWPOINT_SENSOR_3
+MV_COOLING_DEWPOINT_SENSOR_4
+MV_COOLING_DEWPOINT_SENSOR_5
+MV_COOLING_DEWPOINT_SENSOR_6
+MV_COOLING_DEWPOINT_SENSOR_7
+MV_COOLING_DEWPOINT_SENSOR_GLOBAL
+MV_COOLING_DEWPOINT_SENSOR_PRI_COOLING
+MV_COOLING_DEWPOINT_SENSOR_SEC_COOLING
+MV_COOLING_DEW_POINT_SENSOR_SETPOINT_MIN_GLOBAL
+MV_COOLING_E31_G2
+MV_COOLING_FLOWSENSOR_TYPE_GLOBAL
+MV_COOLING_FREEZEGUARD_ACTIVE_GLOBAL
+MV_COOLING_FREEZEGUARD_START
+MV_COOLING_GT45_INFLUENCE_GLOBAL
+MV_COOLING_INCREASE_ROOM_SETPOINT_GLOBAL
+MV_COOLING_MAIN_FLOWSENSOR_TYPE
+MV_COOLING_OUTDOOR_TEMPERATURE_LIMIT_GLOBAL
+MV_COOLING_ROOMSENSOR_TYPE_GLOBAL
+MV_COOLING_SETPOINT_MIN_GLOBAL
+MV_COOLING_SUB_FLOWSENSOR_TYPE
+MV_COOLING_T5_10V_1
+MV_COOLING_T5_10V_2
+MV_COOLING_T5_10V_3
+MV_COOLING_T5_10V_4
+MV_COOLING_T5_10V_5
+MV_COOLING_T5_10V_6
+MV_COOLING_T5_10V_7
+MV_COOLING_T5_10V_GLOBAL
+MV_COOLING_T5_10V_PRI_COOLING
+MV_COOLING_T5_10V_SEC_COOLING
+MV_COOLING_UNDER_SWING_ZONE_GLOBAL
+MV_COOLING_WHEN_HEATING_SEASONG_GLOBAL
+MV_DEW_POINT_SENSOR_ACTIVATED_GLOBAL
+MV_DEW_POINT_SENSOR_ALARM_BITMASK
+MV_DEW_POINT_SENSOR_ALARM_GLOBAL
+MV_DISABLE_COOLING_GLOBAL
+MV_DOWNLOADING_VARIABLES
+MV_DOWNLOADING_VARIABLES_FOR_MIXING_VALVE
+MV_E11_T11_SETPOINT
+MV_E12_CAN_ROOM_SENOR_CONNECTED
+MV_E12_CAN_ROOM_SENSOR_GT45
+MV_E12_DISPLAY_ROOM_SENSOR_ACKNOW
+MV_E12_E1x_T1_ALARM
+MV_E12_EEPROM_ATTENUATION_FACTOR
+MV_E12_EEPROM_CHECK_DISPLAY_SYSTEM_ON
+MV_E12_EEPROM_COUPLINGDIFFERENS_ROOM
+MV_E12_EEPROM_D_VALUE
+MV_E12_EEPROM_ENABLE_HEATING_BLOCK_BY_EXT
+MV_E12_EEPROM_ENABLE_HIGH_PROTECTION_HS_BY_EXT
+MV_E12_EEPROM_ERASE_EEPROM_NEXT_STARTUP
+MV_E12_EEPROM_EXTERNAL_TEMP_VALUE
+MV_E12_EEPROM_FREEZEGARD_START_DELAY_TIME
+MV_E12_EEPROM_FREEZEGARD_START_TEMPERATURE
+MV_E12_EEPROM_FREEZEGARD_STOP_TEMPERATURE
+MV_E12_EEPROM_HEATING_COOLING_MODE
+MV_E12_EEPROM_HEATING_CURVE_LEFT_Y
+MV_E12_EEPROM_HEATING_CURVE_PARALLEL_OFFSET
+MV_E12_EEPROM_HEATING_CURVE_RIGHT_Y
+MV_E12_EEPROM_HEATING_CURVE_Y1
+MV_E12_EEPROM_HEATING_CURVE_Y10
+MV_E12_EEPROM_HEATING_CURVE_Y11
+MV_E12_EEPROM_HEATING_CURVE_Y12
+MV_E12_EEPROM_HEATING_CURVE_Y2
+MV_E12_EEPROM_HEATING_CURVE_Y3
+MV_E12_EEPROM_HEATING_CURVE_Y4
+MV_E12_EEPROM_HEATING_CURVE_Y5
+MV_E12_EEPROM_HEATING_CURVE_Y6
+MV_E12_EEPROM_HEATING_CURVE_Y7
+MV_E12_EEPROM_HEATING_CURVE_Y8
+MV_E12_EEPROM_HEATING_CURVE_Y9
+MV_E12_EEPROM_HEATING_SEASON_DELAYED_TEMP
+MV_E12_EEPROM_HEATING_SEASON_IMMEDIATE_TEMP
+MV_E12_EEPROM_HEATING_SEASON_MODE
+MV_E12_EEPROM_HEATING_SEASON_START_DELAY_TIME
+MV_E12_EEPROM_HEATING_SEASON_STOP_DELAY_TIME
+MV_E12_EEPROM_HEATING_SYSTEM_TYPE
+MV_E12_EEPROM_HOLIDAY_ACTIVE
+MV_E12_EEPROM_HOLIDAY_LEVEL_TEMPERATURE
+MV_E12_EEPROM_HOLIDAY_START_DAY
+MV_E12_EEPROM_HOLIDAY_START_MONTH
+MV_E12_EEPROM_HOLIDAY_START_YEAR
+MV_E12_EEPROM_HOLIDAY_STOP_DAY
+MV_E12_EEPROM_HOLIDAY_STOP_MONTH
+MV_E12_EEPROM_HOLIDAY_STOP_YEAR
+MV_E12_EEPROM_INCREASE_ROOM_SETPOINT
+MV_E12_EEPROM_INVERT_AI1
+MV_E12_EEPROM_INVERT_AI2
+MV_E12_EEPROM_INVERT_AI5
+MV_E12_EEPROM_INVERT_EXT_INPUT
+MV_E12_EEPROM_I_VALUE
+MV_E12_EEPROM_MAX_AI1
+MV_E12_EEPROM_MAX_TEMPERAURE_GT41
+MV_E12_EEPROM_MIN_AI1
+MV_E12_EEPROM_MIN_TEMPERAURE_GT41
+MV_E12_EEPROM_M_VALVE_DEFROST_DELAY
+MV_E12_EEPROM_M_VALVE_LIMIT_TIME
+MV_E12_EEPROM_M_VALVE_RUNNING_TIME
+MV_E12_EEPROM_NEUTRALZONE_CONTROLLED
+MV_E12_EEPROM_NEUTRALZON_M_VALVE_LIMIT
+MV_E12_EEPROM_NEUTRALZON_M_VALVE_LIMIT_TIME
+MV_E12_EEPROM_NEUTRALZON_RAMP_DOWN_TIME
+MV_E12_EEPROM_NEUTRALZON_RAMP_UP_TIME
+MV_E12_EEPROM_NEUTRALZON_SIZE
+MV_E12_EEPROM_NEUTRALZON_TEMP_DECREASE_M_VALVE
+MV_E12_EEPROM_NEUTRALZON_TEMP_NO_INCREASE_M_VALVE
+MV_E12_EEPROM_PARTY_MODE_ENABLE
+MV_E12_EEPROM_PID_AIRSYSTEM_ACTIVE
+MV_E12_EEPROM_PID_MAX_VALUE
+MV_E12_EEPROM_PID_MIN_VALUE
+MV_E12_EEPROM_P_VALUE
+MV_E12_EEPROM_ROOMSENSOR_INFLUENCE_FACTOR
+MV_E12_EEPROM_ROOM_PROGRAM_MODE
+MV_E12_EEPROM_ROOM_SENSOR_ACTIVE
+MV_E12_EEPROM_T1_KORRIGERING
+MV_E12_EEPROM_T5_KORRIGERING
+MV_E12_EEPROM_T5_SETPOINT
+MV_E12_EEPROM_TEMP_TIMECONTROLLED
+MV_E12_EEPROM_TIME_PROGRAM
+MV_E12_EEPROM_TIME_PROGRAM_5FRI
+MV_E12_EEPROM_TIME_PROGRAM_5FRI_2
+MV_E12_EEPROM_TIME_PROGRAM_1MON
+MV_E12_EEPROM_TIME_PROGRAM_1MON_2
+MV_E12_EEPROM_TIME_PROGRAM_6SAT
+MV_E12_EEPROM_TIME_PROGRAM_6SAT_2
+MV_E12_EEPROM_TIME_PROGRAM_7SUN
+MV_E12_EEPROM_TIME_PROGRAM_7SUN_2
+MV_E12_EEPROM_TIME_PROGRAM_4THU
+MV_E12_EEPROM_TIME_PROGRAM_4THU_2
+MV_E12_EEPROM_TIME_PROGRAM_2TUE
+MV_E12_EEPROM_TIME_PROGRAM_2TUE_2
+MV_E12_EEPROM_TIME_PROGRAM_3WED
+MV_E12_EEPROM_TIME_PROGRAM_3WED_2
+MV_E12_EEPROM_UI_BRAND
+MV_E12_EEPROM_VALVE_AO_0_10V_ACTIVE
+MV_E12_EXT_FUNCTION_TRIGGED
+MV_E12_FREEZEGUARD_ACTIVE
+MV_E12_GT41_TEMP_SETPOINT
+MV_E12_GT5_DAMPING_FACTOR
+MV_E12_HEATING_CURVE_NUMBER_OF_POINTS
+MV_E12_HEATING_SEASON_ACTIVE
+MV_E12_HIGHTEMP_HEATINGSYSTEM_ACTIVE
+MV_E12_INTERNAL_HOLIDAY_ACTIVE
+MV_E12_INTERNAL_TIMECONTROLLED_ACTIVE
+MV_E12_MAN_OP_G1
+MV_E12_MAN_OP_VALVE_CLOSE
+MV_E12_MAN_OP_VALVE_OPEN
+MV_E12_PID_ISPOINT
+MV_E12_PID_SETPOINT
+MV_E12_ROOMSENSOR_INFLUENCE
+MV_E12_ROOM_SENSOR_ACKNOW
+MV_E12_ROOM_SETPOINT_TEMP_ACTIVE
+MV_E12_T1_ALARM
+MV_E12_T1_TEMP
+MV_E12_T5_ATTENUATIONED_TEMP
+MV_E12_T5_TEMP
+MV_E12_T5_TEMP_ACTIVE
+MV_E12_T5_TEMP_ACTIVE_TO_DISPLAY
+MV_E12_TIME_PROGRAM_FRI
+MV_E12_TIME_PROGRAM_MON
+MV_E12_TIME_PROGRAM_SAT
+MV_E12_TIME_PROGRAM_SUN
+MV_E12_TIME_PROGRAM_THU
+MV_E12_TIME_PROGRAM_TUE
+MV_E12_TIME_PROGRAM_WED
+MV_E12_VALVE_PID_ISPOINT
+MV_E12_VALVE_PID_SETPOINT
+MV_E31_Q2_PRI_COOLING
+MV_E31_Q2_SEC_COOLING
+MV_E31_T2_SENSOR_ALARM_GLOBAL
+MV_E31_T31_SETPOINT
+MV_E31_T32_ACKNOWLEDGED
+MV_ENABLE_CONDENSATIONGUARD_BY_EXT_GLOBAL
+MV_ENABLE_COOLING_BLOCK_BY_EXT_GLOBAL
+MV_ENABLE_HEATING_BLOCK_BY_EXT_GLOBAL
+MV_ENABLE_HIGH_PROTECTION_HS_BY_EXT_GLOBAL
+MV_EX1_Q2_GLOBAL
+MV_Ex_T1_ALARM_BITMASK
+MV_Ex_T1_ALARM_GLOBAL
+MV_FREEZEGUARD_ACTIVE_BITMASK
+MV_FREEZEGUARD_ACTIVE_GLOBAL
+MV_HIGHTEMP_HS_ACTIVE_BITMASK
+MV_HIGHTEMP_HS_ACTIVE_GLOBAL
+MV_HIGHTEMP_HS_ALERT_ACTIVE_BITMASK
+MV_HOLIDAY_ACTIVE_BITMASK
+MV_HOLIDAY_ACTIVE_GLOBAL
+MV_ICONS_TIMEPROGRAM_ACTIVE_BITMASK
+MV_ICONS_TIMEPROGRAM_ACTIVE_GLOBAL
+MV_INVERT_EXT_INPUT_GLOBAL
+MV_PID_ACTUAL_1
+MV_PID_ACTUAL_2
+MV_PID_ACTUAL_3
+MV_PID_ACTUAL_4
+MV_PID_ACTUAL_5
+MV_PID_ACTUAL_6
+MV_PID_ACTUAL_7
+MV_PID_ACTUAL_GLOBAL
+MV_PID_ACTUAL_PRI_COOLING
+MV_PID_ACTUAL_SEC_COOLING
+MV_PID_SETPOINT_1
+MV_PID_SETPOINT_2
+MV_PID_SETPOINT_3
+MV_PID_SETPOINT_4
+MV_PID_SETPOINT_5
+MV_PID_SETPOINT_6
+MV_PID_SETPOINT_7
+MV_PID_SETPOINT_GLOBAL
+MV_PID_SETPOINT_PRI_COOLING
+MV_PID_SETPOINT_SEC_COOLING
+MV_ROOMSENSOR_KNOB_ALARM_BITMASK
+MV_ROOMSENSOR_KNOB_ALARM_GLOBAL
+MV_T1_SETPOINT_1
+MV_T1_SETPOINT_2
+MV_T1_SETPOINT_3
+MV_T1_SETPOINT_4
+MV_T1_SETPOINT_5
+MV_T1_SETPOINT_6
+MV_T1_SETPOINT_7
+MV_T1_SETPOINT_GLOBAL
+MV_T1_SETPOINT_PRI_COOLING
+MV_T1_SETPOINT_SEC_COOLING
+MV_T5_ACKNOWLEDGED_BITMASK
+MV_T5_ACTUAL_1
+MV_T5_ACTUAL_1_ROUND_OFFED
+MV_T5_ACTUAL_2
+MV_T5_ACTUAL_2_ROUND_OFFED
+MV_T5_ACTUAL_3
+MV_T5_ACTUAL_3_ROUND_OFFED
+MV_T5_ACTUAL_4
+MV_T5_ACTUAL_4_ROUND_OFFED
+MV_T5_ACTUAL_5
+MV_T5_ACTUAL_5_ROUND_OFFED
+MV_T5_ACTUAL_6
+MV_T5_ACTUAL_6_ROUND_OFFED
+MV_T5_ACTUAL_7
+MV_T5_ACTUAL_7_ROUND_OFFED
+MV_T5_ACTUAL_GLOBAL
+MV_T5_ACTUAL_PRI_COOLING
+MV_T5_ACTUAL_SEC_COOLING
+MV_T5_ATTENUATED_1
+MV_T5_ATTENUATED_2
+MV_T5_ATTENUATED_3
+MV_T5_ATTENUATED_4
+MV_T5_ATTENUATED_5
+MV_T5_ATTENUATED_6
+MV_T5_ATTENUATED_7
+MV_T5_ATTENUATED_PRI_COOLING
+MV_T5_ATTENUATED_SEC_COOLING
+MV_T5_CONNECTED_BITMASK
+MV_T5_SETPOINT_1
+MV_T5_SETPOINT_2
+MV_T5_SETPOINT_3
+MV_T5_SETPOINT_4
+MV_T5_SETPOINT_5
+MV_T5_SETPOINT_6
+MV_T5_SETPOINT_7
+MV_T5_SETPOINT_ACTUAL_1
+MV_T5_SETPOINT_ACTUAL_2
+MV_T5_SETPOINT_ACTUAL_3
+MV_T5_SETPOINT_ACTUAL_4
+MV_T5_SETPOINT_ACTUAL_5
+MV_T5_SETPOINT_ACTUAL_6
+MV_T5_SETPOINT_ACTUAL_7
+MV_T5_SETPOINT_ACTUAL_GLOBAL
+MV_T5_SETPOINT_ACTUAL_PRI_COOLING
+MV_T5_SETPOINT_ACTUAL_SEC_COOLING
+MV_T5_SETPOINT_PRI_COOLING
+MV_T5_SETPOINT_SEC_COOLING
+MV_TIMER_HEATING_COOLING_DELAY_1
+MV_TIMER_HEATING_COOLING_DELAY_2
+MV_TIMER_HEATING_COOLING_DELAY_3
+MV_TIMER_HEATING_COOLING_DELAY_4
+MV_TIMER_HEATING_COOLING_DELAY_5
+MV_TIMER_HEATING_COOLING_DELAY_6
+MV_TIMER_HEATING_COOLING_DELAY_7
+MV_TIMER_HEATING_COOLING_DELAY_GLOBAL
+MV_TIMER_HEATING_COOLING_DELAY_PRI_COOLING
+MV_TIMER_HEATING_COOLING_DELAY_SEC_COOLING
+PARTY_MODE_CIRCUIT_1
+PARTY_MODE_CIRCUIT_2
+PARTY_MODE_CIRCUIT_3
+PARTY_MODE_CIRCUIT_4
+PARTY_MODE_CIRCUIT_5
+PARTY_MODE_CIRCUIT_6
+PARTY_MODE_CIRCUIT_7
+PARTY_MODE_CIRCUIT_8
+PARTY_MODE_CIRCUIT_GLOBAL
+PARTY_MODE_TIME
+PGU_ACTIVATED
+PGU_CONNECTED
+PGU_CORRECTION_L1_A
+PGU_CORRECTION_L2_A
+PGU_CORRECTION_L3_A
+PGU_CURRENT_MARGIN
+PGU_L1_A
+PGU_L2_A
+PGU_L3_A
+PGU_MAIN_FUSE
+PGU_RECONNECTION_TIME
+PGU_SUPPLY_VOLTAGE
+PGU_TRIGGERED
+PGU_TRIGGERED_PHASE1
+PGU_TRIGGERED_PHASE2
+PGU_TRIGGERED_PHASE3
+PGU_TRIGGERED_TIME
+PGU_VERSION
+PHASE_DETECTOR_ACKNOWLEDGED
+PHASE_DETECTOR_ACKNOWLEDGED_2
+POOL_ACTIVE
+POOL_BLOCKED_BY_EXT
+POOL_DIFF_CONST
+POOL_DIFF_CONST_2
+POOL_DIFF_MAX
+POOL_DIFF_MAX_2
+POOL_DIFF_MIN
+POOL_DIFF_MIN_2
+POOL_EXTERN_BLOCKED
+POOL_EXT_INPUT_INV
+POOL_PID_D
+POOL_PID_I
+POOL_PID_MAX
+POOL_PID_MIN
+POOL_PID_P
+POOL_REQUEST
+POOL_REQUEST_2
+POOL_SETPOINT_TEMP
+POOL_START_DELAY_TIME
+POOL_START_TEMP
+POOL_STOP_TEMP
+POOL_USE_COMPRESSOR_1
+POOL_USE_COMPRESSOR_2
+POOL_VALVE_DELAY_AFTER_DEFROST
+POOL_VALVE_POSITION
+POOL_VALVE_RUNNING_TIME
+POPUP_WINDOW_DELAY
+PROGRAM_GENERATION
+PROGRAM_REVISION
+PROGRAM_VERSION
+PUMP_DHW_ACTIVE
+PUMP_DHW_PROGRAM1_START_TIME
+PUMP_DHW_PROGRAM1_STOP_TIME
+PUMP_DHW_PROGRAM2_START_TIME
+PUMP_DHW_PROGRAM2_STOP_TIME
+PUMP_DHW_PROGRAM3_START_TIME
+PUMP_DHW_PROGRAM3_STOP_TIME
+PUMP_DHW_PROGRAM4_START_TIME
+PUMP_DHW_PROGRAM4_STOP_TIME
+PUMP_E71_G71_BLOCKED_BY_EXT
+PUMP_E71_G71_START_DIFF
+PUMP_E71_G71_START_MODE
+PUMP_E71_G71_START_TEMP
+PUMP_E72_G71_BLOCKED_BY_EXT
+PUMP_E72_G71_START_DIFF
+PUMP_E72_G71_START_MODE
+PUMP_E72_G71_START_TEMP
+PUMP_G1_CONTINUAL
+PUMP_G2_CONTINUAL
+PUMP_G2_LOW_TEMPERATURE
+PUMP_G2_MAX_TEMPERATURE
+PUMP_G3_ACTIVE_IN_COOLING
+PUMP_G3_CONTINUAL
+PUMP_G3_EXTERN_ACTIVATED_BY_E21_EXT_1
+PUMP_G3_EXTERN_ACTIVATED_BY_E21_EXT_2
+PUMP_G3_EXTERN_ACTIVATED_BY_E22_EXT_1
+PUMP_G3_EXTERN_ACTIVATED_BY_E22_EXT_2
+PUMP_G3_EXTERN_ACTIVE
+PUMP_G3_LOW_PRESSURE_HEAT_CARRIER_ACTIVATED_BY_E21_EXT_1
+PUMP_G3_LOW_PRESSURE_HEAT_CARRIER_ACTIVATED_BY_E21_EXT_2
+PUMP_G3_LOW_PRESSURE_HEAT_CARRIER_ACTIVATED_BY_E22_EXT_1
+PUMP_G3_LOW_PRESSURE_HEAT_CARRIER_ACTIVATED_BY_E22_EXT_2
+PUMP_G3_LOW_PRESSURE_HEAT_CARRIER_ACTIVE
+PUMP_G3_MAX_HASTIGHET
+PUMP_G3_MAX_SPEED_AT_COMPRESSOR_FREQUENCY
+PUMP_G3_MIN_HASTIGHET
+PUMP_G3_MIN_SPEED_AT_COMPRESSOR_FREQUENCY
+REMOTE_GET_DISPLAY
+RESET_LARMHISTORY
+RESET_LARMINFO
+RESET_LARMLOG
+RESET_SYSVAR
+RESTART_ADDITIONAL_TIMER_BLOCKED
+RIGGKORNING
+ROOM_BLOCK
+ROOM_BUZZER_BLOCKED
+ROOM_DIAL_RANGE
+ROOM_DIAL_RANGE_GLOBAL
+ROOM_EXTERN_SETPOINT_TEMP_BY_E21_EXT_1
+ROOM_EXTERN_SETPOINT_TEMP_BY_E21_EXT_2
+ROOM_EXTERN_SETPOINT_TEMP_BY_E22_EXT_1
+ROOM_EXTERN_SETPOINT_TEMP_BY_E22_EXT_2
+ROOM_EXTERN_SETPOINT_TEMP_GLOBAL
+ROOM_EXTERN_TEMPERATURE_ACTIVE_1
+ROOM_EXTERN_TEMPERATURE_ACTIVE_2
+ROOM_EXTERN_TEMPERATURE_ACTIVE_3
+ROOM_EXTERN_TEMPERATURE_ACTIVE_4
+ROOM_HOLIDAY_SETPOINT_BASE_TEMP
+ROOM_HOLIDAY_SETPOINT_BASE_TEMP_GLOBAL
+ROOM_INFLUENCE
+ROOM_INFLUENCE_CONST
+ROOM_INFLUENCE_CONST_GLOBAL
+ROOM_LED_ALLOWED
+ROOM_LED_BLOCKED
+ROOM_PROGRAM_1_5FRI
+ROOM_PROGRAM_1_1MON
+ROOM_PROGRAM_1_6SAT
+ROOM_PROGRAM_1_7SUN
+ROOM_PROGRAM_1_4THU
+ROOM_PROGRAM_1_2TUE
+ROOM_PROGRAM_1_3WED
+ROOM_PROGRAM_2_5FRI
+ROOM_PROGRAM_2_1MON
+ROOM_PROGRAM_2_6SAT
+ROOM_PROGRAM_2_7SUN
+ROOM_PROGRAM_2_4THU
+ROOM_PROGRAM_2_2TUE
+ROOM_PROGRAM_2_3WED
+ROOM_PROGRAM_FRI_GLOBAL
+ROOM_PROGRAM_MODE
+ROOM_PROGRAM_MODE_GLOBAL
+ROOM_PROGRAM_MON_GLOBAL
+ROOM_PROGRAM_SAT_GLOBAL
+ROOM_PROGRAM_SUN_GLOBAL
+ROOM_PROGRAM_THU_GLOBAL
+ROOM_PROGRAM_TUE_GLOBAL
+ROOM_PROGRAM_WED_GLOBAL
+ROOM_SENSOR_SHOW_OUTDOOR_TEMP
+ROOM_SETPOINT_BASE_TEMP
+ROOM_SETPOINT_BASE_TEMP_GLOBAL
+ROOM_SETPOINT_OFFSET
+ROOM_SETPOINT_OFFSET_GLOBAL
+ROOM_SETPOINT_TEMP
+ROOM_TIMECONTROLLED
+ROOM_TIMEPROGRAM
+ROOM_TIMEPROGRAMMED_SETPOINT_BASE_TEMP
+ROOM_TIMEPROGRAMMED_SETPOINT_BASE_TEMP_GLOBAL
+ROOM_TIMEPROGRAM_GLOBAL
+RTU800B_CONNECTED
+RTU800B_CONNECTED_2
+RTU800B_CONNECTED_3
+RTU800B_CONNECTED_4
+RTU800B_CONNECTED_5
+RTU800B_CONNECTED_6
+RTU800B_CONNECTED_7
+RTU800B_CONNECTED_8
+RTU800B_CONNECTED_BITMASK
+RTU800B_CONNECTED_GLOBAL
+RTU800B_GENERATION
+RTU800B_GENERATION_2
+RTU800B_GENERATION_3
+RTU800B_GENERATION_4
+RTU800B_GENERATION_5
+RTU800B_GENERATION_6
+RTU800B_GENERATION_7
+RTU800B_GENERATION_8
+RTU800B_REVISION
+RTU800B_REVISION_2
+RTU800B_REVISION_3
+RTU800B_REVISION_4
+RTU800B_REVISION_5
+RTU800B_REVISION_6
+RTU800B_REVISION_7
+RTU800B_REVISION_8
+RTU800B_SUPPORTS_NEW_MESSAGES
+RTU800B_SUPPORTS_NEW_MESSAGES_BITMASK
+RTU800B_SYSTEM_STATUS
+RTU800B_VERSION
+RTU800B_VERSION_2
+RTU800B_VERSION_3
+RTU800B_VERSION_4
+RTU800B_VERSION_5
+RTU800B_VERSION_6
+RTU800B_VERSION_7
+RTU800B_VERSION_8
+SCREED_DRYING_ACTIVATED
+SCREED_DRYING_COOLING_STEP_COUNT
+SCREED_DRYING_CURRENT_HOUR
+SCREED_DRYING_CURRENT_PROGRAM_STEP
+SCREED_DRYING_DAYS_AT_MAX_TEMPERATURE
+SCREED_DRYING_DAYS_PER_COOLING_STEP
+SCREED_DRYING_DAYS_PER_HEATING_STEP
+SCREED_DRYING_HEATING_STEP_COUNT
+SCREED_DRYING_HEAT_SOURCE
+SCREED_DRYING_INCOMPLETE
+SCREED_DRYING_MAX_TEMPERATURE
+SCREED_DRYING_PROGRAM_STEP_COUNT
+SCREED_DRYING_REQUEST
+SCREED_DRYING_SETPOINT_TEMP
+SCREED_DRYING_TEMPERATURE_STEP_COOLING
+SCREED_DRYING_TEMPERATURE_STEP_HEATING
+SCREENSAVER_ACTIVE
+SCREENSAVER_DELAY_TIME
+SENSORS_E74_T1_CORRECTION
+SENSORS_E74_T1_DISPLAY_TEMP
+SENSORS_E74_T1_STATUS
+SENSORS_E74_T1_TEMP
+SENSORS_E74_T3_CORRECTION
+SENSORS_E74_T3_DISPLAY_TEMP
+SENSORS_E74_T3_STATUS
+SENSORS_E74_T3_TEMP
+SENSORS_E74_T7_CORRECTION
+SENSORS_E74_T7_DISPLAY_TEMP
+SENSORS_E74_T7_STATUS
+SENSORS_E74_T7_TEMP
+SETUP_COMPLETED
+SOLAR_ACTIVATED
+SOLAR_ACTIVE
+SOLAR_DHW_BLOCK
+SOLAR_DIFF_START_TEMP
+SOLAR_DIFF_STOP_TEMP
+SOLAR_FREEZEGUARD_ACTIVE
+SOLAR_FREEZEGUARD_START_TEMP
+SOLAR_FREEZEGUARD_STOP_TEMP
+SOLAR_PIPE_FUNCTION
+SOLAR_PRIO_DHW_BLOCK_TEMP
+SOLAR_SOUTHEUROPE
+SOLAR_T1_HIGH
+SOLAR_T1_LOW
+SOLAR_T1_MAX_TEMP
+SOLAR_T1_MIN_TEMP
+SOLAR_T7_HIGH
+SOLAR_T7_MAX_TEMP
+SOLAR_T7_RESTART_DIFF
+STATS_COMPRESSOR_DHW
+STATS_COMPRESSOR_DHW_2
+STATS_COMPRESSOR_HEATING
+STATS_COMPRESSOR_HEATING_2
+STATS_COMPRESSOR_HZ_DHW
+STATS_COMPRESSOR_HZ_HEATING
+STATS_COMPRESSOR_POOL
+STATS_COMPRESSOR_POOL_2
+STATS_COMPRESSOR_RESET
+STATS_COMPRESSOR_START_DHW
+STATS_COMPRESSOR_START_DHW_2
+STATS_COMPRESSOR_START_HEATING
+STATS_COMPRESSOR_START_HEATING_2
+STATS_COMPRESSOR_START_POOL
+STATS_COMPRESSOR_START_POOL_2
+STATS_CONTACTOR_1
+STATS_CONTACTOR_2
+STATS_CONTACTOR_RESET
+STATS_CONTROL
+STATS_CONTROL_RESET
+STATS_ELECTR_ADD_DHW
+STATS_ELECTR_ADD_HEATING
+STATS_ELECTR_ADD_POOL
+STATS_ELECTR_ADD_RESET
+STATS_ENERGY_HIDE_MENU
+STATS_ENERGY_OUTPUT
+STATS_ENERGY_OUTPUT_DHW
+STATS_ENERGY_OUTPUT_HEATING
+STATS_ENERGY_OUTPUT_POOL
+STATS_OP_DHW
+STATS_OP_HEATING
+STATS_OP_RESET
+STATS_RESET
+STATS_ST_COMPRESSOR_AVERAGE_HZ_DHW
+STATS_ST_COMPRESSOR_AVERAGE_HZ_HEATING
+STATS_ST_COMPRESSOR_DHW
+STATS_ST_COMPRESSOR_DHW_2
+STATS_ST_COMPRESSOR_HEATING
+STATS_ST_COMPRESSOR_HEATING_2
+STATS_ST_COMPRESSOR_HZ_DHW
+STATS_ST_COMPRESSOR_HZ_HEATING
+STATS_ST_COMPRESSOR_HZ_POOL
+STATS_ST_COMPRESSOR_POOL
+STATS_ST_COMPRESSOR_POOL_2
+STATS_ST_COMPRESSOR_RESET
+STATS_ST_COMPRESSOR_START_DHW
+STATS_ST_COMPRESSOR_START_DHW_2
+STATS_ST_COMPRESSOR_START_HEATING
+STATS_ST_COMPRESSOR_START_HEATING_2
+STATS_ST_COMPRESSOR_START_POOL
+STATS_ST_COMPRESSOR_START_POOL_2
+STATS_ST_COMPRESSOR_START_RESET
+STATS_ST_CONTACTOR_1
+STATS_ST_CONTACTOR_2
+STATS_ST_CONTACTOR_RESET
+STATS_ST_ELECTR_ADD_DHW
+STATS_ST_ELECTR_ADD_HEATING
+STATS_ST_ELECTR_ADD_POOL
+STATS_ST_ELECTR_ADD_RESET
+STATS_ST_OP_DHW
+STATS_ST_OP_HEATING
+STATS_ST_OP_RESET
+STATS_ST_RESET
+SUMMARY_ALARM_MODE
+TEMP
+TILLSKOTT_DRIFTTILLSTAND
+TILLSKOTT_RAMP_TID
+TILLSKOTT_UTSIGNAL_UT
+UI_BRAND
+USER_CONFIRMATION
+USER_CONFIRMATION_OBJECT
+VS_DIREKTSTART_GRANS
+VS_DIREKTSTOPP_GRANS
+XDHW_COMPRESSOR_REQUEST
+XDHW_COMPRESSOR_REQUEST_2
+XDHW_REQUEST
+XDHW_STOP_TEMP
+XDHW_TIME
+XDHW_WEEKPROGRAM_DAY
+XDHW_WEEKPROGRAM_DURATION_TIME
+XDHW_WEEKPROGRAM_FAILED
+XDHW_WEEKPROGRAM_HAS_FINISHED
+XDHW_WEEKPROGRAM_HOUR
+XDHW_WEEKPROGRAM_MAX_TIME
+XDHW_WEEKPROGRAM_REQUEST
+XDHW_WEEKPROGRAM_SAVED_DAY
+XDHW_WEEKPROGRAM_STOP_TEMP
+XDHW_WEEKPROGRAM_WEEK
+XDHW_WEEKPROGRAM_WARM_KEEPING_TIMER
+VV_MAX_TIMER
+XDHW_TIMER
+VV_RAD_TIMER
+RAD_MAX_TIMER
+RAD_BEHOV_BLOCKERING_TIMER
+DEGREE_MINUTE_SAMPLE_TIMER
+HEATING_SEASON_START_DELAY_TIMER
+FREEZEGUARD_DELAY_TIMER
+TILLSKOTT_RAMP_TIMER
+COMPRESSOR_STARTUP_TIMER
+COMPRESSOR_START_TIMER
+COMPRESSOR_START_DELAY_TIMER
+EXERCISE_TIMER
+ADDITIONAL_TEMP_LIMIT_TIMER
+PUMP_G1_OPTIMIZED_TIMER
+PUMP_G2_TEMP_BLOCK_TIMER
+PUMP_G2_TEMP_BLOCK_TIMER_2
+HEATING_SEASON_STOP_DELAY_TIMER
+ALARM_MODE_DELAY_TIMER
+LARMSUMMER_DELAY_TIMER
+LARMSUMMER_INTERVAL_TIMER
+SCREENSAVER_TIMER
+QUICKMENU_TIMER
+COOLING_FAN_STOP_DELAY_TIMER
+TILLSKOTT_START_TIMER
+LP_LARM_DELAY_TIMER
+LP_2_LARM_DELAY_TIMER
+DEFROST_MAX_TIMER
+DEFROST_MAX_TIMER_2
+DEFROST_MIN_BREAK_TIMER
+DEFROST_MIN_BREAK_TIMER_2
+DEFROST_BLOCK_TIMER
+DEFROST_BLOCK_TIMER_2
+DEFROST_FAN_TIMER
+DEFROST_FAN_TIMER_2
+DEFROST_DELTA_TIMER
+DEFROST_DELTA_TIMER_2
+HEATING_CABLE_TIMER
+HEATING_CABLE_TIMER_2
+ADDITIONAL_BLOCK_HIGH_T2_TIMER
+NEUTRALZONE_LIMITATION_TIMER
+ADDITIONAL_EXTERNAL_HEAT_VALVE_DELAY_TIMER
+T8_T9_DELAY_TIMER
+T8_T9_2_DELAY_TIMER
+T8_T9_DELAY_AFTER_SWITCH_TIMER
+T8_T9_2_DELAY_AFTER_SWITCH_TIMER
+T10_T11_DELAY_TIMER
+T10_T11_2_DELAY_TIMER
+T10_T11_DELAY_AFTER_SWITCH_TIMER
+T10_T11_2_DELAY_AFTER_SWITCH_TIMER
+ADDITIONAL_LIMITATION_DEFROST_DELAY_TIMER
+POOL_ADDITIONALHEAT_DELAY_TIMER
+TIMER_HEATING_START_DELAY_AT_CASCADE
+TIMER_HEATING_STOP_DELAY_AT_CASCADE
+SCREED_DRYING_TIMER
+COMPRESSOR_START_TIMER_2
+COMPRESSOR_START_DELAY_TIMER_2
+ENVELOPE_BLOCK_AFTER_VV_TIMER
+ENVELOPE_BLOCK_AFTER_HG_TIMER
+ENVELOPE_2_BLOCK_AFTER_VV_TIMER
+ENVELOPE_2_BLOCK_AFTER_HG_TIMER
+ENVELOPE_BLOCK_OUTDOOR_ACKNOWLEDGE_TIMER
+ENVELOPE_2_BLOCK_AFTER_GT2_LOW_TIMER
+PARTY_MODE_TIMER
+D_VALVE_STARTUP_TIMER
+POOL_START_DELAY_TIMER
+ADDITIONAL_SYNCH_VALVE_TIMER
+DHW_PROTECTIVE_ANODE_ALERT_DELAY_TIMER
+TIMER_DEFROST_DELAY_COMPRESSOR_START
+TIMER_DEFROST_DELAY_4_WAY_VALVE_SWITCH
+TIMER_DEFROST_DELAY_COMPRESSOR_2_START
+TIMER_DEFROST_DELAY_4_WAY_VALVE_2_SWITCH
+TIMER_SOLAR_PIPE_DELAY
+TIMER_SOLAR_PIPE_EXERCISE
+TIMER_SOLAR_T1_HIGH
+TIMER_SOLAR_T1_LOW
+LP_STOP_MAX_TIMER
+HP_STOP_MAX_TIMER
+LP_STOP_MAX_TIMER_2
+HP_STOP_MAX_TIMER_2
+TIMER_G2_AFTER_XDHW
+TIMER_SOLAR_T1_DELAY_BEFORE_SHORT_CIRCUIT
+TIMER_SOLAR_T1_CONTROLLED_RISE
+TIMER_CIRCULATION_G2_ADJUST_TIMER
+TIMER_DHW_E21_COMPRESSOR_TEMPORARY_STOP_DELAY
+TIMER_DHW_E22_COMPRESSOR_TEMPORARY_STOP_DELAY
+TIMER_ACCESS_LEVEL
+TIMER_CIRCULATION_E21_G2_TEMPORARY_STOP
+TIMER_CIRCULATION_E22_G2_TEMPORARY_STOP
+TIMER_COMMUNICATION_BAD_CANBUS_REBOOT_DELAY
+TIMER_CIRCULATION_E21_G2_MEAN_VALUE_SAMPLE_TIME
+TIMER_CIRCULATION_E22_G2_MEAN_VALUE_SAMPLE_TIME
+TIMER_CIRCULATION_E21_G2_INIT
+TIMER_CIRCULATION_E22_G2_INIT
+TIMER_MV_E12_FREEZEGUARD
+TIMER_MV_E12_CALIBRATE_PID
+TIMER_MV_E12_PID_SV41
+TIMER_MV_E12_M_VALVE_DEFROST
+TIMER_MV_E12_INIT_SV41
+TIMER_MV_E21_M_VALVE_DEFROST
+TIMER_MV_E12_M_VALVE_LIMITATION
+TIMER_MV_E12_M_VALVE_PULS_PAUS
+TIMER_MV_E12_STARTUP_DELAY
+TIMER_MV_E12_HEATING_SEASON_STOP_DELAY
+TIMER_MV_E12_HEATING_SEASON_START_DELAY
+TIMER_MV_E12_ATTENUATION
+TIMER_MV_E12_DEFROST
+TIMER_DEFROST_MAX_RUNNING_TIME_BETWEEN_DEFROSTS_2
+TIMER_DEFROST_MAX_RUNNING_TIME_BETWEEN_DEFROSTS
+TIMER_DHW_E21_T3_START_TEMP_ADJ
+TIMER_DHW_E22_T3_START_TEMP_ADJ
+TIMER_SYSTEM_INIT
+TIMER_COMPRESSOR_START_DELAY_AT_CASCADE
+"""
+
+# Corrections applied by parameter_data.PARAMETER_DATA
+DATA_OVERRIDES: dict[str, dict[str, int | str]] = {
+    "COMPRESSOR_REAL_FREQUENCY": {"idx": 279},
+    "COMPRESSOR_STATE": {"idx": 295},
+    "COMPRESSOR_STATE_2": {"idx": 296},
+    "GT3_STATUS": {"idx": 681},
+    "GT3_TEMP": {"idx": 682},
+    "XDHW_STOP_TEMP": {"idx": 2478, "read": 0},
+    "XDHW_TIME": {"idx": 2480, "read": 0},
+}
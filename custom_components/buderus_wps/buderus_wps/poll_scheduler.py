@@ -0,0 +1,157 @@
+"""Multi-rate polling plan for RTR parameters.
+
+Values on the heat pump change at very different rates: the compressor state
+flips within seconds, temperatures drift over minutes and settings only
+change when someone writes them. PollScheduler reads each group of
+parameters (a PollItem) at its own interval:
+
+- due() returns the items whose interval has elapsed; callers read their
+  parameters in one pipelined batch (see batch_parameters() and
+  HeatPumpClient.read_many()).
+- mark_done() starts the next interval of the items that were read. Items
+  that could not be read are simply not marked and stay due, so they are
+  retried on the next tick.
+- mark_due() forces an item to be read on the next tick, e.g. after one of
+  its parameters was written. If that happens while the item is being read,
+  the poll may have seen the old value, so mark_done() leaves it due.
+
+Every item is due on the first tick.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+@dataclass(frozen=True)
+class PollItem:
+    """A group of parameters read together at a fixed interval.
+
+    Attributes:
+        key: Unique item name
+        parameters: Parameter names and/or indices to read
+        interval: Seconds between reads
+    """
+
+    key: str
+    parameters: tuple[Any, ...]
+    interval: float
+
+    def __post_init__(self) -> None:
+        if self.interval <= 0:
+            raise ValueError(
+                f"interval of poll item {self.key!r} must be positive, got {self.interval}"
+            )
+
+
+def batch_parameters(items: Iterable[PollItem]) -> list[Any]:
+    """Parameters of several items in plan order, without duplicates."""
+    return list(dict.fromkeys(p for item in items for p in item.parameters))
+
+
+class PollScheduler:
+    """Tracks when each PollItem of a polling plan is due.
+
+    Thread-safe: writes may mark items due while a poll is running.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[PollItem],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            items: Polling plan
+            clock: Monotonic time source (injectable for tests)
+
+        Raises:
+            ValueError: If the plan is empty or item keys are not unique
+        """
+        self._items: dict[str, PollItem] = {}
+        for item in items:
+            if item.key in self._items:
+                raise ValueError(f"duplicate poll item {item.key!r}")
+            self._items[item.key] = item
+        if not self._items:
+            raise ValueError("polling plan is empty")
+        self._clock = clock
+        self._next_due = dict.fromkeys(self._items, float("-inf"))
+        # mark_due() calls are numbered; an item forced after the due() that
+        # returned it is not marked done by the poll that read it
+        self._marks = 0
+        self._marked_at = dict.fromkeys(self._items, 0)
+        self._polled_at = dict.fromkeys(self._items, 0)
+        self._lock = threading.Lock()
+
+    @property
+    def items(self) -> list[PollItem]:
+        """Items of the plan, in plan order."""
+        return list(self._items.values())
+
+    @property
+    def tick(self) -> float:
+        """Shortest interval of the plan, i.e. how often due() should be called."""
+        return min(item.interval for item in self._items.values())
+
+    def due(self, now: Optional[float] = None) -> list[PollItem]:
+        """Items whose interval has elapsed, in plan order."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            due = [
+                item for key, item in self._items.items() if self._next_due[key] <= now
+            ]
+            for item in due:
+                self._polled_at[item.key] = self._marks
+            return due
+
+    def next_due_in(self, now: Optional[float] = None) -> float:
+        """Seconds until the next item is due (0 if one is due already)."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            return max(min(self._next_due.values()) - now, 0.0)
+
+    def mark_done(self, keys: Iterable[str], now: Optional[float] = None) -> None:
+        """Start the next interval of items that were read at ``now``.
+
+        Items marked due since the due() call that returned them stay due.
+        """
+        now = self._clock() if now is None else now
+        with self._lock:
+            for key in keys:
+                if self._marked_at[key] <= self._polled_at[key]:
+                    self._next_due[key] = now + self._items[key].interval
+
+    def mark_due(self, key_or_parameter: Any) -> list[str]:
+        """Force items to be read on the next tick.
+
+        Args:
+            key_or_parameter: Item key, or a parameter name/index; names are
+                matched case-insensitively
+
+        Returns:
+            Keys of the items marked due (empty if nothing matched)
+        """
+        needle = _normalize(key_or_parameter)
+        with self._lock:
+            keys = [
+                key
+                for key, item in self._items.items()
+                if key == key_or_parameter
+                or any(_normalize(p) == needle for p in item.parameters)
+            ]
+            if keys:
+                self._marks += 1
+            for key in keys:
+                self._next_due[key] = float("-inf")
+                self._marked_at[key] = self._marks
+        return keys
+
+
+def _normalize(name_or_idx: Any) -> Any:
+    return name_or_idx.upper() if isinstance(name_or_idx, str) else name_or_idx
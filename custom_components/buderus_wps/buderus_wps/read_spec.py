@@ -0,0 +1,270 @@
+"""Declarative parameter reads with uniform validation and fallbacks.
+
+A ReadSpec describes how one value is read: which parameter, the minimum
+response length, how the decoded value is parsed, what to use when it was
+never read, how often a failed read is retried and in which order it is
+requested. ReadEngine executes a set of specs:
+
+- Specs reading the same parameter share one RTR.
+- All reads of a run go out in one pipelined HeatPumpClient.read_many()
+  batch, in priority order (lower priority values first). Failed reads of
+  specs with retries left are batched again, so adding a spec never adds
+  a sequential timeout.
+- A spec whose read, length check or parser fails keeps its last good
+  value, or its fallback if it was never read.
+- Every run records per-spec outcome, attempts and elapsed time (see
+  report()).
+- With a CapabilityMap, parameters marked unavailable are only read when
+  due for a probe; skipped specs report the mark as their error.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from .capabilities import CapabilityMap
+
+
+def parse_int(value: Any) -> int:
+    """Integer value; dp2-style strings like "1:Always_On" yield their prefix."""
+    if isinstance(value, str) and ":" in value:
+        value = value.split(":")[0]
+    return int(value or 0)
+
+
+def parse_float(value: Any) -> float:
+    """Float value (temperatures, offsets)."""
+    return float(value)
+
+
+def parse_bool(value: Any) -> bool:
+    """Status flag: any non-zero value is True."""
+    return parse_int(value) != 0
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@dataclass(frozen=True)
+class ReadSpec:
+    """How to read one value.
+
+    Attributes:
+        name: Parameter name or index
+        expected_dlc: Minimum response length in bytes
+        parser: Converts the decoded value; exceptions mark the read failed
+        fallback: Value used while the spec has never been read successfully
+        retries: Extra attempts after a failed read or short response
+        priority: Request order within a batch (lower first)
+        key: Name of the value (default: str(name)); several specs may read
+            the same parameter under different keys
+    """
+
+    name: Any
+    expected_dlc: int = 1
+    parser: Callable[[Any], Any] = _identity
+    fallback: Any = None
+    retries: int = 0
+    priority: int = 0
+    key: Optional[str] = None
+
+    @property
+    def output_key(self) -> str:
+        """Key of the value produced by this spec."""
+        return self.key if self.key is not None else str(self.name)
+
+
+@dataclass
+class ReadOutcome:
+    """Result of one spec in a run.
+
+    Attributes:
+        value: Fresh value, else the last good value or the fallback
+        fresh: Whether the value was read in this run
+        error: Why the read failed ("timeout", "invalid_dlc", "no_value",
+            "parse_error", ...), None on success
+        attempts: Number of reads issued for the spec's parameter
+        elapsed: Seconds from the start of the run until the spec was resolved
+            (0 and attempts 0 for specs skipped as unavailable)
+        result: Full read_parameter()-style result of the last attempt
+    """
+
+    value: Any
+    fresh: bool
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+    result: Optional[dict[str, Any]] = None
+
+
+def _read_key(name: Any) -> Any:
+    return name.upper() if isinstance(name, str) else name
+
+
+class ReadEngine:
+    """Executes ReadSpecs and keeps the last good value of each.
+
+    The engine holds no client; runs take the client to use, so one engine
+    (and its last good values) can outlive reconnects.
+    """
+
+    def __init__(
+        self,
+        specs: Iterable[ReadSpec],
+        clock: Callable[[], float] = time.monotonic,
+        capabilities: Optional[CapabilityMap] = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            specs: All specs the engine may run
+            clock: Monotonic time source (injectable for tests)
+            capabilities: Map of unavailable parameters, updated by every run
+
+        Raises:
+            ValueError: If two specs produce the same key
+        """
+        self._specs: dict[str, ReadSpec] = {}
+        for spec in specs:
+            if spec.output_key in self._specs:
+                raise ValueError(f"duplicate read spec {spec.output_key!r}")
+            self._specs[spec.output_key] = spec
+        self._clock = clock
+        self.capabilities = capabilities
+        self._values: dict[str, Any] = {}
+        self._last_run: dict[str, ReadOutcome] = {}
+
+    @property
+    def specs(self) -> list[ReadSpec]:
+        """Registered specs."""
+        return list(self._specs.values())
+
+    def value(self, key: str) -> Any:
+        """Last good value of a spec, or its fallback."""
+        return self._values.get(key, self._specs[key].fallback)
+
+    def run(
+        self,
+        client: Any,
+        keys: Optional[Iterable[str]] = None,
+        deadline: Optional[float] = None,
+    ) -> dict[str, ReadOutcome]:
+        """Read specs in pipelined batches.
+
+        Args:
+            client: HeatPumpClient (anything with read_many())
+            keys: Keys of the specs to run (default: all)
+            deadline: Time budget per batch in seconds (default: client's)
+
+        Returns:
+            Outcome per spec key
+        """
+        start = self._clock()
+        specs = sorted(
+            (self._specs[key] for key in (self._specs if keys is None else keys)),
+            key=lambda spec: spec.priority,
+        )
+        by_read: dict[Any, list[ReadSpec]] = {}
+        for spec in specs:
+            by_read.setdefault(_read_key(spec.name), []).append(spec)
+
+        outcomes: dict[str, ReadOutcome] = {}
+        capabilities = self.capabilities
+        if capabilities is not None:
+            for read, read_specs in list(by_read.items()):
+                if capabilities.should_read(read_specs[0].name):
+                    continue
+                status = capabilities.status(read_specs[0].name)
+                for spec in by_read.pop(read):
+                    outcomes[spec.output_key] = ReadOutcome(
+                        self.value(spec.output_key), False, status
+                    )
+
+        attempts: dict[Any, int] = dict.fromkeys(by_read, 0)
+        final_errors: dict[Any, Optional[str]] = {}
+        pending = list(by_read)
+        while pending:
+            names = [by_read[read][0].name for read in pending]
+            try:
+                batch = client.read_many(names, deadline=deadline)
+            except Exception as err:
+                batch = {name: {"decoded": None, "error": str(err)} for name in names}
+            elapsed = self._clock() - start
+
+            retry = []
+            for read, name in zip(pending, names):
+                attempts[read] += 1
+                result = batch.get(name) or {"decoded": None, "error": "no result"}
+                resolved = [
+                    self._resolve(spec, result, attempts[read], elapsed)
+                    for spec in by_read[read]
+                ]
+                retryable = any(
+                    outcome.error is not None
+                    and outcome.error not in ("no_value", "parse_error")
+                    and attempts[read] <= spec.retries
+                    for spec, outcome in zip(by_read[read], resolved)
+                )
+                if retryable:
+                    retry.append(read)
+                    continue
+                final_errors[read] = (
+                    None
+                    if any(outcome.fresh for outcome in resolved)
+                    else result.get("error") or resolved[0].error
+                )
+                for spec, outcome in zip(by_read[read], resolved):
+                    outcomes[spec.output_key] = outcome
+                    if outcome.fresh:
+                        self._values[spec.output_key] = outcome.value
+            pending = retry
+
+        if capabilities is not None:
+            # Timeouts only count while the bus answers other reads
+            answered = any(error is None for error in final_errors.values())
+            for read, error in final_errors.items():
+                if error != "timeout" or answered:
+                    capabilities.record(by_read[read][0].name, error)
+
+        self._last_run.update(outcomes)
+        return outcomes
+
+    def _resolve(
+        self, spec: ReadSpec, result: dict[str, Any], attempts: int, elapsed: float
+    ) -> ReadOutcome:
+        """Validate and parse one spec's read result."""
+        error = result.get("error")
+        decoded = result.get("decoded")
+        if error is None:
+            raw = result.get("raw")
+            if raw is not None and len(raw) < spec.expected_dlc:
+                error = "invalid_dlc"
+            elif decoded is None:
+                error = "no_value"
+        if error is None:
+            try:
+                value = spec.parser(decoded)
+            except (TypeError, ValueError):
+                error = "parse_error"
+            else:
+                return ReadOutcome(value, True, None, attempts, elapsed, result)
+        return ReadOutcome(
+            self.value(spec.output_key), False, str(error), attempts, elapsed, result
+        )
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """Latest outcome of each spec that has run (JSON-serializable)."""
+        return {
+            key: {
+                "ok": outcome.fresh,
+                "error": outcome.error,
+                "attempts": outcome.attempts,
+                "elapsed_ms": round(outcome.elapsed * 1000, 1),
+                "source": (outcome.result or {}).get("source"),
+            }
+            for key, outcome in self._last_run.items()
+        }
@@ -0,0 +1,448 @@
+"""Replay adapter for FHEM CAN bus capture files.
+
+The captures in fhem/fhem-capture/capture-*.hex are ``socat -x -v`` dumps
+of the serial traffic between FHEM and the USBtin::
+
+    > 2025/12/24 16:50:51.000305450  length=15 from=0 to=14
+     43 0d 43 0d 56 0d 56 0d 76 0d 53 34 0d 4f 0d     C.C.V.V.v.S4.O.
+    --
+    < 2025/12/24 16:50:51.000306342  length=4095 from=0 to=4094
+     54 30 30 30 33 30 32 37 30 31 30 30 0d 54 30 43  T00030270100.T0C
+    ...
+
+``>`` blocks were written to the USBtin, ``<`` blocks were read from it.
+The fractional second field is printed as zero-padded microseconds.
+
+ReplayAdapter implements the USBtinAdapter surface used by BroadcastMonitor,
+HeatPumpClient and the CLI and feeds the recorded ``<`` bytes through the
+same SLCAN framer, at recorded speed, N times faster, or as fast as
+possible. RTRs sent by the caller are answered from the capture: the most
+recent recorded response with the matching CAN ID (at the current playback
+position) is queued ahead of the replayed traffic.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Literal, Optional
+
+from .can_message import CANMessage
+from .element_discovery import (
+    ELEMENT_BUFFER_READ_ID,
+    ELEMENT_COUNT_REQUEST_ID,
+    ELEMENT_COUNT_RESPONSE_ID,
+    ELEMENT_DATA_RESPONSE_ID,
+)
+from .exceptions import DeviceCommunicationError, TimeoutError
+from .slcan_framer import SlcanFramer
+
+_HEADER = re.compile(
+    r"^([<>]) (\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})\.(\d+)\s+length=(\d+)"
+)
+
+# Hex bytes per dump line
+_BYTES_PER_LINE = 16
+
+# Non-parameter RTRs and the CAN ID their answer arrives on
+_RTR_RESPONSE_IDS = {
+    ELEMENT_COUNT_REQUEST_ID: ELEMENT_COUNT_RESPONSE_ID,
+    ELEMENT_BUFFER_READ_ID: ELEMENT_DATA_RESPONSE_ID,
+}
+
+
+@dataclass(frozen=True)
+class CaptureRecord:
+    """One block of serial traffic from a capture file.
+
+    Attributes:
+        timestamp: Unix timestamp of the block
+        direction: ">" (written to the USBtin) or "<" (read from it)
+        data: Raw serial bytes
+    """
+
+    timestamp: float
+    direction: str
+    data: bytes
+
+
+def load_fhem_capture(path: str | Path) -> list[CaptureRecord]:
+    """Parse a FHEM ``socat -x -v`` capture file.
+
+    Args:
+        path: Capture file path
+
+    Returns:
+        Records in file order
+
+    Raises:
+        ValueError: A block's hex dump is shorter than its declared length
+    """
+    records: list[CaptureRecord] = []
+    with open(path, encoding="ascii", errors="replace") as handle:
+        lines = iter(handle)
+        for line in lines:
+            match = _HEADER.match(line)
+            if not match:
+                continue
+            direction, stamp, fraction, length = match.groups()
+            timestamp = (
+                datetime.strptime(stamp, "%Y/%m/%d %H:%M:%S").timestamp()
+                + int(fraction) / 1_000_000
+            )
+            remaining = int(length)
+            data = bytearray()
+            while remaining > 0:
+                row = next(lines, None)
+                if row is None:
+                    break
+                # Hex column first, then the ASCII rendering; only take as many
+                # tokens as bytes remain so the ASCII column is never parsed
+                count = min(_BYTES_PER_LINE, remaining)
+                tokens = row.split()[:count]
+                data += bytes(int(token, 16) for token in tokens)
+                remaining -= len(tokens)
+            if remaining:
+                raise ValueError(
+                    f"Truncated capture block at {stamp} in {path}: "
+                    f"{remaining} bytes missing"
+                )
+            records.append(CaptureRecord(timestamp, direction, bytes(data)))
+    return records
+
+
+def response_id_for(request: CANMessage) -> Optional[int]:
+    """Return the CAN ID on which the heat pump answers an RTR, if known."""
+    if not request.is_remote_frame:
+        return None
+    can_id = request.arbitration_id
+    if can_id in _RTR_RESPONSE_IDS:
+        return _RTR_RESPONSE_IDS[can_id]
+    if can_id & 0x3FFF == 0x3FE0 and can_id >> 26 == 0x04003FE0 >> 26:
+        # Parameter read: 0x04003FE0 | idx << 14 -> 0x0C003FE0 | idx << 14
+        return can_id | 0x08000000
+    return None
+
+
+class ReplayAdapter:
+    """Drop-in USBtinAdapter replacement playing back a FHEM capture.
+
+    Attributes:
+        port: Capture description (used in logs and error context)
+        timeout: Default operation timeout in seconds
+        speed: Playback speed factor; None plays back as fast as possible
+        sent: Frames passed to send_frame()/send_frame_nowait()
+    """
+
+    def __init__(
+        self,
+        capture: str | Path | list[CaptureRecord],
+        speed: Optional[float] = 1.0,
+        timeout: float = 5.0,
+        read_only: bool = False,
+        loop: bool = False,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """Initialize adapter (does not start playback).
+
+        Args:
+            capture: Capture file path or records from load_fhem_capture()
+            speed: 1.0 for recorded speed, N for N times faster, None for
+                as fast as possible
+            timeout: Default operation timeout in seconds
+            read_only: If True, disable transmit operations
+            loop: Restart from the beginning when the capture is exhausted
+            logger: Optional logger for debug output
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"Speed must be positive or None, got {speed}")
+        if timeout <= 0:
+            raise ValueError(f"Timeout must be positive, got {timeout}")
+
+        if isinstance(capture, list):
+            records = capture
+            self.port = "replay"
+        else:
+            records = load_fhem_capture(capture)
+            self.port = f"replay:{Path(capture).name}"
+        self._records = [r for r in records if r.direction == "<"]
+        self.speed = speed
+        self.timeout = timeout
+        self.read_only = read_only
+        self.loop = loop
+        self._logger = logger or logging.getLogger(__name__)
+
+        self.sent: list[CANMessage] = []
+        self._open = False
+        self._framer = SlcanFramer()
+        self._injected: deque[CANMessage] = deque()
+        self._position = 0
+        self._clock_start = 0.0
+        self._responses: Optional[dict[int, tuple[list[float], list[CANMessage]]]] = (
+            None
+        )
+
+    @property
+    def is_open(self) -> bool:
+        """Check if playback is active."""
+        return self._open
+
+    @property
+    def status(self) -> Literal["connected", "disconnected"]:
+        return "connected" if self._open else "disconnected"
+
+    @property
+    def reader_running(self) -> bool:
+        """Replay has no background reader thread."""
+        return False
+
+    @property
+    def exhausted(self) -> bool:
+        """True once every recorded block has been delivered."""
+        return self._position >= len(self._records) and not self.loop
+
+    @property
+    def duration(self) -> float:
+        """Recorded duration of the capture in seconds."""
+        if not self._records:
+            return 0.0
+        return self._records[-1].timestamp - self._records[0].timestamp
+
+    def connect(self) -> ReplayAdapter:
+        """Start playback from the beginning of the capture."""
+        if self._open:
+            raise RuntimeError(
+                f"Already connected to {self.port}. "
+                "Call disconnect() first or use a new adapter instance."
+            )
+        self._open = True
+        self._position = 0
+        self._framer.reset()
+        self._injected.clear()
+        self._clock_start = time.monotonic()
+        return self
+
+    def disconnect(self) -> None:
+        """Stop playback (idempotent, never raises)."""
+        self._open = False
+
+    def __enter__(self) -> ReplayAdapter:
+        return self.connect()
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.disconnect()
+
+    def _due_time(self, position: int) -> float:
+        """Monotonic time at which record ``position`` is delivered."""
+        if self.speed is None:
+            return self._clock_start
+        offset = self._records[position].timestamp - self._records[0].timestamp
+        return self._clock_start + offset / self.speed
+
+    def _deliver(self, deadline: float) -> bool:
+        """Feed the next recorded block, waiting for it until ``deadline``.
+
+        Returns:
+            True if a block was fed to the framer
+        """
+        if self._position >= len(self._records):
+            if not self.loop or not self._records:
+                return False
+            self._position = 0
+            self._clock_start = time.monotonic()
+
+        due = self._due_time(self._position)
+        now = time.monotonic()
+        if due > now:
+            if due > deadline:
+                time.sleep(max(deadline - now, 0))
+                return False
+            time.sleep(due - now)
+        self._framer.feed(self._records[self._position].data)
+        self._position += 1
+        return True
+
+    def _read_frame(self, timeout: float = 5.0) -> Optional[CANMessage]:
+        """Return the next replayed frame, or None after ``timeout``.
+
+        Once the capture is exhausted the bus is silent: the call waits for
+        the timeout and returns None.
+        """
+        if not self._open:
+            raise DeviceCommunicationError(
+                "Device not connected", context={"port": self.port}
+            )
+        if self._injected:
+            return self._injected.popleft()
+
+        deadline = time.monotonic() + timeout
+        while True:
+            msg = self._framer.next_frame()
+            if msg is not None:
+                return msg
+            if not self._deliver(deadline):
+                if self.exhausted:
+                    time.sleep(max(deadline - time.monotonic(), 0))
+                return None
+
+    def receive_frame(self, timeout: Optional[float] = None) -> CANMessage:
+        """Receive the next replayed frame.
+
+        Raises:
+            DeviceCommunicationError: Not connected
+            TimeoutError: No frame within timeout
+        """
+        effective_timeout = timeout if timeout is not None else self.timeout
+        frame = self._read_frame(timeout=effective_timeout)
+        if frame is None:
+            raise TimeoutError(
+                "No frame received within timeout",
+                context={"port": self.port, "timeout": effective_timeout},
+            )
+        return frame
+
+    def send_frame_nowait(self, message: CANMessage) -> None:
+        """Record a transmitted frame and queue the captured answer to RTRs.
+
+        Raises:
+            DeviceCommunicationError: Not connected
+            PermissionError: Adapter is in read-only mode
+        """
+        if not self._open:
+            raise DeviceCommunicationError(
+                "Device not connected", context={"port": self.port}
+            )
+        if self.read_only:
+            raise PermissionError(
+                "Adapter is in read-only mode; sending frames is disabled."
+            )
+        self.sent.append(message)
+        response = self._recorded_response(message)
+        if response is not None:
+            self._injected.append(response)
+
+    def send_frame(
+        self, message: CANMessage, timeout: Optional[float] = None
+    ) -> CANMessage:
+        """Send a frame and return the next frame (captured answer first).
+
+        Raises:
+            DeviceCommunicationError: Not connected
+            PermissionError: Adapter is in read-only mode
+            TimeoutError: No frame within timeout
+        """
+        self.send_frame_nowait(message)
+        return self.receive_frame(timeout)
+
+    def send_request(
+        self, message: CANMessage, response_id: int, timeout: Optional[float] = None
+    ) -> CANMessage:
+        """Send a request and wait for the frame with ``response_id``.
+
+        Raises:
+            TimeoutError: Capture has no matching frame within timeout
+        """
+        effective_timeout = timeout if timeout is not None else self.timeout
+        self.send_frame_nowait(message)
+        deadline = time.monotonic() + effective_timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            frame = self._read_frame(timeout=max(remaining, 0))
+            if frame is not None and frame.arbitration_id == response_id:
+                return frame
+            if frame is None or remaining <= 0:
+                raise TimeoutError(
+                    f"No response 0x{response_id:X} within timeout",
+                    context={
+                        "port": self.port,
+                        "response_id": response_id,
+                        "timeout": effective_timeout,
+                    },
+                )
+
+    def receive_stream(
+        self,
+        expected_bytes: int,
+        timeout: float = 10.0,
+        frame_filter: Optional[int] = None,
+        on_data: Optional[Callable[[bytes], None]] = None,
+    ) -> bytes:
+        """Accumulate payload bytes of replayed frames.
+
+        ``on_data`` receives each frame's payload as it is replayed.
+
+        Raises:
+            TimeoutError: No matching data within timeout
+        """
+        data = bytearray()
+        deadline = time.monotonic() + timeout
+        while len(data) < expected_bytes:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            frame = self._read_frame(timeout=remaining)
+            if frame is None:
+                break
+            if frame_filter is None or frame.arbitration_id == frame_filter:
+                data.extend(frame.data)
+                if on_data is not None and frame.data:
+                    on_data(bytes(frame.data))
+        if not data:
+            raise TimeoutError(
+                "No stream data received within timeout",
+                context={
+                    "port": self.port,
+                    "timeout": timeout,
+                    "filter": f"0x{frame_filter:08X}" if frame_filter else None,
+                },
+            )
+        return bytes(data)
+
+    def flush_input_buffer(self) -> None:
+        """Discard replayed frames that were delivered but not yet read."""
+        if not self._open:
+            raise DeviceCommunicationError(
+                "Device not connected", context={"port": self.port}
+            )
+        self._framer.reset()
+        self._injected.clear()
+
+    def _recorded_response(self, request: CANMessage) -> Optional[CANMessage]:
+        """Most recent captured answer to ``request`` at the playback position."""
+        response_id = response_id_for(request)
+        if response_id is None:
+            return None
+        entry = self._response_index().get(response_id)
+        if entry is None:
+            return None
+        timestamps, frames = entry
+        if self._position < len(self._records):
+            now = self._records[self._position].timestamp
+        else:
+            now = float("inf")
+        pos = bisect.bisect_right(timestamps, now)
+        return frames[max(pos - 1, 0)]
+
+    def _response_index(self) -> dict[int, tuple[list[float], list[CANMessage]]]:
+        """Index every captured data frame by CAN ID (built on first use)."""
+        if self._responses is None:
+            index: dict[int, tuple[list[float], list[CANMessage]]] = {}
+            framer = SlcanFramer()
+            for record in self._records:
+                framer.feed(record.data)
+                for frame in framer.drain():
+                    if frame.is_remote_frame:
+                        continue
+                    timestamps, frames = index.setdefault(
+                        frame.arbitration_id, ([], [])
+                    )
+                    timestamps.append(record.timestamp)
+                    frames.append(frame)
+            self._responses = index
+        return self._responses
@@ -0,0 +1,156 @@
+"""Read-through cache of parameter responses with per-parameter TTLs.
+
+Many parameters are settings that only change when they are written, yet
+every read_parameter() call costs an RTR round trip. ResponseCache keeps the
+raw response of such parameters for a time-to-live derived from the
+parameter metadata:
+
+- Measurements and status values (min >= max, e.g. GT8_TEMP,
+  COMPRESSOR_STATE) are never cached.
+- Settings with a write range and read flag 0 (e.g.
+  HEATING_CURVE_PARALLEL_OFFSET_GLOBAL, XDHW_STOP_TEMP) are cached for
+  SETTING_TTL; they only change when written, from here or the panel.
+- Settings with the read flag set (e.g. DHW_PROGRAM_MODE) are cached for
+  the shorter PANEL_SETTING_TTL.
+- Schedule formats (sw1/sw2) are cached like writable settings.
+
+A write range alone does not make a parameter a setting: status flags such
+as PUMP_DHW_ACTIVE carry a bitmask range. Names in DEFAULT_TTL_OVERRIDES or
+in the overrides passed to the cache take precedence; callers polling live
+values should pass TTL 0 for them.
+
+Writes through the clients invalidate the entry of the written parameter
+and bump its generation. Responses are stored with the generation read
+before their RTR was sent, so a response that raced a write is dropped
+instead of putting the old value back.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .parameter import Parameter
+
+# TTL of writable settings (seconds)
+SETTING_TTL = 3600.0
+
+# TTL of settings flagged read=1, which the panel also changes (seconds)
+PANEL_SETTING_TTL = 300.0
+
+# Weekly program formats: switch points only change when written
+SCHEDULE_FORMATS = frozenset({"sw1", "sw2"})
+
+# Parameters with a write range whose value the heat pump changes on its own
+DEFAULT_TTL_OVERRIDES: dict[str, float] = {
+    "XDHW_TIME": 0.0,  # Remaining extra DHW hours count down
+    "DHW_CALCULATED_SETPOINT_TEMP": 0.0,  # Recomputed by the controller
+    "PUMP_DHW_ACTIVE": 0.0,  # Status flags (bitmask range)
+    "PUMP_G1_CONTINUAL": 0.0,
+}
+
+
+def default_ttl(param: Parameter) -> float:
+    """Derive a cache TTL in seconds from parameter metadata (0 = no caching)."""
+    if param.format in SCHEDULE_FORMATS:
+        return SETTING_TTL
+    if param.min >= param.max:
+        return 0.0
+    return SETTING_TTL if param.read == 0 else PANEL_SETTING_TTL
+
+
+class ResponseCache:
+    """Raw parameter responses keyed by idx, expiring per parameter TTL.
+
+    Hit/miss counters only count parameters with a non-zero TTL, so reads of
+    live values do not dilute the hit rate. Like BusMetrics, counters are
+    updated without a lock; entries and generations are kept under one.
+    """
+
+    def __init__(
+        self,
+        ttl_overrides: Optional[dict[str, float]] = None,
+        ttl_func: Callable[[Parameter], float] = default_ttl,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_overrides: TTL in seconds per parameter name, on top of
+                DEFAULT_TTL_OVERRIDES (0 disables caching for a name)
+            ttl_func: Metadata-based TTL for all other parameters
+            clock: Monotonic time source (injectable for tests)
+        """
+        self._overrides = {
+            name.upper(): ttl
+            for name, ttl in {**DEFAULT_TTL_OVERRIDES, **(ttl_overrides or {})}.items()
+        }
+        self._ttl_func = ttl_func
+        self._clock = clock
+        self._entries: dict[int, tuple[float, bytes]] = {}
+        # idx -> number of invalidations (writes) so far
+        self._generations: dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def ttl(self, param: Parameter) -> float:
+        """Effective TTL of a parameter in seconds."""
+        override = self._overrides.get(param.text.upper())
+        return override if override is not None else self._ttl_func(param)
+
+    def get(self, param: Parameter) -> Optional[bytes]:
+        """Return the cached raw value if still valid, counting hit/miss."""
+        if self.ttl(param) <= 0:
+            return None
+        entry = self._entries.get(param.idx)
+        if entry is not None and entry[0] > self._clock():
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def generation(self, param: Parameter) -> int:
+        """Invalidation count of a parameter; read it before sending an RTR."""
+        return self._generations.get(param.idx, 0)
+
+    def put(
+        self, param: Parameter, raw: bytes, generation: Optional[int] = None
+    ) -> None:
+        """Store a raw response (ignored for parameters with TTL 0).
+
+        Args:
+            param: Parameter the response belongs to
+            raw: Raw response data
+            generation: generation() from before the RTR was sent; the
+                response is dropped if the parameter was invalidated since
+        """
+        ttl = self.ttl(param)
+        if ttl <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation(param):
+                return
+            self._entries[param.idx] = (self._clock() + ttl, bytes(raw))
+
+    def invalidate(self, param: Parameter) -> None:
+        """Drop the cached value of a parameter (e.g. after a write)."""
+        with self._lock:
+            self._generations[param.idx] = self.generation(param) + 1
+            self._entries.pop(param.idx, None)
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and entry count (JSON-serializable)."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "entries": len(self._entries),
+        }
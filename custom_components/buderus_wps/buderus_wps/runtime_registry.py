@@ -15,9 +15,6 @@ from typing import Optional, cast
 from .element_discovery import DiscoveredElement
 from .parameter_defaults import PARAMETER_DEFAULTS
 
-# Build a lookup dict from the parameter defaults list
-_STATIC_PARAMS = {str(p["text"]).upper(): p for p in PARAMETER_DEFAULTS}
-
 logger = logging.getLogger(__name__)
 
 
@@ -113,12 +110,11 @@ class RuntimeParameterRegistry:
         Returns:
             DiscoveredElement constructed from static data, or None if not found.
         """
-        # Look up in static parameters dict
-        if name not in _STATIC_PARAMS:
+        # Look up in the static parameter table (only this row is built)
+        param = PARAMETER_DEFAULTS.get_by_name(name)
+        if param is None:
             return None
 
-        param = _STATIC_PARAMS[name]
-
         # Construct a DiscoveredElement from static data
         # Static data format: {'idx': int, 'extid': str, 'min': int, 'max': int, ...}
         return DiscoveredElement(
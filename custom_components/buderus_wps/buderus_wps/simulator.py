@@ -0,0 +1,575 @@
+"""Virtual Buderus WPS heat pump behind a USBtin on a pseudo-terminal.
+
+HeatPumpSimulator opens a pty and speaks the USBtin SLCAN protocol on its
+master side, so the real USBtinAdapter (and everything built on it) can be
+pointed at the slave path unchanged. It emulates:
+
+- The USBtin init handshake (C, V, v, S4, O) and transmit acks (z/Z).
+- Parameter reads: RTR 0x04003FE0 | idx << 14 answered on
+  0x0C003FE0 | idx << 14 from the parameter table (parameter_defaults.py
+  unless given) plus configurable raw values; data frames to the request
+  ID are stored as writes and confirmed on the response ID.
+- Element list discovery: count RTR, data request (size/offset) and
+  buffer-read RTR streaming the encoded element list on 0x09FDBFE0.
+- Periodic broadcast traffic, by default the KNOWN_BROADCASTS IDs every
+  15 s (the most common period in the FHEM captures), or periods and values
+  learned from a capture via broadcasts_from_capture().
+- Fault injection: response latency and jitter, dropped responses and
+  streamed frames, and filler traffic to raise bus load.
+
+All I/O runs on one thread: select() on the pty master plus a heap of
+scheduled transmissions (delayed responses, stream frames, broadcasts).
+
+Run standalone with ``python -m buderus_wps.simulator``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import itertools
+import logging
+import os
+import random
+import select
+import statistics
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .broadcast_monitor import KNOWN_BROADCASTS, encode_can_id
+from .can_message import CANMessage
+from .element_discovery import (
+    ELEMENT_BUFFER_READ_ID,
+    ELEMENT_COUNT_REQUEST_ID,
+    ELEMENT_COUNT_RESPONSE_ID,
+    ELEMENT_DATA_REQUEST_ID,
+    ELEMENT_DATA_RESPONSE_ID,
+)
+from .heat_pump import CAN_REQUEST_BASE, CAN_RESPONSE_BASE
+from .parameter_defaults import PARAMETER_DEFAULTS
+from .replay_adapter import CaptureRecord
+from .slcan_framer import SlcanFramer
+
+# Most common broadcast period observed in the FHEM captures (seconds)
+DEFAULT_BROADCAST_PERIOD = 15.0
+
+# Time one 8-byte extended frame occupies a 125 kbit/s bus (seconds)
+CAN_FRAME_TIME = 0.001
+
+# CAN ID used for filler traffic when bus_load is set (counter prefix)
+FILLER_CAN_ID = 0x08000270
+
+# Replies to USBtin commands other than frames
+_VERSION_REPLIES = {b"V": b"V0107\r", b"v": b"v0107\r"}
+
+
+@dataclass
+class SimulatedBroadcast:
+    """A CAN ID the simulated heat pump broadcasts periodically.
+
+    Attributes:
+        can_id: Broadcast arbitration ID
+        period: Seconds between transmissions
+        data: Payload
+        phase: Delay before the first transmission (seconds)
+    """
+
+    can_id: int
+    period: float
+    data: bytes
+    phase: float = 0.0
+
+
+@dataclass
+class FaultConfig:
+    """Fault injection settings.
+
+    Attributes:
+        latency: Delay added before every response (seconds)
+        jitter: Uniform random extra delay up to this many seconds
+        drop_rate: Probability (0-1) that a response or stream frame is lost
+        bus_load: Filler frames per second sent in addition to broadcasts
+        seed: Random seed for reproducible drop/jitter patterns
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    drop_rate: float = 0.0
+    bus_load: float = 0.0
+    seed: Optional[int] = None
+
+
+@dataclass
+class SimulatorStats:
+    """Counters of simulator activity."""
+
+    rtr_requests: int = 0
+    writes: int = 0
+    responses: int = 0
+    dropped: int = 0
+    broadcasts: int = 0
+    stream_frames: int = 0
+    unknown_requests: int = 0
+    nak: int = 0
+    by_id: dict[int, int] = field(default_factory=dict)
+
+
+def encode_element_list(parameters: list[dict[str, Any]]) -> bytes:
+    """Encode parameters in the element list wire format.
+
+    Per element: idx (>H), extid (7 bytes), max (>i), min (>i),
+    name length incl. NUL (B), name, NUL.
+    """
+    blob = bytearray()
+    for param in parameters:
+        name = str(param["text"]).encode("ascii", errors="replace")
+        extid = bytes.fromhex(str(param.get("extid") or "").ljust(14, "0")[:14])
+        blob += struct.pack(
+            ">H7siiB",
+            int(param["idx"]),
+            extid,
+            int(param["max"]),
+            int(param["min"]),
+            len(name) + 1,
+        )
+        blob += name + b"\x00"
+    return bytes(blob)
+
+
+def default_broadcasts(
+    period: float = DEFAULT_BROADCAST_PERIOD,
+) -> list[SimulatedBroadcast]:
+    """One broadcast per KNOWN_BROADCASTS entry, spread evenly over a period.
+
+    Temperatures report 21.5 °C, everything else 0.
+    """
+    broadcasts = []
+    keys = sorted(KNOWN_BROADCASTS)
+    for n, (base, idx) in enumerate(keys):
+        _, fmt = KNOWN_BROADCASTS[(base, idx)]
+        value = 215 if fmt == "tem" else 0
+        broadcasts.append(
+            SimulatedBroadcast(
+                can_id=encode_can_id(0x03, idx, base),
+                period=period,
+                data=struct.pack(">h", value),
+                phase=period * n / max(len(keys), 1),
+            )
+        )
+    return broadcasts
+
+
+def broadcasts_from_capture(
+    records: list[CaptureRecord], min_samples: int = 3
+) -> list[SimulatedBroadcast]:
+    """Learn broadcast periods and last values from a FHEM capture.
+
+    Parameter responses (0x...3FE0) and discovery IDs are excluded.
+
+    Args:
+        records: Records from load_fhem_capture()
+        min_samples: Minimum occurrences for an ID to be included
+
+    Returns:
+        Broadcasts with the median observed period and last seen payload
+    """
+    seen: dict[int, list[float]] = {}
+    last: dict[int, bytes] = {}
+    framer = SlcanFramer()
+    for record in records:
+        if record.direction != "<":
+            continue
+        framer.feed(record.data)
+        for frame in framer.drain():
+            if frame.is_remote_frame or frame.arbitration_id & 0x3FFF == 0x3FE0:
+                continue
+            seen.setdefault(frame.arbitration_id, []).append(record.timestamp)
+            last[frame.arbitration_id] = frame.data
+
+    broadcasts = []
+    for can_id, stamps in seen.items():
+        if len(stamps) < min_samples:
+            continue
+        period = statistics.median(b - a for a, b in zip(stamps, stamps[1:]))
+        if period <= 0:
+            continue
+        broadcasts.append(
+            SimulatedBroadcast(
+                can_id=can_id,
+                period=period,
+                data=last[can_id],
+                phase=(stamps[0] - records[0].timestamp) % period,
+            )
+        )
+    return broadcasts
+
+
+class HeatPumpSimulator:
+    """USBtin + heat pump emulator on a pty.
+
+    Attributes:
+        port: Slave tty path to open with USBtinAdapter
+        stats: Activity counters
+    """
+
+    def __init__(
+        self,
+        parameters: Optional[list[dict[str, Any]]] = None,
+        values: Optional[dict[str | int, int | bytes]] = None,
+        broadcasts: Optional[list[SimulatedBroadcast]] = None,
+        faults: Optional[FaultConfig] = None,
+        frame_time: float = CAN_FRAME_TIME,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        """Initialize simulator (does not open the pty).
+
+        Args:
+            parameters: Parameter table (default: PARAMETER_DEFAULTS)
+            values: Raw values by parameter name or idx (int or payload bytes)
+            broadcasts: Periodic broadcasts (default: default_broadcasts())
+            faults: Fault injection settings
+            frame_time: Spacing of streamed element-list frames (seconds)
+            logger: Optional logger
+        """
+        self._parameters = list(
+            parameters if parameters is not None else PARAMETER_DEFAULTS
+        )
+        self._by_idx = {int(p["idx"]): p for p in self._parameters}
+        self._idx_by_name = {
+            str(p["text"]).upper(): int(p["idx"]) for p in self._parameters
+        }
+        self._values: dict[int, bytes] = {}
+        for key, value in (values or {}).items():
+            self.set_value(key, value)
+        self._broadcasts = list(
+            broadcasts if broadcasts is not None else default_broadcasts()
+        )
+        self.faults = faults or FaultConfig()
+        self.frame_time = frame_time
+        self._logger = logger or logging.getLogger(__name__)
+        self._random = random.Random(self.faults.seed)
+
+        self._element_list = encode_element_list(self._parameters)
+        self._chunk = (0, 0)  # (size, offset) of the last data request
+
+        self.stats = SimulatorStats()
+        self.port = ""
+        self._master: Optional[int] = None
+        self._slave: Optional[int] = None
+        self._channel_open = False
+        # (due time, sequence, (kind, payload)) with kind frame/broadcast/filler
+        self._schedule: list[tuple[float, int, tuple[str, Any]]] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def set_value(self, name_or_idx: str | int, value: int | bytes) -> None:
+        """Set the raw value returned for a parameter.
+
+        Args:
+            name_or_idx: Parameter name or idx
+            value: Raw integer (sent as 2 or 4 signed bytes) or payload bytes
+        """
+        if isinstance(name_or_idx, str):
+            idx = self._idx_by_name[name_or_idx.upper()]
+        else:
+            idx = int(name_or_idx)
+        if isinstance(value, int):
+            value = struct.pack(">h" if -0x8000 <= value <= 0x7FFF else ">i", value)
+        self._values[idx] = bytes(value)
+
+    def get_value(self, name_or_idx: str | int) -> bytes:
+        """Return the raw payload currently served for a parameter."""
+        if isinstance(name_or_idx, str):
+            idx = self._idx_by_name[name_or_idx.upper()]
+        else:
+            idx = int(name_or_idx)
+        return self._value_for(idx)
+
+    def start(self) -> HeatPumpSimulator:
+        """Open the pty and start serving."""
+        if self._thread is not None:
+            raise RuntimeError("Simulator already running")
+        import tty  # POSIX only; imported here so the package loads elsewhere
+
+        self._master, self._slave = os.openpty()
+        # Raw mode: no echo, no CR/LF translation on the slave side
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._stop.clear()
+        start = time.monotonic()
+        for broadcast in self._broadcasts:
+            self._push(start + broadcast.phase, ("broadcast", broadcast))
+        if self.faults.bus_load > 0:
+            self._push(start, ("filler", 0))
+        self._thread = threading.Thread(
+            target=self._run, name="heatpump-simulator", daemon=True
+        )
+        self._thread.start()
+        self._logger.info("Heat pump simulator listening on %s", self.port)
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the pty (idempotent)."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(2.0)
+        self._thread = None
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._master = self._slave = None
+        self._schedule.clear()
+
+    def __enter__(self) -> HeatPumpSimulator:
+        return self.start()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.stop()
+
+    # -- event loop ---------------------------------------------------------
+
+    def _push(self, when: float, event: tuple[str, Any]) -> None:
+        with self._lock:
+            heapq.heappush(self._schedule, (when, next(self._sequence), event))
+
+    def _run(self) -> None:
+        master = self._master
+        if master is None:
+            return
+        framer = SlcanFramer()
+        pending = b""
+        while not self._stop.is_set():
+            with self._lock:
+                next_due = self._schedule[0][0] if self._schedule else None
+            wait = (
+                0.1
+                if next_due is None
+                else min(max(next_due - time.monotonic(), 0), 0.1)
+            )
+            try:
+                readable, _, _ = select.select([master], [], [], wait)
+                if readable:
+                    chunk = os.read(master, 4096)
+                    pending = self._handle_input(pending + chunk, framer)
+                self._run_due()
+            except OSError as e:
+                if not self._stop.is_set():
+                    self._logger.error("Simulator I/O error: %s", e)
+                return
+
+    def _run_due(self) -> None:
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._schedule or self._schedule[0][0] > now:
+                    return
+                when, _, event = heapq.heappop(self._schedule)
+            kind, payload = event
+            if kind == "frame":
+                self._write(payload)
+            elif kind == "broadcast":
+                self._emit_broadcast(payload, when)
+            elif kind == "filler":
+                self._emit_filler(payload, when)
+
+    def _handle_input(self, data: bytes, framer: SlcanFramer) -> bytes:
+        """Process complete command lines; return the incomplete remainder."""
+        while True:
+            end = data.find(b"\r")
+            if end < 0:
+                return data
+            line, data = data[:end], data[end + 1 :]
+            self._handle_line(line.strip(b"\n "), framer)
+
+    def _handle_line(self, line: bytes, framer: SlcanFramer) -> None:
+        if not line:
+            self._write(b"\r")
+            return
+        command = line[:1]
+        if command in (b"t", b"T", b"r", b"R"):
+            if not self._channel_open:
+                self.stats.nak += 1
+                self._write(b"\a")
+                return
+            framer.feed(line + b"\r")
+            frame = framer.next_frame()
+            if frame is None:
+                self.stats.nak += 1
+                self._write(b"\a")
+                return
+            self._write(b"Z\r" if frame.is_extended_id else b"z\r")
+            self._handle_frame(frame)
+        elif line in _VERSION_REPLIES:
+            self._write(_VERSION_REPLIES[line])
+        elif line == b"O":
+            self._channel_open = True
+            self._write(b"\r")
+        elif line == b"C":
+            self._channel_open = False
+            self._write(b"\r")
+        elif line[:1] in (b"S", b"s", b"F", b"Z", b"M", b"m", b"W"):
+            self._write(b"\r")
+        else:
+            self.stats.nak += 1
+            self._write(b"\a")
+
+    def _handle_frame(self, frame: CANMessage) -> None:
+        can_id = frame.arbitration_id
+        self.stats.by_id[can_id] = self.stats.by_id.get(can_id, 0) + 1
+
+        if can_id == ELEMENT_COUNT_REQUEST_ID and frame.is_remote_frame:
+            self._respond(
+                ELEMENT_COUNT_RESPONSE_ID,
+                struct.pack(">II", len(self._element_list), 0),
+            )
+        elif can_id == ELEMENT_DATA_REQUEST_ID and not frame.is_remote_frame:
+            if len(frame.data) >= 8:
+                self._chunk = struct.unpack(">II", frame.data[:8])
+        elif can_id == ELEMENT_BUFFER_READ_ID and frame.is_remote_frame:
+            self._stream_chunk()
+        elif can_id & 0x3FFF == 0x3FE0 and can_id >> 26 == CAN_REQUEST_BASE >> 26:
+            idx = (can_id >> 14) & 0xFFF
+            if frame.is_remote_frame:
+                self.stats.rtr_requests += 1
+                if idx not in self._by_idx and idx not in self._values:
+                    self.stats.unknown_requests += 1
+                    return
+                self._respond(CAN_RESPONSE_BASE | (idx << 14), self._value_for(idx))
+            else:
+                # Confirm the write with the stored value on the response ID
+                self.stats.writes += 1
+                self._values[idx] = bytes(frame.data)
+                self._respond(CAN_RESPONSE_BASE | (idx << 14), self._values[idx])
+        else:
+            self.stats.unknown_requests += 1
+
+    def _value_for(self, idx: int) -> bytes:
+        if idx in self._values:
+            return self._values[idx]
+        param = self._by_idx.get(idx)
+        value = max(int(param["min"]), 0) if param else 0
+        return struct.pack(">h" if value <= 0x7FFF else ">i", value)
+
+    def _response_delay(self) -> float:
+        delay = self.faults.latency
+        if self.faults.jitter:
+            delay += self._random.uniform(0, self.faults.jitter)
+        return delay
+
+    def _dropped(self) -> bool:
+        if self.faults.drop_rate and self._random.random() < self.faults.drop_rate:
+            self.stats.dropped += 1
+            return True
+        return False
+
+    def _respond(self, can_id: int, data: bytes) -> None:
+        if self._dropped():
+            return
+        self.stats.responses += 1
+        line = self._frame_line(can_id, data)
+        delay = self._response_delay()
+        if delay > 0:
+            self._push(time.monotonic() + delay, ("frame", line))
+        else:
+            self._write(line)
+
+    def _stream_chunk(self) -> None:
+        size, offset = self._chunk
+        blob = self._element_list[offset : offset + size]
+        when = time.monotonic() + self._response_delay()
+        for pos in range(0, len(blob), 8):
+            when += self.frame_time
+            if self._dropped():
+                continue
+            self.stats.stream_frames += 1
+            line = self._frame_line(ELEMENT_DATA_RESPONSE_ID, blob[pos : pos + 8])
+            self._push(when, ("frame", line))
+
+    def _emit_broadcast(self, broadcast: SimulatedBroadcast, when: float) -> None:
+        self.stats.broadcasts += 1
+        self._write(self._frame_line(broadcast.can_id, broadcast.data))
+        self._push(when + broadcast.period, ("broadcast", broadcast))
+
+    def _emit_filler(self, count: int, when: float) -> None:
+        can_id = FILLER_CAN_ID | ((count % 64) << 14)
+        self._write(self._frame_line(can_id, struct.pack(">I", count & 0xFFFFFFFF)))
+        self._push(when + 1.0 / self.faults.bus_load, ("filler", count + 1))
+
+    @staticmethod
+    def _frame_line(can_id: int, data: bytes) -> bytes:
+        frame = CANMessage(arbitration_id=can_id, data=data, is_extended_id=True)
+        return frame.to_usbtin_format().encode("ascii")
+
+    def _write(self, data: bytes) -> None:
+        if self._master is not None:
+            os.write(self._master, data)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Simulated Buderus WPS heat pump behind a USBtin on a pty"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="response latency (s)"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="random extra latency (s)"
+    )
+    parser.add_argument(
+        "--drop-rate", type=float, default=0.0, help="response drop probability"
+    )
+    parser.add_argument(
+        "--bus-load", type=float, default=0.0, help="filler frames per second"
+    )
+    parser.add_argument(
+        "--broadcast-period",
+        type=float,
+        default=DEFAULT_BROADCAST_PERIOD,
+        help="period of the default broadcasts (s)",
+    )
+    parser.add_argument(
+        "--from-capture", default=None, help="learn broadcasts from a FHEM capture"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    if args.from_capture:
+        from .replay_adapter import load_fhem_capture
+
+        broadcasts = broadcasts_from_capture(load_fhem_capture(args.from_capture))
+    else:
+        broadcasts = default_broadcasts(args.broadcast_period)
+
+    simulator = HeatPumpSimulator(
+        broadcasts=broadcasts,
+        faults=FaultConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            drop_rate=args.drop_rate,
+            bus_load=args.bus_load,
+            seed=args.seed,
+        ),
+    )
+    with simulator:
+        print(simulator.port, flush=True)
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
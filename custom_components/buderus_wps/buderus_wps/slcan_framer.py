@@ -0,0 +1,296 @@
+"""Incremental SLCAN framer over a preallocated receive buffer.
+
+The USBtin delivers SLCAN lines (``T<IIIIIIII><L><DD..>\\r``) in arbitrary
+chunks; a single serial read during an element-list transfer or a broadcast
+burst can carry several kilobytes. SlcanFramer accumulates those chunks in
+one preallocated bytearray and parses complete lines in place:
+
+- Chunks are copied once into the buffer (or read straight into it with
+  ``readinto``); consumed bytes are reclaimed by advancing a read cursor and
+  compacting only when the free tail runs out.
+- ID, DLC and payload are decoded from the raw bytes (binascii.unhexlify on
+  memoryview slices plus a nibble lookup table), so no intermediate ``str``
+  or per-line ``bytes`` objects are created.
+- drain() returns every complete frame as one batch; drain_payloads() skips
+  CANMessage construction entirely and appends payload bytes of matching
+  frames to a caller-owned bytearray (element-list streams).
+
+Lines that are not frames (``\\r`` acks, ``z``/``Z`` transmit acks, version
+replies) are skipped. Malformed frame lines are counted and, if a fallback
+parser is supplied, handed to it.
+"""
+
+from __future__ import annotations
+
+import binascii
+from typing import Any, Callable, Optional
+
+from .can_message import CANMessage
+
+# Initial receive buffer size; grows by doubling if a caller never drains
+DEFAULT_BUFFER_SIZE = 16384
+
+_STRIP = b"\a\n "
+
+# ASCII byte -> nibble value, 0xFF for non-hex characters
+_HEX = bytes(
+    int(chr(b), 16) if chr(b) in "0123456789abcdefABCDEF" else 0xFF for b in range(256)
+)
+
+# Frame type byte -> (is_extended, is_remote, id_len)
+_FRAME_TYPES = {
+    ord("t"): (False, False, 3),
+    ord("T"): (True, False, 8),
+    ord("r"): (False, True, 3),
+    ord("R"): (True, True, 8),
+}
+
+
+class SlcanFramer:
+    """Accumulate serial chunks and parse complete SLCAN frames.
+
+    Not thread-safe; each reader owns its own framer.
+
+    Attributes:
+        malformed: Number of frame lines that failed to parse
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_BUFFER_SIZE,
+        fallback: Optional[Callable[[bytes], Optional[CANMessage]]] = None,
+    ) -> None:
+        """Initialize framer.
+
+        Args:
+            size: Initial buffer capacity in bytes
+            fallback: Optional parser for malformed frame lines
+        """
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+        self._start = 0  # first unconsumed byte
+        self._end = 0  # one past the last buffered byte
+        self._fallback = fallback
+        self.malformed = 0
+
+    def __len__(self) -> int:
+        """Number of buffered, not yet consumed bytes."""
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        """Current buffer capacity in bytes."""
+        return len(self._buf)
+
+    def reset(self) -> None:
+        """Discard all buffered data (e.g. on input flush)."""
+        self._start = self._end = 0
+
+    def feed(self, chunk: bytes) -> None:
+        """Append a received chunk to the buffer."""
+        n = len(chunk)
+        if n:
+            self._reserve(n)
+            self._view[self._end : self._end + n] = chunk
+            self._end += n
+
+    def readinto(self, port: Any, size: int) -> int:
+        """Read up to ``size`` bytes from ``port`` straight into the buffer.
+
+        Args:
+            port: Object with a readinto(buffer) method (e.g. serial.Serial)
+            size: Maximum number of bytes to read
+
+        Returns:
+            Number of bytes read
+        """
+        self._reserve(size)
+        n = port.readinto(self._view[self._end : self._end + size]) or 0
+        self._end += n
+        return n
+
+    def next_frame(self) -> Optional[CANMessage]:
+        """Parse and consume lines up to the next complete frame.
+
+        Returns:
+            Next CANMessage, or None if no complete frame is buffered
+        """
+        while True:
+            line_end = self._buf.find(b"\r", self._start, self._end)
+            if line_end < 0:
+                self._compact_if_empty()
+                return None
+            start = self._start
+            self._start = line_end + 1
+            msg = self._parse_line(start, line_end)
+            if msg is not None:
+                return msg
+
+    def drain(self) -> list[CANMessage]:
+        """Parse and consume every complete line in the buffer.
+
+        Returns:
+            Frames in arrival order (may be empty)
+        """
+        frames = []
+        buf = self._buf
+        pos = self._start
+        end = self._end
+        while True:
+            line_end = buf.find(b"\r", pos, end)
+            if line_end < 0:
+                break
+            msg = self._parse_line(pos, line_end)
+            pos = line_end + 1
+            if msg is not None:
+                frames.append(msg)
+        self._start = pos
+        self._compact_if_empty()
+        return frames
+
+    def drain_payloads(self, out: bytearray, can_id: Optional[int] = None) -> int:
+        """Append the payload of every complete data frame to ``out``.
+
+        Frames are not materialized as CANMessage objects; the hex payload is
+        decoded straight from the receive buffer.
+
+        Args:
+            out: Destination buffer
+            can_id: Only include frames with this arbitration ID (None = all)
+
+        Returns:
+            Number of frames whose payload was appended
+        """
+        buf = self._buf
+        view = self._view
+        pos = self._start
+        end = self._end
+        count = 0
+        while True:
+            line_end = buf.find(b"\r", pos, end)
+            if line_end < 0:
+                break
+            start, stop = self._trim(pos, line_end)
+            pos = line_end + 1
+            kind = _FRAME_TYPES.get(buf[start]) if start < stop else None
+            if kind is None:
+                continue
+            extended, remote, id_len = kind
+            parsed = self._parse_header(start, stop, id_len, remote)
+            if parsed is None:
+                msg = self._malformed(start, stop)
+                if msg is not None and (can_id is None or msg.arbitration_id == can_id):
+                    out += msg.data
+                    count += 1
+                continue
+            arbitration_id, data_start = parsed
+            if remote or (can_id is not None and arbitration_id != can_id):
+                continue
+            try:
+                out += binascii.unhexlify(view[data_start:stop])
+            except binascii.Error:
+                self.malformed += 1
+                continue
+            count += 1
+        self._start = pos
+        self._compact_if_empty()
+        return count
+
+    def _reserve(self, n: int) -> None:
+        """Make room for ``n`` more bytes after the write cursor."""
+        if self._end + n <= len(self._buf):
+            return
+        pending = self._end - self._start
+        if pending + n > len(self._buf):
+            size = len(self._buf)
+            while pending + n > size:
+                size *= 2
+            self._view.release()
+            grown = bytearray(size)
+            grown[:pending] = self._buf[self._start : self._end]
+            self._buf = grown
+            self._view = memoryview(self._buf)
+        elif pending:
+            self._view[:pending] = self._view[self._start : self._end]
+        self._start = 0
+        self._end = pending
+
+    def _compact_if_empty(self) -> None:
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def _trim(self, start: int, stop: int) -> tuple[int, int]:
+        buf = self._buf
+        while start < stop and buf[start] in _STRIP:
+            start += 1
+        while stop > start and buf[stop - 1] in _STRIP:
+            stop -= 1
+        return start, stop
+
+    def _parse_header(
+        self, start: int, stop: int, id_len: int, remote: bool
+    ) -> Optional[tuple[int, int]]:
+        """Decode ID and DLC of the line at buf[start:stop].
+
+        Payload hex digits are validated later by unhexlify.
+
+        Returns:
+            (arbitration_id, data_start), or None if the line is malformed
+        """
+        buf = self._buf
+        data_start = start + 2 + id_len
+        if stop < data_start:
+            return None
+        if id_len == 8:
+            try:
+                arbitration_id = int.from_bytes(
+                    binascii.unhexlify(self._view[start + 1 : start + 9]), "big"
+                )
+            except binascii.Error:
+                return None
+        else:
+            hi, mid, lo = (
+                _HEX[buf[start + 1]],
+                _HEX[buf[start + 2]],
+                _HEX[buf[start + 3]],
+            )
+            if 0xFF in (hi, mid, lo):
+                return None
+            arbitration_id = (hi << 8) | (mid << 4) | lo
+        dlc = _HEX[buf[data_start - 1]]
+        if dlc > 8:
+            return None
+        if not remote and stop - data_start != dlc * 2:
+            return None
+        return arbitration_id, data_start
+
+    def _parse_line(self, start: int, stop: int) -> Optional[CANMessage]:
+        start, stop = self._trim(start, stop)
+        if start >= stop:
+            return None
+        kind = _FRAME_TYPES.get(self._buf[start])
+        if kind is None:
+            return None  # ack or other non-frame reply
+        extended, remote, id_len = kind
+        parsed = self._parse_header(start, stop, id_len, remote)
+        if parsed is None:
+            return self._malformed(start, stop)
+        arbitration_id, data_start = parsed
+        try:
+            msg = CANMessage(
+                arbitration_id=arbitration_id,
+                data=b"" if remote else binascii.unhexlify(self._view[data_start:stop]),
+                is_extended_id=extended,
+                is_remote_frame=remote,
+            )
+        except ValueError:  # includes binascii.Error (bad payload hex)
+            return self._malformed(start, stop)
+        if remote:
+            object.__setattr__(msg, "_requested_dlc", _HEX[self._buf[data_start - 1]])
+        return msg
+
+    def _malformed(self, start: int, stop: int) -> Optional[CANMessage]:
+        self.malformed += 1
+        if self._fallback is None:
+            return None
+        return self._fallback(bytes(self._view[start:stop]))
@@ -0,0 +1,264 @@
+"""Fixed-size time series of broadcast values.
+
+BroadcastCache keeps only the latest reading per CAN ID. BroadcastHistory
+keeps recent samples per (base, idx) so callers can smooth values, filter
+glitches or compute rates without an external store:
+
+- Each key owns a TimeSeries ring buffer backed by two preallocated
+  ``array`` objects (float64 timestamps, int16 raw values). Memory per key
+  is fixed at 10 bytes per slot and appending is O(1), so memory stays flat
+  however long the monitor runs.
+- Window queries bisect the timestamps to find the window start and run
+  min/max/sum over array slices, so the per-sample work happens in C.
+- downsample() folds samples into aligned buckets (1 minute by default).
+
+Values are stored raw (as decoded by parse_broadcast_frame); temperatures
+are tenths of a degree.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Optional
+
+# Samples kept per key: two hours at a 10 s broadcast period
+DEFAULT_CAPACITY = 720
+
+# Default downsampling bucket width (seconds)
+DEFAULT_BUCKET = 60.0
+
+# Bytes per ring buffer slot (float64 timestamp + int16 value)
+SLOT_SIZE = 10
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    """Aggregate of the raw samples in a time window or bucket.
+
+    Attributes:
+        start: Window/bucket start time
+        end: Window/bucket end time
+        count: Number of samples
+        min: Smallest raw value
+        max: Largest raw value
+        mean: Average raw value
+        last: Most recent raw value
+    """
+
+    start: float
+    end: float
+    count: int
+    min: int
+    max: int
+    mean: float
+    last: int
+
+    @property
+    def rate(self) -> float:
+        """Samples per second over the window."""
+        span = self.end - self.start
+        return self.count / span if span > 0 else 0.0
+
+
+def _stats(start: float, end: float, values: array) -> WindowStats:
+    count = len(values)
+    return WindowStats(
+        start=start,
+        end=end,
+        count=count,
+        min=min(values),
+        max=max(values),
+        mean=sum(values) / count,
+        last=values[-1],
+    )
+
+
+class TimeSeries:
+    """Ring buffer of (timestamp, int16 value) samples.
+
+    Timestamps are expected to be non-decreasing; a sample older than the
+    newest one is stored with the newest timestamp so that bisecting stays
+    valid after wall-clock adjustments. Not thread-safe on its own; see
+    BroadcastHistory.
+    """
+
+    __slots__ = ("capacity", "_times", "_values", "_next", "_count")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("h", bytes(2 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, value: int) -> None:
+        """Add a sample, overwriting the oldest one when full."""
+        i = self._next
+        if self._count:
+            newest = self._times[i - 1]
+            if timestamp < newest:
+                timestamp = newest
+        self._times[i] = timestamp
+        self._values[i] = value
+        self._next = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def last(self) -> Optional[tuple[float, int]]:
+        """Return the newest (timestamp, value), or None if empty."""
+        if not self._count:
+            return None
+        i = self._next - 1
+        return self._times[i], self._values[i]
+
+    def samples(self, since: Optional[float] = None) -> tuple[array, array]:
+        """Copy samples in chronological order.
+
+        Args:
+            since: Only samples with timestamp >= since
+
+        Returns:
+            (timestamps, values) arrays
+        """
+        if self._count < self.capacity:
+            segments = [(0, self._count)]
+        else:
+            segments = [(self._next, self.capacity), (0, self._next)]
+
+        times = array("d")
+        values = array("h")
+        for lo, hi in segments:
+            if since is not None:
+                lo = bisect.bisect_left(self._times, since, lo, hi)
+            times.extend(self._times[lo:hi])
+            values.extend(self._values[lo:hi])
+        return times, values
+
+    def window(
+        self, seconds: float, now: Optional[float] = None
+    ) -> Optional[WindowStats]:
+        """Aggregate the samples of the last ``seconds``.
+
+        Args:
+            seconds: Window length
+            now: Window end (default: time.time())
+
+        Returns:
+            WindowStats, or None if the window holds no samples
+        """
+        end = time.time() if now is None else now
+        start = end - seconds
+        _, values = self.samples(since=start)
+        if not values:
+            return None
+        return _stats(start, end, values)
+
+    def downsample(
+        self, bucket: float = DEFAULT_BUCKET, since: Optional[float] = None
+    ) -> list[WindowStats]:
+        """Aggregate samples into buckets aligned to multiples of ``bucket``.
+
+        Args:
+            bucket: Bucket width in seconds
+            since: Only samples with timestamp >= since
+
+        Returns:
+            One WindowStats per non-empty bucket, oldest first
+        """
+        times, values = self.samples(since=since)
+        result = []
+        i, n = 0, len(times)
+        while i < n:
+            start = math.floor(times[i] / bucket) * bucket
+            j = bisect.bisect_left(times, start + bucket, i)
+            result.append(_stats(start, start + bucket, values[i:j]))
+            i = j
+        return result
+
+
+class BroadcastHistory:
+    """Per-(base, idx) sample history shared by BroadcastMonitor and its readers.
+
+    Series are created on first sample. Recording and queries are guarded by
+    one lock, so the monitor thread can append while other threads query.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        keys: Optional[Iterable[tuple[int, int]]] = None,
+    ) -> None:
+        """Initialize the history.
+
+        Args:
+            capacity: Samples kept per key
+            keys: If given, only these (base, idx) keys are recorded
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._keys = frozenset(keys) if keys is not None else None
+        self._series: dict[tuple[int, int], TimeSeries] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: tuple[int, int], timestamp: float, value: int) -> None:
+        """Append a raw value for a (base, idx) key."""
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                if self._keys is not None and key not in self._keys:
+                    return
+                series = self._series[key] = TimeSeries(self.capacity)
+            series.append(timestamp, value)
+
+    def keys(self) -> list[tuple[int, int]]:
+        """Keys with at least one sample."""
+        with self._lock:
+            return list(self._series)
+
+    def last(self, base: int, idx: int) -> Optional[tuple[float, int]]:
+        """Newest (timestamp, raw value) of a key."""
+        with self._lock:
+            series = self._series.get((base, idx))
+            return series.last() if series is not None else None
+
+    def window(
+        self, base: int, idx: int, seconds: float, now: Optional[float] = None
+    ) -> Optional[WindowStats]:
+        """Min/max/mean/last of a key over the last ``seconds``."""
+        with self._lock:
+            series = self._series.get((base, idx))
+            return series.window(seconds, now=now) if series is not None else None
+
+    def downsample(
+        self,
+        base: int,
+        idx: int,
+        bucket: float = DEFAULT_BUCKET,
+        since: Optional[float] = None,
+    ) -> list[WindowStats]:
+        """Bucketed aggregates of a key (1-minute buckets by default)."""
+        with self._lock:
+            series = self._series.get((base, idx))
+            return series.downsample(bucket, since=since) if series is not None else []
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the ring buffers."""
+        return len(self._series) * self.capacity * SLOT_SIZE
+
+    def clear(self) -> None:
+        """Drop all series."""
+        with self._lock:
+            self._series.clear()
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
-from typing import Any
+from typing import Any, Callable, TypeVar
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
@@ -37,9 +38,91 @@ from .const import (
 LOCK_ACQUIRE_TIMEOUT = 5.0
 # Timeout for sync executor jobs (prevent indefinite hangs)
 EXECUTOR_JOB_TIMEOUT = 10.0
+# Broadcast readings older than this are treated as missing (seconds).
+# Broadcasts repeat every 15-32 s, so this tolerates a few lost frames.
+BROADCAST_MAX_AGE = 120.0
+
+# Longest wait for stale mapped broadcasts that normally repeat within it
+BROADCAST_WAIT = 5.0
+
+# Mapped broadcast temperatures are pushed to entities between polls, at
+# most once per interval (seconds) and only when a sensor moved at least its
+# deadband (°C) away from the value entities show
+BROADCAST_PUSH_INTERVAL = 5.0
+BROADCAST_DEADBAND_DEFAULT = 0.2
+BROADCAST_DEADBAND = {
+    # Room setpoints only change when set; show every change
+    SENSOR_SETPOINT_C1: 0.0,
+    SENSOR_SETPOINT_C2: 0.0,
+    SENSOR_SETPOINT_C3: 0.0,
+    SENSOR_SETPOINT_C4: 0.0,
+}
+
+# Polling plan: interval in seconds per item; the ReadSpecs of each item
+# are built by BuderusCoordinator._build_read_plan(). Each update reads only
+# the items that are due, in one pipelined batch; the other values keep
+# their last good reading. The parameter allowlist is polled as a further
+# item at the configured scan interval.
+POLL_COMPRESSOR = "compressor"
+POLL_TEMPERATURES = "temperatures"
+POLL_STATUS = "status"
+POLL_SETTINGS = "settings"
+POLL_ALLOWLIST = "allowlist"
+POLL_INTERVALS = {
+    POLL_COMPRESSOR: 10.0,
+    POLL_TEMPERATURES: 30.0,
+    POLL_STATUS: 30.0,
+    POLL_SETTINGS: 900.0,
+}
+# Coordinator update interval: the fastest item of the plan
+POLL_TICK = min(POLL_INTERVALS.values())
+
+# Parameters this installation does not answer (missing or dead sensors) are
+# only probed hourly; the map persists next to the element discovery cache
+CAPABILITY_MAP_PATH = "/config/buderus_wps_capabilities.json"
+
+# Element discovery cache (binary), and the JSON cache of earlier versions
+# it replaces
+ELEMENT_CACHE_PATH = "/config/buderus_wps_elements.bin"
+LEGACY_ELEMENT_CACHE_PATH = "/config/buderus_wps_elements.json"
+
+# Temperatures read via RTR; they override the broadcast value of the sensor
+RTR_TEMPERATURES = {
+    # PROTOCOL: GT3_TEMP must be read via RTR, NOT broadcast.
+    # The broadcast mapping in config.py is incorrect - broadcasts don't contain GT3.
+    # Element discovery finds the correct idx (682 on tested heat pump, varies by model).
+    # The raw sensor value is returned; display may show +4K adjustment (GT3_KORRIGERING).
+    # Verified 2026-01-02: idx=682 returns correct DHW temperature via RTR.
+    "GT3_TEMP": SENSOR_DHW,
+    # Heat transfer fluid OUT/IN. Broadcast values can be offset on some
+    # models; RTR provides the menu value.
+    "GT8_TEMP": SENSOR_SUPPLY,
+    "GT9_TEMP": SENSOR_RETURN,
+    # Collector circuit inlet/outlet (brine in/out). Discovered idx varies by
+    # firmware (~638/~652 in FHEM reference); not all models have them.
+    "GT10_TEMP": SENSOR_BRINE_IN,
+    "GT11_TEMP": SENSOR_BRINE_OUT,
+}
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+def broadcast_read_mapping() -> dict[str, tuple[int | None, int]]:
+    """Parameters the client may answer from broadcasts, minus RTR_TEMPERATURES.
+
+    The RTR temperatures are polled by RTR on purpose (see above), so a fresh
+    broadcast must not stand in for them.
+    """
+    from .buderus_wps.broadcast_monitor import PARAM_TO_BROADCAST
+
+    return {
+        name: key
+        for name, key in PARAM_TO_BROADCAST.items()
+        if name not in RTR_TEMPERATURES
+    }
+
 
 @dataclass
 class BuderusData:
@@ -77,20 +160,45 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=timedelta(seconds=min(scan_interval, POLL_TICK)),
         )
         self.port = port
+        self.scan_interval = scan_interval
         self._adapter: Any = None
         self._client: Any = None
         self._registry: Any = None
         self._monitor: Any = None
         self._api: Any = None
         self.energy_blocking: Any = None
+        # BusMetrics shared by adapter and client; kept across reconnects
+        self.metrics: Any = None
+        # ResponseCache of the current connection's client
+        self.response_cache: Any = None
+        # Serializes writes and on-demand reads; updates hold their own lock
+        # so a write never waits for a whole poll cycle, only for the bus
+        # transaction in progress (see BusArbiter)
         self._lock = asyncio.Lock()
+        self._update_lock = asyncio.Lock()
+        # BusArbiter shared by every client; kept across reconnects
+        self.arbiter = self._create_bus_arbiter()
         self._connected = False
         self._parameter_allowlist = [
             item for item in (parameter_allowlist or []) if str(item).strip()
         ]
+        # Read specs per poll item and the engine keeping their last good
+        # values; the scheduler is replaced on connect so every item is read
+        self._read_plan = self._build_read_plan()
+        self.capabilities = self._create_capability_map()
+        self._read_engine = self._create_read_engine()
+        self._poll_scheduler = self._create_poll_scheduler()
+        # RTR temperature sensors whose last RTR read succeeded
+        self._rtr_temperature_sensors: set[str] = set()
+        # Broadcast push: (base, idx) -> sensor, and values waiting for a push
+        self._broadcast_sensors: dict[tuple[int, int], str] = {}
+        self._pending_push: dict[str, float] = {}
+        self._push_scheduled = False
+        self._push_lock = threading.Lock()
+        self._last_push = float("-inf")
         # Exponential backoff for reconnection
         self._backoff_delay = BACKOFF_INITIAL
         self._reconnect_task: asyncio.Task[None] | None = None
@@ -113,6 +221,184 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         """Return configured parameter allowlist entries."""
         return list(self._parameter_allowlist)
 
+    def _build_read_plan(self) -> dict[str, tuple[Any, ...]]:
+        """ReadSpecs of each poll item (lower priority values are read first)."""
+        from .buderus_wps.read_spec import (
+            ReadSpec,
+            parse_bool,
+            parse_float,
+            parse_int,
+        )
+
+        plan: dict[str, tuple[Any, ...]] = {
+            # PROTOCOL: COMPRESSOR_STATE > 0 indicates compressor running (primary)
+            # COMPRESSOR_REAL_FREQUENCY is kept as a secondary debug signal.
+            POLL_COMPRESSOR: (
+                ReadSpec("COMPRESSOR_STATE", parser=parse_int, retries=2),
+                ReadSpec("COMPRESSOR_REAL_FREQUENCY", parser=parse_int),
+            ),
+            POLL_TEMPERATURES: tuple(
+                ReadSpec(name, expected_dlc=2, parser=parse_float, priority=1)
+                for name in RTR_TEMPERATURES
+            ),
+            POLL_STATUS: (
+                # COMPRESSOR_BLOCKED (idx 247) is both the compressor block
+                # status and the energy blocking state
+                ReadSpec("COMPRESSOR_BLOCKED", parser=parse_bool, priority=1),
+                ReadSpec(
+                    "PUMP_DHW_ACTIVE", parser=parse_bool, fallback=False, priority=1
+                ),
+                # Main/Heating pump
+                ReadSpec(
+                    "PUMP_G1_CONTINUAL", parser=parse_bool, fallback=False, priority=1
+                ),
+                ReadSpec("XDHW_TIME", parser=parse_int, fallback=0, priority=1),
+                # PROTOCOL: DHW_CALCULATED_SETPOINT_TEMP is the normal DHW
+                # setpoint (40-70°C). Note: parameter_defaults.py idx corrected
+                # from 385 to 386 per FHEM discovery
+                ReadSpec(
+                    "DHW_CALCULATED_SETPOINT_TEMP", parser=parse_float, priority=1
+                ),
+            ),
+            POLL_SETTINGS: (
+                ReadSpec("HEATING_SEASON_MODE", parser=parse_int, priority=2),
+                ReadSpec("DHW_PROGRAM_MODE", parser=parse_int, priority=2),
+                # PROTOCOL: Use GLOBAL parameter (idx=804) which is the
+                # user-adjustable "Parallel offset" in the heat pump menu; the
+                # non-GLOBAL version (idx=802) is an internal parameter
+                ReadSpec(
+                    "HEATING_CURVE_PARALLEL_OFFSET_GLOBAL",
+                    parser=parse_float,
+                    priority=2,
+                ),
+                # PROTOCOL: XDHW_STOP_TEMP controls when DHW charging stops (50-65°C)
+                ReadSpec("XDHW_STOP_TEMP", parser=parse_float, priority=2),
+            ),
+        }
+        if self._parameter_allowlist:
+            plan[POLL_ALLOWLIST] = tuple(
+                ReadSpec(
+                    self._coerce_parameter_key(key),
+                    expected_dlc=0,
+                    priority=3,
+                    key=f"{POLL_ALLOWLIST}:{key}",
+                )
+                for key in self._parameter_allowlist
+            )
+        return plan
+
+    def _create_response_cache(self) -> Any:
+        """Build the response cache; only POLL_SETTINGS values may be cached.
+
+        The other poll items read live values at their own interval, so their
+        parameters get TTL 0 whatever their metadata suggests.
+        """
+        from .buderus_wps.response_cache import ResponseCache
+
+        live: dict[str, float] = {}
+        for key, specs in self._read_plan.items():
+            if key == POLL_SETTINGS:
+                continue
+            for spec in specs:
+                param = (
+                    self._registry.get_parameter(spec.name)
+                    if self._registry is not None
+                    else None
+                )
+                live[param.text if param is not None else str(spec.name)] = 0.0
+        return ResponseCache(ttl_overrides=live)
+
+    def _create_bus_arbiter(self) -> Any:
+        from .buderus_wps.bus_arbiter import BusArbiter
+
+        return BusArbiter()
+
+    def _create_capability_map(self) -> Any:
+        """Build the map of unavailable parameters (loaded on connect)."""
+        from .buderus_wps.capabilities import CapabilityMap
+
+        return CapabilityMap(CAPABILITY_MAP_PATH)
+
+    def _create_read_engine(self) -> Any:
+        """Build the ReadEngine for all specs of the read plan."""
+        from .buderus_wps.read_spec import ReadEngine
+
+        return ReadEngine(
+            (spec for specs in self._read_plan.values() for spec in specs),
+            capabilities=self.capabilities,
+        )
+
+    def _create_poll_scheduler(self) -> Any:
+        """Build the scheduler for the poll items of the read plan."""
+        from .buderus_wps.poll_scheduler import PollItem, PollScheduler
+
+        return PollScheduler(
+            PollItem(
+                key,
+                tuple(spec.name for spec in specs),
+                POLL_INTERVALS.get(key, float(self.scan_interval)),
+            )
+            for key, specs in self._read_plan.items()
+        )
+
+    def _on_broadcast(self, reading: Any) -> None:
+        """Queue a mapped broadcast temperature for pushing (monitor thread).
+
+        Values within the sensor's deadband of what entities show are
+        dropped; the rest are pushed together, at most once per
+        BROADCAST_PUSH_INTERVAL.
+        """
+        sensor = self._broadcast_sensors.get((reading.base, reading.idx))
+        data = self.data
+        if (
+            sensor is None
+            or data is None
+            or not reading.is_temperature
+            or sensor in self._rtr_temperature_sensors
+        ):
+            return
+        value = reading.temperature
+        current = data.temperatures.get(sensor)
+        if current is not None:
+            deadband = BROADCAST_DEADBAND.get(sensor, BROADCAST_DEADBAND_DEFAULT)
+            if value == current or abs(value - current) < deadband:
+                return
+
+        with self._push_lock:
+            self._pending_push[sensor] = value
+            if self._push_scheduled:
+                return
+            self._push_scheduled = True
+        delay = max(self._last_push + BROADCAST_PUSH_INTERVAL - time.monotonic(), 0.0)
+        self.hass.loop.call_soon_threadsafe(
+            self.hass.loop.call_later, delay, self._push_broadcasts
+        )
+
+    def _push_broadcasts(self) -> None:
+        """Merge queued broadcast temperatures into data and notify entities.
+
+        Uses async_update_listeners() rather than async_set_updated_data(),
+        which would reschedule the next poll and starve it while pushes keep
+        coming.
+        """
+        with self._push_lock:
+            pending, self._pending_push = self._pending_push, {}
+            self._push_scheduled = False
+        if self.data is None or not pending:
+            return
+        self._last_push = time.monotonic()
+        data = replace(self.data, temperatures={**self.data.temperatures, **pending})
+        if self._last_known_good_data is self.data:
+            self._last_known_good_data = data
+        self.data = data
+        _LOGGER.debug("Pushed broadcast temperatures: %s", pending)
+        self.async_update_listeners()
+
+    def request_poll(self, *keys_or_parameters: Any) -> None:
+        """Read poll items or parameters on the next update (e.g. after a write)."""
+        for key in keys_or_parameters:
+            self._poll_scheduler.mark_due(key)
+
     async def async_setup(self) -> bool:
         """Set up the connection to the heat pump."""
         try:
@@ -292,21 +578,40 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         # Import bundled library using relative imports
         from .buderus_wps import (
             BroadcastMonitor,
+            BroadcastReadPolicy,
             EnergyBlockingControl,
             HeatPump,
             HeatPumpClient,
             USBtinAdapter,
+            get_default_sensor_map,
         )
         from .buderus_wps.element_discovery import ElementDiscovery
         from .buderus_wps.menu_api import MenuAPI
+        from .buderus_wps.metrics import BusMetrics
 
         _LOGGER.debug("Connecting to heat pump at %s", self.port)
 
-        self._adapter = USBtinAdapter(self.port)
+        if self.metrics is None:
+            self.metrics = BusMetrics()
+        self._adapter = USBtinAdapter(self.port, metrics=self.metrics)
         self._adapter.connect()
+        # Single reader thread demultiplexes RTR responses and broadcasts by
+        # CAN ID, so discovery, polling and writes can share the port.
+        self._adapter.start_reader()
+
+        # Collect broadcasts continuously from the shared reader, starting
+        # before discovery so the first update already has readings
+        self._monitor = BroadcastMonitor(self._adapter)
+        self._broadcast_sensors = get_default_sensor_map()
+        self._monitor.add_callback(self._on_broadcast)
+        self._monitor.start()
 
         # Create registry with static defaults first
         self._registry = HeatPump()
+        if self.capabilities.load():
+            unavailable = self.capabilities.unavailable()
+            if unavailable:
+                _LOGGER.info("Parameters probed only hourly: %s", unavailable)
 
         # Run element discovery to get actual device indices
         # This is critical because firmware versions may have different idx values
@@ -318,26 +623,42 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         # silently use static defaults which produce wrong readings.
         from .buderus_wps.exceptions import DiscoveryRequiredError
 
-        cache_path = "/config/buderus_wps_elements.json"
+        cache_path = ELEMENT_CACHE_PATH
         _LOGGER.info("Element discovery cache path: %s", cache_path)
 
+        # Downloaded elements update the registry one chunk at a time, so a
+        # download that fails midway still corrects the indices it received
+        updated = 0
+        last_applied: list[Any] = []
+
+        def apply_elements(elements: list[Any]) -> None:
+            nonlocal updated
+            updated += self._registry.apply_discovery(elements)
+            last_applied[:] = elements[-1:]
+
         try:
             discovery = ElementDiscovery(self._adapter)
             # Use cache to speed up subsequent connections
-            # Cache expires after 24 hours or if previous discovery was incomplete
+            # After 24 hours the cache is revalidated (element count and first
+            # chunk) and only re-downloaded if the element list changed; an
+            # incomplete previous discovery resumes where it stopped
             # On discovery failure:
             #   - With valid cache: falls back to cached data
             #   - Without cache (fresh install): raises DiscoveryRequiredError
             discovered = discovery.discover_with_cache(
                 cache_path=cache_path,
+                legacy_path=LEGACY_ELEMENT_CACHE_PATH,
                 refresh=False,  # Use cache if available
-                max_cache_age=86400.0,  # 24 hours - refresh stale cache
+                max_cache_age=86400.0,  # 24 hours - revalidate stale cache
                 timeout=30.0,
                 max_retries=3,  # Retry incomplete discovery up to 3 times
                 min_completion_ratio=0.95,  # Require 95% of reported elements
+                on_elements=apply_elements,
             )
             if discovered:
-                updated = self._registry.update_from_discovery(discovered)
+                # Only elements loaded from the cache are not applied yet
+                if not last_applied or last_applied[0] is not discovered[-1]:
+                    updated += self._registry.apply_discovery(discovered)
                 _LOGGER.info(
                     "Element discovery: %d elements, %d indices updated",
                     len(discovered),
@@ -375,15 +696,31 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
                 err,
             )
 
-        self._client = HeatPumpClient(self._adapter, self._registry)
-        self._monitor = BroadcastMonitor(self._adapter)
+        # Parameters that are also broadcast are read from the monitor's
+        # cache while fresh, and slow-changing settings from earlier
+        # responses, instead of by RTR
+        self.response_cache = self._create_response_cache()
+        self._client = HeatPumpClient(
+            self._adapter,
+            self._registry,
+            read_policy=BroadcastReadPolicy(
+                self._monitor.cache,
+                default_max_age=BROADCAST_MAX_AGE,
+                mapping=broadcast_read_mapping(),
+            ),
+            response_cache=self.response_cache,
+            arbiter=self.arbiter,
+        )
         self._api = MenuAPI(self._client)
         self.energy_blocking = EnergyBlockingControl(self._client)
+        self._poll_scheduler = self._create_poll_scheduler()
 
         _LOGGER.info("Successfully connected to heat pump at %s", self.port)
 
     def _sync_disconnect(self) -> None:
         """Synchronous disconnect (runs in executor)."""
+        if self._monitor:
+            self._monitor.stop()
         if self._adapter:
             try:
                 self._adapter.disconnect()
@@ -417,7 +754,11 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         expected_dlc: int | None = None,
         timeout: float | None = None,
     ) -> dict[str, Any]:
-        """Read any parameter via RTR using the active client."""
+        """Read any parameter via RTR using the active client.
+
+        Broadcasts and cached responses are bypassed: the service reports
+        what the heat pump answers now.
+        """
         async with self._lock:
             if not self._connected or self._client is None:
                 raise HomeAssistantError("Not connected to heat pump")
@@ -440,7 +781,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
                 coerced, expected_dlc=expected_dlc, timeout=timeout
             )
         else:
-            result = self._client.read_parameter(coerced, timeout=timeout)
+            result = self._client.read_parameter(coerced, timeout=timeout, local=False)
         return self._normalize_parameter_result(result)
 
     async def async_list_parameters(
@@ -486,7 +827,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         Per FR-011: Always return cached data when available (indefinite retention).
         Only raise UpdateFailed if no cache exists yet.
         """
-        async with self._lock:
+        async with self._update_lock:
             if not self._connected:
                 # Always return cached data if available (no threshold check)
                 if self._last_known_good_data is not None:
@@ -583,6 +924,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
 
     def _sync_fetch_data(self) -> BuderusData:
         """Synchronous data fetch (runs in executor) with partial success handling."""
+        from .buderus_wps.bus_arbiter import BusPriority
         from .buderus_wps.config import get_default_sensor_map
 
         # Start with empty/None data
@@ -610,24 +952,47 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
                 if value is not None:
                     temperatures[key] = value
 
-        # Try to collect broadcast data
+        # Read the continuously updated broadcast cache (no bus wait)
         broadcast_success = False
         try:
             sensor_map = get_default_sensor_map()
-            cache = self._monitor.collect(duration=5.0)
+            if not self._monitor.running:
+                self._monitor.start()
+            cache = self._monitor.cache.snapshot()
 
             # DEBUG: Log ALL temperature readings to help diagnose DHW temp issue
-            _LOGGER.debug("=== ALL BROADCAST TEMPERATURES (20-70°C range) ===")
-            for reading in cache.readings.values():
-                if reading.is_temperature and 20.0 <= reading.temperature <= 70.0:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("=== ALL BROADCAST TEMPERATURES (20-70°C range) ===")
+                for reading in cache.readings.values():
+                    if reading.is_temperature and 20.0 <= reading.temperature <= 70.0:
+                        _LOGGER.debug(
+                            f"  Base=0x{reading.base:04X}, Idx={reading.idx:3d}, "
+                            f"Temp={reading.temperature:5.1f}°C"
+                        )
+
+            # Extract temperatures from cache; stale readings keep the
+            # last known value
+            fresh = cache.get_many(sensor_map, max_age=BROADCAST_MAX_AGE)
+
+            # Keys that went stale (e.g. after a bus hiccup) but are known to
+            # repeat quickly are worth a short wait; the wait ends as soon
+            # as all of them arrived
+            wait_keys = []
+            for key, reading in fresh.items():
+                period = self._monitor.broadcast_period(*key)
+                if reading is None and period is not None and period <= BROADCAST_WAIT:
+                    wait_keys.append(key)
+            if wait_keys:
+                result = self._monitor.collect_until(wait_keys, deadline=BROADCAST_WAIT)
+                fresh.update(result.readings)
+                if result.missed:
                     _LOGGER.debug(
-                        f"  Base=0x{reading.base:04X}, Idx={reading.idx:3d}, "
-                        f"Temp={reading.temperature:5.1f}°C"
+                        "Broadcasts not seen within %.1fs: %s",
+                        BROADCAST_WAIT,
+                        ", ".join(f"0x{b:04X}/{i}" for b, i in result.missed),
                     )
-
-            # Extract temperatures from cache
             for (base, idx), sensor_name in sensor_map.items():
-                reading = cache.get_by_idx_and_base(idx, base)
+                reading = fresh[(base, idx)]
                 if reading is not None and sensor_name in temperatures:
                     temperatures[sensor_name] = reading.temperature
                     _LOGGER.debug(
@@ -644,431 +1009,133 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
             if self._last_known_good_data is not None:
                 temperatures = self._last_known_good_data.temperatures.copy()
 
-        parameter_results: dict[str, dict[str, Any]] = {}
-        if self._parameter_allowlist:
-            for key in self._parameter_allowlist:
-                name_or_idx = self._coerce_parameter_key(key)
-                try:
-                    result = self._sync_read_parameter(name_or_idx)
-                    parameter_results[key] = result
-                except Exception as err:
-                    fallback = None
-                    if self._last_known_good_data is not None:
-                        fallback = self._last_known_good_data.parameter_results.get(key)
-                    if fallback is not None:
-                        parameter_results[key] = fallback
-                    else:
-                        parameter_results[key] = {
-                            "name": str(key),
-                            "decoded": None,
-                            "error": str(err),
-                        }
-
-        def _read_rtr_temperature(
-            name: str,
-            sensor_key: str,
-            label: str,
-            *,
-            error_level: int = logging.DEBUG,
-            dead_level: int = logging.DEBUG,
-            invalid_dlc_level: int = logging.DEBUG,
-        ) -> None:
-            try:
-                result = self._client.read_parameter_with_validation(
-                    name, expected_dlc=2
-                )
-                error = result.get("error")
-                decoded = result.get("decoded")
-
-                if error == "invalid_dlc":
-                    _LOGGER.log(
-                        invalid_dlc_level,
-                        "%s not available on this heat pump model (wrong data length)",
-                        name,
-                    )
-                    return
-
-                if decoded is None:
-                    _LOGGER.log(
-                        dead_level,
-                        "%s sensor is DEAD (disconnected or faulty)",
-                        name,
-                    )
-                    return
-
-                try:
-                    temperature = float(decoded)
-                except (TypeError, ValueError):
-                    _LOGGER.log(
-                        error_level,
-                        "%s returned non-numeric value: %s",
-                        name,
-                        decoded,
-                    )
-                    return
-
-                temperatures[sensor_key] = temperature
-                _LOGGER.debug("%s (%s) via RTR: %.1f°C", name, label, temperature)
-            except Exception as err:
-                param = self._registry.get_parameter(name)
-                idx = param.idx if param else "unknown"
-                _LOGGER.log(
-                    error_level,
-                    "RTR FAILED for %s (idx=%s): %s",
-                    name,
-                    idx,
-                    err,
+        previous = self._last_known_good_data
+        engine = self._read_engine
+
+        # Run the read specs of the poll items that are due in one pipelined
+        # batch; values of items that are not due keep their last good reading
+        now = time.monotonic()
+        due = self._poll_scheduler.due(now)
+        outcomes: dict[str, Any] = {}
+        if due:
+            with self.arbiter.using(BusPriority.POLL):
+                outcomes = engine.run(
+                    self._client,
+                    [
+                        spec.output_key
+                        for item in due
+                        for spec in self._read_plan[item.key]
+                    ],
                 )
-                # Keep any broadcast or stale value that may exist
-
-        # Get GT3_TEMP (DHW temperature) via RTR (best-effort)
-        # PROTOCOL: GT3_TEMP must be read via RTR, NOT broadcast.
-        # The broadcast mapping in config.py is incorrect - broadcasts don't contain GT3.
-        # Element discovery finds the correct idx (682 on tested heat pump, varies by model).
-        # The raw sensor value is returned; display may show +4K adjustment (GT3_KORRIGERING).
-        # Verified 2026-01-02: idx=682 returns correct DHW temperature via RTR.
-        _read_rtr_temperature(
-            "GT3_TEMP",
-            SENSOR_DHW,
-            "DHW",
-            error_level=logging.WARNING,
-            dead_level=logging.WARNING,
-            invalid_dlc_level=logging.WARNING,
-        )
-
-        # Get GT8_TEMP (Heat transfer fluid OUT / supply) via RTR (best-effort)
-        # Broadcast values can be offset on some models; RTR provides the menu value.
-        _read_rtr_temperature("GT8_TEMP", SENSOR_SUPPLY, "Supply")
-
-        # Get GT9_TEMP (Heat transfer fluid IN / return) via RTR (best-effort)
-        # Broadcast values can be offset on some models; RTR provides the menu value.
-        _read_rtr_temperature("GT9_TEMP", SENSOR_RETURN, "Return")
-
-        # Get GT10_TEMP (Brine/collector inlet) via RTR (best-effort)
-        # PROTOCOL: GT10_TEMP is the collector circuit inlet temperature (brine in)
-        # Uses discovered idx (varies by firmware, ~638 in FHEM reference)
-        # NOTE: Not all heat pump models have this sensor
-        _read_rtr_temperature(
-            "GT10_TEMP",
-            SENSOR_BRINE_IN,
-            "Brine In",
-            invalid_dlc_level=logging.INFO,
-        )
-
-        # Get GT11_TEMP (Brine/collector outlet) via RTR (best-effort)
-        # PROTOCOL: GT11_TEMP is the collector circuit outlet temperature (brine out)
-        # Uses discovered idx (varies by firmware, ~652 in FHEM reference)
-        # NOTE: Not all heat pump models have this sensor
-        _read_rtr_temperature(
-            "GT11_TEMP",
-            SENSOR_BRINE_OUT,
-            "Brine Out",
-            invalid_dlc_level=logging.INFO,
-        )
-
-        # Get compressor status via RTR request (best-effort with retry)
-        # PROTOCOL: COMPRESSOR_STATE > 0 indicates compressor running (primary)
-        # COMPRESSOR_REAL_FREQUENCY is kept as a secondary debug signal.
-        compressor_running = False
-        compressor_state: int | None = None
-        compressor_frequency: int | None = None
-        state_read = False
-
-        def _parse_int(value: Any) -> int:
-            if isinstance(value, str) and ":" in value:
-                value = value.split(":")[0]
-            return int(value or 0)
-
-        for attempt in range(3):
-            try:
-                state_result = self._client.read_parameter("COMPRESSOR_STATE")
-                compressor_state = _parse_int(state_result.get("decoded", 0))
-                compressor_running = compressor_state > 0
-                state_read = True
-                _LOGGER.debug(
-                    "Compressor state: %d (running=%s)",
-                    compressor_state,
-                    compressor_running,
-                )
-                break  # Success - exit retry loop
-            except Exception as err:
-                if attempt < 2:
-                    _LOGGER.debug(
-                        "RTR attempt %d/3 for COMPRESSOR_STATE failed: %s",
-                        attempt + 1,
-                        err,
-                    )
-                    time.sleep(0.3)  # Brief delay before retry
-                else:
-                    _LOGGER.warning(
-                        "RTR FAILED for COMPRESSOR_STATE after 3 attempts: %s", err
-                    )
-                    if self._last_known_good_data is not None:
-                        compressor_running = (
-                            self._last_known_good_data.compressor_running
-                        )
-                        compressor_state = self._last_known_good_data.compressor_state
-
-        try:
-            result = self._client.read_parameter("COMPRESSOR_REAL_FREQUENCY")
-            compressor_frequency = _parse_int(result.get("decoded", 0))
-            _LOGGER.debug(
-                "Compressor frequency: %d Hz (state_running=%s)",
-                compressor_frequency,
-                compressor_running,
-            )
-            if not state_read and compressor_frequency > 0:
-                compressor_running = True
-        except Exception as err:
-            _LOGGER.debug("RTR FAILED for COMPRESSOR_REAL_FREQUENCY: %s", err)
-            if not state_read and self._last_known_good_data is not None:
-                compressor_running = self._last_known_good_data.compressor_running
-                compressor_frequency = self._last_known_good_data.compressor_frequency
-
-        # Get energy blocking status (best-effort)
-        energy_blocked = False
-        try:
-            result = self._client.read_parameter("ADDITIONAL_BLOCKED")
-            energy_blocked = int(result.get("decoded", 0)) > 0
-        except Exception as err:
-            _LOGGER.warning("RTR FAILED for ADDITIONAL_BLOCKED: %s", err)
-            if self._last_known_good_data is not None:
-                energy_blocked = self._last_known_good_data.energy_blocked
-
-        # Get DHW extra duration (best-effort)
-        dhw_extra_duration = 0
-        if self._dhw_boost_end_time is not None:
-            remaining_seconds = self._dhw_boost_end_time - time.time()
-            if remaining_seconds > 0:
-                # Round up to whole hours for a stable UI value.
-                dhw_extra_duration = int((remaining_seconds + 3599) // 3600)
-        else:
-            try:
-                dhw_extra_duration = self._api.hot_water.extra_duration
-            except Exception as err:
-                _LOGGER.warning("RTR FAILED for DHW_EXTRA_DURATION: %s", err)
-                if self._last_known_good_data is not None:
-                    dhw_extra_duration = self._last_known_good_data.dhw_extra_duration
-
-        # Get heating season mode (best-effort)
-        # PROTOCOL: dp2 format returns strings like "1:Always_On" - parse int prefix
-        heating_season_mode: int | None = None
-        try:
-            result = self._client.read_parameter_with_validation(
-                "HEATING_SEASON_MODE", expected_dlc=1
-            )
-            decoded = result.get("decoded")
-
-            if decoded is None:
-                # Read failed or invalid DLC
-                raise ValueError(f"Invalid read: {result.get('error')}")
-
-            if isinstance(decoded, str) and ":" in decoded:
-                heating_season_mode = int(decoded.split(":")[0])
+            self.capabilities.save()
+
+        # Items without a single fresh value stay due and are retried next
+        # tick, unless their parameters were skipped as unavailable
+        read_keys = []
+        for item in due:
+            specs = self._read_plan[item.key]
+            if any(
+                outcomes[spec.output_key].fresh
+                or outcomes[spec.output_key].attempts == 0
+                for spec in specs
+            ):
+                read_keys.append(item.key)
             else:
-                heating_season_mode = int(decoded)
-        except Exception as err:
-            _LOGGER.warning("RTR FAILED for HEATING_SEASON_MODE: %s", err)
-            if self._last_known_good_data is not None:
-                heating_season_mode = self._last_known_good_data.heating_season_mode
-
-        # Get DHW program mode (best-effort)
-        # PROTOCOL: dp2 format returns strings like "1:Always_On" - parse int prefix
-        dhw_program_mode: int | None = None
-        try:
-            result = self._client.read_parameter_with_validation(
-                "DHW_PROGRAM_MODE", expected_dlc=1
-            )
-            decoded = result.get("decoded")
-
-            if decoded is None:
-                # Read failed or invalid DLC
-                raise ValueError(f"Invalid read: {result.get('error')}")
-
-            if isinstance(decoded, str) and ":" in decoded:
-                dhw_program_mode = int(decoded.split(":")[0])
-            else:
-                dhw_program_mode = int(decoded)
-        except Exception as err:
-            _LOGGER.warning("RTR FAILED for DHW_PROGRAM_MODE: %s", err)
-            if self._last_known_good_data is not None:
-                dhw_program_mode = self._last_known_good_data.dhw_program_mode
-
-        # Get heating curve parallel offset (best-effort)
-        # PROTOCOL: Use GLOBAL parameter (idx=804) which is the user-adjustable setting
-        # visible in the heat pump menu as "Parallel offset" / "Parallelle verschuiving"
-        # The non-GLOBAL version (idx=802) is a different internal parameter
-        heating_curve_offset: float | None = None
-        try:
-            result = self._client.read_parameter("HEATING_CURVE_PARALLEL_OFFSET_GLOBAL")
-            decoded = result.get("decoded")
-            if decoded is not None:
-                heating_curve_offset = float(decoded)
-        except Exception as err:
-            _LOGGER.warning(
-                "RTR FAILED for HEATING_CURVE_PARALLEL_OFFSET_GLOBAL: %s", err
-            )
-            if self._last_known_good_data is not None:
-                heating_curve_offset = self._last_known_good_data.heating_curve_offset
-
-        # Get DHW stop temperature (best-effort)
-        # PROTOCOL: XDHW_STOP_TEMP controls when DHW charging stops (50-65°C)
-        dhw_stop_temp: float | None = None
-        try:
-            if self._api is not None:
-                dhw_stop_temp = self._api.hot_water.stop_temperature
-        except Exception as err:
-            _LOGGER.warning("RTR FAILED for XDHW_STOP_TEMP: %s", err)
-            if self._last_known_good_data is not None:
-                dhw_stop_temp = self._last_known_good_data.dhw_stop_temp
-
-        # Get DHW setpoint temperature (best-effort)
-        # PROTOCOL: DHW_CALCULATED_SETPOINT_TEMP is the normal DHW setpoint (40-70°C)
-        # Note: parameter_defaults.py idx corrected from 385 to 386 per FHEM discovery
-        dhw_setpoint: float | None = None
-        try:
-            result = self._client.read_parameter("DHW_CALCULATED_SETPOINT_TEMP")
-            raw = result.get("raw")
-            decoded = result.get("decoded")
-            _LOGGER.debug(
-                "DHW_CALCULATED_SETPOINT_TEMP: raw=%s, decoded=%s", raw, decoded
-            )
-            if decoded is not None:
-                dhw_setpoint = float(decoded)
-        except Exception as err:
-            _LOGGER.warning("RTR FAILED for DHW_CALCULATED_SETPOINT_TEMP: %s", err)
-            if self._last_known_good_data is not None:
-                dhw_setpoint = self._last_known_good_data.dhw_setpoint
-
-        # Get compressor blocked status (best-effort)
-        compressor_blocked: bool | None = None
-        # Helper to read binary status safely
-        def _get_binary(param_name_or_idx: Any) -> bool:
-            try:
-                res = self._client.read_parameter_with_validation(
-                    param_name_or_idx, expected_dlc=1, timeout=0.5
-                )
-                return bool(res.get("decoded", 0))
-            except Exception:
-                return False
-
-        # Get digital status flags
-        # Default to False if reading fails (safe fallback)
-        # compressor_running = _get_binary("COMPRESSOR_RUNNING") # REMOVED: Unreliable
-        energy_blocked = _get_binary(247)  # COMPRESSOR_BLOCKED
-        dhw_active = _get_binary("PUMP_DHW_ACTIVE")  # idx 2016
-        g1_active = _get_binary("PUMP_G1_CONTINUAL")  # idx 12796, Main/Heating pump
-
-        # Get compressor status via RTR request (best-effort with retry)
-        # PROTOCOL: COMPRESSOR_STATE > 0 indicates compressor running (primary)
-        # COMPRESSOR_REAL_FREQUENCY is kept as a secondary debug signal.
-        compressor_running = False
-        compressor_state: int | None = None
-        compressor_frequency: int | None = None
-        state_read = False
-
-        def _parse_int(value: Any) -> int:
-            if isinstance(value, str) and ":" in value:
-                value = value.split(":")[0]
-            return int(value or 0)
-
-        for attempt in range(3):
-            try:
-                state_result = self._client.read_parameter("COMPRESSOR_STATE")
-                compressor_state = _parse_int(state_result.get("decoded", 0))
-                compressor_running = compressor_state > 0
-                state_read = True
-                _LOGGER.debug(
-                    "Compressor state: %d (running=%s)",
-                    compressor_state,
-                    compressor_running,
+                _LOGGER.warning(
+                    "RTR FAILED for poll item '%s' (%s), keeping previous values",
+                    item.key,
+                    ", ".join(
+                        f"{spec.name}: {outcomes[spec.output_key].error}"
+                        for spec in specs
+                    ),
                 )
-                break  # Success - exit retry loop
-            except Exception as err:
-                if attempt < 2:
-                    _LOGGER.debug(
-                        "RTR attempt %d/3 for COMPRESSOR_STATE failed: %s",
-                        attempt + 1,
-                        err,
-                    )
-                    time.sleep(0.3)  # Brief delay before retry
-                else:
-                    _LOGGER.warning(
-                        "RTR FAILED for COMPRESSOR_STATE after 3 attempts: %s", err
-                    )
-                    if self._last_known_good_data is not None:
-                        compressor_running = (
-                            self._last_known_good_data.compressor_running
-                        )
-                        compressor_state = self._last_known_good_data.compressor_state
-
-        try:
-            result = self._client.read_parameter("COMPRESSOR_REAL_FREQUENCY")
-            # Handle potential None or string values safely
-            val = result.get("decoded", 0)
-            if val is None:
-                val = 0
-            compressor_frequency = _parse_int(val)
+        self._poll_scheduler.mark_done(read_keys, now)
+        if _LOGGER.isEnabledFor(logging.DEBUG) and outcomes:
             _LOGGER.debug(
-                "Compressor frequency: %d Hz (state_running=%s)",
-                compressor_frequency,
-                compressor_running,
+                "Read %d specs: %s",
+                len(outcomes),
+                ", ".join(
+                    f"{key}={o.value}{'' if o.fresh else f' ({o.error})'}"
+                    f" [{o.attempts}x, {o.elapsed * 1000:.0f}ms]"
+                    for key, o in outcomes.items()
+                ),
             )
-            # If state read failed but we have frequency > 0, assume running
-            if not state_read and compressor_frequency > 0:
-                compressor_running = True
-            # If state read says OFF but frequency > 20Hz, trust frequency?
-            # (Maybe not, let's stick to simple logic for now, but freq is a good backup)
-        except Exception as err:
-            _LOGGER.debug("RTR FAILED for COMPRESSOR_REAL_FREQUENCY: %s", err)
-            if not state_read and self._last_known_good_data is not None:
-                # distinct from the COMPRESSOR_STATE fallback above
-                if compressor_frequency is None:
-                     compressor_frequency = self._last_known_good_data.compressor_frequency
-
-        # If we failed to read anything fresh related to compressor,
-        # checking _last_known_good_data for final fallback is wise,
-        # but the above blocks handle it partially.
 
+        parameter_results: dict[str, dict[str, Any]] = {}
+        if previous is not None:
+            parameter_results = dict(previous.parameter_results)
+        for key in self._parameter_allowlist:
+            outcome = outcomes.get(f"{POLL_ALLOWLIST}:{key}")
+            if outcome is None:
+                continue
+            if outcome.fresh and outcome.result is not None:
+                parameter_results[key] = self._normalize_parameter_result(
+                    outcome.result
+                )
+            elif key not in parameter_results:
+                parameter_results[key] = {
+                    "name": str(key),
+                    "decoded": None,
+                    "error": str(outcome.error),
+                }
 
-        # Get compressor blocked status (best-effort)
-        try:
-            # Use the initialized energy_blocking helper to read status
-            # This ensures we use the correct parameter (COMPRESSOR_BLOCKED idx 247)
-            compressor_blocked = self.energy_blocking._read_compressor_status(timeout=2.0)
-        except Exception as err:
-            _LOGGER.warning("Failed to read compressor block status: %s", err)
-            if self._last_known_good_data is not None:
-                compressor_blocked = self._last_known_good_data.compressor_blocked
+        # RTR temperatures replace the broadcast value of their sensor. A
+        # sensor whose last RTR read succeeded keeps that value between
+        # reads instead of flapping back to the (possibly offset) broadcast.
+        for name, sensor_key in RTR_TEMPERATURES.items():
+            outcome = outcomes.get(name)
+            if outcome is None:
+                if sensor_key in self._rtr_temperature_sensors:
+                    temperatures[sensor_key] = engine.value(name)
+            elif outcome.fresh:
+                temperatures[sensor_key] = outcome.value
+                self._rtr_temperature_sensors.add(sensor_key)
             else:
-                compressor_blocked = None
+                # invalid_dlc: not available on this heat pump model;
+                # no_value: sensor disconnected or faulty
+                _LOGGER.debug("%s not read via RTR: %s", name, outcome.error)
+                self._rtr_temperature_sensors.discard(sensor_key)
+
+        compressor_state = engine.value("COMPRESSOR_STATE")
+        compressor_frequency = engine.value("COMPRESSOR_REAL_FREQUENCY")
+        compressor_running = bool(compressor_state)
+        state_outcome = outcomes.get("COMPRESSOR_STATE")
+        if state_outcome is not None and not state_outcome.fresh:
+            # If the state read failed but the compressor turns, it runs
+            compressor_running = compressor_running or bool(compressor_frequency)
+
+        compressor_blocked = engine.value("COMPRESSOR_BLOCKED")
+        dhw_extra_duration = engine.value("XDHW_TIME")
+        if self._dhw_boost_end_time is not None:
+            # Program mode override boost: remaining time is tracked locally,
+            # rounded up to whole hours for a stable UI value
+            remaining_seconds = self._dhw_boost_end_time - time.time()
+            dhw_extra_duration = max(int((remaining_seconds + 3599) // 3600), 0)
 
         # Build result with mix of fresh and stale data
         result = BuderusData(
             temperatures=temperatures,
             compressor_running=compressor_running,
             compressor_blocked=compressor_blocked,
-            energy_blocked=energy_blocked,
-            dhw_active=dhw_active,
-            g1_active=g1_active,
+            energy_blocked=bool(compressor_blocked),
+            dhw_active=engine.value("PUMP_DHW_ACTIVE"),
+            g1_active=engine.value("PUMP_G1_CONTINUAL"),
             dhw_extra_duration=dhw_extra_duration,
-            heating_season_mode=heating_season_mode,
-            dhw_program_mode=dhw_program_mode,
-            heating_curve_offset=heating_curve_offset,
-            dhw_stop_temp=dhw_stop_temp,
-            dhw_setpoint=dhw_setpoint,
+            heating_season_mode=engine.value("HEATING_SEASON_MODE"),
+            dhw_program_mode=engine.value("DHW_PROGRAM_MODE"),
+            heating_curve_offset=engine.value("HEATING_CURVE_PARALLEL_OFFSET_GLOBAL"),
+            dhw_stop_temp=engine.value("XDHW_STOP_TEMP"),
+            dhw_setpoint=engine.value("DHW_CALCULATED_SETPOINT_TEMP"),
             compressor_state=compressor_state,
             compressor_frequency=compressor_frequency,
             parameter_results=parameter_results,
         )
 
         # Check if we got at least SOME fresh data
-        # If broadcast failed and ALL parameters used stale data, this is a problem
-        if not broadcast_success and self._last_known_good_data is not None:
-            # Check if result is identical to stale data (nothing was fresh)
-            if result == self._last_known_good_data:
-                # Complete failure - raise exception to trigger error handling
-                raise RuntimeError("All data reads failed, only stale data available")
+        # If broadcast failed and no poll read succeeded, this is a problem
+        if not broadcast_success and not read_keys and previous is not None:
+            # Complete failure - raise exception to trigger error handling
+            raise RuntimeError("All data reads failed, only stale data available")
 
         return result
 
@@ -1082,6 +1149,40 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
             return None
         return int(time.time() - self._last_successful_update)
 
+    def get_bus_metrics(self, per_parameter: bool = False) -> dict[str, Any] | None:
+        """Return a snapshot of CAN bus metrics, or None before first connect."""
+        if self.metrics is None:
+            return None
+        return self.metrics.snapshot(per_parameter=per_parameter)
+
+    def get_bus_arbiter_stats(self) -> dict[str, Any]:
+        """Return bus grants and queue wait per priority class."""
+        return self.arbiter.stats()
+
+    def get_capability_map(self) -> dict[str, Any]:
+        """Return failure streaks and parameters marked unavailable."""
+        return self.capabilities.snapshot()
+
+    def get_read_report(self) -> dict[str, dict[str, Any]]:
+        """Return the latest outcome, attempts and timing of each read spec."""
+        return self._read_engine.report()
+
+    def get_response_cache_stats(self) -> dict[str, Any] | None:
+        """Return parameter response cache hit/miss counters, or None before connect."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.stats()
+
+    def run_bus_write(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run func with its bus transactions arbitrated as interactive writes.
+
+        Runs in the executor: async_add_executor_job(run_bus_write, func, ...).
+        """
+        from .buderus_wps.bus_arbiter import BusPriority
+
+        with self.arbiter.using(BusPriority.INTERACTIVE_WRITE):
+            return func(*args)
+
     def is_data_stale(self) -> bool:
         """Check if current data is stale (connection issues).
 
@@ -1097,7 +1198,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
                 async with self._lock:
                     await asyncio.wait_for(
                         self.hass.async_add_executor_job(
-                            self._sync_set_energy_blocking, blocked
+                            self.run_bus_write, self._sync_set_energy_blocking, blocked
                         ),
                         timeout=EXECUTOR_JOB_TIMEOUT,
                     )
@@ -1109,6 +1210,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         """Synchronous energy blocking set (runs in executor)."""
         value = 1 if blocked else 0
         self._client.write_value("ADDITIONAL_BLOCKED", value)
+        self.request_poll(POLL_STATUS)
         _LOGGER.info("Set energy blocking to %s", blocked)
 
     async def async_set_dhw_extra_duration(self, hours: int) -> None:
@@ -1129,7 +1231,9 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
 
                     result: dict[str, Any] = await asyncio.wait_for(
                         self.hass.async_add_executor_job(
-                            self._sync_start_dhw_extra_duration, hours
+                            self.run_bus_write,
+                            self._sync_start_dhw_extra_duration,
+                            hours,
                         ),
                         timeout=EXECUTOR_JOB_TIMEOUT,
                     )
@@ -1170,7 +1274,9 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         # Always attempt to stop XDHW_TIME-based boost if the device supports it.
         try:
             await asyncio.wait_for(
-                self.hass.async_add_executor_job(self._sync_write_xdhw_time, 0),
+                self.hass.async_add_executor_job(
+                    self.run_bus_write, self._sync_write_xdhw_time, 0
+                ),
                 timeout=EXECUTOR_JOB_TIMEOUT,
             )
         except TimeoutError:
@@ -1185,7 +1291,9 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
             try:
                 await asyncio.wait_for(
                     self.hass.async_add_executor_job(
-                        self._sync_set_dhw_program_mode, original_mode
+                        self.run_bus_write,
+                        self._sync_set_dhw_program_mode,
+                        original_mode,
                     ),
                     timeout=EXECUTOR_JOB_TIMEOUT,
                 )
@@ -1207,7 +1315,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
                             return
                         await self._async_stop_dhw_boost_locked()
             except TimeoutError:
-                 _LOGGER.error("Timeout acquiring lock for DHW boost timer completion")
+                _LOGGER.error("Timeout acquiring lock for DHW boost timer completion")
             await self.async_request_refresh()
         except asyncio.CancelledError:
             return
@@ -1220,6 +1328,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
             if self._api is None:
                 return
             self._api.hot_water.extra_duration = hours
+            self.request_poll("XDHW_TIME")
         except Exception as err:
             _LOGGER.debug("XDHW_TIME write ignored/failed: %s", err)
 
@@ -1240,6 +1349,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         try:
             if self._api is not None:
                 self._api.hot_water.extra_duration = hours
+                self.request_poll("XDHW_TIME")
                 _LOGGER.info(
                     "Started DHW extra production for %d hours (XDHW_TIME)", hours
                 )
@@ -1264,6 +1374,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
 
         if self._client is not None:
             self._client.write_value("DHW_PROGRAM_MODE", 1)  # Always On
+            self.request_poll("DHW_PROGRAM_MODE")
 
         _LOGGER.info(
             "Started DHW extra production for %d hours (fallback: DHW program mode override)",
@@ -1286,7 +1397,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
                 async with self._lock:
                     await asyncio.wait_for(
                         self.hass.async_add_executor_job(
-                            self._sync_set_heating_season_mode, mode
+                            self.run_bus_write, self._sync_set_heating_season_mode, mode
                         ),
                         timeout=EXECUTOR_JOB_TIMEOUT,
                     )
@@ -1297,6 +1408,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
     def _sync_set_heating_season_mode(self, mode: int) -> None:
         """Synchronous heating season mode set (runs in executor)."""
         self._client.write_value("HEATING_SEASON_MODE", mode)
+        self.request_poll("HEATING_SEASON_MODE")
         mode_names = {0: "Winter (forced)", 1: "Automatic", 2: "Off (summer)"}
         _LOGGER.info(
             "Set heating season mode to %s (%d)", mode_names.get(mode, "Unknown"), mode
@@ -1309,13 +1421,12 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
             mode: 0=Auto, 1=Always On, 2=Always Off (blocked)
         """
 
-
         try:
             async with asyncio.timeout(LOCK_ACQUIRE_TIMEOUT):
                 async with self._lock:
                     await asyncio.wait_for(
                         self.hass.async_add_executor_job(
-                            self._sync_set_dhw_program_mode, mode
+                            self.run_bus_write, self._sync_set_dhw_program_mode, mode
                         ),
                         timeout=EXECUTOR_JOB_TIMEOUT,
                     )
@@ -1326,6 +1437,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
     def _sync_set_dhw_program_mode(self, mode: int) -> None:
         """Synchronous DHW program mode set (runs in executor)."""
         self._client.write_value("DHW_PROGRAM_MODE", mode)
+        self.request_poll("DHW_PROGRAM_MODE")
         mode_names = {0: "Automatic", 1: "Always On", 2: "Always Off"}
         _LOGGER.info(
             "Set DHW program mode to %s (%d)", mode_names.get(mode, "Unknown"), mode
@@ -1351,7 +1463,9 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
                 async with self._lock:
                     await asyncio.wait_for(
                         self.hass.async_add_executor_job(
-                            self._sync_set_heating_curve_offset, offset
+                            self.run_bus_write,
+                            self._sync_set_heating_curve_offset,
+                            offset,
                         ),
                         timeout=EXECUTOR_JOB_TIMEOUT,
                     )
@@ -1369,6 +1483,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         try:
             # Write to GLOBAL parameter (idx=804) which is the user-adjustable setting
             self._client.write_value("HEATING_CURVE_PARALLEL_OFFSET_GLOBAL", offset)
+            self.request_poll("HEATING_CURVE_PARALLEL_OFFSET_GLOBAL")
             _LOGGER.info("Set heating curve parallel offset to %.1f°C", offset)
         except Exception as err:
             _LOGGER.error("_sync_set_heating_curve_offset FAILED: %s", err)
@@ -1394,7 +1509,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
                 async with self._lock:
                     await asyncio.wait_for(
                         self.hass.async_add_executor_job(
-                            self._sync_set_dhw_stop_temp, temp
+                            self.run_bus_write, self._sync_set_dhw_stop_temp, temp
                         ),
                         timeout=EXECUTOR_JOB_TIMEOUT,
                     )
@@ -1412,6 +1527,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         try:
             if self._api is not None:
                 self._api.hot_water.stop_temperature = temp
+                self.request_poll("XDHW_STOP_TEMP")
             _LOGGER.info("Set DHW stop temperature to %.1f°C", temp)
         except Exception as err:
             _LOGGER.error("_sync_set_dhw_stop_temp FAILED: %s", err)
@@ -1437,7 +1553,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
                 async with self._lock:
                     await asyncio.wait_for(
                         self.hass.async_add_executor_job(
-                            self._sync_set_dhw_setpoint, temp
+                            self.run_bus_write, self._sync_set_dhw_setpoint, temp
                         ),
                         timeout=EXECUTOR_JOB_TIMEOUT,
                     )
@@ -1455,6 +1571,7 @@ class BuderusCoordinator(DataUpdateCoordinator[BuderusData]):
         try:
             # Note: parameter_defaults.py idx corrected from 385 to 386 per FHEM discovery
             self._client.write_value("DHW_CALCULATED_SETPOINT_TEMP", temp)
+            self.request_poll("DHW_CALCULATED_SETPOINT_TEMP")
             _LOGGER.info("Set DHW setpoint to %.1f°C", temp)
         except Exception as err:
             _LOGGER.error("_sync_set_dhw_setpoint FAILED: %s", err)
@@ -18,7 +18,6 @@ if sys.path and sys.path[0] == script_dir:
 if script_dir not in sys.path:
     sys.path.append(script_dir)
 
-import json
 import logging
 
 # Enable debug logging
@@ -31,27 +30,24 @@ print("=" * 70)
 try:
     print("\n[1/6] Importing modules...")
     from buderus_wps import HeatPump, HeatPumpClient, USBtinAdapter
-    from buderus_wps.element_discovery import ElementDiscovery
+    from buderus_wps.element_discovery import ElementDiscovery, load_element_cache
 
     print("✓ Modules imported successfully")
 
     print("\n[2/6] Checking element discovery cache...")
     # Check both paths - /config is new persistent location, /tmp is legacy
-    cache_path = "/config/buderus_wps_elements.json"
+    cache_path = "/config/buderus_wps_elements.bin"
     if not os.path.exists(cache_path):
         cache_path = "/tmp/buderus_wps_elements.json"  # Legacy fallback
     if os.path.exists(cache_path):
-        with open(cache_path) as f:
-            cache_data = json.load(f)
-        print(f"✓ Cache exists: {len(cache_data.get('elements', []))} elements")
+        cached = load_element_cache(cache_path)
+        print(f"✓ Cache exists: {len(cached)} elements")
 
         # Search for GT10/GT11 in cache
-        for elem in cache_data.get("elements", []):
-            if "GT10_TEMP" in elem.get("text", "") or "GT11_TEMP" in elem.get(
-                "text", ""
-            ):
+        for elem in cached:
+            if "GT10_TEMP" in elem.text or "GT11_TEMP" in elem.text:
                 print(
-                    f"  Found in cache: {elem['text']} → idx={elem['idx']}, min={elem['min_value']}, max={elem['max_value']}"
+                    f"  Found in cache: {elem.text} → idx={elem.idx}, min={elem.min_value}, max={elem.max_value}"
                 )
     else:
         print("⚠ No cache found - will run full discovery")
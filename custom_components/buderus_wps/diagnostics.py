@@ -0,0 +1,37 @@
+"""Diagnostics support for Buderus WPS Heat Pump."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import BuderusCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: BuderusCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    return {
+        "entry": {
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "connection": {
+            "port": coordinator.port,
+            "connected": coordinator._connected,
+            "manually_disconnected": coordinator._manually_disconnected,
+            "consecutive_failures": coordinator._consecutive_failures,
+            "data_age_seconds": coordinator.get_data_age_seconds(),
+        },
+        "bus_metrics": coordinator.get_bus_metrics(per_parameter=True),
+        "response_cache": coordinator.get_response_cache_stats(),
+        "read_specs": coordinator.get_read_report(),
+        "bus_arbiter": coordinator.get_bus_arbiter_stats(),
+        "capabilities": coordinator.get_capability_map(),
+    }
@@ -11,7 +11,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import UnitOfTemperature
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -53,6 +53,52 @@ SENSOR_TYPES = [
     SENSOR_SETPOINT_C4,
 ]
 
+# CAN bus diagnostic sensors: key -> (name, snapshot section, field, unit)
+BUS_METRIC_SENSORS: dict[str, tuple[str, str, str, str | None]] = {
+    "rx_frame_rate": ("CAN RX Frame Rate", "rates", "rx_frames_per_s", "frames/s"),
+    "tx_frame_rate": ("CAN TX Frame Rate", "rates", "tx_frames_per_s", "frames/s"),
+    "rx_byte_rate": ("CAN RX Byte Rate", "rates", "rx_bytes_per_s", "B/s"),
+    "rtr_latency_p50": (
+        "CAN RTR Latency p50",
+        "rtr_latency",
+        "p50_ms",
+        UnitOfTime.MILLISECONDS,
+    ),
+    "rtr_latency_p95": (
+        "CAN RTR Latency p95",
+        "rtr_latency",
+        "p95_ms",
+        UnitOfTime.MILLISECONDS,
+    ),
+    "rtr_latency_p99": (
+        "CAN RTR Latency p99",
+        "rtr_latency",
+        "p99_ms",
+        UnitOfTime.MILLISECONDS,
+    ),
+    "timeouts": ("CAN Timeouts", "counters", "timeouts", None),
+    "unexpected_responses": (
+        "CAN Unexpected Responses",
+        "counters",
+        "unexpected_responses",
+        None,
+    ),
+    "lenient_parses": ("CAN Lenient Parses", "counters", "lenient_parses", None),
+    "flush_discarded_bytes": (
+        "CAN Flush Discarded Bytes",
+        "counters",
+        "flush_discarded_bytes",
+        None,
+    ),
+    "flush_discarded_frames": (
+        "CAN Flush Discarded Frames",
+        "counters",
+        "flush_discarded_frames",
+        None,
+    ),
+    "coalesced_reads": ("CAN Coalesced Reads", "counters", "coalesced_reads", None),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -75,6 +121,11 @@ async def async_setup_entry(
             for param_key in allowlist
         )
 
+    sensors.extend(
+        BuderusBusMetricSensor(coordinator, metric_key, entry)
+        for metric_key in BUS_METRIC_SENSORS
+    )
+
     async_add_entities(sensors)
 
 
@@ -188,3 +239,35 @@ class BuderusParameterSensor(BuderusEntity, SensorEntity):
             }
         )
         return attrs
+
+
+class BuderusBusMetricSensor(BuderusEntity, SensorEntity):
+    """Diagnostic sensor exposing one CAN bus metric."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:chart-timeline-variant"
+
+    def __init__(
+        self,
+        coordinator: BuderusCoordinator,
+        metric_key: str,
+        entry: ConfigEntry | None = None,
+    ) -> None:
+        """Initialize the bus metric sensor."""
+        super().__init__(coordinator, f"bus_{metric_key}", entry)
+        name, self._section, self._field, unit = BUS_METRIC_SENSORS[metric_key]
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = (
+            SensorStateClass.TOTAL_INCREASING
+            if self._section == "counters"
+            else SensorStateClass.MEASUREMENT
+        )
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current metric value."""
+        snapshot = self.coordinator.get_bus_metrics()
+        if snapshot is None:
+            return None
+        return snapshot[self._section].get(self._field)
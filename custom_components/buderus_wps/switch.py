@@ -210,7 +210,8 @@ class BuderusCompressorBlockSwitch(BuderusEntity, SwitchEntity):
 
         # Block compressor via executor (synchronous call)
         result = await self.hass.async_add_executor_job(
-            self.coordinator.energy_blocking.block_compressor
+            self.coordinator.run_bus_write,
+            self.coordinator.energy_blocking.block_compressor,
         )
 
         if not result.success:
@@ -218,6 +219,7 @@ class BuderusCompressorBlockSwitch(BuderusEntity, SwitchEntity):
                 f"Failed to block compressor: {result.message} (Error: {result.error})"
             )
 
+        self.coordinator.request_poll("COMPRESSOR_BLOCKED")
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -227,7 +229,8 @@ class BuderusCompressorBlockSwitch(BuderusEntity, SwitchEntity):
 
         # Unblock compressor via executor (synchronous call)
         result = await self.hass.async_add_executor_job(
-            self.coordinator.energy_blocking.unblock_compressor
+            self.coordinator.run_bus_write,
+            self.coordinator.energy_blocking.unblock_compressor,
         )
 
         if not result.success:
@@ -235,4 +238,5 @@ class BuderusCompressorBlockSwitch(BuderusEntity, SwitchEntity):
                 f"Failed to unblock compressor: {result.message} (Error: {result.error})"
             )
 
+        self.coordinator.request_poll("COMPRESSOR_BLOCKED")
         await self.coordinator.async_request_refresh()
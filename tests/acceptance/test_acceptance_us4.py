@@ -11,10 +11,9 @@ Acceptance Scenarios:
 4. Firmware version change invalidates cache
 """
 
-import json
-
 import pytest
 
+from buderus_wps.binary_cache import HEADER_SIZE, read_cache
 from buderus_wps.cache import ParameterCache
 from buderus_wps.parameter_data import PARAMETER_DATA
 
@@ -22,7 +21,7 @@ from buderus_wps.parameter_data import PARAMETER_DATA
 @pytest.fixture
 def temp_cache_path(tmp_path):
     """Create temporary cache file path."""
-    return tmp_path / "buderus" / "params_cache.json"
+    return tmp_path / "buderus" / "params_cache.bin"
 
 
 @pytest.fixture
@@ -83,14 +82,12 @@ class TestAcceptanceScenario1:
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_discovered_params)
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
+        records = read_cache(temp_cache_path).records
 
-        assert "parameters" in data
-        assert len(data["parameters"]) == 3
+        assert len(records) == 3
 
         # Verify all fields preserved
-        first_param = data["parameters"][0]
+        first_param = records[0]
         assert "idx" in first_param
         assert "extid" in first_param
         assert "max" in first_param
@@ -105,11 +102,7 @@ class TestAcceptanceScenario1:
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_discovered_params)
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-
-        assert "checksum" in data
-        assert data["checksum"].startswith("sha256:")
+        assert read_cache(temp_cache_path).checksum.startswith("sha256:")
 
 
 class TestAcceptanceScenario2:
@@ -173,12 +166,11 @@ class TestAcceptanceScenario3:
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_discovered_params)
 
-        # Tamper with parameters
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-        data["parameters"][0]["max"] = 12345
-        with open(temp_cache_path, "w") as f:
-            json.dump(data, f)
+        # Tamper with parameters (max of the first record)
+        data = bytearray(temp_cache_path.read_bytes())
+        max_offset = HEADER_SIZE + 13
+        data[max_offset : max_offset + 4] = (12345).to_bytes(4, "big")
+        temp_cache_path.write_bytes(bytes(data))
 
         new_cache = ParameterCache(temp_cache_path)
         assert new_cache.is_valid() is False
@@ -213,12 +205,10 @@ class TestAcceptanceScenario4:
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_discovered_params, firmware="v1.0.0")
 
-        # Simulate cache version mismatch
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-        data["version"] = "0.9.0"  # Old version
-        with open(temp_cache_path, "w") as f:
-            json.dump(data, f)
+        # Simulate cache version mismatch (old format version)
+        data = bytearray(temp_cache_path.read_bytes())
+        data[4:6] = (0).to_bytes(2, "big")
+        temp_cache_path.write_bytes(bytes(data))
 
         new_cache = ParameterCache(temp_cache_path)
         assert new_cache.is_valid() is False
@@ -180,8 +180,21 @@ def setup_ha_mocks():
     sys.modules["voluptuous"] = MagicMock()
 
 
-# Set up mocks at module import time
-setup_ha_mocks()
+# Set up mocks at module import time. Tests importing tests.conftest load
+# this file a second time; keep the first mocks so that HomeAssistantError
+# stays the class the integration modules already imported.
+if not isinstance(sys.modules.get("homeassistant"), MagicMock):
+    setup_ha_mocks()
+
+
+class FakeClock:
+    """Injectable monotonic clock; tests advance ``now`` by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
 
 
 # Mock data class matching coordinator.BuderusData
@@ -269,6 +282,9 @@ def mock_coordinator(mock_buderus_data: MockBuderusData) -> MagicMock:
     # Sync methods for optimistic update
     coordinator.async_set_updated_data = MagicMock()
 
+    # Bus writes run the wrapped call directly (no arbiter)
+    coordinator.run_bus_write = MagicMock(side_effect=lambda func, *args: func(*args))
+
     # Manual disconnect state
     coordinator._manually_disconnected = False
 
@@ -342,3 +358,9 @@ def mock_menu_api() -> MagicMock:
     api.hot_water.extra_duration = 0
 
     return api
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Provide a FakeClock starting at 0."""
+    return FakeClock()
@@ -4,10 +4,9 @@ Tests the complete save/load cycle, checksum verification, and cache
 invalidation scenarios.
 """
 
-import json
-
 import pytest
 
+from buderus_wps.binary_cache import HEADER_SIZE, RECORD_SIZE, read_cache
 from buderus_wps.cache import ParameterCache
 from buderus_wps.parameter_data import PARAMETER_DATA
 
@@ -31,7 +30,7 @@ class TestCacheSaveLoadCycle:
 
     def test_save_then_load_returns_same_data(self, temp_cache_dir, sample_params):
         """Verify save followed by load returns identical data."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
 
         # Save
@@ -54,7 +53,7 @@ class TestCacheSaveLoadCycle:
 
     def test_save_load_with_large_dataset(self, temp_cache_dir):
         """Verify save/load works with full parameter set."""
-        cache_path = temp_cache_dir / "full_params.json"
+        cache_path = temp_cache_dir / "full_params.bin"
         cache = ParameterCache(cache_path)
 
         # Use all parameters
@@ -67,7 +66,7 @@ class TestCacheSaveLoadCycle:
 
     def test_overwrite_existing_cache(self, temp_cache_dir, sample_params):
         """Verify save overwrites existing cache file."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
 
         # Save initial
@@ -87,16 +86,15 @@ class TestCacheChecksumVerification:
 
     def test_modified_parameters_detected(self, temp_cache_dir, sample_params):
         """Verify checksum catches modified parameter values."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
         cache.save(sample_params)
 
-        # Manually modify a parameter value
-        with open(cache_path) as f:
-            data = json.load(f)
-        data["parameters"][0]["max"] = 99999  # Modify max value
-        with open(cache_path, "w") as f:
-            json.dump(data, f)
+        # Manually modify a parameter value (max of the first record)
+        data = bytearray(cache_path.read_bytes())
+        max_offset = HEADER_SIZE + 13
+        data[max_offset : max_offset + 4] = (99999).to_bytes(4, "big")
+        cache_path.write_bytes(bytes(data))
 
         # Load should fail due to checksum mismatch
         loaded = cache.load()
@@ -104,32 +102,29 @@ class TestCacheChecksumVerification:
 
     def test_added_parameter_detected(self, temp_cache_dir, sample_params):
         """Verify checksum catches added parameters."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
         cache.save(sample_params)
 
         # Add a parameter
-        with open(cache_path) as f:
-            data = json.load(f)
-        data["parameters"].append({"idx": 9999, "text": "FAKE"})
-        with open(cache_path, "w") as f:
-            json.dump(data, f)
+        data = cache_path.read_bytes()
+        records_end = HEADER_SIZE + len(sample_params) * RECORD_SIZE
+        fake = data[HEADER_SIZE : HEADER_SIZE + RECORD_SIZE]
+        cache_path.write_bytes(data[:records_end] + fake + data[records_end:])
 
         loaded = cache.load()
         assert loaded is None
 
     def test_removed_parameter_detected(self, temp_cache_dir, sample_params):
         """Verify checksum catches removed parameters."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
         cache.save(sample_params)
 
         # Remove a parameter
-        with open(cache_path) as f:
-            data = json.load(f)
-        data["parameters"].pop()
-        with open(cache_path, "w") as f:
-            json.dump(data, f)
+        data = cache_path.read_bytes()
+        records_end = HEADER_SIZE + len(sample_params) * RECORD_SIZE
+        cache_path.write_bytes(data[: records_end - RECORD_SIZE] + data[records_end:])
 
         loaded = cache.load()
         assert loaded is None
@@ -142,7 +137,7 @@ class TestCacheInvalidation:
         self, temp_cache_dir, sample_params
     ):
         """Verify invalidate makes cache invalid."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
         cache.save(sample_params)
 
@@ -154,7 +149,7 @@ class TestCacheInvalidation:
 
     def test_invalidate_then_load_returns_none(self, temp_cache_dir, sample_params):
         """Verify load returns None after invalidation."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
         cache.save(sample_params)
 
@@ -167,7 +162,7 @@ class TestCacheInvalidation:
         self, temp_cache_dir, sample_params
     ):
         """Verify save works after invalidation."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
         cache.save(sample_params)
         cache.invalidate()
@@ -183,34 +178,27 @@ class TestCacheMetadata:
 
     def test_device_id_persisted(self, temp_cache_dir, sample_params):
         """Verify device_id is saved and retrievable."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
         cache.save(sample_params, device_id="BUDERUS_001")
 
-        with open(cache_path) as f:
-            data = json.load(f)
-
-        assert data["device_id"] == "BUDERUS_001"
+        assert read_cache(cache_path).meta["device_id"] == "BUDERUS_001"
 
     def test_firmware_version_persisted(self, temp_cache_dir, sample_params):
         """Verify firmware version is saved and retrievable."""
-        cache_path = temp_cache_dir / "params.json"
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
         cache.save(sample_params, firmware="v2.0.1")
 
-        with open(cache_path) as f:
-            data = json.load(f)
-
-        assert data["firmware"] == "v2.0.1"
+        assert read_cache(cache_path).meta["firmware"] == "v2.0.1"
 
     def test_element_count_matches_parameters(self, temp_cache_dir, sample_params):
-        """Verify element_count matches actual parameter count."""
-        cache_path = temp_cache_dir / "params.json"
+        """Verify the record count matches actual parameter count."""
+        cache_path = temp_cache_dir / "params.bin"
         cache = ParameterCache(cache_path)
         cache.save(sample_params)
 
-        with open(cache_path) as f:
-            data = json.load(f)
+        count = int.from_bytes(cache_path.read_bytes()[6:10], "big")
 
-        assert data["element_count"] == len(sample_params)
-        assert data["element_count"] == len(data["parameters"])
+        assert count == len(sample_params)
+        assert count == len(read_cache(cache_path).records)
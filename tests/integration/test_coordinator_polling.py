@@ -0,0 +1,264 @@
+"""Integration tests for the coordinator's multi-rate polling plan."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.buderus_wps.buderus_wps.broadcast_monitor import (
+    BroadcastCache,
+    BroadcastReading,
+    BroadcastReadPolicy,
+)
+from custom_components.buderus_wps.buderus_wps.can_message import CANMessage
+from custom_components.buderus_wps.buderus_wps.exceptions import TimeoutError
+from custom_components.buderus_wps.buderus_wps.heat_pump import HeatPumpClient
+from custom_components.buderus_wps.buderus_wps.parameter import HeatPump
+from custom_components.buderus_wps.const import DEFAULT_SCAN_INTERVAL, SENSOR_SUPPLY
+
+# Import after conftest sets up mocks
+from custom_components.buderus_wps.coordinator import (
+    POLL_SETTINGS,
+    BuderusCoordinator,
+    broadcast_read_mapping,
+)
+
+VALUES = {
+    "COMPRESSOR_STATE": 3,
+    "COMPRESSOR_REAL_FREQUENCY": 52,
+    "GT3_TEMP": 48.5,
+    "GT8_TEMP": 35.0,
+    "GT9_TEMP": 30.0,
+    "GT10_TEMP": 8.0,
+    "GT11_TEMP": 5.0,
+    "COMPRESSOR_BLOCKED": 0,
+    "PUMP_DHW_ACTIVE": 1,
+    "PUMP_G1_CONTINUAL": 0,
+    "XDHW_TIME": 2,
+    "DHW_CALCULATED_SETPOINT_TEMP": 50.0,
+    "HEATING_SEASON_MODE": "1:Auto",
+    "DHW_PROGRAM_MODE": 0,
+    "HEATING_CURVE_PARALLEL_OFFSET_GLOBAL": -1.5,
+    "XDHW_STOP_TEMP": 55.0,
+}
+
+
+def _read_many(names, **kwargs):
+    return {
+        name: {"name": name, "raw": b"\x00\x01", "decoded": VALUES[name]}
+        for name in names
+    }
+
+
+@pytest.fixture
+def coordinator(mock_hass: MagicMock) -> BuderusCoordinator:
+    coordinator = BuderusCoordinator(mock_hass, "/dev/ttyACM0", DEFAULT_SCAN_INTERVAL)
+    coordinator._monitor = MagicMock()
+    coordinator._monitor.running = True
+    coordinator._monitor.cache = BroadcastCache()
+    coordinator._monitor.broadcast_period.return_value = None
+    coordinator._client = MagicMock()
+    coordinator._client.read_many.side_effect = _read_many
+    return coordinator
+
+
+def _fetch(coordinator: BuderusCoordinator):
+    data = coordinator._sync_fetch_data()
+    coordinator._last_known_good_data = data
+    return data
+
+
+class TestCoordinatorPolling:
+    def test_first_update_reads_whole_plan_in_one_batch(self, coordinator):
+        data = _fetch(coordinator)
+
+        coordinator._client.read_many.assert_called_once()
+        (names,) = coordinator._client.read_many.call_args.args
+        assert sorted(names) == sorted(VALUES)
+        assert data.compressor_running is True
+        assert data.compressor_frequency == 52
+        assert data.temperatures[SENSOR_SUPPLY] == 35.0
+        assert data.dhw_active is True
+        assert data.dhw_extra_duration == 2
+        assert data.heating_season_mode == 1
+        assert data.heating_curve_offset == -1.5
+
+    def test_items_not_due_keep_previous_values(self, coordinator):
+        first = _fetch(coordinator)
+        coordinator._client.read_many.reset_mock()
+
+        second = _fetch(coordinator)
+
+        coordinator._client.read_many.assert_not_called()
+        assert second == first
+
+    def test_rtr_temperature_not_replaced_by_broadcast_between_reads(self, coordinator):
+        _fetch(coordinator)
+        # Supply broadcast (base 0x0270, idx 6) reports an offset value
+        can_id = 0x0C000000 | (6 << 14) | 0x0270
+        coordinator._monitor.cache.update(
+            BroadcastReading(can_id, 0x0270, 6, 2, b"\x01\x90", 400, time.time())
+        )
+
+        data = _fetch(coordinator)
+
+        assert data.temperatures[SENSOR_SUPPLY] == 35.0
+
+    def test_write_forces_reread_of_its_item(self, coordinator):
+        _fetch(coordinator)
+        coordinator._client.read_many.reset_mock()
+
+        coordinator._sync_set_dhw_program_mode(2)
+        data = _fetch(coordinator)
+
+        (names,) = coordinator._client.read_many.call_args.args
+        assert "DHW_PROGRAM_MODE" in names
+        assert "COMPRESSOR_STATE" not in names
+        assert data.dhw_program_mode == 0
+
+    def test_failed_item_is_retried_next_update(self, coordinator):
+        coordinator._client.read_many.side_effect = lambda names, **kwargs: {
+            name: (
+                {"name": name, "decoded": None, "error": "timeout"}
+                if name.startswith("COMPRESSOR_")
+                else _read_many([name])[name]
+            )
+            for name in names
+        }
+        _fetch(coordinator)
+        coordinator._client.read_many.side_effect = _read_many
+
+        data = _fetch(coordinator)
+
+        (names,) = coordinator._client.read_many.call_args.args
+        assert names == ["COMPRESSOR_STATE", "COMPRESSOR_REAL_FREQUENCY"]
+        assert data.compressor_state == 3
+
+    def test_missing_sensor_is_skipped_and_map_persisted(self, coordinator, tmp_path):
+        coordinator.capabilities.path = tmp_path / "capabilities.json"
+
+        def short_gt10(names, **kwargs):
+            results = _read_many(names)
+            if "GT10_TEMP" in results:
+                results["GT10_TEMP"]["raw"] = b"\x01"
+            return results
+
+        coordinator._client.read_many.side_effect = short_gt10
+        for _ in range(coordinator.capabilities.threshold):
+            coordinator.request_poll("GT10_TEMP")
+            _fetch(coordinator)
+        coordinator.request_poll("GT10_TEMP")
+        coordinator._client.read_many.reset_mock()
+
+        _fetch(coordinator)
+        _fetch(coordinator)
+
+        coordinator._client.read_many.assert_called_once()
+        (names,) = coordinator._client.read_many.call_args.args
+        assert "GT10_TEMP" not in names
+        assert coordinator.capabilities.status("GT10_TEMP") == "invalid_dlc"
+        assert (tmp_path / "capabilities.json").exists()
+
+    def test_allowlist_polled_as_own_item(self, mock_hass):
+        coordinator = BuderusCoordinator(
+            mock_hass, "/dev/ttyACM0", DEFAULT_SCAN_INTERVAL, ["ACCESS_LEVEL"]
+        )
+
+        allowlist = coordinator._poll_scheduler.items[-1]
+
+        assert allowlist.parameters == ("ACCESS_LEVEL",)
+        assert allowlist.interval == DEFAULT_SCAN_INTERVAL
+
+
+class TestResponseCacheTtls:
+    def test_only_settings_are_cached(self, mock_hass):
+        coordinator = BuderusCoordinator(
+            mock_hass, "/dev/ttyACM0", DEFAULT_SCAN_INTERVAL, ["ACCESS_LEVEL", "1"]
+        )
+        coordinator._registry = HeatPump()
+
+        cache = coordinator._create_response_cache()
+
+        for key, specs in coordinator._read_plan.items():
+            for spec in specs:
+                param = coordinator._registry.get_parameter(spec.name)
+                if key == POLL_SETTINGS:
+                    assert cache.ttl(param) > 0, spec.name
+                else:
+                    assert cache.ttl(param) == 0.0, spec.name
+        # Status flags with a bitmask range, as polled every update
+        for name in ("PUMP_DHW_ACTIVE", "PUMP_G1_CONTINUAL", "ACCESS_LEVEL"):
+            assert cache.ttl(coordinator._registry.get_parameter(name)) == 0.0
+
+
+class EchoAdapter:
+    """Answers every RTR with the value 0x01C2 (45.0 for temperatures)."""
+
+    timeout = 0.2
+    reader_running = False
+
+    def __init__(self):
+        self.sent = []
+        self.responses = []
+
+    def send_frame(self, message, timeout=1.0):
+        self.send_frame_nowait(message)
+        return self.receive_frame(timeout)
+
+    def send_frame_nowait(self, message):
+        self.sent.append(message)
+        idx = (message.arbitration_id >> 14) & 0xFFF
+        self.responses.append(
+            CANMessage(
+                arbitration_id=0x0C003FE0 | (idx << 14),
+                data=b"\x01\xc2",
+                is_extended_id=True,
+            )
+        )
+
+    def receive_frame(self, timeout=1.0):
+        if self.responses:
+            return self.responses.pop(0)
+        raise TimeoutError("no frame")
+
+    def flush_input_buffer(self):
+        pass
+
+
+def _broadcast_client():
+    """Client with the coordinator's read policy and fresh GT2/GT8/GT9 broadcasts."""
+    cache = BroadcastCache()
+    for base, idx in [(0x0060, 12), (0x0270, 6), (0x0270, 5)]:
+        can_id = 0x0C000000 | (idx << 14) | base
+        cache.update(
+            BroadcastReading(can_id, base, idx, 2, b"\x01\x90", 400, time.time())
+        )
+    adapter = EchoAdapter()
+    policy = BroadcastReadPolicy(cache, mapping=broadcast_read_mapping())
+    return adapter, HeatPumpClient(adapter, read_policy=policy)
+
+
+class TestBroadcastReadPolicy:
+    def test_rtr_temperatures_read_by_rtr_despite_fresh_broadcast(self):
+        adapter, client = _broadcast_client()
+
+        results = client.read_many(["GT8_TEMP", "GT9_TEMP", "GT2_TEMP"], deadline=1.0)
+
+        assert results["GT8_TEMP"]["source"] == "rtr"
+        assert results["GT9_TEMP"]["source"] == "rtr"
+        assert results["GT8_TEMP"]["decoded"] == 45.0
+        assert results["GT2_TEMP"]["source"] == "broadcast"
+        sent = sorted((m.arbitration_id >> 14) & 0xFFF for m in adapter.sent)
+        assert sent == sorted(client.get(n).idx for n in ("GT8_TEMP", "GT9_TEMP"))
+
+    def test_read_parameter_service_bypasses_broadcasts(self, mock_hass):
+        coordinator = BuderusCoordinator(
+            mock_hass, "/dev/ttyACM0", DEFAULT_SCAN_INTERVAL
+        )
+        adapter, coordinator._client = _broadcast_client()
+
+        result = coordinator._sync_read_parameter("GT2_TEMP")
+
+        assert result["source"] == "rtr"
+        assert result["decoded"] == 45.0
+        assert len(adapter.sent) == 1
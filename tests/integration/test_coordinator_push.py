@@ -0,0 +1,125 @@
+"""Integration tests for pushing broadcast temperatures to entities."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.buderus_wps.buderus_wps.broadcast_monitor import (
+    BroadcastReading,
+)
+from custom_components.buderus_wps.const import (
+    DEFAULT_SCAN_INTERVAL,
+    SENSOR_OUTDOOR,
+    SENSOR_SETPOINT_C1,
+    SENSOR_SUPPLY,
+)
+
+# Import after conftest sets up mocks
+from custom_components.buderus_wps.coordinator import (
+    BROADCAST_PUSH_INTERVAL,
+    BuderusCoordinator,
+    BuderusData,
+)
+
+OUTDOOR = (0x0060, 12)
+SETPOINT_C1 = (0x0060, 33)
+SUPPLY = (0x0270, 6)
+
+
+def _reading(key, temperature):
+    base, idx = key
+    raw = round(temperature * 10)
+    return BroadcastReading(
+        can_id=0x0C000000 | (idx << 14) | base,
+        base=base,
+        idx=idx,
+        dlc=2,
+        raw_data=raw.to_bytes(2, "big", signed=True),
+        raw_value=raw,
+        timestamp=time.time(),
+    )
+
+
+def _data(**temperatures):
+    return BuderusData(
+        temperatures=temperatures,
+        compressor_running=False,
+        compressor_blocked=None,
+        energy_blocked=False,
+        dhw_active=False,
+        g1_active=False,
+        dhw_extra_duration=0,
+        heating_season_mode=None,
+        dhw_program_mode=None,
+        heating_curve_offset=None,
+        dhw_stop_temp=None,
+        dhw_setpoint=None,
+    )
+
+
+@pytest.fixture
+def coordinator(mock_hass: MagicMock) -> BuderusCoordinator:
+    delays = []
+
+    def call_later(delay, callback, *args):
+        delays.append(delay)
+        callback(*args)
+
+    mock_hass.loop.call_soon_threadsafe.side_effect = lambda f, *args: f(*args)
+    mock_hass.loop.call_later.side_effect = call_later
+    coordinator = BuderusCoordinator(mock_hass, "/dev/ttyACM0", DEFAULT_SCAN_INTERVAL)
+    coordinator.hass = mock_hass
+    coordinator.delays = delays
+    coordinator.async_update_listeners = MagicMock()
+    coordinator._broadcast_sensors = {
+        OUTDOOR: SENSOR_OUTDOOR,
+        SETPOINT_C1: SENSOR_SETPOINT_C1,
+        SUPPLY: SENSOR_SUPPLY,
+    }
+    coordinator.data = _data(outdoor=5.0, setpoint_c1=21.0, supply=35.0)
+    coordinator._last_known_good_data = coordinator.data
+    return coordinator
+
+
+class TestBroadcastPush:
+    def test_change_beyond_deadband_is_pushed(self, coordinator):
+        coordinator._on_broadcast(_reading(OUTDOOR, 5.5))
+
+        assert coordinator.data.temperatures[SENSOR_OUTDOOR] == 5.5
+        assert coordinator._last_known_good_data is coordinator.data
+        coordinator.async_update_listeners.assert_called_once()
+
+    def test_jitter_within_deadband_is_dropped(self, coordinator):
+        coordinator._on_broadcast(_reading(OUTDOOR, 5.1))
+        coordinator._on_broadcast(_reading(OUTDOOR, 5.0))
+
+        assert coordinator.data.temperatures[SENSOR_OUTDOOR] == 5.0
+        coordinator.async_update_listeners.assert_not_called()
+
+    def test_zero_deadband_pushes_any_change(self, coordinator):
+        coordinator._on_broadcast(_reading(SETPOINT_C1, 21.1))
+
+        assert coordinator.data.temperatures[SENSOR_SETPOINT_C1] == 21.1
+
+    def test_pushes_are_rate_limited(self, coordinator):
+        coordinator._on_broadcast(_reading(OUTDOOR, 6.0))
+        coordinator._on_broadcast(_reading(OUTDOOR, 7.0))
+
+        assert coordinator.delays[0] == 0.0
+        assert BROADCAST_PUSH_INTERVAL - 1.0 < coordinator.delays[1]
+
+    def test_rtr_owned_and_unmapped_sensors_are_ignored(self, coordinator):
+        coordinator._rtr_temperature_sensors.add(SENSOR_SUPPLY)
+
+        coordinator._on_broadcast(_reading(SUPPLY, 40.0))
+        coordinator._on_broadcast(_reading((0x0270, 99), 40.0))
+
+        coordinator.async_update_listeners.assert_not_called()
+
+    def test_no_push_before_first_update(self, coordinator):
+        coordinator.data = None
+
+        coordinator._on_broadcast(_reading(OUTDOOR, 9.0))
+
+        coordinator.hass.loop.call_soon_threadsafe.assert_not_called()
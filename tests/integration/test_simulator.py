@@ -0,0 +1,212 @@
+"""Integration tests: unmodified USBtinAdapter against the pty heat pump simulator."""
+
+import struct
+import time
+
+import pytest
+from buderus_wps.broadcast_monitor import BroadcastMonitor
+from buderus_wps.can_adapter import USBtinAdapter
+from buderus_wps.element_discovery import ElementDiscovery
+from buderus_wps.exceptions import TimeoutError
+from buderus_wps.heat_pump import HeatPumpClient
+from buderus_wps.parameter_registry import ParameterRegistry
+from buderus_wps.replay_adapter import CaptureRecord
+from buderus_wps.simulator import (
+    FaultConfig,
+    HeatPumpSimulator,
+    SimulatedBroadcast,
+    broadcasts_from_capture,
+    default_broadcasts,
+    encode_element_list,
+)
+
+PARAMETERS = [
+    {
+        "idx": 1,
+        "extid": "61E1E1FC660023",
+        "max": 5,
+        "min": 0,
+        "format": "int",
+        "read": 0,
+        "text": "ACCESS_LEVEL",
+    },
+    {
+        "idx": 11,
+        "extid": "E555E4E11002E9",
+        "max": 40,
+        "min": 1,
+        "format": "int",
+        "read": 0,
+        "text": "ADDITIONAL_BLOCK_HIGH_T2_TEMP",
+    },
+    {
+        "idx": 22,
+        "extid": "C02D7CE3A909E9",
+        "max": 600,
+        "min": 200,
+        "format": "tem",
+        "read": 0,
+        "text": "ADDITIONAL_DHW_ACKNOWLEDGED",
+    },
+]
+
+
+@pytest.fixture
+def simulator():
+    sim = HeatPumpSimulator(parameters=PARAMETERS, broadcasts=[], frame_time=0)
+    with sim:
+        yield sim
+
+
+@pytest.fixture
+def adapter(simulator):
+    usbtin = USBtinAdapter(simulator.port, timeout=1.0)
+    usbtin.stabilization_delay = 0
+    usbtin.connect()
+    yield usbtin
+    usbtin.disconnect()
+
+
+class TestSimulatorProtocol:
+    """Protocol coverage through the real adapter."""
+
+    def test_adapter_initializes(self, adapter):
+        assert adapter.is_open
+
+    def test_read_parameter_default(self, adapter):
+        client = HeatPumpClient(adapter, ParameterRegistry(PARAMETERS))
+
+        assert (
+            client.read_parameter("ADDITIONAL_BLOCK_HIGH_T2_TEMP")["raw"] == b"\x00\x01"
+        )
+
+    def test_configured_value(self, simulator, adapter):
+        simulator.set_value("ACCESS_LEVEL", 3)
+        client = HeatPumpClient(adapter, ParameterRegistry(PARAMETERS))
+
+        assert client.read_parameter("ACCESS_LEVEL")["decoded"] == 3
+
+    def test_write_then_read(self, simulator, adapter):
+        client = HeatPumpClient(adapter, ParameterRegistry(PARAMETERS))
+        client.write_value("ACCESS_LEVEL", 4)
+
+        assert client.read_parameter("ACCESS_LEVEL")["decoded"] == 4
+        assert simulator.stats.writes == 1
+
+    def test_element_discovery(self, adapter):
+        elements = ElementDiscovery(adapter).discover(timeout=10.0)
+
+        assert [(e.idx, e.text, e.min_value, e.max_value) for e in elements] == [
+            (p["idx"], p["text"], p["min"], p["max"]) for p in PARAMETERS
+        ]
+
+    def test_broadcasts(self):
+        broadcast = SimulatedBroadcast(can_id=0x0C084060, period=0.05, data=b"\x00\xd7")
+        with HeatPumpSimulator(parameters=PARAMETERS, broadcasts=[broadcast]) as sim:
+            with USBtinAdapter(sim.port, timeout=1.0) as usbtin:
+                cache = BroadcastMonitor(usbtin).collect(duration=0.3)
+
+        reading = cache.get(0x0C084060)
+        assert reading is not None
+        assert reading.temperature == 21.5
+
+    def test_collect_until_returns_early(self):
+        broadcast = SimulatedBroadcast(can_id=0x0C084060, period=0.05, data=b"\x00\xd7")
+        with HeatPumpSimulator(parameters=PARAMETERS, broadcasts=[broadcast]) as sim:
+            with USBtinAdapter(sim.port, timeout=1.0) as usbtin:
+                result = BroadcastMonitor(usbtin).collect_until(
+                    [(0x0060, 0x21)], deadline=5.0
+                )
+
+        assert result.complete
+        assert result.elapsed < 1.0
+
+    def test_continuous_monitor_alongside_rtr(self):
+        broadcast = SimulatedBroadcast(can_id=0x0C084060, period=0.02, data=b"\x00\xd7")
+        with HeatPumpSimulator(parameters=PARAMETERS, broadcasts=[broadcast]) as sim:
+            with USBtinAdapter(sim.port, timeout=1.0) as usbtin:
+                usbtin.start_reader()
+                monitor = BroadcastMonitor(usbtin)
+                monitor.start()
+                client = HeatPumpClient(usbtin, ParameterRegistry(PARAMETERS))
+                try:
+                    for _ in range(5):
+                        assert client.read_parameter("ACCESS_LEVEL")["decoded"] == 0
+                    time.sleep(0.1)
+                    reading = monitor.cache.get_fresh(0x21, 0x060, max_age=1.0)
+                finally:
+                    monitor.stop()
+
+        assert reading is not None
+        assert reading.temperature == 21.5
+
+
+class TestSimulatorFaults:
+    """Fault injection."""
+
+    def test_dropped_response_times_out(self):
+        faults = FaultConfig(drop_rate=1.0)
+        with HeatPumpSimulator(
+            parameters=PARAMETERS, broadcasts=[], faults=faults
+        ) as sim:
+            with USBtinAdapter(sim.port, timeout=1.0) as usbtin:
+                client = HeatPumpClient(usbtin, ParameterRegistry(PARAMETERS))
+                with pytest.raises(TimeoutError):
+                    client.read_parameter("ACCESS_LEVEL", timeout=0.2)
+
+            assert sim.stats.dropped == 1
+
+    def test_latency_is_applied(self):
+        faults = FaultConfig(latency=0.1)
+        with HeatPumpSimulator(
+            parameters=PARAMETERS, broadcasts=[], faults=faults
+        ) as sim:
+            with USBtinAdapter(sim.port, timeout=1.0) as usbtin:
+                client = HeatPumpClient(usbtin, ParameterRegistry(PARAMETERS))
+                start = time.monotonic()
+                client.read_parameter("ACCESS_LEVEL")
+
+                assert time.monotonic() - start >= 0.1
+
+    def test_bus_load_generates_traffic(self):
+        faults = FaultConfig(bus_load=200)
+        with HeatPumpSimulator(
+            parameters=PARAMETERS, broadcasts=[], faults=faults
+        ) as sim:
+            with USBtinAdapter(sim.port, timeout=1.0) as usbtin:
+                cache = BroadcastMonitor(usbtin).collect(duration=0.2)
+
+        assert len(cache.readings) > 5
+
+
+class TestSimulatorHelpers:
+    """Element list encoding and broadcast tables."""
+
+    def test_element_list_layout(self):
+        blob = encode_element_list(PARAMETERS[:1])
+
+        assert struct.unpack(">H7siiB", blob[:18]) == (
+            1,
+            bytes.fromhex("61E1E1FC660023"),
+            5,
+            0,
+            len("ACCESS_LEVEL") + 1,
+        )
+        assert blob[18:] == b"ACCESS_LEVEL\x00"
+
+    def test_default_broadcasts_spread_over_period(self):
+        broadcasts = default_broadcasts(period=10.0)
+
+        assert broadcasts
+        assert all(0 <= b.phase < 10.0 for b in broadcasts)
+
+    def test_broadcasts_from_capture(self):
+        records = [
+            CaptureRecord(t, "<", b"T0C08406020102\r") for t in (0.0, 1.0, 2.0, 3.0)
+        ] + [CaptureRecord(4.0, "<", b"T0C003FE0200FA\r")]
+
+        (broadcast,) = broadcasts_from_capture(records)
+
+        assert broadcast.can_id == 0x0C084060
+        assert broadcast.period == 1.0
+        assert broadcast.data == b"\x01\x02"
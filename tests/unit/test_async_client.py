@@ -0,0 +1,241 @@
+"""Unit tests for AsyncUSBtinTransport and AsyncHeatPumpClient over a pty."""
+
+import asyncio
+import os
+import sys
+
+import pytest
+from buderus_wps.async_client import AsyncHeatPumpClient
+from buderus_wps.async_transport import AsyncUSBtinTransport
+from buderus_wps.can_message import CANMessage
+from buderus_wps.exceptions import DeviceInitializationError, TimeoutError
+from buderus_wps.parameter_registry import ParameterRegistry
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="pty-based tests require POSIX"
+)
+
+RESPONSE_BASE = 0x0C003FE0
+
+
+class PtyDevice:
+    """Minimal USBtin emulator on the master side of a pty."""
+
+    def __init__(self, values=None, nak=()):
+        self.master, slave = os.openpty()
+        self.port = os.ttyname(slave)
+        self._slave = slave
+        self.values = dict(values or {})
+        self.nak = set(nak)
+        self.received = []
+        self._buffer = b""
+
+    def start(self):
+        asyncio.get_running_loop().add_reader(self.master, self._on_readable)
+
+    def close(self):
+        asyncio.get_running_loop().remove_reader(self.master)
+        os.close(self.master)
+        os.close(self._slave)
+
+    def push(self, can_id, data):
+        frame = CANMessage(arbitration_id=can_id, data=data, is_extended_id=True)
+        os.write(self.master, frame.to_usbtin_format().encode("ascii"))
+
+    def _on_readable(self):
+        self._buffer += os.read(self.master, 1024)
+        while b"\r" in self._buffer:
+            line, self._buffer = self._buffer.split(b"\r", 1)
+            self.received.append(line)
+            self._respond(line.decode("ascii"))
+
+    def _respond(self, line):
+        if line in self.nak:
+            os.write(self.master, b"\a")
+        elif line in ("V", "v"):
+            os.write(self.master, line.encode() + b"0107\r")
+        elif line.startswith("R"):
+            idx = (int(line[1:9], 16) >> 14) & 0xFFF
+            os.write(self.master, b"Z\r")
+            if idx in self.values:
+                self.push(RESPONSE_BASE | (idx << 14), self.values[idx])
+        elif line.startswith("T"):
+            os.write(self.master, b"Z\r")
+        else:
+            os.write(self.master, b"\r")
+
+
+def _registry():
+    return ParameterRegistry(
+        [
+            {
+                "idx": idx,
+                "extid": "00",
+                "min": 0,
+                "max": 100,
+                "format": "int",
+                "read": 1,
+                "text": f"P{idx}",
+            }
+            for idx in range(1, 6)
+        ]
+    )
+
+
+@pytest.fixture
+def no_stabilization_delay(monkeypatch):
+    monkeypatch.setenv("USBTIN_STABILIZATION_DELAY", "0")
+
+
+@pytest.fixture
+async def device(no_stabilization_delay):
+    dev = PtyDevice(values={1: b"\x00\x07", 2: b"\x00\x2a", 3: b"\x00\x03"})
+    dev.start()
+    yield dev
+    dev.close()
+
+
+@pytest.fixture
+async def transport(device):
+    transport = AsyncUSBtinTransport(device.port, timeout=0.5)
+    await transport.connect()
+    yield transport
+    await transport.disconnect()
+
+
+class TestAsyncUSBtinTransport:
+    """Event-loop driven SLCAN transport."""
+
+    async def test_connect_runs_init_sequence(self, device, transport):
+        assert transport.is_open
+        assert device.received[:7] == [b"C", b"C", b"V", b"V", b"v", b"S4", b"O"]
+
+    async def test_connect_tolerates_close_nak(self, no_stabilization_delay):
+        dev = PtyDevice(nak={"C"})
+        dev.start()
+        try:
+            async with AsyncUSBtinTransport(dev.port) as transport:
+                assert transport.is_open
+        finally:
+            dev.close()
+
+    async def test_connect_fails_on_repeated_version_nak(self, no_stabilization_delay):
+        dev = PtyDevice(nak={"V", "v"})
+        dev.start()
+        try:
+            transport = AsyncUSBtinTransport(dev.port)
+            with pytest.raises(DeviceInitializationError):
+                await transport.connect()
+            assert not transport.is_open
+        finally:
+            dev.close()
+
+    async def test_send_request_matches_response_id(self, transport):
+        request = CANMessage(
+            arbitration_id=0x04003FE0 | (2 << 14),
+            data=b"",
+            is_extended_id=True,
+            is_remote_frame=True,
+        )
+        response = await transport.send_request(request, RESPONSE_BASE | (2 << 14))
+
+        assert response.data == b"\x00\x2a"
+        assert transport.pending_waiters == 0
+
+    async def test_send_request_timeout(self, transport):
+        request = CANMessage(
+            arbitration_id=0x04003FE0 | (9 << 14),
+            data=b"",
+            is_extended_id=True,
+            is_remote_frame=True,
+        )
+        with pytest.raises(TimeoutError):
+            await transport.send_request(
+                request, RESPONSE_BASE | (9 << 14), timeout=0.05
+            )
+        assert transport.pending_waiters == 0
+
+    async def test_subscription_receives_filtered_frames(self, device, transport):
+        sub = transport.subscribe(0x0C084060)
+        device.push(0x0C0C0060, b"\x00\x01")
+        device.push(0x0C084060, b"\x00\xd2")
+
+        frame = await sub.get(timeout=1.0)
+        assert frame.arbitration_id == 0x0C084060
+        assert await sub.get(timeout=0.05) is None
+
+    async def test_read_only_rejects_transmit(self, device):
+        transport = AsyncUSBtinTransport(device.port, read_only=True, skip_init=True)
+        await transport.connect()
+        try:
+            with pytest.raises(PermissionError):
+                transport.send_frame_nowait(
+                    CANMessage(arbitration_id=0x100, data=b"", is_extended_id=True)
+                )
+        finally:
+            await transport.disconnect()
+
+
+class TestAsyncHeatPumpClient:
+    """Coroutine parameter reads, writes and broadcast streaming."""
+
+    async def test_read_decodes_value(self, transport):
+        client = AsyncHeatPumpClient(transport, _registry())
+        result = await client.read("P2")
+
+        assert result["idx"] == 2
+        assert result["decoded"] == 42
+
+    async def test_read_many_returns_partial_results(self, transport):
+        client = AsyncHeatPumpClient(transport, _registry())
+        results = await client.read_many(
+            ["P1", "P2", "P3", "P4", "NOPE"], timeout=0.1, window=2
+        )
+
+        assert results["P1"]["decoded"] == 7
+        assert results["P3"]["decoded"] == 3
+        assert results["P4"]["error"] == "timeout"
+        assert results["NOPE"]["error"] == "unknown_parameter"
+
+    async def test_write_sends_encoded_frame(self, device, transport):
+        client = AsyncHeatPumpClient(transport, _registry())
+        await client.write("P5", 9)
+        await asyncio.sleep(0.05)
+
+        assert device.received[-1] == b"T04017FE0" + b"2" + b"0009"
+
+    async def test_subscribe_broadcasts_applies_filter(self, device, transport):
+        client = AsyncHeatPumpClient(transport, _registry())
+        stream = client.subscribe_broadcasts(lambda r: r.base == 0x0060)
+
+        async def first():
+            return await stream.__anext__()
+
+        task = asyncio.ensure_future(first())
+        await asyncio.sleep(0.01)
+        device.push(0x0C0C0270, b"\x00\x01")
+        device.push(0x0C084060, b"\x00\xd2")
+        reading = await asyncio.wait_for(task, 1.0)
+        await stream.aclose()
+
+        assert reading.idx == 0x21
+        assert reading.raw_value == 0xD2
+
+    async def test_subscribe_broadcasts_skips_parameter_responses(
+        self, device, transport
+    ):
+        client = AsyncHeatPumpClient(transport, _registry())
+        stream = client.subscribe_broadcasts()
+
+        async def first():
+            return await stream.__anext__()
+
+        task = asyncio.ensure_future(first())
+        await asyncio.sleep(0.01)
+        device.push(0x0C003FE0 | (0x21 << 14), b"\x00\x09")
+        device.push(0x0C084060, b"\x00\xd2")
+        reading = await asyncio.wait_for(task, 1.0)
+        await stream.aclose()
+
+        assert reading.can_id == 0x0C084060
+        assert reading.raw_value == 0xD2
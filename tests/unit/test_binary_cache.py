@@ -0,0 +1,138 @@
+"""Unit tests for the binary parameter/element cache format."""
+
+import pytest
+from buderus_wps.binary_cache import (
+    HEADER_SIZE,
+    RECORD_SIZE,
+    CacheFormatError,
+    decode_cache,
+    encode_cache,
+    is_binary_cache,
+    read_cache,
+    write_cache,
+)
+from buderus_wps.parameter_data import PARAMETER_DATA
+
+RECORDS = [
+    {
+        "idx": 11,
+        "extid": "E555E4E11002E9",
+        "min": -30,
+        "max": 40,
+        "format": "tem",
+        "read": 0,
+        "text": "ADDITIONAL_BLOCK_HIGH_T2_TEMP",
+    },
+    {
+        "idx": 2475,
+        "extid": "E1263DCA71010F",
+        "min": 0,
+        "max": 48,
+        "read": 1,
+        "text": "XDHW_TIME",
+    },
+]
+
+
+class TestEncoding:
+    def test_round_trip(self):
+        data = encode_cache(RECORDS, {"complete": True}, b"\x01\x02")
+
+        contents = decode_cache(data)
+
+        assert contents.records == RECORDS
+        assert contents.meta == {"complete": True}
+        assert contents.blob == b"\x01\x02"
+        assert contents.checksum.startswith("sha256:")
+
+    def test_fixed_width_records_and_shared_strings(self):
+        records = [dict(RECORDS[0], idx=n) for n in range(3)]
+
+        data = encode_cache(records)
+
+        strings = len(RECORDS[0]["text"]) + len(RECORDS[0]["format"])
+        assert len(data) == HEADER_SIZE + 3 * RECORD_SIZE + strings + len(b"{}")
+
+    def test_encoding_is_deterministic(self):
+        assert encode_cache(RECORDS, {"a": 1}) == encode_cache(RECORDS, {"a": 1})
+
+    def test_full_parameter_table(self):
+        contents = decode_cache(encode_cache(PARAMETER_DATA))
+
+        assert contents.records == PARAMETER_DATA
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"extid": "E555"},
+            {"extid": "not hex"},
+            {"text": "Ä"},
+            {"idx": 70000},
+        ],
+    )
+    def test_unencodable_record(self, change):
+        with pytest.raises(CacheFormatError):
+            encode_cache([dict(RECORDS[0], **change)])
+
+
+class TestValidation:
+    def test_rejects_other_files(self):
+        with pytest.raises(CacheFormatError):
+            decode_cache(b'{"version": 2, "elements": []}' + bytes(HEADER_SIZE))
+        with pytest.raises(CacheFormatError):
+            decode_cache(b"BWPC")
+
+    def test_rejects_other_version(self):
+        data = bytearray(encode_cache(RECORDS))
+        data[4:6] = (99).to_bytes(2, "big")
+
+        with pytest.raises(CacheFormatError, match="version"):
+            decode_cache(bytes(data))
+
+    def test_rejects_truncated_file(self):
+        data = encode_cache(RECORDS)
+
+        with pytest.raises(CacheFormatError, match="size"):
+            decode_cache(data[:-1])
+
+    @pytest.mark.parametrize("offset", [HEADER_SIZE, HEADER_SIZE + RECORD_SIZE, -1])
+    def test_rejects_corrupted_body(self, offset):
+        data = bytearray(encode_cache(RECORDS, {"complete": True}))
+        data[offset] ^= 0x01
+
+        with pytest.raises(CacheFormatError, match="checksum"):
+            decode_cache(bytes(data))
+
+
+class TestFiles:
+    def test_write_then_read(self, tmp_path):
+        path = tmp_path / "cache.bin"
+
+        size = write_cache(path, RECORDS, {"device": "WPS"}, b"raw")
+
+        assert size == path.stat().st_size
+        assert is_binary_cache(path)
+        contents = read_cache(path)
+        assert contents.records == RECORDS
+        assert contents.blob == b"raw"
+        assert not (tmp_path / "cache.bin.tmp").exists()
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "cache.bin"
+        write_cache(path, RECORDS)
+
+        with pytest.raises(CacheFormatError):
+            write_cache(path, [dict(RECORDS[0], extid="bad")])
+
+        assert read_cache(path).records == RECORDS
+        assert not (tmp_path / "cache.bin.tmp").exists()
+
+    def test_empty_or_json_file(self, tmp_path):
+        path = tmp_path / "cache.json"
+        path.write_bytes(b"")
+        with pytest.raises(CacheFormatError):
+            read_cache(path)
+
+        path.write_text('{"elements": []}')
+        assert not is_binary_cache(path)
+        assert not is_binary_cache(tmp_path / "missing.bin")
@@ -1,15 +1,22 @@
 """Unit tests for BroadcastMonitor class."""
 
+import threading
+import time
 from unittest.mock import MagicMock
 
 import pytest
 from buderus_wps.broadcast_monitor import (
     KNOWN_BROADCASTS,
+    BroadcastCache,
     BroadcastMonitor,
     BroadcastReading,
+    CollectionResult,
     decode_can_id,
     encode_can_id,
+    parse_broadcast_frame,
 )
+from buderus_wps.can_message import CANMessage
+from buderus_wps.demultiplexer import FrameDemultiplexer
 
 
 class TestDecodeCanId:
@@ -325,3 +332,294 @@ class TestIsTemperatureParam:
         assert is_temperature_param("dp1") is False
         assert is_temperature_param("str") is False
         assert is_temperature_param("") is False
+
+
+def _frame(can_id: int, data: bytes = b"\x00\xd7") -> CANMessage:
+    return CANMessage(arbitration_id=can_id, data=data, is_extended_id=True)
+
+
+def _wait_for(predicate, timeout: float = 1.0) -> bool:
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestContinuousMonitoring:
+    """Background monitoring on the shared reader."""
+
+    @pytest.fixture
+    def adapter(self) -> MagicMock:
+        adapter = MagicMock()
+        adapter.is_open = True
+        adapter.reader_running = True
+        adapter.demultiplexer = FrameDemultiplexer()
+        return adapter
+
+    def test_requires_reader(self) -> None:
+        adapter = MagicMock()
+        adapter.is_open = True
+        adapter.reader_running = False
+
+        with pytest.raises(RuntimeError, match="background reader"):
+            BroadcastMonitor(adapter).start()
+
+    def test_cache_follows_bus(self, adapter: MagicMock) -> None:
+        monitor = BroadcastMonitor(adapter)
+        monitor.start()
+        try:
+            adapter.demultiplexer.dispatch(_frame(0x0C084060))
+            adapter.demultiplexer.dispatch(_frame(0x0C084060, b"\x00\xd8"))
+
+            assert _wait_for(
+                lambda: monitor.cache.get(0x0C084060) is not None
+                and monitor.cache.get(0x0C084060).raw_value == 0xD8
+            )
+        finally:
+            monitor.stop()
+
+        assert not monitor.running
+        assert monitor.cache.get(0x0C084060) is not None  # kept after stop
+
+    def test_rtr_traffic_not_cached_and_not_stolen(self, adapter: MagicMock) -> None:
+        monitor = BroadcastMonitor(adapter)
+        monitor.start()
+        try:
+            response_id = 0x0C003FE0 | (22 << 14)
+            future = adapter.demultiplexer.expect(response_id)
+            adapter.demultiplexer.dispatch(_frame(response_id))
+            adapter.demultiplexer.dispatch(_frame(0x0C084060))
+
+            assert future.result(timeout=1.0).arbitration_id == response_id
+            assert _wait_for(lambda: monitor.cache.get(0x0C084060) is not None)
+            assert monitor.cache.get(response_id) is None
+        finally:
+            monitor.stop()
+
+    def test_collect_while_running_keeps_live_cache(self, adapter: MagicMock) -> None:
+        monitor = BroadcastMonitor(adapter)
+        monitor.start()
+        try:
+            adapter.demultiplexer.dispatch(_frame(0x0C084060))
+            assert _wait_for(lambda: monitor.cache.get(0x0C084060) is not None)
+
+            collected = monitor.collect(duration=0.05)
+
+            assert collected.get(0x0C084060) is None  # arrived before collect
+            assert monitor.cache.get(0x0C084060) is not None
+        finally:
+            monitor.stop()
+
+
+class TestCollectUntil:
+    """Early-exit collection of required keys."""
+
+    @pytest.fixture
+    def adapter(self) -> MagicMock:
+        adapter = MagicMock()
+        adapter.is_open = True
+        adapter.reader_running = True
+        adapter.demultiplexer = FrameDemultiplexer()
+        return adapter
+
+    def test_returns_when_all_keys_seen(self, adapter: MagicMock) -> None:
+        monitor = BroadcastMonitor(adapter)
+        monitor.start()
+        try:
+            timer = threading.Timer(
+                0.05,
+                lambda: [
+                    adapter.demultiplexer.dispatch(_frame(0x0C030060)),
+                    adapter.demultiplexer.dispatch(_frame(0x0C014270)),
+                ],
+            )
+            timer.start()
+
+            result = monitor.collect_until([(0x0060, 12), (0x0270, 5)], deadline=5.0)
+        finally:
+            monitor.stop()
+
+        assert isinstance(result, CollectionResult)
+        assert result.complete
+        assert result.elapsed < 1.0
+        assert result.readings[(0x0270, 5)].temperature == 21.5
+
+    def test_reports_missed_keys(self, adapter: MagicMock) -> None:
+        monitor = BroadcastMonitor(adapter)
+        monitor.start()
+        try:
+            result = monitor.collect_until([(0x0060, 12)], deadline=0.05)
+        finally:
+            monitor.stop()
+
+        assert not result.complete
+        assert result.missed == [(0x0060, 12)]
+        assert result.readings == {}
+
+    def test_fresh_cached_readings_count(self, adapter: MagicMock) -> None:
+        monitor = BroadcastMonitor(adapter)
+        monitor.cache.update(parse_broadcast_frame(_frame(0x0C030060)))
+
+        result = monitor.collect_until([(0x0060, 12)], deadline=5.0, max_age=60.0)
+
+        assert result.complete
+        assert result.elapsed < 1.0
+
+    def test_reads_adapter_when_not_running(self) -> None:
+        adapter = MagicMock()
+        adapter.is_open = True
+        adapter._read_frame.side_effect = [
+            _frame(0x0C000060),
+            None,
+            _frame(0x0C030060),
+        ] + [None] * 100
+        monitor = BroadcastMonitor(adapter)
+
+        result = monitor.collect_until([(0x0060, 12)], deadline=5.0)
+
+        assert result.complete
+        assert adapter._read_frame.call_count == 3
+        assert monitor.cache.get(0x0C000060) is not None
+
+    def test_learns_period_and_flags_unreachable(self, caplog) -> None:
+        adapter = MagicMock()
+        adapter.is_open = True
+        monitor = BroadcastMonitor(adapter)
+        for timestamp in (0.0, 10.0, 20.0, 32.0):
+            reading = parse_broadcast_frame(_frame(0x0C030060))
+            reading.timestamp = timestamp
+            monitor._store(reading)
+        # A second CAN ID for the same key does not disturb the period
+        other = parse_broadcast_frame(_frame(0x08030060))
+        other.timestamp = 33.0
+        monitor._store(other)
+
+        assert monitor.broadcast_period(0x0060, 12) == pytest.approx(10.5)
+        assert monitor.broadcast_period(0x0060, 0) is None
+
+        adapter._read_frame.return_value = None
+        with caplog.at_level("WARNING"):
+            result = monitor.collect_until([(0x0060, 12)], deadline=0.1)
+
+        assert result.unreachable == [(0x0060, 12)]
+        assert "longer than the 0.1s deadline" in caplog.text
+
+
+class TestBroadcastCacheFreshness:
+    """Per-key staleness checks."""
+
+    def test_get_fresh(self) -> None:
+        cache = BroadcastCache()
+        cache.update(
+            BroadcastReading(
+                can_id=0x0C030060,
+                base=0x0060,
+                idx=12,
+                dlc=2,
+                raw_data=b"\x00\x69",
+                raw_value=105,
+                timestamp=1000.0,
+            )
+        )
+
+        assert cache.get_fresh(12, 0x0060, max_age=60.0, now=1030.0) is not None
+        assert cache.get_fresh(12, 0x0060, max_age=60.0, now=1100.0) is None
+        assert cache.get_fresh(13, 0x0060, max_age=60.0, now=1030.0) is None
+
+    def test_snapshot_is_independent(self) -> None:
+        cache = BroadcastCache()
+        snapshot = cache.snapshot()
+        cache.update(parse_broadcast_frame(_frame(0x0C084060)))
+
+        assert snapshot.readings == {}
+
+
+class TestBroadcastCacheIndexes:
+    """Constant-time (base, idx) and idx lookups."""
+
+    @staticmethod
+    def _reading(
+        can_id: int, value: int = 100, timestamp: float = 0.0
+    ) -> BroadcastReading:
+        reading = parse_broadcast_frame(_frame(can_id, value.to_bytes(2, "big")))
+        reading.timestamp = timestamp
+        return reading
+
+    def test_latest_id_wins_for_shared_key(self) -> None:
+        cache = BroadcastCache()
+        cache.update(self._reading(0x0C030060, 100))
+        cache.update(self._reading(0x08030060, 200))  # same base/idx, other prefix
+
+        assert cache.get_by_idx_and_base(12, 0x0060).raw_value == 200
+        assert cache.get_by_idx(12).can_id == 0x08030060
+
+        cache.update(self._reading(0x0C030060, 150))
+
+        assert cache.get_by_idx_and_base(12, 0x0060).raw_value == 150
+        assert cache.get_by_idx(12).can_id == 0x0C030060
+
+    def test_snapshot_keeps_latest_source(self) -> None:
+        cache = BroadcastCache()
+        cache.update(self._reading(0x0C030060, 100, timestamp=1000.0))
+        cache.update(self._reading(0x08030060, 200, timestamp=1015.0))
+
+        assert cache.snapshot().get_by_idx_and_base(12, 0x0060).raw_value == 200
+        assert (
+            BroadcastCache(readings=dict(cache.readings)).get_by_idx(12).raw_value
+            == 200
+        )
+
+    def test_get_by_idx_across_bases(self) -> None:
+        cache = BroadcastCache()
+        cache.update(self._reading(encode_can_id(0x03, 278, 0x0270)))
+
+        assert cache.get_by_idx(278).base == 0x0270
+        assert cache.get_by_idx(279) is None
+
+    def test_clear_resets_indexes(self) -> None:
+        cache = BroadcastCache()
+        cache.update(self._reading(0x0C030060))
+        cache.clear()
+
+        assert cache.get_by_idx_and_base(12, 0x0060) is None
+        assert cache.get_by_idx(12) is None
+
+    def test_constructed_with_readings(self) -> None:
+        reading = self._reading(0x0C030060)
+
+        cache = BroadcastCache(readings={reading.can_id: reading})
+
+        assert cache.get_by_idx_and_base(12, 0x0060) is reading
+        assert cache.snapshot().get_by_idx(12) is reading
+
+    def test_get_many(self) -> None:
+        cache = BroadcastCache()
+        cache.update(self._reading(0x0C030060, timestamp=1000.0))
+        cache.update(self._reading(0x0C000060, timestamp=900.0))
+
+        result = cache.get_many(
+            [(0x0060, 12), (0x0060, 0), (0x0061, 12)], max_age=60.0, now=1010.0
+        )
+
+        assert result[(0x0060, 12)].raw_value == 100
+        assert result[(0x0060, 0)] is None  # stale
+        assert result[(0x0061, 12)] is None  # never seen
+        assert cache.get_many([(0x0060, 0)])[(0x0060, 0)] is not None
+
+
+class TestMonitorHistory:
+    """Samples recorded per (base, idx) by the monitor."""
+
+    def test_store_records_first_seen_id_only(self) -> None:
+        adapter = MagicMock()
+        adapter.is_open = True
+        monitor = BroadcastMonitor(adapter)
+
+        monitor._store(parse_broadcast_frame(_frame(0x0C030060, b"\x00\x64")))
+        monitor._store(parse_broadcast_frame(_frame(0x08030060, b"\x00\x01")))
+        monitor._store(parse_broadcast_frame(_frame(0x0C030060, b"\x00\x66")))
+
+        stats = monitor.history.window(0x0060, 12, 60.0)
+        assert (stats.count, stats.min, stats.max) == (2, 100, 102)
@@ -0,0 +1,120 @@
+"""Unit tests for priority arbitration of bus transactions."""
+
+import threading
+import time
+
+import pytest
+from buderus_wps.bus_arbiter import BusArbiter, BusPriority
+from buderus_wps.exceptions import TimeoutError
+
+
+def _queue_behind(arbiter, priorities):
+    """Start one waiter per priority while the bus is held; return grant order."""
+    order = []
+    threads = []
+    for priority in priorities:
+
+        def work(priority=priority):
+            with arbiter.claim(priority):
+                order.append(priority)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        threads.append(thread)
+        # Wait until the waiter is queued so arrival order is deterministic
+        while arbiter.stats()["waiting"] < len(threads):
+            time.sleep(0.001)
+    return order, threads
+
+
+class TestBusArbiter:
+    def test_most_urgent_waiter_is_granted_first(self):
+        arbiter = BusArbiter()
+        arbiter.acquire(BusPriority.POLL)
+        order, threads = _queue_behind(
+            arbiter,
+            [
+                BusPriority.DISCOVERY,
+                BusPriority.POLL,
+                BusPriority.INTERACTIVE_WRITE,
+                BusPriority.INTERACTIVE_READ,
+            ],
+        )
+
+        arbiter.release()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert order == [
+            BusPriority.INTERACTIVE_WRITE,
+            BusPriority.INTERACTIVE_READ,
+            BusPriority.POLL,
+            BusPriority.DISCOVERY,
+        ]
+
+    def test_equal_priority_served_in_arrival_order(self):
+        arbiter = BusArbiter()
+        arbiter.acquire()
+        order = []
+        threads = []
+        for n in range(3):
+
+            def work(n=n):
+                with arbiter.claim(BusPriority.POLL):
+                    order.append(n)
+
+            threads.append(threading.Thread(target=work))
+            threads[-1].start()
+            while arbiter.stats()["waiting"] < n + 1:
+                time.sleep(0.001)
+
+        arbiter.release()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert order == [0, 1, 2]
+
+    def test_reentrant_for_owning_thread(self):
+        arbiter = BusArbiter()
+
+        with arbiter.claim():
+            with arbiter.claim(BusPriority.DISCOVERY):
+                pass
+            assert arbiter._owner == threading.get_ident()
+
+        assert arbiter._owner is None
+
+    def test_timeout(self):
+        arbiter = BusArbiter()
+        holder = threading.Thread(target=arbiter.acquire)
+        holder.start()
+        holder.join()
+
+        with pytest.raises(TimeoutError):
+            arbiter.acquire(timeout=0.01)
+        assert arbiter.stats()["waiting"] == 0
+
+    def test_release_by_other_thread_is_rejected(self):
+        arbiter = BusArbiter()
+
+        with pytest.raises(RuntimeError):
+            arbiter.release()
+
+    def test_using_sets_class_of_claims(self):
+        arbiter = BusArbiter()
+
+        with arbiter.using(BusPriority.POLL):
+            assert arbiter.priority is BusPriority.POLL
+            with arbiter.using(BusPriority.INTERACTIVE_WRITE):
+                with arbiter.claim():
+                    pass
+            assert arbiter.priority is BusPriority.POLL
+        with arbiter.claim():
+            pass
+
+        classes = arbiter.stats()["classes"]
+        assert arbiter.priority is BusPriority.INTERACTIVE_READ
+        assert classes["interactive_write"]["grants"] == 1
+        assert classes["interactive_read"]["grants"] == 1
+        assert classes["poll"]["grants"] == 0
+        assert classes["poll"]["wait_avg_ms"] is None
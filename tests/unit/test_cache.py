@@ -5,16 +5,10 @@
 Tests the ParameterCache class which manages persistent storage of discovered
 parameters to avoid slow 30+ second discovery on every connection.
 
-Cache structure (JSON):
-{
-    "version": "1.0.0",
-    "created": "2025-12-18T10:30:00Z",
-    "device_id": "BUDERUS_WPS_SN12345",
-    "firmware": "v1.23",
-    "checksum": "sha256:abc123...",
-    "element_count": 1789,
-    "parameters": [...]
-}
+Cache structure (binary_cache format):
+- header: magic, format version, record count, section sizes, SHA-256
+- records + string table: the parameters
+- metadata: created, device_id, firmware
 """
 
 import json
@@ -23,13 +17,21 @@ from pathlib import Path
 
 import pytest
 
+from buderus_wps.binary_cache import HEADER_SIZE, read_cache
 from buderus_wps.cache import ParameterCache
 
 
+def _corrupt(path: Path, offset: int) -> None:
+    """Flip the bits of one byte of a cache file."""
+    data = bytearray(path.read_bytes())
+    data[offset] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+
 @pytest.fixture
 def temp_cache_path(tmp_path):
     """Create temporary cache file path."""
-    return tmp_path / "params_cache.json"
+    return tmp_path / "params_cache.bin"
 
 
 @pytest.fixture
@@ -77,91 +79,70 @@ class TestParameterCacheSave:
         assert result is True
         assert temp_cache_path.exists()
 
-    def test_save_creates_valid_json(self, temp_cache_path, sample_parameters):
-        """Verify saved file contains valid JSON."""
+    def test_save_creates_binary_cache(self, temp_cache_path, sample_parameters):
+        """Verify saved file is a binary cache, written atomically."""
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters)
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-
-        assert isinstance(data, dict)
+        assert temp_cache_path.read_bytes()[:4] == b"BWPC"
+        assert not temp_cache_path.with_name(temp_cache_path.name + ".tmp").exists()
 
     def test_save_includes_version(self, temp_cache_path, sample_parameters):
         """Verify saved data includes version field."""
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters)
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
+        data = temp_cache_path.read_bytes()
 
-        assert "version" in data
-        assert data["version"] == "1.0.0"
+        assert int.from_bytes(data[4:6], "big") == ParameterCache.CACHE_VERSION
 
     def test_save_includes_created_timestamp(self, temp_cache_path, sample_parameters):
         """Verify saved data includes created timestamp."""
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters)
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
+        meta = read_cache(temp_cache_path).meta
 
-        assert "created" in data
+        assert "created" in meta
         # Verify it's a valid ISO format timestamp
-        datetime.fromisoformat(data["created"])
+        datetime.fromisoformat(meta["created"])
 
     def test_save_includes_checksum(self, temp_cache_path, sample_parameters):
         """Verify saved data includes checksum."""
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters)
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-
-        assert "checksum" in data
-        assert data["checksum"].startswith("sha256:")
+        assert read_cache(temp_cache_path).checksum.startswith("sha256:")
 
     def test_save_includes_parameters(self, temp_cache_path, sample_parameters):
         """Verify saved data includes parameters."""
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters)
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-
-        assert "parameters" in data
-        assert len(data["parameters"]) == 3
+        assert read_cache(temp_cache_path).records == sample_parameters
 
     def test_save_includes_element_count(self, temp_cache_path, sample_parameters):
         """Verify saved data includes element count."""
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters)
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
+        data = temp_cache_path.read_bytes()
 
-        assert "element_count" in data
-        assert data["element_count"] == 3
+        assert int.from_bytes(data[6:10], "big") == 3
 
     def test_save_with_device_id(self, temp_cache_path, sample_parameters):
         """Verify save includes optional device_id."""
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters, device_id="BUDERUS_WPS_001")
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-
-        assert data.get("device_id") == "BUDERUS_WPS_001"
+        assert cache.metadata()["device_id"] == "BUDERUS_WPS_001"
 
     def test_save_with_firmware(self, temp_cache_path, sample_parameters):
         """Verify save includes optional firmware version."""
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters, firmware="v1.23")
 
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-
-        assert data.get("firmware") == "v1.23"
+        assert cache.metadata()["firmware"] == "v1.23"
 
     def test_save_returns_false_on_write_error(self, sample_parameters):
         """Verify save returns False when write fails."""
@@ -200,11 +181,7 @@ class TestParameterCacheLoad:
         cache.save(sample_parameters)
 
         # Corrupt the checksum
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-        data["checksum"] = "sha256:invalid_checksum"
-        with open(temp_cache_path, "w") as f:
-            json.dump(data, f)
+        _corrupt(temp_cache_path, HEADER_SIZE - 1)
 
         loaded = cache.load()
         assert loaded is None
@@ -263,11 +240,7 @@ class TestParameterCacheIsValid:
         cache.save(sample_parameters)
 
         # Modify version
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-        data["version"] = "2.0.0"
-        with open(temp_cache_path, "w") as f:
-            json.dump(data, f)
+        _corrupt(temp_cache_path, 5)
 
         assert cache.is_valid() is False
 
@@ -278,12 +251,8 @@ class TestParameterCacheIsValid:
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters)
 
-        # Corrupt checksum
-        with open(temp_cache_path) as f:
-            data = json.load(f)
-        data["checksum"] = "sha256:0000000000000000"
-        with open(temp_cache_path, "w") as f:
-            json.dump(data, f)
+        # Corrupt a parameter
+        _corrupt(temp_cache_path, HEADER_SIZE)
 
         assert cache.is_valid() is False
 
@@ -314,40 +283,49 @@ class TestParameterCacheChecksum:
     """T042: Test checksum computation."""
 
     def test_checksum_is_deterministic(self, temp_cache_path, sample_parameters):
-        """Verify checksum is deterministic for same data."""
-        cache1 = ParameterCache(temp_cache_path)
-        cache1.save(sample_parameters)
-
-        with open(temp_cache_path) as f:
-            data1 = json.load(f)
-        checksum1 = data1["checksum"]
-
-        # Save again
-        cache2 = ParameterCache(temp_cache_path)
-        cache2.save(sample_parameters)
+        """Verify the same parameters are stored identically."""
+        cache = ParameterCache(temp_cache_path)
+        cache.save(sample_parameters, device_id="WPS")
+        data = read_cache(temp_cache_path)
 
-        with open(temp_cache_path) as f:
-            data2 = json.load(f)
-        checksum2 = data2["checksum"]
+        copy_path = temp_cache_path.with_name("copy.bin")
+        ParameterCache(copy_path).save(sample_parameters, device_id="WPS")
+        copy = read_cache(copy_path)
 
-        assert checksum1 == checksum2
+        assert copy.records == data.records
+        assert len(copy_path.read_bytes()) == len(temp_cache_path.read_bytes())
 
     def test_checksum_changes_with_data(self, temp_cache_path, sample_parameters):
         """Verify checksum changes when data changes."""
         cache = ParameterCache(temp_cache_path)
         cache.save(sample_parameters)
-
-        with open(temp_cache_path) as f:
-            data1 = json.load(f)
-        checksum1 = data1["checksum"]
+        checksum1 = read_cache(temp_cache_path).checksum
 
         # Modify parameters
-        modified = sample_parameters.copy()
+        modified = [dict(p) for p in sample_parameters]
         modified[0]["max"] = 100
         cache.save(modified)
-
-        with open(temp_cache_path) as f:
-            data2 = json.load(f)
-        checksum2 = data2["checksum"]
+        checksum2 = read_cache(temp_cache_path).checksum
 
         assert checksum1 != checksum2
+        assert cache.load()[0]["max"] == 100
+
+    def test_unchanged_file_is_read_once(
+        self, temp_cache_path, sample_parameters, monkeypatch
+    ):
+        """Verify is_valid() followed by load() reads the file once."""
+        import buderus_wps.cache as cache_module
+
+        ParameterCache(temp_cache_path).save(sample_parameters)
+        reads = []
+        original = cache_module.read_cache
+        monkeypatch.setattr(
+            cache_module,
+            "read_cache",
+            lambda path: reads.append(path) or original(path),
+        )
+        cache = ParameterCache(temp_cache_path)
+
+        assert cache.is_valid()
+        assert cache.load() == sample_parameters
+        assert len(reads) == 1
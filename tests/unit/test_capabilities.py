@@ -0,0 +1,84 @@
+"""Unit tests for the map of parameters the heat pump cannot answer."""
+
+import json
+
+import pytest
+from buderus_wps.capabilities import CapabilityMap
+
+
+class TestCapabilityMap:
+    def test_marked_after_consistent_failures(self, clock):
+        caps = CapabilityMap(threshold=3, clock=clock)
+
+        caps.record("gt10_temp", "invalid_dlc")
+        caps.record("GT10_TEMP", "invalid_dlc")
+        assert caps.should_read("GT10_TEMP")
+        caps.record("GT10_TEMP", "invalid_dlc")
+
+        assert caps.status("GT10_TEMP") == "invalid_dlc"
+        assert not caps.should_read("GT10_TEMP")
+        assert caps.unavailable() == {"GT10_TEMP": "invalid_dlc"}
+
+    def test_changing_result_restarts_streak(self, clock):
+        caps = CapabilityMap(threshold=2, clock=clock)
+
+        caps.record("GT11_TEMP", "timeout")
+        caps.record("GT11_TEMP", "no_value")
+        assert caps.status("GT11_TEMP") is None
+        caps.record("GT11_TEMP", "no_value")
+
+        assert caps.status("GT11_TEMP") == "dead"
+
+    def test_unrelated_errors_are_ignored(self, clock):
+        caps = CapabilityMap(threshold=2, clock=clock)
+
+        caps.record("GT3_TEMP", "timeout")
+        caps.record("GT3_TEMP", "parse_error")
+        caps.record("GT3_TEMP", "timeout")
+
+        assert caps.status("GT3_TEMP") == "absent"
+
+    def test_probed_after_interval_and_recovers(self, clock):
+        caps = CapabilityMap(threshold=1, probe_interval=3600, clock=clock)
+        caps.record("GT10_TEMP", "timeout")
+
+        clock.now += 3599
+        assert not caps.should_read("GT10_TEMP")
+        clock.now += 1
+        assert caps.should_read("GT10_TEMP")
+        caps.record("GT10_TEMP", "timeout")
+        assert not caps.should_read("GT10_TEMP")
+
+        clock.now += 3600
+        caps.record("GT10_TEMP", None)
+        assert caps.status("GT10_TEMP") is None
+        assert caps.snapshot()["parameters"] == {}
+
+    def test_save_and_load_round_trip(self, tmp_path, clock):
+        path = tmp_path / "caps.json"
+        caps = CapabilityMap(path, threshold=1, clock=clock)
+
+        assert not caps.save()  # nothing marked yet
+        caps.record("GT10_TEMP", "invalid_dlc")
+        assert caps.save()
+        assert not caps.save()
+
+        loaded = CapabilityMap(path, threshold=1, clock=clock)
+        assert loaded.load()
+        assert loaded.status("GT10_TEMP") == "invalid_dlc"
+        assert not (tmp_path / "caps.json.tmp").exists()
+
+    def test_load_ignores_missing_or_corrupt_file(self, tmp_path):
+        path = tmp_path / "caps.json"
+        caps = CapabilityMap(path)
+        assert not caps.load()
+
+        path.write_text("{not json")
+        assert not caps.load()
+
+        path.write_text(json.dumps({"version": 99, "parameters": {}}))
+        assert not caps.load()
+
+    def test_rejects_zero_threshold(self):
+        with pytest.raises(ValueError):
+            CapabilityMap(threshold=0)
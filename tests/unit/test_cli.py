@@ -2,6 +2,8 @@ import argparse
 import pathlib
 import sys
 
+import pytest
+
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
@@ -270,3 +272,85 @@ class TestBroadcastReadArguments:
         assert args.broadcast is True
         assert args.duration == 15.0
         assert args.json is True
+
+
+def test_monitor_replays_capture(tmp_path, capsys):
+    """--replay runs the monitor command against a FHEM capture."""
+    import json
+
+    capture = tmp_path / "capture.hex"
+    capture.write_text(
+        "< 2025/12/24 16:50:51.000100000  length=15 from=0 to=14\n"
+        " 54 30 43 30 38 34 30 36 30 32 30 31 30 32 0d     T0C08406020102.\n"
+        "--\n"
+    )
+
+    rc = cli.main(
+        [
+            "--replay",
+            str(capture),
+            "--replay-speed",
+            "max",
+            "monitor",
+            "--duration",
+            "0.05",
+            "--json",
+        ]
+    )
+
+    assert rc == 0
+    output = json.loads(capsys.readouterr().out)
+    assert output["readings"][0]["can_id"] == "0x0C084060"
+
+
+def test_monitor_stats_json(tmp_path, capsys):
+    """--stats adds per-key count and min/max/mean to the monitor output."""
+    import json
+
+    capture = tmp_path / "capture.hex"
+    capture.write_text(
+        "< 2025/12/24 16:50:51.000100000  length=15 from=0 to=14\n"
+        " 54 30 43 30 38 34 30 36 30 32 30 30 44 37 0d     T0C0840602000D7.\n"
+        "--\n"
+        "< 2025/12/24 16:50:52.000100000  length=15 from=0 to=14\n"
+        " 54 30 43 30 38 34 30 36 30 32 30 30 44 39 0d     T0C0840602000D9.\n"
+        "--\n"
+    )
+
+    rc = cli.main(
+        [
+            "--replay",
+            str(capture),
+            "--replay-speed",
+            "max",
+            "monitor",
+            "--duration",
+            "0.2",
+            "--json",
+            "--stats",
+        ]
+    )
+
+    assert rc == 0
+    stats = json.loads(capsys.readouterr().out)["readings"][0]["stats"]
+    assert stats["count"] == 2
+    assert stats["min"] == 21.5
+    assert stats["max"] == 21.7
+    assert stats["mean"] == 21.6
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "nan", "fast"])
+def test_replay_speed_rejects_non_positive(value, capsys):
+    """Invalid --replay-speed values are reported by the parser."""
+    parser = cli.build_parser()
+    with pytest.raises(SystemExit) as exc:
+        parser.parse_args(["--replay-speed", value, "list"])
+
+    assert exc.value.code == 2
+    assert "--replay-speed" in capsys.readouterr().err
+
+
+def test_replay_speed_max_is_unthrottled():
+    parser = cli.build_parser()
+    assert parser.parse_args(["--replay-speed", "max", "list"]).replay_speed is None
+    assert parser.parse_args(["--replay-speed", "2.5", "list"]).replay_speed == 2.5
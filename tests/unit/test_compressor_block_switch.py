@@ -74,6 +74,9 @@ class TestCompressorBlockSwitchActions:
 
         await switch.async_turn_on()
 
+        mock_coordinator.run_bus_write.assert_called_once_with(
+            mock_coordinator.energy_blocking.block_compressor
+        )
         mock_coordinator.async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
@@ -92,6 +95,9 @@ class TestCompressorBlockSwitchActions:
 
         await switch.async_turn_off()
 
+        mock_coordinator.run_bus_write.assert_called_once_with(
+            mock_coordinator.energy_blocking.unblock_compressor
+        )
         mock_coordinator.async_request_refresh.assert_called_once()
 
     @pytest.mark.asyncio
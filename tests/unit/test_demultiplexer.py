@@ -0,0 +1,133 @@
+"""Unit tests for FrameDemultiplexer routing of background-reader frames."""
+
+import threading
+
+import pytest
+from buderus_wps.can_message import CANMessage
+from buderus_wps.demultiplexer import FrameDemultiplexer
+from buderus_wps.exceptions import DeviceDisconnectedError
+
+
+def _frame(can_id: int, data: bytes = b"\x01") -> CANMessage:
+    return CANMessage(arbitration_id=can_id, data=data, is_extended_id=True)
+
+
+class TestResponseWaiters:
+    """Futures keyed by arbitration ID."""
+
+    def test_waiter_receives_matching_frame(self):
+        demux = FrameDemultiplexer()
+        future = demux.expect(0x0C007FE0)
+
+        assert demux.dispatch(_frame(0x0C007FE0, b"\x02")) is True
+        assert future.result(timeout=0).data == b"\x02"
+
+    def test_claimed_frame_not_in_backlog(self):
+        demux = FrameDemultiplexer()
+        demux.expect(0x0C007FE0)
+        demux.dispatch(_frame(0x0C007FE0))
+
+        assert demux.backlog_size == 0
+        assert demux.pending_waiters == 0
+
+    def test_unrelated_frame_goes_to_backlog(self):
+        demux = FrameDemultiplexer()
+        future = demux.expect(0x0C007FE0)
+
+        assert demux.dispatch(_frame(0x0C084060)) is False
+        assert not future.done()
+        assert demux.next_unclaimed(timeout=0).arbitration_id == 0x0C084060
+
+    def test_cancel_removes_waiter(self):
+        demux = FrameDemultiplexer()
+        future = demux.expect(0x0C007FE0)
+        demux.cancel(0x0C007FE0, future)
+
+        assert demux.pending_waiters == 0
+        assert demux.dispatch(_frame(0x0C007FE0)) is False
+
+    def test_fail_all_sets_exception(self):
+        demux = FrameDemultiplexer()
+        future = demux.expect(0x0C007FE0)
+        demux.fail_all(DeviceDisconnectedError("gone"))
+
+        with pytest.raises(DeviceDisconnectedError):
+            future.result(timeout=0)
+
+    def test_waiter_resolved_from_other_thread(self):
+        demux = FrameDemultiplexer()
+        future = demux.expect(0x0C007FE0)
+        threading.Timer(0.05, demux.dispatch, args=(_frame(0x0C007FE0),)).start()
+
+        assert future.result(timeout=1.0).arbitration_id == 0x0C007FE0
+
+
+class TestSubscriptions:
+    """Subscriber queues receive copies of matching frames."""
+
+    def test_filtered_subscription(self):
+        demux = FrameDemultiplexer()
+        sub = demux.subscribe(0x09FDBFE0)
+        demux.dispatch(_frame(0x09FDBFE0, b"\xaa"))
+        demux.dispatch(_frame(0x0C084060))
+
+        assert sub.get(timeout=0).data == b"\xaa"
+        assert sub.get(timeout=0) is None
+
+    def test_subscription_sees_claimed_frames(self):
+        demux = FrameDemultiplexer()
+        sub = demux.subscribe()
+        demux.expect(0x0C007FE0)
+        demux.dispatch(_frame(0x0C007FE0))
+
+        assert sub.get(timeout=0).arbitration_id == 0x0C007FE0
+
+    def test_include_backlog_moves_matching_frames(self):
+        demux = FrameDemultiplexer()
+        demux.dispatch(_frame(0x09FDBFE0, b"\x01"))
+        demux.dispatch(_frame(0x0C084060))
+
+        sub = demux.subscribe(0x09FDBFE0, include_backlog=True)
+
+        assert sub.get(timeout=0).data == b"\x01"
+        assert demux.backlog_size == 1
+
+    def test_full_subscription_counts_drops(self):
+        demux = FrameDemultiplexer()
+        sub = demux.subscribe(maxsize=1)
+        demux.dispatch(_frame(0x100))
+        demux.dispatch(_frame(0x101))
+
+        assert sub.dropped == 1
+
+    def test_unsubscribe_stops_delivery(self):
+        demux = FrameDemultiplexer()
+        sub = demux.subscribe()
+        demux.unsubscribe(sub)
+        demux.dispatch(_frame(0x100))
+
+        assert sub.get_nowait() is None
+
+
+class TestUnclaimedBacklog:
+    """Bounded backlog backing receive_frame()."""
+
+    def test_next_unclaimed_timeout(self):
+        demux = FrameDemultiplexer()
+        assert demux.next_unclaimed(timeout=0.01) is None
+
+    def test_backlog_is_bounded(self):
+        demux = FrameDemultiplexer(backlog_size=2)
+        for can_id in (0x100, 0x101, 0x102):
+            demux.dispatch(_frame(can_id))
+
+        assert demux.backlog_size == 2
+        assert demux.next_unclaimed(timeout=0).arbitration_id == 0x101
+
+    def test_clear_unclaimed_returns_count(self):
+        demux = FrameDemultiplexer()
+        demux.dispatch(_frame(0x100))
+        demux.dispatch(_frame(0x101))
+
+        assert demux.clear_unclaimed() == 2
+        assert demux.backlog_size == 0
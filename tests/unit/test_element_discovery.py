@@ -374,10 +374,10 @@ class TestElementDiscovery:
         assert elements[1].text == "PARAM_B"
 
     def test_discover_with_cache_saves_file(self, tmp_path):
-        """Test that discover_with_cache saves elements to JSON file."""
-        import json
+        """Test that discover_with_cache saves elements to a binary cache."""
         from unittest.mock import Mock
 
+        from buderus_wps.binary_cache import read_cache
         from buderus_wps.can_message import CANMessage
         from buderus_wps.element_discovery import (
             ELEMENT_COUNT_RESPONSE_ID,
@@ -421,15 +421,16 @@ class TestElementDiscovery:
         assert elements[0].text == "TEST_PARAM"
         assert cache_file.exists()
 
-        # Verify cache file content (version 2 format)
-        with open(cache_file) as f:
-            cache_data = json.load(f)
-        assert cache_data["version"] == 2
-        assert cache_data["reported_bytes"] == len(element_data)
-        assert cache_data["actual_bytes"] == len(element_data)
-        assert cache_data["actual_count"] == 1
-        assert cache_data["complete"] is True
-        assert cache_data["elements"][0]["text"] == "TEST_PARAM"
+        # Verify cache file content (version 3, binary format)
+        contents = read_cache(cache_file)
+        assert contents.meta["version"] == 3
+        assert contents.meta["reported_bytes"] == len(element_data)
+        assert contents.meta["actual_bytes"] == len(element_data)
+        assert contents.meta["actual_count"] == 1
+        assert contents.meta["complete"] is True
+        assert contents.records[0]["text"] == "TEST_PARAM"
+        assert contents.records[0]["extid"] == "AA" * 7
+        assert contents.blob == element_data
 
     def test_discover_with_cache_loads_existing(self, tmp_path):
         """Test that discover_with_cache loads from existing cache file."""
@@ -819,3 +820,298 @@ class TestFailFastBehavior:
         # Should raise DiscoveryRequiredError - incomplete cache is not valid fallback
         with pytest.raises(DiscoveryRequiredError):
             discovery.discover_with_cache(str(cache_file), max_retries=1)
+
+
+def _element(idx: int, name: str) -> bytes:
+    name_bytes = name.encode("ascii")
+    return (
+        idx.to_bytes(2, "big")
+        + bytes(7)
+        + (100).to_bytes(4, "big", signed=True)
+        + (0).to_bytes(4, "big", signed=True)
+        + bytes([len(name_bytes) + 1])
+        + name_bytes
+        + b"\x00"
+    )
+
+
+class ElementStore:
+    """Mock adapter serving an element list in chunks, with failing offsets."""
+
+    def __init__(self, data: bytes, fail_at=(), fail_always=False):
+        from unittest.mock import Mock
+
+        self.data = data
+        self.fail_at = set(fail_at)
+        self.fail_always = fail_always
+        self.offsets: list[int] = []
+        self.adapter = Mock()
+        self.adapter.send_frame.side_effect = self._count
+        self.adapter.send_frame_nowait.side_effect = self._request
+        self.adapter.receive_stream.side_effect = self._stream
+
+    def _count(self, message, timeout=None):
+        from buderus_wps.can_message import CANMessage
+        from buderus_wps.element_discovery import ELEMENT_COUNT_RESPONSE_ID
+
+        return CANMessage(
+            arbitration_id=ELEMENT_COUNT_RESPONSE_ID,
+            data=len(self.data).to_bytes(4, "big"),
+            is_extended_id=True,
+        )
+
+    def _request(self, message):
+        import struct
+
+        from buderus_wps.element_discovery import ELEMENT_DATA_REQUEST_ID
+
+        if message.arbitration_id == ELEMENT_DATA_REQUEST_ID:
+            self.pending = struct.unpack(">II", message.data)
+
+    def _stream(self, expected_bytes, timeout, frame_filter, on_data=None):
+        from buderus_wps.exceptions import TimeoutError
+
+        size, offset = self.pending
+        self.offsets.append(offset)
+        if offset in self.fail_at:
+            if not self.fail_always:
+                self.fail_at.discard(offset)
+            raise TimeoutError("chunk lost")
+        chunk = self.data[offset : offset + size]
+        if on_data is not None:
+            # Deliver the chunk frame by frame like the adapter does
+            for start in range(0, len(chunk), 8):
+                on_data(chunk[start : start + 8])
+        return chunk
+
+
+ELEMENTS = b"".join(_element(i, f"PARAM_{i:02d}") for i in range(8))
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    import buderus_wps.element_discovery as element_discovery
+
+    monkeypatch.setattr(element_discovery.time, "sleep", lambda seconds: None)
+
+
+def _age_cache(path) -> None:
+    """Backdate the timestamp of an element cache file."""
+    from buderus_wps.binary_cache import read_cache, write_cache
+
+    contents = read_cache(path)
+    contents.meta["timestamp_unix"] = 0
+    write_cache(path, contents.records, contents.meta, contents.blob)
+
+
+def _discovery(store: "ElementStore"):
+    from buderus_wps.element_discovery import ElementDiscovery
+
+    discovery = ElementDiscovery(store.adapter)
+    discovery.CHUNK_SIZE = 64
+    return discovery
+
+
+class TestIncrementalDiscovery:
+    """Resumable, chunk-checksummed discovery and cache revalidation."""
+
+    def test_failed_chunk_resumes_at_last_good_offset(self, tmp_path, fast_retries):
+        store = ElementStore(ELEMENTS, fail_at={128})
+
+        elements = _discovery(store).discover_with_cache(
+            str(tmp_path / "cache.json"), max_retries=2
+        )
+
+        assert len(elements) == 8
+        assert store.offsets == [0, 64, 128, 128, 192]
+
+    def test_resumed_chunks_delivered_as_one_batch(self, tmp_path, fast_retries):
+        store = ElementStore(ELEMENTS, fail_at={128})
+        batches = []
+
+        elements = _discovery(store).discover_with_cache(
+            str(tmp_path / "cache.json"),
+            max_retries=2,
+            on_elements=lambda batch: batches.append([e.text for e in batch]),
+        )
+
+        # Attempt 1 delivers chunks 0 and 64; attempt 2 replays both at once
+        first, second, resumed, *rest = batches
+        assert resumed == first + second
+        assert resumed + [text for batch in rest for text in batch] == [
+            e.text for e in elements
+        ]
+
+    def test_expired_cache_revalidated_with_one_chunk(self, tmp_path):
+        from buderus_wps.binary_cache import read_cache
+
+        cache_file = tmp_path / "cache.json"
+        _discovery(ElementStore(ELEMENTS)).discover_with_cache(str(cache_file))
+        _age_cache(cache_file)
+        store = ElementStore(ELEMENTS)
+
+        elements = _discovery(store).discover_with_cache(
+            str(cache_file), max_cache_age=60.0
+        )
+
+        assert len(elements) == 8
+        assert store.offsets == [0]
+        assert store.adapter.send_frame.call_count == 1
+        assert read_cache(cache_file).meta["timestamp_unix"] > 0
+
+    def test_changed_first_chunk_triggers_download(self, tmp_path):
+        cache_file = tmp_path / "cache.json"
+        _discovery(ElementStore(ELEMENTS)).discover_with_cache(str(cache_file))
+        _age_cache(cache_file)
+        changed = _element(0, "RENAMED_0") + ELEMENTS[len(_element(0, "RENAMED_0")) :]
+        store = ElementStore(changed)
+
+        elements = _discovery(store).discover_with_cache(
+            str(cache_file), max_cache_age=60.0
+        )
+
+        assert elements[0].text == "RENAMED_0"
+        # The first chunk fetched for revalidation is not fetched again
+        assert store.offsets == [0, 64, 128, 192]
+
+    def test_progress_of_failed_discovery_survives_restart(
+        self, tmp_path, fast_retries
+    ):
+        from buderus_wps.exceptions import DiscoveryRequiredError
+
+        cache_file = tmp_path / "cache.json"
+        failing = ElementStore(ELEMENTS, fail_at={128}, fail_always=True)
+        with pytest.raises(DiscoveryRequiredError):
+            _discovery(failing).discover_with_cache(str(cache_file), max_retries=1)
+        assert (tmp_path / "cache.json.partial").exists()
+        store = ElementStore(ELEMENTS)
+
+        elements = _discovery(store).discover_with_cache(str(cache_file))
+
+        assert len(elements) == 8
+        assert store.offsets == [0, 128, 192]
+        assert not (tmp_path / "cache.json.partial").exists()
+
+    def test_corrupt_cache_is_downloaded_again(self, tmp_path):
+        cache_file = tmp_path / "cache.bin"
+        _discovery(ElementStore(ELEMENTS)).discover_with_cache(str(cache_file))
+        data = bytearray(cache_file.read_bytes())
+        data[-1] ^= 0xFF  # last byte of the raw element list
+        cache_file.write_bytes(bytes(data))
+        store = ElementStore(ELEMENTS)
+
+        elements = _discovery(store).discover_with_cache(str(cache_file))
+
+        assert len(elements) == 8
+        assert store.offsets == [0, 64, 128, 192]
+
+    def test_legacy_json_cache_is_migrated(self, tmp_path):
+        import json
+
+        from buderus_wps.element_discovery import load_element_cache
+
+        legacy = tmp_path / "cache.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "version": 2,
+                    "complete": True,
+                    "elements": [
+                        {
+                            "idx": 7,
+                            "extid": "00000000000000",
+                            "text": "PARAM_07",
+                            "min_value": 0,
+                            "max_value": 100,
+                        }
+                    ],
+                }
+            )
+        )
+        cache_file = tmp_path / "cache.bin"
+        store = ElementStore(ELEMENTS)
+
+        elements = _discovery(store).discover_with_cache(
+            str(cache_file), legacy_path=str(legacy)
+        )
+        assert [e.text for e in elements] == ["PARAM_07"]
+        assert store.offsets == []
+
+        # An expired legacy cache has no chunks to revalidate: the list is
+        # downloaded and the binary cache replaces the JSON file
+        elements = _discovery(store).discover_with_cache(
+            str(cache_file), max_cache_age=-1.0, legacy_path=str(legacy)
+        )
+        assert len(elements) == 8
+        assert not legacy.exists()
+        assert load_element_cache(str(cache_file)) == elements
+
+
+class TestStreamingElementParser:
+    """Incremental parsing of the element stream as frames arrive."""
+
+    def test_elements_emitted_as_soon_as_complete(self):
+        from buderus_wps.element_discovery import StreamingElementParser
+
+        parser = StreamingElementParser()
+        first = len(_element(0, "PARAM_00"))
+
+        assert parser.feed(ELEMENTS[: first - 1]) == []
+        assert [e.text for e in parser.feed(ELEMENTS[first - 1 : first])] == [
+            "PARAM_00"
+        ]
+        assert parser.offset == first
+
+    def test_byte_by_byte_feed_matches_whole_parse(self):
+        from buderus_wps.element_discovery import StreamingElementParser
+
+        parser = StreamingElementParser()
+        elements = []
+        for n in range(len(ELEMENTS)):
+            elements.extend(parser.feed(ELEMENTS[n : n + 1]))
+        parser.close()
+
+        assert elements == ElementListParser().parse_data_chunk(ELEMENTS)
+        assert len(elements) == 8
+        assert parser.bytes_skipped == 0
+
+    def test_lost_frame_resyncs_at_next_element(self):
+        from buderus_wps.element_discovery import StreamingElementParser
+
+        size = len(_element(0, "PARAM_00"))
+        damaged = ELEMENTS[: size + 5] + ELEMENTS[size + 13 :]
+        parser = StreamingElementParser()
+
+        elements = parser.feed(damaged)
+
+        assert [e.text for e in elements] == [
+            "PARAM_00",
+            *(f"PARAM_{i:02d}" for i in range(2, 8)),
+        ]
+        assert parser.resyncs == 1
+        assert parser.bytes_skipped == size - 8
+
+    def test_resync_gives_up_after_window(self):
+        from buderus_wps.element_discovery import StreamingElementParser
+
+        parser = StreamingElementParser(resync_window=32)
+
+        elements = parser.feed(bytes(18) + b"\xff" * 100 + ELEMENTS)
+
+        assert elements == []
+        assert parser.desynced
+        assert parser.feed(ELEMENTS) == []
+
+    def test_discover_emits_elements_per_chunk(self):
+        store = ElementStore(ELEMENTS)
+        seen = []
+
+        elements = _discovery(store).discover(
+            on_elements=lambda batch: seen.append((batch, list(store.offsets)))
+        )
+
+        assert len(elements) == 8
+        assert [e for batch, _ in seen for e in batch] == elements
+        # Each chunk's elements arrive before the next chunk is requested
+        assert len(seen) > 1
+        assert seen[0][1] == [0]
@@ -89,7 +89,7 @@ def test_metadata_written(tmp_path, monkeypatch):
     # Use a tiny custom target for isolation
     source = tmp_path / "dummy.pm"
     source.write_text(
-        "{ 'idx' => 1 , 'extid' => 'AA' , 'max' => 1 , 'min' => 0 , 'format' => 'int' , 'read' => 0 , 'text' => 'FOO' },",
+        "{ 'idx' => 1 , 'extid' => '61E1E1FC660023' , 'max' => 1 , 'min' => -5 , 'format' => 'int' , 'read' => 0 , 'text' => 'FOO' },",
         encoding="utf-8",
     )
     target = tmp_path / "out.py"
@@ -108,3 +108,4 @@ def test_metadata_written(tmp_path, monkeypatch):
     assert meta.exists()
     meta_data = json.loads(meta.read_text(encoding="utf-8"))
     assert meta_data["count"] == 1
+    assert gen.load_existing() == entries
@@ -0,0 +1,125 @@
+"""Unit tests for CAN bus diagnostic sensors and the diagnostics download."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from buderus_wps.metrics import BusMetrics
+
+# conftest.py sets up HA mocks before we import
+from custom_components.buderus_wps.const import DOMAIN
+from custom_components.buderus_wps.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.buderus_wps.sensor import (
+    BUS_METRIC_SENSORS,
+    BuderusBusMetricSensor,
+    async_setup_entry,
+)
+
+
+@pytest.fixture
+def metrics() -> BusMetrics:
+    bus = BusMetrics()
+    bus.incr("timeouts", 3)
+    bus.record_latency("GT3_TEMP", 0.012)
+    return bus
+
+
+class TestBusMetricSensors:
+    """Diagnostic sensor entities."""
+
+    def test_counter_value(self, mock_coordinator, metrics):
+        mock_coordinator.get_bus_metrics = lambda per_parameter=False: metrics.snapshot(
+            per_parameter=per_parameter
+        )
+
+        sensor = BuderusBusMetricSensor(mock_coordinator, "timeouts")
+
+        assert sensor.native_value == 3
+        assert sensor.name == "CAN Timeouts"
+
+    def test_latency_value(self, mock_coordinator, metrics):
+        mock_coordinator.get_bus_metrics = lambda per_parameter=False: metrics.snapshot(
+            per_parameter=per_parameter
+        )
+
+        sensor = BuderusBusMetricSensor(mock_coordinator, "rtr_latency_p50")
+
+        assert sensor.native_value == pytest.approx(12.0, rel=0.25)
+
+    def test_none_before_connect(self, mock_coordinator):
+        mock_coordinator.get_bus_metrics = MagicMock(return_value=None)
+
+        assert (
+            BuderusBusMetricSensor(mock_coordinator, "rx_frame_rate").native_value
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_created_for_config_entry(self, mock_hass, mock_coordinator):
+        mock_coordinator.parameter_allowlist = []
+        entry = MagicMock()
+        entry.entry_id = "abc"
+        mock_hass.data[DOMAIN] = {"abc": {"coordinator": mock_coordinator}}
+        added = []
+
+        await async_setup_entry(mock_hass, entry, added.extend)
+
+        metric_sensors = [e for e in added if isinstance(e, BuderusBusMetricSensor)]
+        assert len(metric_sensors) == len(BUS_METRIC_SENSORS)
+
+
+class TestDiagnostics:
+    """Config entry diagnostics download."""
+
+    @pytest.mark.asyncio
+    async def test_includes_bus_metrics(self, mock_hass, mock_coordinator, metrics):
+        mock_coordinator.get_bus_metrics = lambda per_parameter=False: metrics.snapshot(
+            per_parameter=per_parameter
+        )
+        mock_coordinator._connected = True
+        mock_coordinator._consecutive_failures = 0
+        mock_coordinator.get_data_age_seconds.return_value = 5
+        mock_coordinator.get_response_cache_stats.return_value = {
+            "hits": 4,
+            "misses": 1,
+            "hit_rate": 0.8,
+            "entries": 1,
+        }
+        mock_coordinator.get_read_report.return_value = {
+            "GT3_TEMP": {"ok": True, "error": None, "attempts": 1, "elapsed_ms": 42.0}
+        }
+        mock_coordinator.get_bus_arbiter_stats.return_value = {
+            "waiting": 0,
+            "classes": {"poll": {"grants": 12, "wait_avg_ms": 0.4, "wait_max_ms": 2.0}},
+        }
+        mock_coordinator.get_capability_map.return_value = {
+            "threshold": 3,
+            "probe_interval_s": 3600.0,
+            "parameters": {
+                "GT10_TEMP": {
+                    "status": "invalid_dlc",
+                    "count": 3,
+                    "marked": True,
+                    "since": 0.0,
+                    "last_probe": 60.0,
+                }
+            },
+        }
+        entry = MagicMock()
+        entry.entry_id = "abc"
+        entry.data = {"serial_device": "/dev/ttyACM0"}
+        entry.options = {"scan_interval": 60}
+        mock_hass.data[DOMAIN] = {"abc": {"coordinator": mock_coordinator}}
+
+        result = await async_get_config_entry_diagnostics(mock_hass, entry)
+
+        assert result["connection"]["connected"] is True
+        assert result["bus_metrics"]["counters"]["timeouts"] == 3
+        assert "GT3_TEMP" in result["bus_metrics"]["parameters"]
+        assert result["response_cache"]["hits"] == 4
+        assert result["read_specs"]["GT3_TEMP"]["attempts"] == 1
+        assert result["bus_arbiter"]["classes"]["poll"]["grants"] == 12
+        assert result["capabilities"]["parameters"]["GT10_TEMP"]["marked"] is True
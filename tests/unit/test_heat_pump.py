@@ -1,11 +1,17 @@
+import threading
+import time
+
 import pytest
 
 from buderus_wps.can_message import CANMessage
+from buderus_wps.exceptions import TimeoutError as BuderusTimeoutError
 from buderus_wps.heat_pump import HeatPumpClient
 from buderus_wps.parameter_registry import ParameterRegistry
 
 
 class FakeAdapter:
+    reader_running = False
+
     def __init__(self):
         self.is_open = True
         self.sent = []
@@ -147,3 +153,370 @@ def test_write_value_out_of_range_raises():
 
     with pytest.raises(ValueError):
         client.write_value("bar", 1000)
+
+
+def test_read_value_uses_send_request_with_background_reader():
+    reg = ParameterRegistry(
+        [
+            {
+                "idx": 1,
+                "extid": "ABCD",
+                "min": 0,
+                "max": 10,
+                "format": "int",
+                "read": 1,
+                "text": "FOO",
+            }
+        ]
+    )
+
+    class ReaderAdapter(FakeAdapter):
+        reader_running = True
+
+        def send_request(self, message, response_id, timeout=None):
+            self.sent.append((message, response_id))
+            return CANMessage(
+                arbitration_id=response_id, data=b"\x03", is_extended_id=True
+            )
+
+    adapter = ReaderAdapter()
+    client = HeatPumpClient(adapter, reg)
+
+    assert client.read_value("foo", timeout=0.1) == b"\x03"
+    message, response_id = adapter.sent[0]
+    assert message.arbitration_id == 0x04003FE0 | (1 << 14)
+    assert response_id == 0x0C003FE0 | (1 << 14)
+
+
+def _batch_registry():
+    return ParameterRegistry(
+        [
+            {
+                "idx": idx,
+                "extid": "ABCD",
+                "min": 0,
+                "max": 1000,
+                "format": "int",
+                "read": 1,
+                "text": f"P{idx}",
+            }
+            for idx in (1, 2, 3)
+        ]
+    )
+
+
+class PipelineAdapter(FakeAdapter):
+    """Answers RTRs out of order after the whole window has been sent."""
+
+    def __init__(self, missing=()):
+        super().__init__()
+        self.timeout = 0.2
+        self.missing = set(missing)
+
+    def send_frame_nowait(self, message: CANMessage):
+        self.sent.append(message)
+        idx = (message.arbitration_id >> 14) & 0xFFF
+        if idx not in self.missing:
+            self.recv_queue.insert(
+                0,
+                CANMessage(
+                    arbitration_id=0x0C003FE0 | (idx << 14),
+                    data=idx.to_bytes(2, "big"),
+                    is_extended_id=True,
+                ),
+            )
+
+    def receive_frame(self, timeout: float = 1.0):
+        from buderus_wps.exceptions import TimeoutError as BuderusTimeoutError
+
+        if self.recv_queue:
+            return self.recv_queue.pop(0)
+        raise BuderusTimeoutError("no frame")
+
+
+def test_read_many_pipelines_requests():
+    adapter = PipelineAdapter()
+    client = HeatPumpClient(adapter, _batch_registry())
+
+    results = client.read_many(["P1", "P2", 3], deadline=1.0)
+
+    assert [results[k]["decoded"] for k in ("P1", "P2", 3)] == [1, 2, 3]
+    assert len(adapter.sent) == 3
+    assert all(m.is_remote_frame for m in adapter.sent)
+
+
+def test_read_many_returns_partial_results():
+    adapter = PipelineAdapter(missing={2})
+    client = HeatPumpClient(adapter, _batch_registry())
+
+    results = client.read_many(["P1", "P2", "NOPE"], deadline=1.0, timeout=0.05)
+
+    assert results["P1"]["decoded"] == 1
+    assert results["P2"]["error"] == "timeout"
+    assert results["P2"]["decoded"] is None
+    assert results["NOPE"]["error"] == "unknown_parameter"
+
+
+def test_read_many_respects_window():
+    adapter = PipelineAdapter()
+    client = HeatPumpClient(adapter, _batch_registry())
+
+    results = client.read_many(["P1", "P2", "P3"], window=1)
+
+    assert len(results) == 3
+    assert "error" not in results["P3"]
+
+
+def test_read_many_claims_bus_per_window():
+    from buderus_wps.bus_arbiter import BusArbiter, BusPriority
+
+    arbiter = BusArbiter()
+    adapter = PipelineAdapter()
+    client = HeatPumpClient(adapter, _batch_registry(), arbiter=arbiter)
+
+    with arbiter.using(BusPriority.POLL):
+        results = client.read_many(["P1", "P2", "P3"], window=2)
+
+    assert [results[k]["decoded"] for k in ("P1", "P2", "P3")] == [1, 2, 3]
+    assert arbiter.stats()["classes"]["poll"]["grants"] == 2
+
+
+def test_read_many_with_background_reader():
+    from buderus_wps.demultiplexer import FrameDemultiplexer
+
+    class ReaderAdapter(FakeAdapter):
+        reader_running = True
+        timeout = 0.2
+
+        def __init__(self):
+            super().__init__()
+            self.demultiplexer = FrameDemultiplexer()
+
+        def send_frame_nowait(self, message: CANMessage):
+            idx = (message.arbitration_id >> 14) & 0xFFF
+            self.demultiplexer.dispatch(
+                CANMessage(
+                    arbitration_id=0x0C003FE0 | (idx << 14),
+                    data=bytes([0, idx]),
+                    is_extended_id=True,
+                )
+            )
+
+    adapter = ReaderAdapter()
+    client = HeatPumpClient(adapter, _batch_registry())
+
+    results = client.read_many(["P1", "P2", "P3"], deadline=1.0)
+
+    assert [results[k]["decoded"] for k in ("P1", "P2", "P3")] == [1, 2, 3]
+    assert adapter.demultiplexer.pending_waiters == 0
+
+
+def _broadcast_registry():
+    return ParameterRegistry(
+        [
+            {
+                "idx": 1,
+                "extid": "ABCD",
+                "min": 0,
+                "max": 1000,
+                "format": "int",
+                "read": 1,
+                "text": "P1",
+            },
+            {
+                "idx": 2,
+                "extid": "ABCD",
+                "min": -500,
+                "max": 1500,
+                "format": "tem",
+                "read": 1,
+                "text": "GT8_TEMP",
+            },
+            {
+                "idx": 3,
+                "extid": "ABCD",
+                "min": -500,
+                "max": 1500,
+                "format": "tem",
+                "read": 1,
+                "text": "GT2_TEMP",
+            },
+        ]
+    )
+
+
+def _policy(**kwargs):
+    import time as _time
+
+    from buderus_wps.broadcast_monitor import (
+        BroadcastCache,
+        BroadcastReading,
+        BroadcastReadPolicy,
+    )
+
+    cache = BroadcastCache()
+    for base, idx, value in [(0x0270, 6, 465), (0x0062, 12, -35)]:
+        cache.update(
+            BroadcastReading(
+                can_id=0x0C000000 | (idx << 14) | base,
+                base=base,
+                idx=idx,
+                dlc=2,
+                raw_data=value.to_bytes(2, "big", signed=True),
+                raw_value=value,
+                timestamp=_time.time() - 10.0,
+            )
+        )
+    return BroadcastReadPolicy(cache, **kwargs)
+
+
+def test_read_parameter_served_from_fresh_broadcast():
+    adapter = FakeAdapter()
+    client = HeatPumpClient(adapter, _broadcast_registry(), read_policy=_policy())
+
+    supply = client.read_parameter("GT8_TEMP")
+    outdoor = client.read_parameter("GT2_TEMP")  # found on a circuit base
+
+    assert (supply["decoded"], supply["source"]) == (46.5, "broadcast")
+    assert (outdoor["decoded"], outdoor["source"]) == (-3.5, "broadcast")
+    assert adapter.sent == []
+
+
+def test_read_parameter_falls_back_to_rtr_when_stale():
+    adapter = FakeAdapter()
+    adapter.recv_queue.append(
+        CANMessage(
+            arbitration_id=0x0C003FE0 | (2 << 14),
+            data=b"\x01\xc2",
+            is_extended_id=True,
+        )
+    )
+    client = HeatPumpClient(
+        adapter,
+        _broadcast_registry(),
+        read_policy=_policy(max_age={"GT8_TEMP": 5.0}),
+    )
+
+    result = client.read_parameter("GT8_TEMP", timeout=0.1)
+
+    assert (result["decoded"], result["source"]) == (45.0, "rtr")
+    assert len(adapter.sent) == 1
+
+
+def test_read_many_skips_rtr_for_broadcast_parameters():
+    adapter = PipelineAdapter()
+    client = HeatPumpClient(adapter, _broadcast_registry(), read_policy=_policy())
+
+    results = client.read_many(["P1", "GT8_TEMP"], deadline=1.0)
+
+    assert results["P1"]["source"] == "rtr"
+    assert (results["GT8_TEMP"]["decoded"], results["GT8_TEMP"]["source"]) == (
+        46.5,
+        "broadcast",
+    )
+    assert [(m.arbitration_id >> 14) & 0xFFF for m in adapter.sent] == [1]
+
+
+class GatedAdapter(FakeAdapter):
+    """Holds every RTR until ``gate`` is set, then answers it."""
+
+    def __init__(self, data=b"\x00\x07"):
+        super().__init__()
+        self.timeout = 2.0
+        self.gate = threading.Event()
+        self.data = data
+
+    def send_frame(self, message: CANMessage, timeout: float = 1.0):
+        self.sent.append(message)
+        if not message.is_remote_frame:
+            return None
+        if not self.gate.wait(timeout):
+            raise BuderusTimeoutError("no frame")
+        idx = (message.arbitration_id >> 14) & 0xFFF
+        return CANMessage(
+            arbitration_id=0x0C003FE0 | (idx << 14), data=self.data, is_extended_id=True
+        )
+
+    def receive_frame(self, timeout: float = 1.0):
+        time.sleep(timeout)
+        raise BuderusTimeoutError("no frame")
+
+
+def _read_in_background(client, name):
+    results = []
+
+    def read():
+        try:
+            results.append(client.read_value(name))
+        except BuderusTimeoutError as e:
+            results.append(e)
+
+    thread = threading.Thread(target=read, daemon=True)
+    thread.start()
+    # Wait until the RTR is on the bus
+    while not client._adapter.sent:
+        time.sleep(0.001)
+    return thread, results
+
+
+def test_concurrent_reads_of_same_parameter_share_one_rtr():
+    adapter = GatedAdapter()
+    client = HeatPumpClient(adapter, _batch_registry())
+    thread, first = _read_in_background(client, "P1")
+
+    second = []
+    follower = threading.Thread(target=lambda: second.append(client.read_value(1)))
+    follower.start()
+    while client.metrics.counters["coalesced_reads"] == 0:
+        time.sleep(0.001)
+    adapter.gate.set()
+    thread.join(timeout=2)
+    follower.join(timeout=2)
+
+    assert first == second == [b"\x00\x07"]
+    assert len(adapter.sent) == 1
+    assert client._inflight == {}
+
+
+def test_read_many_joins_read_in_flight():
+    adapter = GatedAdapter()
+    client = HeatPumpClient(adapter, _batch_registry())
+    thread, _ = _read_in_background(client, "P1")
+    threading.Timer(0.05, adapter.gate.set).start()
+
+    # P2 and P3 go out in the pipeline; P1 waits for the pending read
+    adapter.send_frame_nowait = lambda message: None
+    results = client.read_many(["P1", "P2"], deadline=1.0, timeout=0.2)
+    thread.join(timeout=2)
+
+    assert results["P1"]["raw"] == b"\x00\x07"
+    assert results["P2"]["error"] == "timeout"
+    assert client.metrics.counters["coalesced_reads"] == 1
+
+
+def test_failed_read_is_shared_with_joined_readers():
+    adapter = GatedAdapter()
+    adapter.timeout = 0.1
+    client = HeatPumpClient(adapter, _batch_registry())
+    thread, _ = _read_in_background(client, "P1")
+
+    results = client.read_many(["P1"], deadline=1.0)
+    thread.join(timeout=2)
+
+    assert results["P1"]["error"] == "timeout"
+    assert len(adapter.sent) == 1
+
+
+def test_write_does_not_coalesce_later_reads_onto_earlier_ones():
+    adapter = GatedAdapter()
+    client = HeatPumpClient(adapter, _batch_registry())
+    thread, _ = _read_in_background(client, "P1")
+
+    client.write_value("P1", 5)
+    adapter.gate.set()
+    thread.join(timeout=2)
+    client.read_value("P1")
+
+    rtrs = [m for m in adapter.sent if m.is_remote_frame]
+    assert len(rtrs) == 2
+    assert client.metrics.counters["coalesced_reads"] == 0
@@ -0,0 +1,210 @@
+"""Unit tests for CAN bus metrics (counters, latency histograms, snapshots)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from buderus_wps.can_adapter import USBtinAdapter
+from buderus_wps.can_message import CANMessage
+from buderus_wps.exceptions import TimeoutError
+from buderus_wps.heat_pump import CAN_RESPONSE_BASE, HeatPumpClient
+from buderus_wps.metrics import BusMetrics, LatencyHistogram
+from buderus_wps.parameter_registry import ParameterRegistry
+
+PARAMETERS = [
+    {
+        "idx": 1,
+        "extid": "00",
+        "max": 100,
+        "min": 0,
+        "format": "int",
+        "read": 1,
+        "text": "P1",
+    },
+    {
+        "idx": 2,
+        "extid": "00",
+        "max": 100,
+        "min": 0,
+        "format": "int",
+        "read": 1,
+        "text": "P2",
+    },
+]
+
+
+class TestLatencyHistogram:
+    """Bucketed percentiles."""
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(50) is None
+        assert histogram.snapshot()["p99_ms"] is None
+
+    def test_percentiles_within_bucket_width(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000.0)
+
+        assert histogram.percentile(50) == pytest.approx(0.050, rel=0.25)
+        assert histogram.percentile(95) == pytest.approx(0.095, rel=0.25)
+        assert histogram.percentile(99) <= 0.100
+        assert histogram.snapshot()["mean_ms"] == pytest.approx(50.5)
+
+    def test_overflow_bucket_reports_max(self):
+        histogram = LatencyHistogram()
+        histogram.record(500.0)
+
+        assert histogram.percentile(99) == 500.0
+
+
+class TestBusMetrics:
+    """Counters, rates and snapshots."""
+
+    def test_snapshot_rates_use_window(self, clock):
+        metrics = BusMetrics(clock=clock)
+        metrics.record_rx(frames=10, nbytes=300)
+        clock.now += 2.0
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["counters"]["rx_frames"] == 10
+        assert snapshot["rates"]["rx_frames_per_s"] == 5.0
+        assert snapshot["rates"]["rx_bytes_per_s"] == 150.0
+
+    def test_old_samples_leave_window(self, clock):
+        metrics = BusMetrics(clock=clock)
+        metrics.record_rx(frames=600, nbytes=0)
+        clock.now += 60.0
+        metrics.snapshot()
+        clock.now += 60.0
+
+        # Only the quiet last minute counts
+        assert metrics.snapshot()["rates"]["rx_frames_per_s"] == 0.0
+
+    def test_per_parameter_latency(self):
+        metrics = BusMetrics()
+        metrics.record_latency("P1", 0.010)
+        metrics.record_latency("P2", 0.020)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["rtr_latency"]["count"] == 2
+        assert set(snapshot["parameters"]) == {"P1", "P2"}
+        assert "parameters" not in metrics.snapshot(per_parameter=False)
+
+    def test_reset(self):
+        metrics = BusMetrics()
+        metrics.incr("timeouts")
+        metrics.record_latency("P1", 0.01)
+        metrics.reset()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["counters"]["timeouts"] == 0
+        assert snapshot["parameters"] == {}
+
+
+@pytest.fixture
+def adapter():
+    usbtin = USBtinAdapter("/dev/ttyACM0", read_mode="poll")
+    serial_port = MagicMock()
+    serial_port.is_open = True
+    serial_port.in_waiting = 0
+    usbtin._serial = serial_port
+    return usbtin
+
+
+class TestAdapterMetrics:
+    """Recording in USBtinAdapter."""
+
+    def test_tx_and_rx_counted(self, adapter):
+        adapter._serial.read.side_effect = [b"T0C007FE0202A2B\r"]
+        adapter._serial.in_waiting = 0
+
+        adapter.send_frame(
+            CANMessage(
+                arbitration_id=0x04007FE0,
+                data=b"",
+                is_extended_id=True,
+                is_remote_frame=True,
+            ),
+            timeout=0.5,
+        )
+
+        counters = adapter.metrics.counters
+        assert counters["tx_frames"] == 1
+        assert counters["tx_bytes"] == len(b"R04007FE00\r")
+        assert counters["rx_frames"] == 1
+        assert counters["rx_bytes"] == len(b"T0C007FE0202A2B\r")
+
+    def test_timeout_counted(self, adapter):
+        adapter._serial.read.return_value = b""
+
+        with pytest.raises(TimeoutError):
+            adapter.receive_frame(timeout=0.1)
+
+        assert adapter.metrics.counters["timeouts"] == 1
+
+    def test_flush_counts_discarded_bytes(self, adapter):
+        adapter._rx_framer.feed(b"T0C0")
+        adapter._serial.in_waiting = 12
+
+        adapter.flush_input_buffer()
+
+        assert adapter.metrics.counters["flush_discarded_bytes"] == 16
+
+    def test_lenient_parse_counted(self, adapter):
+        # DLC says 2 bytes but 3 are present: strict parse fails
+        adapter._serial.read.side_effect = [b"T0C007FE02112233\r"]
+
+        assert adapter.receive_frame(timeout=0.5) is not None
+        assert adapter.metrics.counters["lenient_parses"] == 1
+
+    def test_shared_metrics_instance(self):
+        metrics = BusMetrics()
+
+        assert USBtinAdapter("/dev/ttyACM0", metrics=metrics).metrics is metrics
+
+
+class TestClientMetrics:
+    """Recording in HeatPumpClient."""
+
+    def test_read_records_latency_and_unexpected_ids(self):
+        adapter = MagicMock()
+        adapter.reader_running = False
+        adapter.timeout = 1.0
+        adapter.metrics = BusMetrics()
+        adapter.send_frame.return_value = CANMessage(
+            arbitration_id=0x0C084060, data=b"\x00\x01", is_extended_id=True
+        )
+        adapter.receive_frame.return_value = CANMessage(
+            arbitration_id=CAN_RESPONSE_BASE | (1 << 14),
+            data=b"\x00\x05",
+            is_extended_id=True,
+        )
+        client = HeatPumpClient(adapter, ParameterRegistry(PARAMETERS))
+
+        assert client.read_parameter("P1")["decoded"] == 5
+        assert client.metrics is adapter.metrics
+        assert adapter.metrics.counters["unexpected_responses"] == 1
+        assert adapter.metrics.latency("P1").count == 1
+
+    def test_read_many_records_latency(self):
+        adapter = MagicMock()
+        adapter.reader_running = False
+        adapter.timeout = 0.2
+        frames = [
+            CANMessage(
+                arbitration_id=CAN_RESPONSE_BASE | (idx << 14),
+                data=b"\x00\x01",
+                is_extended_id=True,
+            )
+            for idx in (1, 2)
+        ]
+        adapter.receive_frame.side_effect = frames
+        client = HeatPumpClient(adapter, ParameterRegistry(PARAMETERS))
+
+        client.read_many(["P1", "P2"])
+
+        assert client.metrics.rtr_latency.count == 2
+        assert client.metrics.latency("P2").count == 1
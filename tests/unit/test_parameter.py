@@ -341,3 +341,181 @@ class TestHeatPumpDiscoveredNames:
 
         # Params NOT in discovery should NOT be marked
         assert hp.is_discovered("GT10_TEMP") is False
+
+
+class TestHeatPumpLazyFallback:
+    """Fallback parameters are built on lookup but behave like an eager load."""
+
+    @staticmethod
+    def _eager():
+        from buderus_wps.parameter import HeatPump
+        from buderus_wps.parameter_data import PARAMETER_DATA
+
+        hp = HeatPump()
+        hp._load_parameters(PARAMETER_DATA)
+        return hp
+
+    def test_lookups_do_not_build_whole_table(self):
+        from buderus_wps.parameter import HeatPump
+
+        hp = HeatPump()
+
+        assert hp.parameter_count() == 1784
+        assert hp.get_parameter_by_name("access_level").max == 5
+        assert hp.get_parameter_by_index(2480).text == "XDHW_WEEKPROGRAM_HOUR"
+        assert hp.has_parameter_name("XDHW_TIME")
+        assert not hp.has_parameter_index(13)
+        assert len(hp._params_by_name) < 10
+
+    def test_matches_eager_load_after_discovery(self):
+        from buderus_wps.element_discovery import DiscoveredElement
+        from buderus_wps.parameter import HeatPump
+
+        lazy = HeatPump()
+        eager = self._eager()
+        discovered = [
+            # Shadowed duplicate (idx 2480 belongs to XDHW_WEEKPROGRAM_HOUR)
+            DiscoveredElement(2475, "E1263DCA71010F", "XDHW_TIME", 0, 48),
+            DiscoveredElement(681, "0EB5CF43420068", "GT3_TEMP", 0, 0),
+            DiscoveredElement(1, "61E1E1FC660023", "ACCESS_LEVEL", 0, 9),
+            DiscoveredElement(3000, "AABBCCDD001122", "NEW_PARAM", 0, 100),
+        ]
+
+        for hp in (lazy, eager):
+            assert hp.update_from_discovery(discovered) == 3
+
+        for key in ("XDHW_TIME", "GT3_TEMP", "GT3_STATUS", 681, 682, 2475, 2480):
+            assert lazy.get_parameter(key) == eager.get_parameter(key)
+        assert lazy.parameter_count() == eager.parameter_count()
+        assert lazy.parameters == eager.parameters
+
+    def test_concurrent_lookups_resolve_every_name(self):
+        import sys
+        import threading
+
+        from buderus_wps.parameter import HeatPump
+        from buderus_wps.parameter_data import PARAMETER_DATA
+
+        names = PARAMETER_DATA.names[:200]
+        misses = []
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for _ in range(20):
+                hp = HeatPump()
+                barrier = threading.Barrier(4)
+
+                def lookup(hp=hp, barrier=barrier):
+                    barrier.wait()
+                    misses.extend(n for n in names if hp.get_parameter(n) is None)
+
+                threads = [threading.Thread(target=lookup) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert misses == []
+
+    def test_duplicate_indices_are_logged(self, caplog):
+        from buderus_wps.parameter import HeatPump
+
+        HeatPump()
+
+        assert "Duplicate idx=2480: XDHW_WEEKPROGRAM_HOUR overwrites XDHW_TIME" in (
+            caplog.text
+        )
+
+
+class TestHeatPumpViews:
+    """Sorted/filtered views are cached per registry version."""
+
+    @staticmethod
+    def _heat_pump():
+        from buderus_wps.parameter import HeatPump
+
+        hp = HeatPump()
+        hp._load_parameters(
+            [
+                {
+                    "idx": 5,
+                    "extid": "00000000000005",
+                    "min": 0,
+                    "max": 1,
+                    "format": "tem",
+                    "read": 1,
+                    "text": "A",
+                },
+                {
+                    "idx": 6,
+                    "extid": "00000000000006",
+                    "min": 0,
+                    "max": 1,
+                    "format": "int",
+                    "read": 0,
+                    "text": "B",
+                },
+                {
+                    "idx": 1,
+                    "extid": "00000000000001",
+                    "min": 0,
+                    "max": 1,
+                    "format": "tem",
+                    "read": 0,
+                    "text": "C",
+                },
+            ]
+        )
+        return hp
+
+    def test_views_are_cached_until_change(self):
+        from buderus_wps.element_discovery import DiscoveredElement
+
+        hp = self._heat_pump()
+        version = hp.version
+        view = hp.parameters
+
+        assert [p.text for p in view] == ["C", "A", "B"]
+        assert hp.parameters is view
+        assert [p.text for p in hp.list_writable_parameters()] == ["C", "B"]
+        assert [p.text for p in hp.list_readonly_parameters()] == ["A"]
+        assert [p.text for p in hp.list_parameters_by_format("tem")] == ["C", "A"]
+        assert hp.list_parameters_by_format("sw1") == ()
+
+        # Unchanged element: same version, same views
+        assert (
+            hp.apply_discovery([DiscoveredElement(5, "00000000000005", "A", 0, 1)]) == 0
+        )
+        assert hp.version == version
+        assert hp.parameters is view
+
+        assert (
+            hp.apply_discovery([DiscoveredElement(9, "00000000000005", "A", 0, 1)]) == 1
+        )
+        assert hp.version == version + 1
+        assert [p.text for p in hp.parameters] == ["C", "B", "A"]
+        assert [p.idx for p in hp.list_readonly_parameters()] == [9]
+
+    def test_apply_discovery_moves_indices_in_one_pass(self):
+        from buderus_wps.element_discovery import DiscoveredElement
+
+        hp = self._heat_pump()
+
+        # A takes the index B leaves in the same batch
+        updated = hp.apply_discovery(
+            [
+                DiscoveredElement(6, "00000000000005", "A", 0, 1),
+                DiscoveredElement(7, "00000000000006", "B", 0, 1),
+                DiscoveredElement(8, "00000000000008", "NEW", 0, 1),
+            ]
+        )
+
+        assert updated == 2
+        assert hp.get_parameter(5) is None
+        assert hp.get_parameter(6).text == "A"
+        assert hp.get_parameter(7).text == "B"
+        assert hp.get_parameter("new").format == "int"
+        assert hp.parameter_count() == 4
+        assert hp.is_discovered("NEW")
@@ -0,0 +1,118 @@
+"""Unit tests for the packed static parameter table."""
+
+import pytest
+from buderus_wps import parameter_table_data
+from buderus_wps.parameter_data import PARAMETER_DATA
+from buderus_wps.parameter_defaults import PARAMETER_DEFAULTS
+from buderus_wps.parameter_table import ParameterTable, pack_array
+
+
+def _columns(entries):
+    return {
+        "COUNT": len(entries),
+        "FORMATS": ("int", "tem"),
+        "IDX": pack_array("H", [e["idx"] for e in entries]),
+        "MIN": pack_array("i", [e["min"] for e in entries]),
+        "MAX": pack_array("i", [e["max"] for e in entries]),
+        "READ": bytes(e["read"] for e in entries),
+        "FORMAT": bytes(("int", "tem").index(e["format"]) for e in entries),
+        "EXTID": b"".join(bytes.fromhex(e["extid"]) for e in entries),
+        "NAMES": "\n".join(e["text"] for e in entries),
+    }
+
+
+ENTRIES = [
+    {
+        "idx": 1,
+        "extid": "61E1E1FC660023",
+        "max": 5,
+        "min": 0,
+        "format": "int",
+        "read": 0,
+        "text": "ACCESS_LEVEL",
+    },
+    {
+        "idx": 11,
+        "extid": "E555E4E11002E9",
+        "max": 40,
+        "min": -30,
+        "format": "tem",
+        "read": 1,
+        "text": "ADDITIONAL_BLOCK_HIGH_T2_TEMP",
+    },
+    {
+        "idx": 11,
+        "extid": "00392219C60482",
+        "max": 167772160,
+        "min": 0,
+        "format": "int",
+        "read": 0,
+        "text": "MV_Ex_T1_ALARM",
+    },
+]
+
+
+class TestParameterTable:
+    def test_rows_match_entries(self):
+        table = ParameterTable(_columns(ENTRIES))
+
+        assert len(table) == 3
+        assert table == ENTRIES
+        assert table[-1] == ENTRIES[-1]
+        assert table[1:] == ENTRIES[1:]
+        assert list(table[0]) == list(ENTRIES[0])  # same key order
+        assert table[0] is table[0]
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_lookups(self):
+        table = ParameterTable(_columns(ENTRIES))
+
+        assert table.get_by_name("mv_ex_t1_alarm") == ENTRIES[2]
+        assert table.get_by_idx(11) == ENTRIES[2]  # last row wins
+        assert table.get_by_name("MISSING") is None
+        assert table.indices() == {1, 11}
+        assert table.duplicates() == [(1, 2)]
+
+    def test_overrides(self):
+        table = ParameterTable(
+            _columns(ENTRIES), overrides={"ACCESS_LEVEL": {"idx": 2, "format": "tem"}}
+        )
+
+        assert table[0] == dict(ENTRIES[0], idx=2, format="tem")
+        assert table.get_by_idx(2)["text"] == "ACCESS_LEVEL"
+        assert ParameterTable(_columns(ENTRIES))[0] == ENTRIES[0]
+
+    @pytest.mark.parametrize(
+        "overrides", [{"MISSING": {"idx": 1}}, {"ACCESS_LEVEL": {"text": "X"}}]
+    )
+    def test_invalid_overrides(self, overrides):
+        with pytest.raises(ValueError):
+            ParameterTable(_columns(ENTRIES), overrides=overrides)
+
+    def test_mismatched_columns(self):
+        columns = dict(_columns(ENTRIES), READ=b"\x00")
+
+        with pytest.raises(ValueError):
+            ParameterTable(columns)
+
+
+class TestStaticTables:
+    def test_data_applies_overrides_to_defaults(self):
+        overrides = parameter_table_data.DATA_OVERRIDES
+
+        assert len(PARAMETER_DATA) == len(PARAMETER_DEFAULTS) == 1788
+        for data, default in zip(PARAMETER_DATA, PARAMETER_DEFAULTS):
+            assert data == dict(default, **overrides.get(data["text"], {}))
+
+    def test_known_rows(self):
+        assert PARAMETER_DEFAULTS.get_by_name("XDHW_TIME")["idx"] == 2475
+        assert PARAMETER_DATA.get_by_name("XDHW_TIME") == {
+            "idx": 2480,
+            "extid": "E1263DCA71010F",
+            "max": 48,
+            "min": 0,
+            "format": "int",
+            "read": 0,
+            "text": "XDHW_TIME",
+        }
@@ -0,0 +1,98 @@
+"""Unit tests for the multi-rate polling scheduler."""
+
+import pytest
+from buderus_wps.poll_scheduler import PollItem, PollScheduler, batch_parameters
+
+FAST = PollItem("fast", ("COMPRESSOR_STATE",), 10.0)
+SLOW = PollItem("slow", ("GT3_TEMP", "GT8_TEMP"), 30.0)
+SETTINGS = PollItem("settings", ("DHW_PROGRAM_MODE", "GT8_TEMP"), 900.0)
+
+
+def _keys(items):
+    return [item.key for item in items]
+
+
+class TestPollItem:
+    def test_interval_must_be_positive(self):
+        with pytest.raises(ValueError):
+            PollItem("bad", ("GT3_TEMP",), 0)
+
+    def test_batch_parameters_deduplicates_in_plan_order(self):
+        assert batch_parameters([SLOW, SETTINGS, FAST]) == [
+            "GT3_TEMP",
+            "GT8_TEMP",
+            "DHW_PROGRAM_MODE",
+            "COMPRESSOR_STATE",
+        ]
+
+
+class TestPollScheduler:
+    def test_rejects_empty_plan_and_duplicate_keys(self):
+        with pytest.raises(ValueError):
+            PollScheduler([])
+        with pytest.raises(ValueError):
+            PollScheduler([FAST, FAST])
+
+    def test_everything_due_initially(self):
+        scheduler = PollScheduler([FAST, SLOW, SETTINGS])
+
+        assert _keys(scheduler.due(now=0.0)) == ["fast", "slow", "settings"]
+        assert scheduler.tick == 10.0
+
+    def test_items_run_at_their_own_interval(self):
+        scheduler = PollScheduler([FAST, SLOW, SETTINGS])
+        ticks = {}
+        for now in range(0, 60, 10):
+            due = scheduler.due(now=now)
+            ticks[now] = _keys(due)
+            scheduler.mark_done(_keys(due), now=now)
+
+        assert ticks == {
+            0: ["fast", "slow", "settings"],
+            10: ["fast"],
+            20: ["fast"],
+            30: ["fast", "slow"],
+            40: ["fast"],
+            50: ["fast"],
+        }
+
+    def test_unmarked_item_stays_due(self):
+        scheduler = PollScheduler([FAST, SLOW])
+        scheduler.mark_done(["fast"], now=0.0)
+
+        assert _keys(scheduler.due(now=1.0)) == ["slow"]
+
+    def test_mark_due_by_key_or_parameter(self):
+        scheduler = PollScheduler([FAST, SLOW, SETTINGS])
+        scheduler.mark_done(["fast", "slow", "settings"], now=0.0)
+
+        assert scheduler.mark_due("fast") == ["fast"]
+        assert scheduler.mark_due("gt8_temp") == ["slow", "settings"]
+        assert scheduler.mark_due("UNKNOWN") == []
+        assert _keys(scheduler.due(now=1.0)) == ["fast", "slow", "settings"]
+
+    def test_mark_due_during_poll_keeps_item_due(self):
+        scheduler = PollScheduler([FAST, SETTINGS])
+        scheduler.mark_done(["fast", "settings"], now=0.0)
+        assert _keys(scheduler.due(now=100.0)) == ["fast"]
+        scheduler.mark_due("settings")
+        due = scheduler.due(now=100.0)
+
+        # A write lands while the settings are being read
+        scheduler.mark_due("DHW_PROGRAM_MODE")
+        scheduler.mark_done(_keys(due), now=100.0)
+
+        assert _keys(scheduler.due(now=101.0)) == ["settings"]
+        assert scheduler.next_due_in(now=101.0) == 0.0
+
+        # The next poll reads the written value and is marked done
+        scheduler.mark_done(_keys(scheduler.due(now=101.0)), now=101.0)
+        assert scheduler.next_due_in(now=102.0) == 8.0
+
+    def test_next_due_in(self):
+        clock = iter([5.0])
+        scheduler = PollScheduler([FAST, SLOW], clock=lambda: next(clock))
+        scheduler.mark_done(["fast", "slow"], now=0.0)
+
+        assert scheduler.next_due_in() == 5.0
+        assert scheduler.next_due_in(now=12.0) == 0.0
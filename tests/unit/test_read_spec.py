@@ -0,0 +1,210 @@
+"""Unit tests for the declarative read-spec engine."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from buderus_wps.capabilities import CapabilityMap
+from buderus_wps.read_spec import (
+    ReadEngine,
+    ReadSpec,
+    parse_bool,
+    parse_float,
+    parse_int,
+)
+
+
+def _ok(decoded, raw=b"\x00\x01"):
+    return {"raw": raw, "decoded": decoded}
+
+
+def _client(*rounds):
+    """Client whose read_many answers from one dict per call."""
+    client = MagicMock()
+    answers = iter(rounds)
+    client.read_many.side_effect = lambda names, **kwargs: {
+        name: result for name, result in next(answers).items() if name in names
+    }
+    return client
+
+
+def _names(client, call=0):
+    return client.read_many.call_args_list[call].args[0]
+
+
+class TestParsers:
+    def test_parse_int_handles_dp2_labels(self):
+        assert parse_int("1:Always_On") == 1
+        assert parse_int(None) == 0
+        assert parse_int(3) == 3
+
+    def test_parse_bool_and_float(self):
+        assert parse_bool("0:Off") is False
+        assert parse_bool(2) is True
+        assert parse_float("21.5") == 21.5
+
+
+class TestReadEngine:
+    def test_rejects_duplicate_keys(self):
+        with pytest.raises(ValueError):
+            ReadEngine([ReadSpec("GT3_TEMP"), ReadSpec("GT3_TEMP")])
+
+    def test_one_batch_in_priority_order(self):
+        engine = ReadEngine(
+            [
+                ReadSpec("DHW_PROGRAM_MODE", priority=2),
+                ReadSpec("COMPRESSOR_STATE", priority=0),
+                ReadSpec("GT3_TEMP", expected_dlc=2, priority=1),
+            ]
+        )
+        client = _client(
+            {
+                "DHW_PROGRAM_MODE": _ok(0),
+                "COMPRESSOR_STATE": _ok(3),
+                "GT3_TEMP": _ok(48.5),
+            }
+        )
+
+        outcomes = engine.run(client)
+
+        client.read_many.assert_called_once()
+        assert _names(client) == ["COMPRESSOR_STATE", "GT3_TEMP", "DHW_PROGRAM_MODE"]
+        assert outcomes["GT3_TEMP"].value == 48.5
+        assert outcomes["GT3_TEMP"].fresh
+
+    def test_specs_sharing_a_parameter_share_one_read(self):
+        engine = ReadEngine(
+            [
+                ReadSpec("COMPRESSOR_BLOCKED", parser=parse_bool),
+                ReadSpec("compressor_blocked", parser=parse_int, key="raw_block"),
+            ]
+        )
+        client = _client({"COMPRESSOR_BLOCKED": _ok(1)})
+
+        outcomes = engine.run(client)
+
+        assert _names(client) == ["COMPRESSOR_BLOCKED"]
+        assert outcomes["COMPRESSOR_BLOCKED"].value is True
+        assert engine.value("raw_block") == 1
+
+    def test_failed_read_keeps_last_good_value_or_fallback(self):
+        engine = ReadEngine(
+            [ReadSpec("XDHW_TIME", parser=parse_int, fallback=0), ReadSpec("GT3_TEMP")]
+        )
+        timeout = {"decoded": None, "error": "timeout"}
+        client = _client(
+            {"XDHW_TIME": timeout, "GT3_TEMP": timeout},
+            {"XDHW_TIME": _ok(2), "GT3_TEMP": timeout},
+            {"XDHW_TIME": timeout, "GT3_TEMP": timeout},
+        )
+
+        first = engine.run(client)
+        engine.run(client)
+        third = engine.run(client)
+
+        assert first["XDHW_TIME"].value == 0
+        assert first["GT3_TEMP"].value is None
+        assert third["XDHW_TIME"].value == 2
+        assert not third["XDHW_TIME"].fresh
+        assert third["XDHW_TIME"].error == "timeout"
+
+    def test_retries_only_failed_reads_in_a_new_batch(self):
+        engine = ReadEngine(
+            [
+                ReadSpec("COMPRESSOR_STATE", parser=parse_int, retries=2),
+                ReadSpec("GT3_TEMP"),
+            ]
+        )
+        client = _client(
+            {
+                "COMPRESSOR_STATE": {"decoded": None, "error": "timeout"},
+                "GT3_TEMP": _ok(1),
+            },
+            {"COMPRESSOR_STATE": _ok(3)},
+        )
+
+        outcomes = engine.run(client)
+
+        assert _names(client, 1) == ["COMPRESSOR_STATE"]
+        assert outcomes["COMPRESSOR_STATE"].value == 3
+        assert outcomes["COMPRESSOR_STATE"].attempts == 2
+        assert outcomes["GT3_TEMP"].attempts == 1
+
+    def test_short_response_and_dead_sensor(self):
+        engine = ReadEngine(
+            [ReadSpec("GT10_TEMP", expected_dlc=2), ReadSpec("GT11_TEMP", retries=3)]
+        )
+        client = _client({"GT10_TEMP": _ok(1, raw=b"\x01"), "GT11_TEMP": _ok(None)})
+
+        outcomes = engine.run(client)
+
+        assert outcomes["GT10_TEMP"].error == "invalid_dlc"
+        # A dead sensor answers; retrying would not help
+        assert outcomes["GT11_TEMP"].error == "no_value"
+        assert client.read_many.call_count == 1
+
+    def test_parse_error(self):
+        engine = ReadEngine([ReadSpec("GT3_TEMP", parser=parse_float)])
+
+        outcomes = engine.run(_client({"GT3_TEMP": _ok("n/a")}))
+
+        assert outcomes["GT3_TEMP"].error == "parse_error"
+
+    def test_client_exception_fails_all_specs(self):
+        engine = ReadEngine([ReadSpec("GT3_TEMP")])
+        client = MagicMock()
+        client.read_many.side_effect = OSError("port closed")
+
+        outcomes = engine.run(client)
+
+        assert outcomes["GT3_TEMP"].error == "port closed"
+
+    def test_run_subset_and_report(self):
+        clock = iter([0.0, 0.25])
+        engine = ReadEngine(
+            [ReadSpec("GT3_TEMP"), ReadSpec("GT8_TEMP")], clock=lambda: next(clock)
+        )
+
+        engine.run(_client({"GT3_TEMP": {**_ok(1), "source": "rtr"}}), ["GT3_TEMP"])
+
+        assert engine.report() == {
+            "GT3_TEMP": {
+                "ok": True,
+                "error": None,
+                "attempts": 1,
+                "elapsed_ms": 250.0,
+                "source": "rtr",
+            }
+        }
+
+
+class TestCapabilities:
+    def test_unavailable_parameter_skipped_until_probe(self):
+        clock = iter(range(100))
+        caps = CapabilityMap(threshold=2, probe_interval=50, clock=lambda: next(clock))
+        engine = ReadEngine(
+            [ReadSpec("GT3_TEMP"), ReadSpec("GT10_TEMP", expected_dlc=2, fallback=0)],
+            capabilities=caps,
+        )
+        answers = {"GT3_TEMP": _ok(1), "GT10_TEMP": _ok(1, raw=b"\x01")}
+        client = _client(answers, answers, answers)
+
+        engine.run(client)
+        engine.run(client)
+        outcomes = engine.run(client)
+
+        assert _names(client, 2) == ["GT3_TEMP"]
+        assert outcomes["GT10_TEMP"].error == "invalid_dlc"
+        assert outcomes["GT10_TEMP"].attempts == 0
+        assert outcomes["GT10_TEMP"].value == 0
+
+    def test_timeouts_not_counted_when_nothing_answered(self):
+        caps = CapabilityMap(threshold=1)
+        engine = ReadEngine([ReadSpec("GT3_TEMP")], capabilities=caps)
+        client = MagicMock()
+        client.read_many.return_value = {
+            "GT3_TEMP": {"decoded": None, "error": "timeout"}
+        }
+
+        engine.run(client)
+
+        assert caps.status("GT3_TEMP") is None
@@ -0,0 +1,198 @@
+"""Unit tests for ReplayAdapter and the FHEM capture parser."""
+
+import pathlib
+import time
+
+import pytest
+from buderus_wps.broadcast_monitor import BroadcastMonitor
+from buderus_wps.can_message import CANMessage
+from buderus_wps.exceptions import TimeoutError
+from buderus_wps.heat_pump import HeatPumpClient
+from buderus_wps.parameter_registry import ParameterRegistry
+from buderus_wps.replay_adapter import (
+    CaptureRecord,
+    ReplayAdapter,
+    load_fhem_capture,
+    response_id_for,
+)
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+FHEM_CAPTURE = ROOT / "fhem" / "fhem-capture" / "capture-20251224-165740.hex"
+
+
+def _dump(direction, stamp, payload):
+    """Render one block the way socat -x -v does."""
+    lines = [f"{direction} 2025/12/24 {stamp}  length={len(payload)} from=0 to=0"]
+    for pos in range(0, len(payload), 16):
+        row = payload[pos : pos + 16]
+        hex_part = "".join(f" {b:02x}" for b in row)
+        ascii_part = "".join(chr(b) if 32 <= b < 127 else "." for b in row)
+        lines.append(f"{hex_part:<48}  {ascii_part}")
+    lines.append("--")
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def capture_file(tmp_path):
+    path = tmp_path / "capture-test.hex"
+    path.write_text(
+        "# FHEM CAN Bus Capture\n#\n"
+        + _dump(">", "16:50:51.000000000", b"C\rC\rV\rV\rv\rS4\rO\r")
+        + _dump("<", "16:50:51.000100000", b"T0C08406020102\rT0C0C0270201")
+        + _dump("<", "16:50:51.000300000", b"03\rT0C04806020064\r")
+        + _dump("<", "16:50:51.000500000", b"T0C007FE0200FA\r")
+    )
+    return path
+
+
+class TestLoadFhemCapture:
+    """socat hexdump parsing."""
+
+    def test_parses_directions_and_payloads(self, capture_file):
+        records = load_fhem_capture(capture_file)
+
+        assert [r.direction for r in records] == [">", "<", "<", "<"]
+        assert records[1].data == b"T0C08406020102\rT0C0C0270201"
+
+    def test_fraction_is_microseconds(self, capture_file):
+        records = load_fhem_capture(capture_file)
+
+        assert records[2].timestamp - records[1].timestamp == pytest.approx(0.2)
+
+    def test_ascii_column_that_looks_like_hex(self, tmp_path):
+        path = tmp_path / "c.hex"
+        path.write_text(_dump("<", "10:00:00.000000000", b"00"))
+
+        assert load_fhem_capture(path)[0].data == b"00"
+
+    def test_truncated_block_raises(self, tmp_path):
+        path = tmp_path / "c.hex"
+        path.write_text(
+            "< 2025/12/24 10:00:00.000000000  length=4 from=0 to=3\n 54 30\n"
+        )
+
+        with pytest.raises(ValueError, match="Truncated"):
+            load_fhem_capture(path)
+
+    @pytest.mark.skipif(not FHEM_CAPTURE.exists(), reason="FHEM capture not present")
+    def test_real_capture(self):
+        records = load_fhem_capture(FHEM_CAPTURE)
+
+        assert records[0].direction == ">"
+        assert sum(len(r.data) for r in records if r.direction == "<") > 10000
+
+
+class TestResponseIds:
+    """RTR -> response CAN ID mapping."""
+
+    def test_parameter_rtr(self):
+        rtr = CANMessage(
+            arbitration_id=0x04003FE0 | (0xABC << 14),
+            data=b"",
+            is_extended_id=True,
+            is_remote_frame=True,
+        )
+        assert response_id_for(rtr) == 0x0C003FE0 | (0xABC << 14)
+
+    def test_element_count_rtr(self):
+        rtr = CANMessage(
+            arbitration_id=0x01FD7FE0,
+            data=b"",
+            is_extended_id=True,
+            is_remote_frame=True,
+        )
+        assert response_id_for(rtr) == 0x09FD7FE0
+
+    def test_data_frame_has_no_response(self):
+        frame = CANMessage(arbitration_id=0x04003FE0, data=b"\x01", is_extended_id=True)
+        assert response_id_for(frame) is None
+
+
+class TestReplayAdapter:
+    """Playback through the USBtinAdapter surface."""
+
+    def test_frames_split_across_blocks(self, capture_file):
+        with ReplayAdapter(capture_file, speed=None) as adapter:
+            ids = [adapter.receive_frame(0.1).arbitration_id for _ in range(4)]
+
+        assert ids == [0x0C084060, 0x0C0C0270, 0x0C048060, 0x0C007FE0]
+
+    def test_exhausted_capture_times_out(self, capture_file):
+        with ReplayAdapter(capture_file, speed=None) as adapter:
+            for _ in range(4):
+                adapter.receive_frame(0.1)
+            assert adapter.exhausted
+            with pytest.raises(TimeoutError):
+                adapter.receive_frame(0.01)
+
+    def test_loop_restarts_playback(self, capture_file):
+        with ReplayAdapter(capture_file, speed=None, loop=True) as adapter:
+            ids = [adapter.receive_frame(0.1).arbitration_id for _ in range(5)]
+
+        assert ids[4] == ids[0]
+
+    def test_recorded_speed_is_respected(self, capture_file):
+        with ReplayAdapter(capture_file, speed=1.0) as adapter:
+            start = time.monotonic()
+            for _ in range(4):
+                adapter.receive_frame(1.0)
+            elapsed = time.monotonic() - start
+
+        assert 0.35 < elapsed < 1.0
+
+    def test_speed_factor_shortens_playback(self, capture_file):
+        with ReplayAdapter(capture_file, speed=10.0) as adapter:
+            start = time.monotonic()
+            for _ in range(4):
+                adapter.receive_frame(1.0)
+
+            assert time.monotonic() - start < 0.2
+
+    def test_flush_discards_delivered_frames(self, capture_file):
+        with ReplayAdapter(capture_file, speed=None) as adapter:
+            adapter.receive_frame(0.1)
+            adapter.flush_input_buffer()
+
+            assert adapter.receive_frame(0.1).arbitration_id == 0x0C048060
+
+    def test_rtr_answered_from_capture(self, capture_file):
+        registry = ParameterRegistry(
+            [
+                {
+                    "idx": 1,
+                    "extid": "00",
+                    "min": 0,
+                    "max": 500,
+                    "format": "int",
+                    "read": 1,
+                    "text": "P1",
+                }
+            ]
+        )
+        with ReplayAdapter(capture_file, speed=None) as adapter:
+            client = HeatPumpClient(adapter, registry)
+
+            assert client.read_parameter("P1", timeout=0.5)["decoded"] == 250
+            assert adapter.sent[0].is_remote_frame is True
+
+    def test_read_only_rejects_send(self, capture_file):
+        with ReplayAdapter(capture_file, read_only=True) as adapter:
+            with pytest.raises(PermissionError):
+                adapter.send_frame_nowait(
+                    CANMessage(arbitration_id=0x100, data=b"", is_extended_id=True)
+                )
+
+    def test_records_list_accepted(self):
+        records = [CaptureRecord(0.0, "<", b"T0C08406020102\r")]
+        with ReplayAdapter(records, speed=None) as adapter:
+            assert adapter.receive_frame(0.1).data == b"\x01\x02"
+
+    def test_broadcast_monitor_over_capture(self, capture_file):
+        with ReplayAdapter(capture_file, speed=None) as adapter:
+            cache = BroadcastMonitor(adapter).collect(duration=0.05)
+
+        assert cache.get_by_idx_and_base(0x21, 0x060).raw_value == 0x0102
+
+    def test_invalid_speed(self, capture_file):
+        with pytest.raises(ValueError):
+            ReplayAdapter(capture_file, speed=0)
@@ -0,0 +1,233 @@
+"""Unit tests for the read-through parameter response cache."""
+
+import pytest
+from buderus_wps.can_message import CANMessage
+from buderus_wps.heat_pump import HeatPumpClient
+from buderus_wps.parameter import Parameter
+from buderus_wps.parameter_registry import ParameterRegistry
+from buderus_wps.response_cache import (
+    PANEL_SETTING_TTL,
+    SETTING_TTL,
+    ResponseCache,
+    default_ttl,
+)
+
+PARAMETERS = [
+    {
+        "idx": 1,
+        "extid": "00",
+        "min": -100,
+        "max": 100,
+        "format": "tem",
+        "read": 0,
+        "text": "OFFSET",
+    },
+    {
+        "idx": 2,
+        "extid": "00",
+        "min": 0,
+        "max": 0,
+        "format": "tem",
+        "read": 1,
+        "text": "GT8_TEMP",
+    },
+    {
+        "idx": 3,
+        "extid": "00",
+        "min": 0,
+        "max": 2,
+        "format": "dp2",
+        "read": 1,
+        "text": "PROGRAM",
+    },
+]
+
+
+def _param(**overrides) -> Parameter:
+    fields = {
+        "idx": 1,
+        "extid": "00",
+        "min": 0,
+        "max": 10,
+        "format": "int",
+        "read": 0,
+        "text": "P",
+    }
+    fields.update(overrides)
+    return Parameter(**fields)
+
+
+class TestDefaultTtl:
+    """TTLs derived from parameter metadata."""
+
+    def test_measurement_not_cached(self):
+        assert default_ttl(_param(min=0, max=0)) == 0.0
+
+    def test_writable_setting(self):
+        assert default_ttl(_param()) == SETTING_TTL
+
+    def test_read_flagged_setting(self):
+        assert default_ttl(_param(read=1)) == PANEL_SETTING_TTL
+
+    def test_schedule_format(self):
+        assert default_ttl(_param(min=0, max=0, format="sw2")) == SETTING_TTL
+
+
+class TestResponseCache:
+    """Expiry, overrides and counters."""
+
+    def test_expires_after_ttl(self, clock):
+        cache = ResponseCache(clock=clock)
+        param = _param()
+        cache.put(param, b"\x00\x05")
+
+        clock.now = SETTING_TTL - 1
+        assert cache.get(param) == b"\x00\x05"
+        clock.now = SETTING_TTL + 1
+        assert cache.get(param) is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+    def test_override_by_name(self):
+        cache = ResponseCache(ttl_overrides={"p": 0.0})
+
+        assert cache.ttl(_param()) == 0.0
+        assert cache.ttl(_param(text="XDHW_TIME")) == 0.0  # built-in override
+
+    def test_status_flags_not_cached(self):
+        cache = ResponseCache()
+
+        # Flags carry a bitmask range that looks like a setting
+        flag = _param(text="PUMP_DHW_ACTIVE", max=16777216, read=1)
+        assert default_ttl(flag) > 0
+        assert cache.ttl(flag) == 0.0
+        assert cache.ttl(_param(text="PUMP_G1_CONTINUAL", max=134217728)) == 0.0
+
+    def test_put_dropped_after_invalidation(self):
+        cache = ResponseCache()
+        param = _param()
+        generation = cache.generation(param)  # taken before the RTR
+        cache.invalidate(param)  # write lands before the response
+
+        cache.put(param, b"\x00\x05", generation=generation)
+        assert cache.get(param) is None
+
+        cache.put(param, b"\x00\x06", generation=cache.generation(param))
+        assert cache.get(param) == b"\x00\x06"
+
+    def test_uncached_parameters_not_counted(self):
+        cache = ResponseCache()
+        param = _param(min=0, max=0)
+        cache.put(param, b"\x01")
+
+        assert cache.get(param) is None
+        assert cache.stats()["misses"] == 0
+
+
+class CountingAdapter:
+    """Answers every RTR with the parameter's idx as value."""
+
+    is_open = True
+    timeout = 0.2
+    reader_running = False
+
+    def __init__(self) -> None:
+        self.sent = []
+        self._queue = []
+        # Called once before the next response is received
+        self.before_receive = None
+
+    def flush_input_buffer(self):
+        pass
+
+    def _answer(self, message: CANMessage) -> CANMessage:
+        self.sent.append(message)
+        idx = (message.arbitration_id >> 14) & 0xFFF
+        return CANMessage(
+            arbitration_id=0x0C003FE0 | (idx << 14),
+            data=idx.to_bytes(2, "big"),
+            is_extended_id=True,
+        )
+
+    def _run_hook(self) -> None:
+        hook, self.before_receive = self.before_receive, None
+        if hook is not None:
+            hook()
+
+    def send_frame(self, message: CANMessage, timeout: float = 1.0):
+        response = self._answer(message)
+        self._run_hook()
+        return response
+
+    def send_frame_nowait(self, message: CANMessage):
+        self._queue.append(self._answer(message))
+
+    def receive_frame(self, timeout: float = 1.0):
+        from buderus_wps.exceptions import TimeoutError as BuderusTimeoutError
+
+        self._run_hook()
+        if self._queue:
+            return self._queue.pop(0)
+        raise BuderusTimeoutError("no frame")
+
+
+class TestClientCaching:
+    """HeatPumpClient read-through behavior."""
+
+    @pytest.fixture
+    def client(self):
+        return HeatPumpClient(
+            CountingAdapter(),
+            ParameterRegistry(PARAMETERS),
+            response_cache=ResponseCache(),
+        )
+
+    def test_second_read_served_from_cache(self, client):
+        first = client.read_parameter("OFFSET")
+        second = client.read_parameter("OFFSET")
+
+        assert (first["source"], second["source"]) == ("rtr", "cache")
+        assert second["decoded"] == first["decoded"]
+        assert len(client._adapter.sent) == 1
+
+    def test_measurements_always_read(self, client):
+        client.read_parameter("GT8_TEMP")
+        result = client.read_parameter("GT8_TEMP")
+
+        assert result["source"] == "rtr"
+        assert len(client._adapter.sent) == 2
+
+    def test_write_invalidates(self, client):
+        client.read_parameter("OFFSET")
+        client.write_value("OFFSET", 2.5)
+
+        assert client.read_parameter("OFFSET")["source"] == "rtr"
+        assert client.response_cache.stats()["misses"] == 2
+
+    def test_read_many_uses_and_fills_cache(self, client):
+        client.read_parameter("PROGRAM")
+
+        results = client.read_many(["OFFSET", "PROGRAM", "GT8_TEMP"], deadline=1.0)
+
+        assert results["PROGRAM"]["source"] == "cache"
+        assert results["OFFSET"]["source"] == "rtr"
+        assert client.read_parameter("OFFSET")["source"] == "cache"
+        # PROGRAM once, then OFFSET and GT8_TEMP in the batch
+        assert len(client._adapter.sent) == 3
+
+    def test_write_during_batch_not_overwritten_by_older_response(self, client):
+        # OFFSET's RTR is out when the write goes through; its response
+        # carries the value from before the write
+        client._adapter.before_receive = lambda: client.write_value("OFFSET", 2.5)
+
+        results = client.read_many(["OFFSET", "PROGRAM"], deadline=1.0, window=1)
+
+        assert results["OFFSET"]["source"] == "rtr"
+        assert client.read_parameter("OFFSET")["source"] == "rtr"
+        assert client.read_parameter("PROGRAM")["source"] == "cache"
+
+    def test_write_during_read_not_overwritten_by_older_response(self, client):
+        client._adapter.before_receive = lambda: client.write_value("OFFSET", 2.5)
+
+        client.read_parameter("OFFSET")
+
+        assert client.read_parameter("OFFSET")["source"] == "rtr"
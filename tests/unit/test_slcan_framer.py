@@ -0,0 +1,177 @@
+"""Unit tests for the incremental SLCAN framer."""
+
+import io
+
+import pytest
+from buderus_wps.can_message import CANMessage
+from buderus_wps.slcan_framer import SlcanFramer
+
+
+def _line(can_id: int, data: bytes) -> bytes:
+    msg = CANMessage(arbitration_id=can_id, data=data, is_extended_id=True)
+    return msg.to_usbtin_format().encode("ascii")
+
+
+class TestFraming:
+    """Line assembly across chunk boundaries."""
+
+    def test_frame_split_across_chunks(self):
+        framer = SlcanFramer()
+        line = _line(0x0C084060, b"\x00\xd2")
+        framer.feed(line[:5])
+        assert framer.drain() == []
+
+        framer.feed(line[5:])
+        frames = framer.drain()
+
+        assert len(frames) == 1
+        assert frames[0].arbitration_id == 0x0C084060
+        assert frames[0].data == b"\x00\xd2"
+        assert len(framer) == 0
+
+    def test_drain_returns_batch_in_order(self):
+        framer = SlcanFramer()
+        framer.feed(b"".join(_line(0x100 + i, bytes([i])) for i in range(50)))
+
+        frames = framer.drain()
+
+        assert [f.arbitration_id for f in frames] == [0x100 + i for i in range(50)]
+
+    def test_next_frame_keeps_remaining_lines(self):
+        framer = SlcanFramer()
+        framer.feed(_line(0x100, b"\x01") + _line(0x101, b"\x02"))
+
+        assert framer.next_frame().arbitration_id == 0x100
+        assert framer.next_frame().arbitration_id == 0x101
+        assert framer.next_frame() is None
+
+    def test_skips_acks_and_bell_prefix(self):
+        framer = SlcanFramer()
+        framer.feed(b"\r" + b"Z\r" + b"V0107\r" + b"\a" + _line(0x200, b"\x05"))
+
+        frames = framer.drain()
+
+        assert len(frames) == 1
+        assert frames[0].data == b"\x05"
+        assert framer.malformed == 0
+
+    def test_standard_and_remote_frames(self):
+        framer = SlcanFramer()
+        framer.feed(b"t1232AABB\rR0C0040604\r")
+
+        std, rtr = framer.drain()
+
+        assert std.arbitration_id == 0x123
+        assert std.is_extended_id is False
+        assert std.data == b"\xaa\xbb"
+        assert rtr.is_remote_frame is True
+        assert rtr.dlc == 4
+
+    def test_matches_from_usbtin_format(self):
+        line = "T0C0C02702AB12\r"
+        framer = SlcanFramer()
+        framer.feed(line.encode("ascii"))
+
+        assert framer.drain() == [CANMessage.from_usbtin_format(line)]
+
+
+class TestMalformedLines:
+    """Rejected lines are counted and optionally passed to a fallback."""
+
+    def test_malformed_lines_are_counted(self):
+        framer = SlcanFramer()
+        framer.feed(b"T0C0C0270ZZ\r" + b"T0C0C027021\r" + _line(0x300, b"\x01"))
+
+        frames = framer.drain()
+
+        assert [f.arbitration_id for f in frames] == [0x300]
+        assert framer.malformed == 2
+
+    def test_fallback_receives_raw_line(self):
+        seen = []
+
+        def fallback(line):
+            seen.append(line)
+            return CANMessage(arbitration_id=0x7FF, data=b"", is_extended_id=False)
+
+        framer = SlcanFramer(fallback=fallback)
+        framer.feed(b"T0C0C0270201\r")
+
+        assert framer.drain()[0].arbitration_id == 0x7FF
+        assert seen == [b"T0C0C0270201"]
+
+
+class TestPayloadDrain:
+    """drain_payloads() for element-list streams."""
+
+    def test_filters_and_concatenates_payloads(self):
+        framer = SlcanFramer()
+        framer.feed(
+            _line(0x09FDBFE0, b"\x01\x02")
+            + _line(0x0C084060, b"\xff")
+            + _line(0x09FDBFE0, b"\x03")
+            + b"R09FDBFE00\r"
+        )
+        out = bytearray()
+
+        count = framer.drain_payloads(out, 0x09FDBFE0)
+
+        assert count == 2
+        assert out == b"\x01\x02\x03"
+
+
+class TestBuffer:
+    """Buffer compaction and growth."""
+
+    def test_buffer_compacts_instead_of_growing(self):
+        framer = SlcanFramer(size=64)
+        line = _line(0x0C084060, b"\x00\xd2")
+        for _ in range(100):
+            framer.feed(line)
+            assert len(framer.drain()) == 1
+
+        assert framer.capacity == 64
+
+    def test_buffer_grows_for_large_backlog(self):
+        framer = SlcanFramer(size=32)
+        framer.feed(b"".join(_line(0x100, b"\x01") for _ in range(20)))
+
+        assert framer.capacity >= 20 * len(_line(0x100, b"\x01"))
+        assert len(framer.drain()) == 20
+
+    def test_partial_line_survives_compaction(self):
+        framer = SlcanFramer(size=32)
+        line = _line(0x0C084060, b"\x00\xd2")
+        framer.feed(line + line[:10])
+        assert len(framer.drain()) == 1
+
+        framer.feed(line[10:] + line)
+
+        assert len(framer.drain()) == 2
+
+    def test_readinto_reads_directly_into_buffer(self):
+        framer = SlcanFramer()
+        port = io.BytesIO(_line(0x100, b"\x01") * 3)
+
+        assert framer.readinto(port, 4096) == len(_line(0x100, b"\x01")) * 3
+        assert len(framer.drain()) == 3
+
+    def test_reset_discards_buffered_data(self):
+        framer = SlcanFramer()
+        framer.feed(_line(0x100, b"\x01"))
+        framer.reset()
+
+        assert framer.drain() == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_burst_parses_identically_for_any_chunking(chunk_size):
+    stream = b"".join(_line(0x0C000060 | (i << 14), bytes([i, i])) for i in range(200))
+    framer = SlcanFramer(size=128)
+    frames = []
+    for pos in range(0, len(stream), chunk_size):
+        framer.feed(stream[pos : pos + chunk_size])
+        frames.extend(framer.drain())
+
+    assert len(frames) == 200
+    assert frames[-1].data == bytes([199, 199])
@@ -0,0 +1,93 @@
+"""Unit tests for broadcast time-series ring buffers."""
+
+import pytest
+from buderus_wps.timeseries import SLOT_SIZE, BroadcastHistory, TimeSeries
+
+
+class TestTimeSeries:
+    """Ring buffer storage and window queries."""
+
+    def test_empty(self):
+        series = TimeSeries(capacity=4)
+
+        assert len(series) == 0
+        assert series.last() is None
+        assert series.window(60.0, now=100.0) is None
+        assert series.downsample() == []
+
+    def test_wraps_at_capacity(self):
+        series = TimeSeries(capacity=3)
+        for t in range(5):
+            series.append(float(t), t * 10)
+
+        times, values = series.samples()
+
+        assert len(series) == 3
+        assert list(times) == [2.0, 3.0, 4.0]
+        assert list(values) == [20, 30, 40]
+        assert series.last() == (4.0, 40)
+
+    def test_window_stats(self):
+        series = TimeSeries(capacity=4)
+        for t, value in [(0.0, 100), (10.0, -5), (20.0, 215), (30.0, 210), (40.0, 220)]:
+            series.append(t, value)
+
+        stats = series.window(25.0, now=40.0)
+
+        assert (stats.count, stats.min, stats.max, stats.last) == (3, 210, 220, 220)
+        assert stats.mean == pytest.approx(215.0)
+        assert stats.rate == pytest.approx(3 / 25.0)
+
+    def test_backwards_timestamp_clamped(self):
+        series = TimeSeries(capacity=4)
+        series.append(10.0, 1)
+        series.append(5.0, 2)
+
+        assert series.last() == (10.0, 2)
+
+    def test_downsample_into_minutes(self):
+        series = TimeSeries(capacity=16)
+        for t, value in [(0.0, 1), (30.0, 3), (65.0, 10), (200.0, 7)]:
+            series.append(t, value)
+
+        buckets = series.downsample(60.0)
+
+        assert [(b.start, b.count, b.mean) for b in buckets] == [
+            (0.0, 2, 2.0),
+            (60.0, 1, 10.0),
+            (180.0, 1, 7.0),
+        ]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            TimeSeries(capacity=0)
+
+
+class TestBroadcastHistory:
+    """Per-key series management."""
+
+    def test_records_per_key(self):
+        history = BroadcastHistory(capacity=8)
+        history.record((0x0060, 12), 1.0, 50)
+        history.record((0x0060, 12), 2.0, 52)
+        history.record((0x0270, 5), 2.0, 430)
+
+        assert sorted(history.keys()) == [(0x0060, 12), (0x0270, 5)]
+        assert history.window(0x0060, 12, 10.0, now=2.0).mean == 51.0
+        assert history.last(0x0270, 5) == (2.0, 430)
+        assert history.window(0x0061, 12, 10.0) is None
+        assert history.nbytes == 2 * 8 * SLOT_SIZE
+
+    def test_key_filter(self):
+        history = BroadcastHistory(keys=[(0x0060, 12)])
+        history.record((0x0060, 0), 1.0, 50)
+
+        assert history.keys() == []
+
+    def test_memory_stays_flat(self):
+        history = BroadcastHistory(capacity=10)
+        for t in range(1000):
+            history.record((0x0060, 12), float(t), t % 300)
+
+        assert history.nbytes == 10 * SLOT_SIZE
+        assert len(history.downsample(0x0060, 12, 60.0)) == 1
@@ -7,6 +7,10 @@ Tests cover:
 - T038: USBtinAdapter.receive_frame()
 """
 
+import os
+import sys
+import threading
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -510,3 +514,262 @@ class TestConnectionStateDetection:
         # receive_frame should detect and raise error
         with pytest.raises(DeviceCommunicationError, match="not connected"):
             adapter.receive_frame()
+
+
+class FakeSerialPort:
+    """Thread-safe serial stand-in with blocking reads for reader-thread tests.
+
+    ``responder`` maps written bytes to the bytes the "device" sends back.
+    """
+
+    def __init__(self, responder=None):
+        self.is_open = True
+        self.timeout = 1.0
+        self.written = []
+        self._rx = bytearray()
+        self._cond = threading.Condition()
+        self._responder = responder
+
+    @property
+    def in_waiting(self):
+        with self._cond:
+            return len(self._rx)
+
+    def feed(self, data: bytes) -> None:
+        with self._cond:
+            self._rx.extend(data)
+            self._cond.notify_all()
+
+    def read(self, size=1):
+        with self._cond:
+            if not self._rx:
+                self._cond.wait(self.timeout)
+            chunk = bytes(self._rx[:size])
+            del self._rx[:size]
+            return chunk
+
+    def write(self, data):
+        self.written.append(data)
+        if self._responder is not None:
+            reply = self._responder(data)
+            if reply:
+                self.feed(reply)
+
+    def reset_input_buffer(self):
+        with self._cond:
+            self._rx.clear()
+
+    def close(self):
+        self.is_open = False
+
+
+def _connected_reader_adapter(fake):
+    adapter = USBtinAdapter("/dev/ttyACM0", skip_init=True)
+    adapter.stabilization_delay = 0
+    with patch("serial.Serial", return_value=fake):
+        adapter.connect()
+    adapter.start_reader()
+    return adapter
+
+
+class TestUSBtinAdapterBackgroundReader:
+    """Single reader thread with per-CAN-ID demultiplexing."""
+
+    def test_start_requires_connection(self):
+        adapter = USBtinAdapter("/dev/ttyACM0")
+        with pytest.raises(DeviceCommunicationError):
+            adapter.start_reader()
+
+    def test_start_and_stop(self):
+        adapter = _connected_reader_adapter(FakeSerialPort())
+        assert adapter.reader_running is True
+
+        adapter.stop_reader()
+        assert adapter.reader_running is False
+        adapter.disconnect()
+
+    def test_disconnect_stops_reader(self):
+        adapter = _connected_reader_adapter(FakeSerialPort())
+        adapter.disconnect()
+        assert adapter.reader_running is False
+
+    def test_send_request_matches_response_id(self):
+        """Unrelated broadcasts do not satisfy an RTR waiter."""
+
+        def responder(data):
+            if data.startswith(b"R04007FE0"):
+                return b"Z\rT0C08406020102\rT0C007FE0200AB\r"
+            return b""
+
+        adapter = _connected_reader_adapter(FakeSerialPort(responder))
+        try:
+            request = CANMessage(
+                arbitration_id=0x04007FE0,
+                data=b"",
+                is_extended_id=True,
+                is_remote_frame=True,
+            )
+            response = adapter.send_request(request, 0x0C007FE0, timeout=1.0)
+
+            assert response.data == b"\x00\xab"
+            # Broadcast left for passive consumers
+            assert adapter.receive_frame(timeout=0.5).arbitration_id == 0x0C084060
+        finally:
+            adapter.disconnect()
+
+    def test_send_request_timeout(self):
+        adapter = _connected_reader_adapter(FakeSerialPort())
+        try:
+            request = CANMessage(
+                arbitration_id=0x04007FE0,
+                data=b"",
+                is_extended_id=True,
+                is_remote_frame=True,
+            )
+            with pytest.raises(TimeoutError):
+                adapter.send_request(request, 0x0C007FE0, timeout=0.1)
+            assert adapter.demultiplexer.pending_waiters == 0
+        finally:
+            adapter.disconnect()
+
+    def test_concurrent_requests_do_not_conflict(self):
+        """Two callers no longer fail with 'Operation already in progress'."""
+
+        def responder(data):
+            can_id = data[1:9].decode()
+            response_id = int(can_id, 16) | 0x08000000
+            return f"T{response_id:08X}10{can_id[-2:]}\r".encode()
+
+        adapter = _connected_reader_adapter(FakeSerialPort(responder))
+        results = {}
+
+        def worker(idx):
+            request_id = 0x04003FE0 | (idx << 14)
+            request = CANMessage(
+                arbitration_id=request_id,
+                data=b"",
+                is_extended_id=True,
+                is_remote_frame=True,
+            )
+            results[idx] = adapter.send_request(
+                request, 0x0C003FE0 | (idx << 14), timeout=1.0
+            )
+
+        try:
+            threads = [threading.Thread(target=worker, args=(i,)) for i in (1, 2, 3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(2.0)
+            assert sorted(results) == [1, 2, 3]
+            for idx, frame in results.items():
+                assert frame.arbitration_id == 0x0C003FE0 | (idx << 14)
+        finally:
+            adapter.disconnect()
+
+    def test_receive_stream_includes_early_frames(self):
+        """Frames arriving before receive_stream() is called are not lost."""
+        fake = FakeSerialPort()
+        adapter = _connected_reader_adapter(fake)
+        try:
+            fake.feed(b"T09FDBFE080102030405060708\r")
+            time.sleep(0.05)
+            fake.feed(b"T09FDBFE02090A\r")
+
+            pieces = []
+            data = adapter.receive_stream(
+                10, timeout=1.0, frame_filter=0x09FDBFE0, on_data=pieces.append
+            )
+            assert data == bytes(range(1, 11))
+            assert pieces == [bytes(range(1, 9)), b"\x09\x0a"]
+        finally:
+            adapter.disconnect()
+
+    def test_flush_keeps_serial_buffer(self):
+        fake = FakeSerialPort()
+        fake.reset_input_buffer = Mock()
+        adapter = _connected_reader_adapter(fake)
+        try:
+            adapter.flush_input_buffer()
+            fake.reset_input_buffer.assert_not_called()
+        finally:
+            adapter.disconnect()
+
+
+@pytest.fixture
+def pty_port():
+    """Pty pair: yields (master_fd, slave_path)."""
+    master, slave = os.openpty()
+    try:
+        yield master, os.ttyname(slave)
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="pty-based tests require POSIX")
+class TestUSBtinAdapterReadMode:
+    """fd-readiness reads (read_mode='select') versus sleep polling."""
+
+    def _connect(self, path, read_mode):
+        adapter = USBtinAdapter(path, skip_init=True, read_mode=read_mode)
+        adapter.stabilization_delay = 0
+        return adapter.connect()
+
+    def test_invalid_read_mode_rejected(self):
+        with pytest.raises(ValueError, match="read_mode"):
+            USBtinAdapter("/dev/ttyACM0", read_mode="busy")
+
+    def test_select_mode_uses_serial_fd(self, pty_port):
+        _, path = pty_port
+        adapter = self._connect(path, "select")
+        try:
+            assert adapter._read_fd is not None
+        finally:
+            adapter.disconnect()
+
+    def test_poll_mode_has_no_fd(self, pty_port):
+        _, path = pty_port
+        adapter = self._connect(path, "poll")
+        try:
+            assert adapter._read_fd is None
+        finally:
+            adapter.disconnect()
+
+    def test_select_mode_wakes_on_data(self, pty_port):
+        master, path = pty_port
+        adapter = self._connect(path, "select")
+        try:
+            threading.Timer(0.05, os.write, args=(master, b"T0C08406020102\r")).start()
+            start = time.monotonic()
+            frame = adapter.receive_frame(timeout=2.0)
+
+            assert frame.arbitration_id == 0x0C084060
+            assert time.monotonic() - start < 0.5
+        finally:
+            adapter.disconnect()
+
+    def test_select_mode_respects_deadline(self, pty_port):
+        _, path = pty_port
+        adapter = self._connect(path, "select")
+        try:
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                adapter.receive_frame(timeout=0.2)
+            assert 0.15 < time.monotonic() - start < 0.6
+        finally:
+            adapter.disconnect()
+
+    def test_select_mode_stream(self, pty_port):
+        master, path = pty_port
+        adapter = self._connect(path, "select")
+        try:
+            os.write(master, b"T09FDBFE080102030405060708\rT09FDBFE02090A\r")
+            pieces = []
+            data = adapter.receive_stream(
+                10, timeout=1.0, frame_filter=0x09FDBFE0, on_data=pieces.append
+            )
+            assert data == bytes(range(1, 11))
+            assert b"".join(pieces) == data
+        finally:
+            adapter.disconnect()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Benchmark the binary cache format against the JSON caches it replaces.
+
+Builds a 1789-element cache (the static parameter table plus one element)
+and compares, for the parameter cache and the element discovery cache:
+
+1. File size
+2. Load time: median / min over repeated loads, including validation.
+   The JSON parameter cache is validated as ParameterCache did before
+   (parse, re-serialize sorted for the SHA-256, then parse again in load);
+   the JSON element cache is parsed and its base64 chunks checked.
+
+Usage:
+    python tools/benchmark_cache_formats.py [--repeat 50]
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# Appended (not prepended): the HA platform modules next to the library
+# (select.py, ...) would otherwise shadow stdlib modules.
+sys.path.append(
+    str(Path(__file__).resolve().parents[1] / "custom_components" / "buderus_wps")
+)
+
+from buderus_wps.cache import ParameterCache
+from buderus_wps.element_discovery import (
+    DiscoveredElement,
+    _write_element_cache,
+    load_element_cache,
+)
+from buderus_wps.parameter_data import PARAMETER_DATA
+
+ELEMENT_COUNT = 1789
+CHUNK_SIZE = 4096
+
+
+def build_parameters() -> list[dict[str, Any]]:
+    """Static parameter table padded to ELEMENT_COUNT entries."""
+    params = [dict(p) for p in PARAMETER_DATA]
+    while len(params) < ELEMENT_COUNT:
+        last = params[-1]
+        params.append(dict(last, idx=last["idx"] + 1, text=f"{last['text']}_X"))
+    return params[:ELEMENT_COUNT]
+
+
+def element_stream(params: list[dict[str, Any]]) -> bytes:
+    """Raw element list as the heat pump sends it."""
+    data = bytearray()
+    for p in params:
+        name = p["text"].encode("ascii")
+        data += p["idx"].to_bytes(2, "big") + bytes.fromhex(p["extid"])
+        data += p["max"].to_bytes(4, "big", signed=True)
+        data += p["min"].to_bytes(4, "big", signed=True)
+        data += bytes([len(name) + 1]) + name + b"\x00"
+    return bytes(data)
+
+
+# JSON formats as written before the binary cache
+
+
+def legacy_checksum(parameters: list[dict]) -> str:
+    ordered = sorted(parameters, key=lambda p: p.get("idx", 0))
+    text = json.dumps(ordered, sort_keys=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def write_legacy_parameters(path: Path, params: list[dict]) -> None:
+    data = {
+        "version": "1.0.0",
+        "created": "2026-01-01T00:00:00",
+        "element_count": len(params),
+        "checksum": legacy_checksum(params),
+        "parameters": params,
+    }
+    path.write_text(json.dumps(data, indent=2))
+
+
+def load_legacy_parameters(path: Path) -> list[dict]:
+    # is_valid(): parse and verify checksum
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("version") != "1.0.0" or data["checksum"] != legacy_checksum(
+        data["parameters"]
+    ):
+        raise ValueError("invalid")
+    # load(): parse again
+    with open(path) as f:
+        return list(json.load(f)["parameters"])
+
+
+def write_legacy_elements(path: Path, params: list[dict], raw: bytes) -> None:
+    chunks = [raw[i : i + CHUNK_SIZE] for i in range(0, len(raw), CHUNK_SIZE)]
+    records = []
+    offset = 0
+    for chunk in chunks:
+        records.append(
+            {
+                "offset": offset,
+                "size": len(chunk),
+                "sha256": hashlib.sha256(chunk).hexdigest(),
+                "data": base64.b64encode(chunk).decode("ascii"),
+            }
+        )
+        offset += len(chunk)
+    data = {
+        "version": 2,
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "timestamp_unix": time.time(),
+        "reported_count": len(raw),
+        "actual_count": len(params),
+        "reported_bytes": len(raw),
+        "actual_bytes": len(raw),
+        "complete": True,
+        "elements": [
+            {
+                "idx": p["idx"],
+                "extid": p["extid"],
+                "text": p["text"],
+                "min_value": p["min"],
+                "max_value": p["max"],
+            }
+            for p in params
+        ],
+        "chunk_size": CHUNK_SIZE,
+        "chunks": records,
+    }
+    path.write_text(json.dumps(data, indent=2))
+
+
+def load_legacy_elements(path: Path) -> list[DiscoveredElement]:
+    with open(path) as f:
+        data = json.load(f)
+    for record in data["chunks"]:
+        chunk = base64.b64decode(record["data"])
+        if hashlib.sha256(chunk).hexdigest() != record["sha256"]:
+            raise ValueError("corrupt chunk")
+    return [
+        DiscoveredElement(
+            idx=e["idx"],
+            extid=e["extid"],
+            text=e["text"],
+            min_value=e["min_value"],
+            max_value=e["max_value"],
+        )
+        for e in data["elements"]
+    ]
+
+
+def load_binary_parameters(path: Path) -> list[dict]:
+    cache = ParameterCache(path)
+    if not cache.is_valid():
+        raise ValueError("invalid")
+    params = cache.load()
+    assert params is not None
+    return params
+
+
+def time_load(load: Callable[[Path], Any], path: Path, repeat: int) -> list[float]:
+    load(path)  # warm the page cache
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load(path)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="loads per format")
+    args = parser.parse_args()
+
+    params = build_parameters()
+    raw = element_stream(params)
+    elements = [
+        DiscoveredElement(p["idx"], p["extid"], p["text"], p["min"], p["max"])
+        for p in params
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        files = {
+            "parameters (json)": root / "params.json",
+            "parameters (binary)": root / "params.bin",
+            "elements (json)": root / "elements.json",
+            "elements (binary)": root / "elements.bin",
+        }
+        write_legacy_parameters(files["parameters (json)"], params)
+        ParameterCache(files["parameters (binary)"]).save(params)
+        write_legacy_elements(files["elements (json)"], params, raw)
+        _write_element_cache(
+            str(files["elements (binary)"]),
+            elements,
+            {"complete": True, "reported_bytes": len(raw)},
+            [raw[i : i + CHUNK_SIZE] for i in range(0, len(raw), CHUNK_SIZE)],
+        )
+
+        loaders: dict[str, Callable[[Path], Any]] = {
+            "parameters (json)": load_legacy_parameters,
+            "parameters (binary)": load_binary_parameters,
+            "elements (json)": load_legacy_elements,
+            "elements (binary)": lambda path: load_element_cache(str(path)),
+        }
+
+        print(f"{ELEMENT_COUNT} elements, {len(raw)} bytes of raw element data\n")
+        print(f"{'cache':<22}{'size':>12}{'median ms':>12}{'min ms':>10}")
+        for name, path in files.items():
+            samples = time_load(loaders[name], path, args.repeat)
+            print(
+                f"{name:<22}{path.stat().st_size:>12,}"
+                f"{statistics.median(samples):>12.2f}{min(samples):>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
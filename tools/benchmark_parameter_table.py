@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark start-up cost of the static parameter table.
+
+Runs each scenario in fresh interpreters and reports wall time and the
+growth of peak resident memory (ru_maxrss) for:
+
+1. Integration load: import the library and build the HeatPump registry
+   with static fallback data, as the coordinator does before discovery
+2. CLI start: import the CLI and build its HeatPump registry
+
+With --baseline, the same scenarios also run against the library and CLI
+exported from a git revision (e.g. the commit before the packed table),
+so the two can be compared on the same machine.
+
+Usage:
+    python tools/benchmark_parameter_table.py [--runs 15] [--baseline REV]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+SCENARIOS = {
+    "integration load": (
+        "import buderus_wps\n"
+        "from buderus_wps.parameter import HeatPump\n"
+        "HeatPump()\n"
+    ),
+    "CLI start": (
+        "import buderus_wps_cli.main\n"
+        "from buderus_wps import HeatPump\n"
+        "HeatPump()\n"
+    ),
+}
+
+# Paths are appended (not prepended): the HA platform modules next to the
+# library (select.py, ...) would otherwise shadow stdlib modules.
+PROBE = """
+import logging, resource, sys, time
+sys.path.append({library!r})
+sys.path.append({root!r})
+logging.disable(logging.CRITICAL)
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed * 1000, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss)
+"""
+
+
+def run_scenario(tree: Path, code: str, runs: int) -> tuple[list[float], list[int]]:
+    probe = PROBE.format(
+        library=str(tree / "custom_components" / "buderus_wps"),
+        root=str(tree),
+        code=code,
+    )
+    # First run compiles the .pyc files; it is not measured
+    subprocess.run([sys.executable, "-c", probe], check=True, capture_output=True)
+    times, rss = [], []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+        ).stdout.split()
+        times.append(float(out[0]))
+        rss.append(int(out[1]))
+    return times, rss
+
+
+def export_revision(revision: str, target: Path) -> Path:
+    archive = target / "tree.tar"
+    with open(archive, "wb") as f:
+        subprocess.run(
+            ["git", "archive", revision, "custom_components", "buderus_wps_cli"],
+            cwd=ROOT,
+            check=True,
+            stdout=f,
+        )
+    with tarfile.open(archive) as tar:
+        tar.extractall(target / "tree")
+    return target / "tree"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15, help="runs per scenario")
+    parser.add_argument("--baseline", help="git revision to compare against")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        trees = {"current": ROOT}
+        if args.baseline:
+            trees[args.baseline] = export_revision(args.baseline, Path(tmp))
+
+        print(
+            f"{'scenario':<18}{'tree':<12}{'median ms':>11}{'min ms':>9}{'RSS KiB':>10}"
+        )
+        for name, code in SCENARIOS.items():
+            for label, tree in trees.items():
+                times, rss = run_scenario(tree, code, args.runs)
+                print(
+                    f"{name:<18}{label:<12}{statistics.median(times):>11.1f}"
+                    f"{min(times):>9.1f}{statistics.median(rss):>10.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
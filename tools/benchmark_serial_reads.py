@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark USBtinAdapter read modes against a pty-based USBtin stand-in.
+
+Compares read_mode="poll" (sleep between reads) with read_mode="select"
+(wait on the serial fd) for:
+
+1. RTR round-trip latency: send_frame() of a parameter RTR until the
+   0x0C003FE0 | idx << 14 response has been parsed (median / p95 / max)
+2. Idle CPU: process CPU time consumed while receive_frame() waits on a
+   silent bus, as a percentage of wall time
+
+The stand-in is the master side of a pty answering every extended RTR with a
+two-byte data frame after an optional simulated bus delay.
+
+Usage:
+    python tools/benchmark_serial_reads.py [--requests 200] [--idle 3.0]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Appended (not prepended): the HA platform modules next to the library
+# (select.py, ...) would otherwise shadow stdlib modules.
+sys.path.append(
+    str(Path(__file__).resolve().parents[1] / "custom_components" / "buderus_wps")
+)
+
+from buderus_wps.can_adapter import USBtinAdapter
+from buderus_wps.can_message import CANMessage
+from buderus_wps.exceptions import TimeoutError
+
+RESPONSE_BASE = 0x0C003FE0
+
+
+class PtyUSBtin:
+    """Answer extended RTRs written to the slave side of a pty."""
+
+    def __init__(self, response_delay: float) -> None:
+        self.master, self._slave = os.openpty()
+        self.port = os.ttyname(self._slave)
+        self.response_delay = response_delay
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> "PtyUSBtin":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        os.write(self._slave, b"\r")  # wake the responder
+        self._thread.join(1.0)
+        os.close(self.master)
+        os.close(self._slave)
+
+    def _run(self) -> None:
+        buffer = b""
+        while not self._stop.is_set():
+            buffer += os.read(self.master, 4096)
+            while b"\r" in buffer:
+                line, buffer = buffer.split(b"\r", 1)
+                if not line.startswith(b"R"):
+                    continue
+                idx = (int(line[1:9], 16) >> 14) & 0xFFF
+                if self.response_delay:
+                    time.sleep(self.response_delay)
+                frame = CANMessage(
+                    arbitration_id=RESPONSE_BASE | (idx << 14),
+                    data=b"\x01\x2c",
+                    is_extended_id=True,
+                )
+                os.write(self.master, frame.to_usbtin_format().encode("ascii"))
+
+
+def measure_latency(adapter: USBtinAdapter, requests: int) -> list:
+    samples = []
+    for n in range(requests):
+        idx = 1 + n % 4000
+        rtr = CANMessage(
+            arbitration_id=0x04003FE0 | (idx << 14),
+            data=b"",
+            is_extended_id=True,
+            is_remote_frame=True,
+        )
+        start = time.perf_counter()
+        response = adapter.send_frame(rtr, timeout=1.0)
+        samples.append(time.perf_counter() - start)
+        assert response.arbitration_id == RESPONSE_BASE | (idx << 14)
+    return samples
+
+
+def measure_idle_cpu(adapter: USBtinAdapter, duration: float) -> float:
+    wall_start = time.monotonic()
+    cpu_start = time.process_time()
+    try:
+        adapter.receive_frame(timeout=duration)
+    except TimeoutError:
+        pass
+    wall = time.monotonic() - wall_start
+    return 100.0 * (time.process_time() - cpu_start) / wall
+
+
+def run(mode: str, requests: int, idle: float, response_delay: float) -> dict:
+    device = PtyUSBtin(response_delay).start()
+    adapter = USBtinAdapter(device.port, skip_init=True, read_mode=mode)
+    adapter.stabilization_delay = 0
+    try:
+        adapter.connect()
+        samples = measure_latency(adapter, requests)
+        cpu = measure_idle_cpu(adapter, idle)
+    finally:
+        adapter.disconnect()
+        device.stop()
+    samples.sort()
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "p95_ms": samples[int(len(samples) * 0.95) - 1] * 1000,
+        "max_ms": samples[-1] * 1000,
+        "idle_cpu_pct": cpu,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--idle", type=float, default=3.0, help="idle seconds")
+    parser.add_argument(
+        "--response-delay",
+        type=float,
+        default=0.002,
+        help="simulated heat pump response time in seconds",
+    )
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'median ms':>12}{'p95 ms':>10}{'max ms':>10}{'idle CPU %':>12}")
+    for mode in ("poll", "select"):
+        r = run(mode, args.requests, args.idle, args.response_delay)
+        print(
+            f"{mode:<8}{r['median_ms']:>12.2f}{r['p95_ms']:>10.2f}"
+            f"{r['max_ms']:>10.2f}{r['idle_cpu_pct']:>12.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """
-Parse FHEM 26_KM273v018.pm and emit buderus_wps/parameter_defaults.py.
+Parse FHEM 26_KM273v018.pm and emit buderus_wps/parameter_table_data.py.
 
 This is a one-off helper to snapshot the KM273_elements_default table into a
 Python module so the library has a baseline registry even before fetching from
-the heat pump. Run from repository root:
+the heat pump. The table is written as packed columns (see
+buderus_wps/parameter_table.py) that parameter_defaults.py and
+parameter_data.py expose as lazy views. The curated corrections applied to
+PARAMETER_DATA (DATA_OVERRIDES) are kept from the existing module. Run from
+repository root:
 
     python tools/generate_parameter_defaults.py
 """
@@ -15,12 +19,27 @@ import argparse
 import json
 import pathlib
 import re
+import sys
 from typing import Any
 
 ROOT = pathlib.Path(__file__).resolve().parent.parent
+LIBRARY = ROOT / "custom_components" / "buderus_wps" / "buderus_wps"
 SOURCE = ROOT / "fhem" / "26_KM273v018.pm"
-TARGET = ROOT / "buderus_wps" / "parameter_defaults.py"
-META = ROOT / "buderus_wps" / "parameter_defaults.meta.json"
+TARGET = LIBRARY / "parameter_table_data.py"
+META = LIBRARY / "parameter_defaults.meta.json"
+
+# Appended (not prepended): the HA platform modules next to the library
+# (select.py, ...) would otherwise shadow stdlib modules.
+if str(LIBRARY.parent) not in sys.path:
+    sys.path.append(str(LIBRARY.parent))
+
+from buderus_wps.parameter_table import (  # noqa: E402
+    ARRAY_COLUMNS,
+    ParameterTable,
+    pack_array,
+)
+
+HEX_PER_LINE = 64
 
 ENTRY_REGEX = re.compile(
     r"\{\s*'idx'\s*=>\s*(?P<idx>-?\d+)\s*,\s*"
@@ -74,14 +93,25 @@ def validate_entries(entries: list[dict[str, Any]], source_text: str) -> None:
         )
 
 
-def load_existing() -> list[dict[str, Any]]:
+def _load_target() -> dict[str, Any]:
     if not TARGET.exists():
-        return []
+        return {}
     # Crude import by exec to avoid import-time side effects
     data: dict = {}
     code = TARGET.read_text(encoding="utf-8")
     exec(compile(code, str(TARGET), "exec"), data)
-    return data.get("PARAMETER_DEFAULTS", [])
+    return data
+
+
+def load_existing() -> list[dict[str, Any]]:
+    data = _load_target()
+    if "COUNT" not in data:
+        return []
+    return [dict(row) for row in ParameterTable(data)]
+
+
+def load_existing_overrides() -> dict[str, dict[str, Any]]:
+    return dict(_load_target().get("DATA_OVERRIDES", {}))
 
 
 def diff_entries(old: list[dict[str, Any]], new: list[dict[str, Any]]) -> tuple[
@@ -107,21 +137,71 @@ def diff_entries(old: list[dict[str, Any]], new: list[dict[str, Any]]) -> tuple[
     return added, removed, modified
 
 
-def write_module(entries: list[dict[str, Any]]) -> None:
-    header = (
+def _hex_literal(data: bytes) -> str:
+    text = data.hex()
+    lines = [
+        f'    "{text[i : i + HEX_PER_LINE]}"\n'
+        for i in range(0, len(text), HEX_PER_LINE)
+    ]
+    return "bytes.fromhex(\n" + "".join(lines) + ")\n"
+
+
+def pack_entries(entries: list[dict[str, Any]]) -> dict[str, Any]:
+    """Columns of the packed table for ``entries`` (in order)."""
+    formats = tuple(sorted({e["format"] for e in entries}))
+    try:
+        columns = {
+            name: pack_array(typecode, [e[name.lower()] for e in entries])
+            for name, typecode in ARRAY_COLUMNS.items()
+        }
+        columns["READ"] = bytes(e["read"] for e in entries)
+        columns["EXTID"] = b"".join(bytes.fromhex(e["extid"]) for e in entries)
+    except (OverflowError, ValueError) as e:
+        raise SystemExit(f"Entry cannot be packed: {e}") from e
+    bad_extid = [e["text"] for e in entries if len(e["extid"]) != 14]
+    if bad_extid:
+        raise SystemExit(f"extid is not 7 bytes: {bad_extid}")
+    bad_text = [e["text"] for e in entries if e["text"].split() != [e["text"]]]
+    if bad_text:
+        raise SystemExit(f"Parameter names with whitespace: {bad_text}")
+    columns["FORMAT"] = bytes(formats.index(e["format"]) for e in entries)
+    columns["COUNT"] = len(entries)
+    columns["FORMATS"] = formats
+    columns["NAMES"] = "\n".join(e["text"] for e in entries)
+    return columns
+
+
+def write_module(
+    entries: list[dict[str, Any]],
+    overrides: dict[str, dict[str, Any]] | None = None,
+) -> None:
+    columns = pack_entries(entries)
+    names = {e["text"] for e in entries}
+    kept = {k: v for k, v in (overrides or {}).items() if k in names}
+    lines = [
         "# Auto-generated by tools/generate_parameter_defaults.py\n"
-        "# Do not edit manually. Source: fhem/26_KM273v018.pm\n\n"
-        "PARAMETER_DEFAULTS = [\n"
+        "# Do not edit manually. Source: fhem/26_KM273v018.pm\n"
+        "#\n"
+        "# Packed columns of the static parameter table, decoded by\n"
+        "# parameter_table.ParameterTable: IDX (uint16), MIN and MAX (int32) are\n"
+        "# little-endian arrays; READ, FORMAT (index into FORMATS) and EXTID\n"
+        "# (7 bytes per row) are byte columns; NAMES has one name per line.\n\n"
+        # Keeps the DATA_OVERRIDES annotation unevaluated on Python 3.9
+        "from __future__ import annotations\n\n",
+        f"COUNT = {columns['COUNT']}\n\n",
+        "FORMATS = (\n" + "".join(f'    "{f}",\n' for f in columns["FORMATS"]) + ")\n",
+    ]
+    for name in ("IDX", "MIN", "MAX", "READ", "FORMAT", "EXTID"):
+        lines.append(f"\n{name} = " + _hex_literal(columns[name]))
+    lines.append('\nNAMES = """\\\n' + columns["NAMES"] + '\n"""\n')
+    lines.append(
+        "\n# Corrections applied by parameter_data.PARAMETER_DATA\n"
+        "DATA_OVERRIDES: dict[str, dict[str, int | str]] = {\n"
     )
-    lines = [header]
-    for entry in entries:
-        lines.append(
-            f"    {{'idx': {entry['idx']}, 'extid': '{entry['extid']}', "
-            f"'max': {entry['max']}, 'min': {entry['min']}, "
-            f"'format': '{entry['format']}', 'read': {entry['read']}, "
-            f"'text': '{entry['text']}' }},\n"
-        )
-    lines.append("]\n")
+    for text, fields in sorted(kept.items()):
+        body = ", ".join(f'"{k}": {json.dumps(v)}' for k, v in fields.items())
+        lines.append(f'    "{text}": {{{body}}},\n')
+    lines.append("}\n")
     TARGET.write_text("".join(lines), encoding="utf-8")
     print(f"Wrote {len(entries)} entries to {TARGET}")
 
@@ -135,7 +215,7 @@ def write_module(entries: list[dict[str, Any]]) -> None:
 
 def main() -> None:
     parser = argparse.ArgumentParser(
-        description="Generate parameter_defaults.py from fhem/26_KM273v018.pm"
+        description="Generate parameter_table_data.py from fhem/26_KM273v018.pm"
     )
     parser.add_argument(
         "--summary",
@@ -148,13 +228,14 @@ def main() -> None:
     entries = extract_entries(text)
     validate_entries(entries, text)
     old_entries = load_existing()
+    overrides = load_existing_overrides()
     added, removed, modified = diff_entries(old_entries, entries)
     if args.summary:
         print(f"Existing: {len(old_entries)} entries; New: {len(entries)} entries")
         print(
             f"Added: {len(added)}; Removed: {len(removed)}; Modified: {len(modified)}"
         )
-    write_module(entries)
+    write_module(entries, overrides)
 
 
 if __name__ == "__main__":